@@ -0,0 +1,426 @@
+# managers/autosave_journal.py
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QLockFile, QObject, QTimer
+
+from utils.write_behind import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+# スナップショットへ畳み込むまでのエントリ数・時間の既定値
+DEFAULT_COMPACT_EVERY: int = 200
+DEFAULT_COMPACT_INTERVAL_MS: int = 5 * 60 * 1000
+# fsync の最短間隔（秒）。追記ごとには同期せず、この間隔でまとめて同期する。
+DEFAULT_FSYNC_INTERVAL_SEC: float = 1.0
+# ウィンドウ追加/削除などの構造変更後、スナップショットを取るまでの待ち時間
+_STRUCTURE_COMPACT_DELAY_MS: int = 2000
+# 多重起動時に使う記録ディレクトリの最大数（既定ディレクトリを含む）
+_MAX_SESSION_SLOTS: int = 8
+
+
+class _JournalWriter(threading.Thread):
+    """ジャーナルの追記とスナップショット書き込みを行うワーカースレッド。
+
+    追記は到着順に書き込み、fsync は fsync_interval_sec ごとに1回に抑える。
+    スナップショットは一時ファイル経由で置き換えた後、ジャーナルを空にする
+    （キュー上でスナップショットより前の追記は全てスナップショットに含まれている）。
+    """
+
+    def __init__(self, journal_path: str, snapshot_path: str, fsync_interval_sec: float) -> None:
+        super().__init__(name="AutosaveJournal", daemon=True)
+        self.journal_path = journal_path
+        self.snapshot_path = snapshot_path
+        self.fsync_interval_sec = max(0.0, float(fsync_interval_sec))
+        self.ops: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        self.fsync_count: int = 0
+        self._file: Optional[Any] = None
+        self._dirty: bool = False
+        self._last_sync: float = 0.0
+
+    def run(self) -> None:
+        while True:
+            timeout = None
+            if self._dirty:
+                timeout = max(0.0, self._last_sync + self.fsync_interval_sec - time.monotonic())
+            try:
+                op, payload = self.ops.get(timeout=timeout)
+            except queue.Empty:
+                self._sync()
+                continue
+            try:
+                if op == "append":
+                    self._append(payload)
+                elif op == "snapshot":
+                    self._write_snapshot(payload)
+                elif op == "flush":
+                    self._sync()
+                    payload.set()
+                elif op == "stop":
+                    self._sync()
+                    self._close_file()
+                    return
+            except Exception:
+                logger.error(f"Autosave journal write failed ({op})", exc_info=True)
+                if op == "flush":
+                    payload.set()
+
+    def _open(self) -> Any:
+        if self._file is None:
+            self._file = open(self.journal_path, "a", encoding="utf-8")
+        return self._file
+
+    def _append(self, line: str) -> None:
+        f = self._open()
+        f.write(line)
+        f.write("\n")
+        self._dirty = True
+        if time.monotonic() - self._last_sync >= self.fsync_interval_sec:
+            self._sync()
+
+    def _sync(self) -> None:
+        if not self._dirty or self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._dirty = False
+        self._last_sync = time.monotonic()
+        self.fsync_count += 1
+
+    def _write_snapshot(self, payload: Dict[str, Any]) -> None:
+        write_json_atomic(self.snapshot_path, payload, fsync=True)
+        self._close_file()
+        with open(self.journal_path, "w", encoding="utf-8") as f:
+            f.flush()
+            os.fsync(f.fileno())
+        self._dirty = False
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            finally:
+                self._file = None
+
+
+class AutosaveJournal(QObject):
+    """設定変更の差分を追記する自動保存ジャーナル。
+
+    PropertyChangeBus で届いた（PropertyChangeCommand の redo/undo を含む）config 値を1行ずつ追記し、
+    一定件数・一定時間ごと（およびウィンドウ構造の変更後）に現在のシーン全体を
+    スナップショットへ畳み込んでジャーナルを空にする。
+    起動時に前回のロックファイルが残っていて、その持ち主のプロセスが既に居なければ
+    異常終了と判断し、スナップショットへジャーナルを再適用したシーンを復旧候補として返す。
+    ロックが生存中の別インスタンスに握られている場合（多重起動）は、そのインスタンスの
+    記録には触れず、`session-2` などの専用ディレクトリを使う。
+
+    ファイル書き込みはすべてワーカースレッドで行う。
+    """
+
+    JOURNAL_FILENAME: str = "journal.jsonl"
+    SNAPSHOT_FILENAME: str = "snapshot.json"
+    LOCK_FILENAME: str = "session.lock"
+
+    def __init__(
+        self,
+        root_dir: str,
+        snapshot_provider: Callable[[], Dict[str, Any]],
+        *,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+        compact_interval_ms: int = DEFAULT_COMPACT_INTERVAL_MS,
+        fsync_interval_sec: float = DEFAULT_FSYNC_INTERVAL_SEC,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        """AutosaveJournalを初期化します。
+
+        Args:
+            root_dir: ジャーナル・スナップショット・ロックを置くディレクトリ。
+                多重起動時は claim_session() でこの下の専用ディレクトリに切り替わる。
+            snapshot_provider: 現在のシーン辞書を返す関数（FileManager.get_scene_data）。
+            compact_every: この件数を追記したらスナップショットへ畳み込む。
+            compact_interval_ms: 追記があればこの間隔でスナップショットへ畳み込む。
+            fsync_interval_sec: ジャーナル fsync の最短間隔（秒）。
+            parent: 親 QObject。
+        """
+        super().__init__(parent)
+        self.base_dir = root_dir
+        self.root_dir = root_dir
+        self.snapshot_provider = snapshot_provider
+        self.compact_every: int = max(1, int(compact_every))
+        self.fsync_interval_sec: float = fsync_interval_sec
+        self._seq: int = 0
+        self._entries_since_snapshot: int = 0
+        self._writer: Optional[_JournalWriter] = None
+        self._session_lock: Optional[QLockFile] = None
+        self._found_stale_lock: bool = False
+
+        self._interval_timer = QTimer(self)
+        self._interval_timer.setInterval(max(1, int(compact_interval_ms)))
+        self._interval_timer.timeout.connect(self._on_interval)
+
+        self._structure_timer = QTimer(self)
+        self._structure_timer.setSingleShot(True)
+        self._structure_timer.setInterval(_STRUCTURE_COMPACT_DELAY_MS)
+        self._structure_timer.timeout.connect(self.compact)
+
+    @property
+    def journal_path(self) -> str:
+        """差分ジャーナル（JSON Lines）のパス。"""
+        return os.path.join(self.root_dir, self.JOURNAL_FILENAME)
+
+    @property
+    def snapshot_path(self) -> str:
+        """スナップショットのパス。"""
+        return os.path.join(self.root_dir, self.SNAPSHOT_FILENAME)
+
+    @property
+    def lock_path(self) -> str:
+        """セッション中であることを示すロックファイルのパス。"""
+        return os.path.join(self.root_dir, self.LOCK_FILENAME)
+
+    def is_running(self) -> bool:
+        """記録中かどうかを返す。"""
+        return self._writer is not None
+
+    # ==========================================
+    # Recovery
+    # ==========================================
+
+    def claim_session(self) -> bool:
+        """セッションロックを取得し、このインスタンスが使う記録ディレクトリを決める。
+
+        ロックファイルには PID とホスト名が記録され、持ち主のプロセスが終了していれば
+        古いロックとして取り除いて取得する（このとき前回は異常終了とみなす）。
+        生存中のプロセスが持っている場合は次の `session-N` ディレクトリを試す。
+
+        Returns:
+            bool: ロックを取得できた場合 True。
+        """
+        if self._session_lock is not None:
+            return True
+        for slot in range(1, _MAX_SESSION_SLOTS + 1):
+            root = self.base_dir if slot == 1 else os.path.join(self.base_dir, f"session-{slot}")
+            try:
+                os.makedirs(root, exist_ok=True)
+                lock_path = os.path.join(root, self.LOCK_FILENAME)
+                existed = os.path.exists(lock_path)
+                lock = QLockFile(lock_path)
+                # 経過時間では古いと判断しない（長時間のセッションを奪わない）
+                lock.setStaleLockTime(0)
+                if lock.tryLock(0):
+                    self.root_dir = root
+                    self._session_lock = lock
+                    self._found_stale_lock = existed
+                    if slot > 1:
+                        logger.info(f"Autosave journal is used by another instance; using {root}")
+                    return True
+                if lock.error() != QLockFile.LockError.LockFailedError:
+                    logger.warning(f"Failed to create autosave lock: {lock_path} ({lock.error()})")
+            except Exception:
+                logger.warning(f"Failed to claim autosave session: {root}", exc_info=True)
+        logger.warning("No free autosave session directory; autosave journal is disabled")
+        return False
+
+    def had_unclean_shutdown(self) -> bool:
+        """前回セッションが正常終了せず、復旧できるデータが残っているかを返す。
+
+        claim_session() で持ち主の居ないロックを引き継いだ場合のみ True になる。
+        """
+        return self._found_stale_lock and os.path.exists(self.snapshot_path)
+
+    def recover(self) -> Optional[Dict[str, Any]]:
+        """スナップショットにジャーナルを再適用したシーン辞書を返す。
+
+        クラッシュで途中まで書かれた末尾行は読み飛ばす。
+
+        Returns:
+            Optional[Dict[str, Any]]: 復旧したシーン。スナップショットが無い/読めない場合は None。
+        """
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except Exception:
+            logger.warning("Autosave snapshot is missing or unreadable", exc_info=True)
+            return None
+        scene = payload.get("scene") if isinstance(payload, dict) else None
+        if not isinstance(scene, dict):
+            return None
+
+        base_seq = int(payload.get("seq", 0) or 0)
+        by_uuid: Dict[str, Dict[str, Any]] = {
+            str(w.get("uuid")): w for w in scene.get("windows", []) if isinstance(w, dict) and w.get("uuid")
+        }
+        applied = 0
+        for entry in self._read_entries():
+            if int(entry.get("seq", 0) or 0) <= base_seq:
+                continue
+            spec = by_uuid.get(str(entry.get("uuid")))
+            field = entry.get("field")
+            if spec is None or not isinstance(field, str):
+                continue
+            if entry.get("value") is None:
+                spec.pop(field, None)
+            else:
+                spec[field] = entry["value"]
+            applied += 1
+        logger.info(f"Autosave recovery: {len(by_uuid)} windows, {applied} journal entries replayed")
+        return scene
+
+    def _read_entries(self) -> List[Dict[str, Any]]:
+        entries: List[Dict[str, Any]] = []
+        if not os.path.exists(self.journal_path):
+            return entries
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # 書き込み途中で落ちた末尾行
+                    continue
+                if isinstance(entry, dict):
+                    entries.append(entry)
+        return entries
+
+    # ==========================================
+    # Lifecycle
+    # ==========================================
+
+    def start(self) -> None:
+        """記録を開始する。ロックを取得し、現在のシーンで初回スナップショットを取る。"""
+        if self._writer is not None:
+            return
+        if not self.claim_session():
+            return
+        self._writer = _JournalWriter(self.journal_path, self.snapshot_path, self.fsync_interval_sec)
+        self._writer.start()
+        self.compact()
+        self._interval_timer.start()
+
+    def close(self) -> None:
+        """正常終了として記録を止め、ジャーナル・スナップショット・ロックを削除する。"""
+        writer = self._writer
+        if writer is None:
+            return
+        self._interval_timer.stop()
+        self._structure_timer.stop()
+        self._writer = None
+        writer.ops.put(("stop", None))
+        writer.join(timeout=5.0)
+        for path in (self.journal_path, self.snapshot_path):
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except Exception:
+                logger.warning(f"Failed to remove autosave file: {path}", exc_info=True)
+        self._release_session()
+
+    def _release_session(self) -> None:
+        lock = self._session_lock
+        if lock is None:
+            return
+        self._session_lock = None
+        self._found_stale_lock = False
+        lock.unlock()
+        if self.root_dir != self.base_dir:
+            # 多重起動用の専用ディレクトリは空なら片付ける
+            try:
+                os.rmdir(self.root_dir)
+            except OSError:
+                pass
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """キュー済みの書き込みを完了させ、fsync まで待つ（テスト・終了処理用）。"""
+        writer = self._writer
+        if writer is None:
+            return True
+        done = threading.Event()
+        writer.ops.put(("flush", done))
+        return done.wait(timeout)
+
+    # ==========================================
+    # Recording
+    # ==========================================
+
+    def record_property(self, target: Any, property_name: str) -> None:
+        """適用済みのプロパティ変更を config 値として追記する。
+
+        PropertyChangeCommand の変更リスナーとして登録する想定。
+        config を持たない対象や、config のフィールドでないプロパティは記録しない。
+
+        Args:
+            target: 変更されたウィンドウ。
+            property_name: 変更されたプロパティ名。
+        """
+        writer = self._writer
+        if writer is None:
+            return
+        config = getattr(target, "config", None)
+        fields = getattr(type(config), "model_fields", None)
+        if not fields or property_name not in fields:
+            return
+        try:
+            value = config.model_dump(mode="json", include={property_name}).get(property_name)
+            self._seq += 1
+            entry = {
+                "seq": self._seq,
+                "t": round(time.time(), 3),
+                "uuid": str(config.uuid),
+                "field": property_name,
+                "value": value,
+            }
+            writer.ops.put(("append", json.dumps(entry, ensure_ascii=False, separators=(",", ":"))))
+        except Exception:
+            logger.warning(f"Failed to journal property change: {property_name}", exc_info=True)
+            return
+
+        self._entries_since_snapshot += 1
+        if self._entries_since_snapshot >= self.compact_every:
+            self.compact()
+
+    def record_changes(self, events: List[Any]) -> None:
+        """PropertyChangeBus の購読者として、合流済みの変更フィールドを追記する。
+
+        同じ周回で同じフィールドが何度変わっても、追記するのは最新の値 1 件だけになる。
+        どのフィールドが変わったか分からない変更（config の差し替え）はスナップショットへ畳み込む。
+
+        Args:
+            events: PropertyChangeEvent のリスト。
+        """
+        for event in events:
+            if event.fields is None:
+                self.schedule_compact()
+                continue
+            for field_name in sorted(event.fields):
+                self.record_property(event.window, field_name)
+
+    def schedule_compact(self, *_args: Any) -> None:
+        """ウィンドウ構造の変更後など、少し待ってからスナップショットを取る。"""
+        if self._writer is not None:
+            self._structure_timer.start()
+
+    def compact(self) -> None:
+        """現在のシーンをスナップショットとして書き出し、ジャーナルを空にする。
+
+        シーン辞書の取得だけを GUI スレッドで行い、書き込みはワーカーで行う。
+        """
+        writer = self._writer
+        if writer is None:
+            return
+        self._structure_timer.stop()
+        try:
+            scene = self.snapshot_provider()
+        except Exception:
+            logger.error("Failed to take autosave snapshot", exc_info=True)
+            return
+        writer.ops.put(("snapshot", {"seq": self._seq, "saved_at": round(time.time(), 3), "scene": scene}))
+        self._entries_since_snapshot = 0
+
+    def _on_interval(self) -> None:
+        if self._entries_since_snapshot > 0:
+            self.compact()
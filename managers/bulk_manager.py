@@ -36,6 +36,9 @@ class BulkOperationManager:
             self.mw.window_manager.hide_all_image_windows()
 
     def close_all_everything(self) -> None:
+        if hasattr(self.mw, "file_manager"):
+            # 段階的読み込み中なら、残りのウィンドウが後から現れないよう打ち切る
+            self.mw.file_manager.cancel_scene_loading()
         if hasattr(self.mw, "window_manager"):
             self.mw.window_manager.clear_all()
 
@@ -0,0 +1,298 @@
+# managers/due_scheduler.py
+"""期限の境界（today / overdue への切り替わり）をまとめて管理するスケジューラ。
+
+全ウィンドウの「次に期限の状態が変わる時刻」を最小ヒープで保持し、QTimer は先頭の境界に
+1 本だけ合わせる。発火したら境界を過ぎたウィンドウだけを再評価する（定期的な全件走査はしない）。
+境界は utils.due_date.compose_due_datetime と同じ規則で求めるため、時刻指定の期限と
+タイムゾーン付きの期限（ローカル時刻へ換算）も扱える。
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from utils.due_date import compose_due_datetime
+
+logger = logging.getLogger(__name__)
+
+# 境界ちょうどではなく少し後に発火させ、状態の切り替わりを確実に拾う
+DUE_SCHEDULER_SLACK_MS = 500
+# スリープ復帰や時計の変更に備え、遠い境界でも一定間隔で時刻を確かめ直す
+DUE_SCHEDULER_MAX_DELAY_MS = 6 * 60 * 60 * 1000
+
+
+def due_state_boundaries(
+    due_at: str,
+    due_time: str = "",
+    due_timezone: str = "",
+    due_precision: str = "date",
+) -> Tuple[datetime, ...]:
+    """期限の状態が切り替わる時刻（ローカル時刻、昇順）を返す。
+
+    日付単位の期限は「当日0時（upcoming→today）」と「翌日0時（today→overdue）」、
+    時刻指定の期限は「当日0時（upcoming→today）」と「期限時刻（today→overdue）」で切り替わる。
+
+    Returns:
+        Tuple[datetime, ...]: 境界の時刻。期限が無い・解析できない場合は空。
+    """
+    if not str(due_at or "").strip():
+        return ()
+    due_dt = compose_due_datetime(due_at, due_time=due_time, due_timezone=due_timezone, due_precision=due_precision)
+    if due_dt is None:
+        return ()
+    day_start = datetime.combine(due_dt.date(), datetime.min.time())
+    if str(due_precision or "date").strip().lower() == "datetime":
+        return tuple(sorted({day_start, due_dt}))
+    return (day_start, day_start + timedelta(days=1))
+
+
+def window_due_fields(window: Any) -> Tuple[str, str, str, str]:
+    """ウィンドウの期限属性（due_at, due_time, due_timezone, due_precision）。"""
+    return (
+        str(getattr(window, "due_at", "") or ""),
+        str(getattr(window, "due_time", "") or ""),
+        str(getattr(window, "due_timezone", "") or ""),
+        str(getattr(window, "due_precision", "date") or "date").strip().lower(),
+    )
+
+
+class DueBoundaryHeap:
+    """キーごとの将来の境界を保持する最小ヒープ。
+
+    キーの境界を差し替えたときは古いエントリをその場で探さず、世代番号で無効化して
+    取り出し時に読み捨てる（遅延削除）。無効なエントリが増えすぎたら作り直す。
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[datetime, int, Hashable, int]] = []
+        self._versions: Dict[Hashable, int] = {}
+        self._live: Dict[Hashable, int] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        """将来の境界を持つキーの数。"""
+        return len(self._live)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._live
+
+    def schedule(self, key: Hashable, boundaries: Iterable[datetime], now: datetime) -> int:
+        """キーの境界を差し替える。now 以前の境界は登録しない。
+
+        Returns:
+            int: 登録した境界の数。
+        """
+        version = self._versions.get(key, 0) + 1
+        self._versions[key] = version
+        count = 0
+        for boundary in boundaries:
+            if boundary <= now:
+                continue
+            heapq.heappush(self._heap, (boundary, next(self._counter), key, version))
+            count += 1
+        if count:
+            self._live[key] = count
+        else:
+            self._live.pop(key, None)
+        self._compact_if_needed()
+        return count
+
+    def discard(self, key: Hashable) -> None:
+        """キーの境界をすべて無効にする。"""
+        if key in self._versions:
+            self._versions[key] += 1
+        self._live.pop(key, None)
+        self._compact_if_needed()
+
+    def clear(self) -> None:
+        """すべての境界を捨てる。"""
+        self._heap.clear()
+        self._versions.clear()
+        self._live.clear()
+
+    def peek(self) -> Optional[datetime]:
+        """次の境界。無ければ None。"""
+        self._drop_stale_head()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> List[Hashable]:
+        """now より前の境界を取り出し、該当するキーを（重複なく、境界順に）返す。"""
+        keys: List[Hashable] = []
+        seen: set[Hashable] = set()
+        while True:
+            self._drop_stale_head()
+            if not self._heap or self._heap[0][0] >= now:
+                break
+            _boundary, _seq, key, _version = heapq.heappop(self._heap)
+            remaining = self._live.get(key, 0) - 1
+            if remaining > 0:
+                self._live[key] = remaining
+            else:
+                self._live.pop(key, None)
+            if key not in seen:
+                seen.add(key)
+                keys.append(key)
+        return keys
+
+    def _is_stale(self, entry: Tuple[datetime, int, Hashable, int]) -> bool:
+        return self._versions.get(entry[2]) != entry[3] or entry[2] not in self._live
+
+    def _drop_stale_head(self) -> None:
+        while self._heap and self._is_stale(self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def _compact_if_needed(self) -> None:
+        live_entries = sum(self._live.values())
+        if len(self._heap) > 64 and len(self._heap) > 2 * live_entries:
+            self._heap = [entry for entry in self._heap if not self._is_stale(entry)]
+            heapq.heapify(self._heap)
+
+
+class DueScheduler(QObject):
+    """全ウィンドウの期限境界を 1 本の QTimer で監視する。
+
+    track() は期限属性が変わったウィンドウだけヒープを差し替える。境界を過ぎたら
+    該当ウィンドウのオーバーレイのツールチップ（期限の表示）を更新し、
+    sig_due_reached で該当ウィンドウだけを通知する（Info タブはその行だけを再評価する）。
+
+    Attributes:
+        fired_count: 境界を処理した回数（計測・テスト用）。
+    """
+
+    sig_due_reached = Signal(list)
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """DueSchedulerを初期化します。
+
+        Args:
+            parent: 親 QObject。
+        """
+        super().__init__(parent)
+        self._heap = DueBoundaryHeap()
+        self._windows: Dict[int, Any] = {}
+        self._fields: Dict[int, Tuple[str, str, str, str]] = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timeout)
+        self.fired_count: int = 0
+
+    @property
+    def tracked_count(self) -> int:
+        """将来の境界を持つウィンドウの数。"""
+        return len(self._heap)
+
+    def next_boundary(self) -> Optional[datetime]:
+        """次に期限の状態が変わる時刻。無ければ None。"""
+        return self._heap.peek()
+
+    def is_armed(self) -> bool:
+        """タイマーが動いているかどうか。"""
+        return self._timer.isActive()
+
+    def track(self, window: Any, now: Optional[datetime] = None) -> None:
+        """ウィンドウの期限を登録し直す。期限属性が前回と同じなら何もしない。"""
+        if window is None:
+            return
+        if self._track(window, now or datetime.now()):
+            self._arm()
+
+    def track_many(self, windows: Iterable[Any], now: Optional[datetime] = None) -> None:
+        """複数ウィンドウの期限を登録し直す（タイマーの再設定は 1 回だけ）。"""
+        now = now or datetime.now()
+        changed = False
+        for window in windows or []:
+            if window is not None:
+                changed = self._track(window, now) or changed
+        if changed:
+            self._arm()
+
+    def untrack(self, window: Any) -> None:
+        """ウィンドウを監視対象から外す。"""
+        key = id(window)
+        if self._windows.pop(key, None) is None:
+            return
+        self._fields.pop(key, None)
+        self._heap.discard(key)
+        self._arm()
+
+    def sync(self, windows: Iterable[Any], now: Optional[datetime] = None) -> None:
+        """ウィンドウ一覧と突き合わせる。一覧に無いウィンドウは外し、期限の変わったものだけ登録し直す。"""
+        now = now or datetime.now()
+        current = [w for w in windows or [] if w is not None]
+        alive = {id(w) for w in current}
+        for key in [k for k in self._windows if k not in alive]:
+            self._windows.pop(key, None)
+            self._fields.pop(key, None)
+            self._heap.discard(key)
+        for window in current:
+            self._track(window, now)
+        self._arm()
+
+    def clear(self) -> None:
+        """すべての監視を止める。"""
+        self._heap.clear()
+        self._windows.clear()
+        self._fields.clear()
+        self._timer.stop()
+
+    def process_due(self, now: Optional[datetime] = None) -> List[Any]:
+        """now より前の境界を処理し、該当ウィンドウを再評価・通知する。
+
+        Returns:
+            List[Any]: 期限の状態が切り替わりうるウィンドウ。
+        """
+        now = now or datetime.now()
+        windows = [self._windows[key] for key in self._heap.pop_due(now) if key in self._windows]
+        if windows:
+            self.fired_count += 1
+            for window in windows:
+                refresh = getattr(window, "_refresh_overlay_meta_tooltip", None)
+                if not callable(refresh):
+                    continue
+                try:
+                    refresh()
+                except RuntimeError:
+                    # 閉じられた（C++ 側が破棄済みの）ウィンドウ
+                    self.untrack(window)
+                except Exception:
+                    logger.warning("Failed to refresh due tooltip", exc_info=True)
+            self.sig_due_reached.emit(windows)
+        self._arm(now)
+        return windows
+
+    def _track(self, window: Any, now: datetime) -> bool:
+        key = id(window)
+        fields = window_due_fields(window)
+        if self._windows.get(key) is window and self._fields.get(key) == fields:
+            return False
+        self._windows[key] = window
+        self._fields[key] = fields
+        try:
+            boundaries = due_state_boundaries(*fields)
+        except Exception:
+            logger.warning("Failed to compute due boundaries", exc_info=True)
+            boundaries = ()
+        self._heap.schedule(key, boundaries, now)
+        return True
+
+    def _arm(self, now: Optional[datetime] = None) -> None:
+        boundary = self._heap.peek()
+        if boundary is None:
+            self._timer.stop()
+            return
+        now = now or datetime.now()
+        delay_ms = int((boundary - now).total_seconds() * 1000) + DUE_SCHEDULER_SLACK_MS
+        self._timer.start(max(DUE_SCHEDULER_SLACK_MS, min(delay_ms, DUE_SCHEDULER_MAX_DELAY_MS)))
+
+    def _on_timeout(self) -> None:
+        try:
+            self.process_due()
+        except Exception:
+            logger.error("Due scheduler failed", exc_info=True)
+            self._arm()
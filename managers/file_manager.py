@@ -5,19 +5,71 @@ import logging
 import os
 import re
 import traceback
-from typing import Any, Dict, List, Optional, Union
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from PySide6.QtCore import QPoint, Qt
 from PySide6.QtGui import QColor, QFont
 from PySide6.QtWidgets import QFileDialog, QMessageBox
 
+from managers.project_bundle import (
+    BUNDLE_EXTENSION,
+    MANIFEST_NAME,
+    ProjectBundle,
+    start_deferred_extraction,
+    write_project_bundle,
+)
+from managers.scene_format import (
+    FORMAT_STREAM,
+    SCENE_STREAM_EXTENSION,
+    detect_scene_format,
+    iter_scene_stream,
+    write_scene_stream,
+)
+from managers.scene_loader import ProgressiveSceneLoader
+from managers.scene_store import SceneStore
 from utils.translator import tr
+from utils.write_behind import write_json_atomic
 from windows.image_window import ImageWindow
 from windows.text_window import TextWindow
 
+if TYPE_CHECKING:
+    from managers.info_store import InfoStore
+
 logger = logging.getLogger(__name__)
 
 
+def _copy_json_tree(value: Any) -> Any:
+    """JSON 互換の dict/list を再帰的にコピーする（deepcopy より軽量）。"""
+    if isinstance(value, dict):
+        return {k: _copy_json_tree(v) if isinstance(v, (dict, list)) else v for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json_tree(v) if isinstance(v, (dict, list)) else v for v in value]
+    return value
+
+
+def _is_flat_container(value: Any) -> bool:
+    items = value.values() if isinstance(value, dict) else value
+    return not any(isinstance(v, (dict, list)) for v in items)
+
+
+def _container_keys(data: Dict[str, Any]) -> Tuple[Tuple[str, bool], ...]:
+    """list/dict を値に持つキーと、その値が入れ子を含まない（浅いコピーで足りる）かを返す。"""
+    return tuple((k, _is_flat_container(v)) for k, v in data.items() if isinstance(v, (dict, list)))
+
+
+def _copy_dump(data: Dict[str, Any], container_keys: Tuple[Tuple[str, bool], ...]) -> Dict[str, Any]:
+    """dump 辞書をコピーする。スカラー値は共有し、list/dict の値だけ複製する。"""
+    copied = dict(data)
+    for key, flat in container_keys:
+        value = data[key]
+        if flat:
+            copied[key] = value.copy()
+        else:
+            copied[key] = _copy_json_tree(value)
+    return copied
+
+
 class FileManager:
     """プロジェクト、シーン、およびウィンドウデータの保存と読み込みを管理するクラス。
 
@@ -28,6 +80,16 @@ class FileManager:
         main_window: アプリケーションのメインウィンドウインスタンス。
     """
 
+    # このウィンドウ数以上のシーンは段階的に読み込む
+    PROGRESSIVE_LOAD_MIN_WINDOWS: int = 40
+    # コンパクト形式の読み込みで1回に生成するウィンドウ数
+    STREAM_LOAD_CHUNK: int = 32
+    SCENE_SAVE_FILTER: str = "JSON Files (*.json);;Compact Scene Stream (*.ftivs)"
+    SCENE_OPEN_FILTER: str = "Scene Files (*.json *.ftivs);;JSON Files (*.json);;Compact Scene Stream (*.ftivs)"
+    PROJECT_SAVE_FILTER: str = "Project Files (*.json);;Project Bundle with Images (*.ftivz)"
+    PROJECT_OPEN_FILTER: str = "Project Files (*.json *.ftivz ftiv_bundle.json);;Project Bundle (*.ftivz)"
+    INFO_STORE_FILENAME: str = "info_store.sqlite3"
+
     def __init__(self, main_window: Any) -> None:
         """FileManagerを初期化します。
 
@@ -35,6 +97,15 @@ class FileManager:
             main_window: MainWindowのインスタンス。
         """
         self.main_window = main_window
+        # 進行中の段階的読み込み（無ければ None）
+        self.scene_loader: Optional[ProgressiveSceneLoader] = None
+        self._scene_store: Optional[SceneStore] = None
+        self._info_store: Optional["InfoStore"] = None
+        self._info_store_backfilled: bool = False
+        # {uuid: (config, dump_revision, dumped_dict, container_keys)} — 変更の無いウィンドウは再シリアライズしない
+        self._dump_cache: Dict[str, Tuple[Any, int, Dict[str, Any], Tuple[Tuple[str, bool], ...]]] = {}
+        self.dump_cache_hits: int = 0
+        self.dump_cache_misses: int = 0
 
     @property
     def window_manager(self) -> Any:
@@ -59,9 +130,10 @@ class FileManager:
         try:
             # 相対モードが明示的にONの場合のみ、絶対座標情報を消す
             if getattr(config, "move_use_relative", False):
-                if hasattr(config, "start_position"):
+                # 既に None なら代入しない（dump キャッシュを無効化しないため）
+                if getattr(config, "start_position", None) is not None:
                     config.start_position = None
-                if hasattr(config, "end_position"):
+                if getattr(config, "end_position", None) is not None:
                     config.end_position = None
         except Exception:
             pass
@@ -75,6 +147,48 @@ class FileManager:
         self._clear_absolute_move_fields_if_relative(config)
         return config.model_dump(mode="json", exclude_none=True)
 
+    def _dump_window_config_cached(self, config: Any, w_type: str) -> Dict[str, Any]:
+        """ウィンドウ config の JSON 辞書を、前回から変更が無ければキャッシュから返す。
+
+        config の dump_revision（フィールド代入で進む）と config オブジェクト自体が
+        前回と同じならシリアライズを省略する。呼び出し側が書き換えても
+        キャッシュが壊れないよう、返り値は常にコピー。
+
+        Args:
+            config: ウィンドウの config。
+            w_type: 付与する "type"（"text" / "image"）。
+
+        Returns:
+            Dict[str, Any]: type 付きの JSON 辞書。
+        """
+        self._clear_absolute_move_fields_if_relative(config)
+        revision = getattr(config, "dump_revision", None)
+        uuid = getattr(config, "uuid", None)
+        if not isinstance(revision, int) or not isinstance(uuid, str) or not uuid:
+            data = config.model_dump(mode="json", exclude_none=True)
+            data["type"] = w_type
+            return data
+
+        cached = self._dump_cache.get(uuid)
+        if cached is not None and cached[0] is config and cached[1] == revision:
+            self.dump_cache_hits += 1
+            _config, _revision, data, container_keys = cached
+        else:
+            self.dump_cache_misses += 1
+            data = config.model_dump(mode="json", exclude_none=True)
+            data["type"] = w_type
+            container_keys = _container_keys(data)
+            self._dump_cache[uuid] = (config, revision, data, container_keys)
+        return _copy_dump(data, container_keys)
+
+    def dump_cache_stats(self) -> Dict[str, int]:
+        """シリアライズキャッシュの効き具合（累計のヒット/ミスと保持件数）を返す。"""
+        return {
+            "hits": self.dump_cache_hits,
+            "misses": self.dump_cache_misses,
+            "entries": len(self._dump_cache),
+        }
+
     def _serialize_pen_style(self, pen_style: Any) -> int:
         """Qt.PenStyle 等を JSON 保存用の int に変換する。
 
@@ -180,33 +294,53 @@ class FileManager:
         return QColor(100, 200, 255, 180).name(QColor.HexArgb)
 
     def get_scene_data(self) -> Dict[str, Any]:
-        try:
-            if hasattr(self.window_manager, "_prune_invalid_refs"):
-                self.window_manager._prune_invalid_refs()
-        except Exception:
-            pass
-
         """現在のシーン情報（ウィンドウ、接続）を辞書データとして取得します。
 
+        無効参照は WindowManager の destroyed 購読で除去されるため、
+        全件走査は DEBUG ログ時の検査（_debug_check_refs）に限定します。
+
         Returns:
             Dict[str, Any]: シリアライズされたシーンデータ（新形式）。
         """
+        # 段階的読み込みの途中で保存すると未生成分が欠けるため、先に完了させる
+        self.finish_scene_loading()
+
+        try:
+            if hasattr(self.window_manager, "_debug_check_refs"):
+                self.window_manager._debug_check_refs()
+        except Exception:
+            pass
+
         scene_data: Dict[str, Any] = {
             "format_version": 1,
             "windows": [],
             "connections": [],
         }
 
+        seen: Set[str] = set()
+
         # テキストウィンドウの処理
         for window in self.window_manager.text_windows:
-            window.config.position = {"x": window.x(), "y": window.y()}
-            text_data = self._dump_config_json(window.config)
-            text_data["type"] = "text"
-            scene_data["windows"].append(text_data)
+            position = {"x": window.x(), "y": window.y()}
+            # 位置が変わっていなければ代入しない（dump キャッシュを無効化しないため）
+            if window.config.position != position:
+                window.config.position = position
+            scene_data["windows"].append(self._dump_window_config_cached(window.config, "text"))
+            seen.add(window.config.uuid)
 
         # 画像ウィンドウの処理
         for window in self.window_manager.image_windows:
-            scene_data["windows"].append(window.to_dict())
+            prepare = getattr(window, "prepare_config_for_dump", None)
+            if callable(prepare):
+                prepare()
+                scene_data["windows"].append(self._dump_window_config_cached(window.config, "image"))
+                seen.add(window.config.uuid)
+            else:
+                scene_data["windows"].append(window.to_dict())
+
+        # 閉じられたウィンドウのキャッシュを捨てる
+        for stale in [uuid for uuid in self._dump_cache if uuid not in seen]:
+            del self._dump_cache[stale]
 
         # コネクタ（接続）の処理
         for conn in self.window_manager.connectors:
@@ -232,12 +366,18 @@ class FileManager:
 
         return scene_data
 
-    def load_scene_from_data(self, data: Union[Dict[str, Any], List[Any]]) -> None:
+    def load_scene_from_data(
+        self, data: Union[Dict[str, Any], List[Any]], *, progressive: Optional[bool] = None
+    ) -> None:
         """辞書データからシーンを復元します。
 
         Args:
             data: 読み込むシーンデータ。辞書形式またはリスト形式（旧版）。
+            progressive: True で複数 tick に分散して読み込む。None の場合はウィンドウ数で自動判定する。
         """
+        # 前回の段階的読み込みが残っていれば先に完了させる
+        self.finish_scene_loading()
+
         if hasattr(self.main_window, "undo_stack"):
             self.main_window.undo_stack.clear()
 
@@ -251,43 +391,292 @@ class FileManager:
                 pass
             return
 
-        loaded_windows_map: Dict[str, Any] = {}
-        skipped_text_windows: int = 0
-        skipped_image_windows: int = 0
-
         windows_list = normalized.get("windows", [])
         if not isinstance(windows_list, list):
             windows_list = []
+        window_specs = [w for w in windows_list if isinstance(w, dict)]
 
-        # 1. ウィンドウ生成
-        for w_data in windows_list:
-            if not isinstance(w_data, dict):
-                continue
+        connections_list = normalized.get("connections", [])
+        if not isinstance(connections_list, list):
+            connections_list = []
+
+        if self._should_load_progressively(window_specs, progressive):
+            self.load_scene_progressively(window_specs, connections_list)
+            return
 
-            w_type = w_data.get("type")
-            if not w_type:
-                w_type = "image" if "image_path" in w_data else "text"
+        # 1. ウィンドウ生成（一括生成: 描画・接続・通知はバッチで1回）
+        created = self._create_scene_windows(window_specs)
+        # 2. 親子関係・レイヤー順・接続の復元
+        self._finish_scene_load(window_specs, created, connections_list)
 
-            window: Optional[Any] = None
+    def load_scene_from_file(self, path: str) -> None:
+        """シーンファイルを形式を自動判定して読み込みます。
+
+        コンパクト形式（.ftivs）はレコードを読みながら chunk 単位でウィンドウを生成するため、
+        ファイル全体のパースを待たずに最初のウィンドウが現れます。
+
+        Args:
+            path: シーンファイルのパス。
+        """
+        if detect_scene_format(path) != FORMAT_STREAM:
+            with open(path, "r", encoding="utf-8-sig") as f:
+                self.load_scene_from_data(json.load(f))
+            return
+        self._load_scene_stream(path)
+
+    def _load_scene_stream(self, path: str) -> None:
+        """コンパクト形式のシーンを、読み込みとウィンドウ生成を交互に行いながら復元します。"""
+        self.finish_scene_loading()
+        if hasattr(self.main_window, "undo_stack"):
+            self.main_window.undo_stack.clear()
+
+        window_specs: List[Dict[str, Any]] = []
+        created: List[Optional[Any]] = []
+        connections_list: List[Dict[str, Any]] = []
+        chunk: List[Dict[str, Any]] = []
+
+        def _flush_chunk() -> None:
+            if chunk:
+                specs = list(chunk)
+                chunk.clear()
+                created.extend(self._create_scene_windows(specs, select_last=False))
+                window_specs.extend(specs)
+
+        for record in iter_scene_stream(path):
+            if record.kind == "window":
+                chunk.append(record.data)
+                if len(chunk) >= self.STREAM_LOAD_CHUNK:
+                    _flush_chunk()
+            elif record.kind == "connection":
+                connections_list.append(record.data)
+        _flush_chunk()
+
+        self._finish_scene_load(window_specs, created, connections_list)
+        last = next((w for w in reversed(created) if w is not None), None)
+        select = getattr(self.window_manager, "set_selected_window", None)
+        if last is not None and callable(select):
+            select(last)
+
+    def _should_load_progressively(self, window_specs: List[Dict[str, Any]], progressive: Optional[bool]) -> bool:
+        """段階的読み込みを使うかどうかを判定します。"""
+        if progressive is not None:
+            return bool(progressive)
+        # テスト実行時は同期読み込みで結果を即座に検証できるようにする
+        if os.getenv("FTIV_TEST_MODE") == "1":
+            return False
+        return len(window_specs) >= self.PROGRESSIVE_LOAD_MIN_WINDOWS
+
+    def load_scene_progressively(
+        self, window_specs: List[Dict[str, Any]], connections: List[Dict[str, Any]]
+    ) -> "ProgressiveSceneLoader":
+        """ウィンドウ生成をイベントループの複数 tick に分散して読み込みを開始します。
+
+        表示中・最前面のウィンドウから先に生成し、進捗は返り値のローダーのシグナルで通知されます。
+
+        Args:
+            window_specs: ウィンドウ辞書のリスト。
+            connections: 接続情報のリスト。
+
+        Returns:
+            ProgressiveSceneLoader: 開始済みのローダー。
+        """
+        self.finish_scene_loading()
+        loader = ProgressiveSceneLoader(self, window_specs, connections)
+        # ローダーは生成したウィンドウを保持するため、自身のシグナル接続から強参照しない
+        loader_ref = weakref.ref(loader)
+        loader.sig_finished.connect(lambda: self._on_scene_loader_finished(loader_ref()))
+        self.scene_loader = loader
+        loader.start()
+        return loader
+
+    def finish_scene_loading(self) -> None:
+        """段階的読み込みが進行中なら、残りを同期的に完了させます。"""
+        loader = self.scene_loader
+        if loader is not None and loader.is_running():
+            loader.finish_now()
+
+    def cancel_scene_loading(self) -> None:
+        """段階的読み込みが進行中なら、以降の生成を打ち切ります。"""
+        loader = self.scene_loader
+        if loader is not None:
+            loader.cancel()
+            self.scene_loader = None
+
+    def _on_scene_loader_finished(self, loader: Optional["ProgressiveSceneLoader"]) -> None:
+        if loader is not None and self.scene_loader is loader:
+            self.scene_loader = None
+
+    def switch_scene_from_data(self, data: Union[Dict[str, Any], List[Any]]) -> None:
+        """現在のシーンを data のシーンへ差分で切り替えます。
+
+        UUID が一致するウィンドウはウィジェット（描画キャッシュ含む）をそのまま再利用し、
+        変化した config フィールドだけを適用します。切替先に無いウィンドウだけを閉じ、
+        新しく現れたウィンドウだけを生成します。
+
+        Args:
+            data: 切替先のシーンデータ。辞書形式またはリスト形式（旧版）。
+        """
+        self.finish_scene_loading()
+
+        try:
+            normalized: Dict[str, Any] = self._normalize_scene_data(data)
+        except Exception as e:
+            try:
+                QMessageBox.critical(self.main_window, tr("msg_error"), f"Failed to normalize scene data: {e}")
+            except Exception:
+                pass
+            return
+
+        windows_list = normalized.get("windows", [])
+        window_specs = [w for w in windows_list if isinstance(w, dict)] if isinstance(windows_list, list) else []
+        connections_list = normalized.get("connections", [])
+        if not isinstance(connections_list, list):
+            connections_list = []
+
+        wm = self.window_manager
+        current = {w.uuid: w for w in wm.text_windows + wm.image_windows}
+        reused: Dict[str, Any] = {}
+        kept_pairs: List[tuple] = []
+        added_specs: List[Dict[str, Any]] = []
+        for spec in window_specs:
+            window = current.get(spec.get("uuid") or "")
+            if window is not None and window.uuid not in reused and self._can_reuse_window(window, spec):
+                reused[window.uuid] = window
+                kept_pairs.append((window, spec))
+            else:
+                added_specs.append(spec)
+
+        if not kept_pairs:
+            # 共通のウィンドウが無ければ差分の利点が無いので、通常の読み込み（段階的読み込みを含む）に任せる
+            self.cancel_scene_loading()
+            wm.clear_all()
+            self.load_scene_from_data(normalized)
+            return
+
+        if hasattr(self.main_window, "undo_stack"):
+            self.main_window.undo_stack.clear()
+
+        # 1. 切替先で不要になるコネクタを削除し、残すコネクタは属性を再適用
+        target_connections: Dict[frozenset, Dict[str, Any]] = {}
+        for conn_data in connections_list:
+            if isinstance(conn_data, dict):
+                target_connections[frozenset((conn_data.get("from_uuid"), conn_data.get("to_uuid")))] = conn_data
+        for connector in list(wm.connectors):
+            start = getattr(connector, "start_window", None)
+            end = getattr(connector, "end_window", None)
+            key = frozenset((getattr(start, "uuid", None), getattr(end, "uuid", None)))
+            conn_data = target_connections.get(key)
+            if (
+                conn_data is None
+                or reused.get(getattr(start, "uuid", None)) is not start
+                or reused.get(getattr(end, "uuid", None)) is not end
+            ):
+                wm.delete_connector(connector)
+            else:
+                self._apply_connection_properties(connector, conn_data)
+
+        # 2. 切替先に無いウィンドウを閉じる（closeEvent -> remove_window で親子・コネクタも掃除される）
+        for uuid, window in current.items():
+            if uuid not in reused:
+                try:
+                    window.close()
+                except Exception:
+                    logger.warning(f"Failed to close window during scene switch: {uuid}", exc_info=True)
+
+        # 3. 親が変わる再利用ウィンドウは一旦切り離す（新しい親子関係は _finish_scene_load で張り直す）
+        for window, spec in kept_pairs:
+            parent_uuid = window.parent_window_uuid
+            if parent_uuid and parent_uuid != spec.get("parent_uuid"):
+                parent = reused.get(parent_uuid)
+                if parent is not None:
+                    parent.remove_child_window(window)
+                else:
+                    window.parent_window_uuid = None
+
+        # 4. 再利用ウィンドウへ差分を適用（新規生成と同じく Archetype → spec の順で比較する）
+        changed_count = 0
+        archetype = wm._load_text_archetype()
+        for window, spec in kept_pairs:
+            try:
+                if wm.reconfigure_window(window, spec, archetype):
+                    changed_count += 1
+            except Exception:
+                logger.error(f"Failed to reconfigure window during scene switch: {window.uuid}", exc_info=True)
+
+        # 5. 新しく現れたウィンドウだけ生成
+        created_map: Dict[int, Optional[Any]] = {}
+        if added_specs:
+            for spec, window in zip(added_specs, self._create_scene_windows(added_specs, select_last=False)):
+                created_map[id(spec)] = window
+        created = [reused.get(spec.get("uuid") or "") or created_map.get(id(spec)) for spec in window_specs]
+
+        self._finish_scene_load(window_specs, created, connections_list)
+        wm.sig_layer_structure_changed.emit()
+        logger.info(
+            f"Scene switched: kept={len(kept_pairs)} (changed={changed_count}), "
+            f"added={len(added_specs)}, removed={len(current) - len(reused)}"
+        )
+
+    @staticmethod
+    def _can_reuse_window(window: Any, spec: Dict[str, Any]) -> bool:
+        """既存ウィンドウを spec の表示に再利用できるかどうかを判定します。
+
+        種類が異なる場合と、画像パスが変わる場合（画像の再読込が必要）は再利用しません。
+        """
+        w_type = spec.get("type") or ("image" if "image_path" in spec else "text")
+        if isinstance(window, ImageWindow):
+            return w_type == "image" and str(spec.get("image_path") or "") == str(window.config.image_path or "")
+        return w_type == "text"
+
+    def _restore_window_order(self, created: List[Optional[Any]]) -> None:
+        """管理リストの並びをシーンの保存順（created の並び）へ戻します。
+
+        段階的読み込みは表示優先度順に生成し、差分切替は新規分を末尾へ追加するため、
+        そのままだと次の保存やレイヤーのルート順が入れ替わってしまいます。
+        シーン外のウィンドウは相対順を保ったまま末尾に置きます。
+        """
+        rank = {id(w): i for i, w in enumerate(created) if w is not None}
+        if not rank:
+            return
+        wm = self.window_manager
+
+        def _key(window: Any) -> int:
+            return rank.get(id(window), len(created))
+
+        wm.text_windows = sorted(wm.text_windows, key=_key)
+        wm.image_windows = sorted(wm.image_windows, key=_key)
+
+    def _finish_scene_load(
+        self,
+        window_specs: List[Dict[str, Any]],
+        created: List[Optional[Any]],
+        connections_list: List[Dict[str, Any]],
+    ) -> None:
+        """生成済みウィンドウに対して、親子関係・レイヤー順・接続を復元します。
+
+        Args:
+            window_specs: ウィンドウ辞書のリスト。
+            created: window_specs と同じ並びの生成結果（生成できなかった要素は None）。
+            connections_list: 接続情報のリスト。
+        """
+        skipped_text_windows: int = 0
+        skipped_image_windows: int = 0
+        for w_data, window in zip(window_specs, created):
+            if window is not None:
+                continue
+            w_type = w_data.get("type") or ("image" if "image_path" in w_data else "text")
             if w_type == "text":
-                window = self.create_text_window_from_data(w_data)
-                if window is None:
-                    skipped_text_windows += 1
+                skipped_text_windows += 1
             elif w_type == "image":
-                window = self.create_image_window_from_data(w_data)
-                if window is None:
-                    skipped_image_windows += 1
+                skipped_image_windows += 1
 
-            if window and hasattr(window, "uuid"):
-                loaded_windows_map[window.uuid] = window
+        self._restore_window_order(created)
 
-        # 2. 親子関係の復元
+        # 親子関係の復元
         all_wins = self.window_manager.text_windows + self.window_manager.image_windows
         all_map = {w.uuid: w for w in all_wins}
 
-        for w_data in windows_list:
-            if not isinstance(w_data, dict):
-                continue
+        for w_data in window_specs:
             parent_uuid = w_data.get("parent_uuid")
             self_uuid = w_data.get("uuid")
             if parent_uuid and self_uuid in all_map:
@@ -295,7 +684,7 @@ class FileManager:
                 if parent_uuid in all_map:
                     all_map[parent_uuid].add_child_window(child)
 
-        # 2.5 layer_offset（親相対座標）で位置を復元
+        # layer_offset（親相対座標）で位置を復元
         # layer_offset が無効/未設定の場合は、JSON の絶対座標をそのまま使う。
         def _restore_layer_offsets(parent: Any) -> None:
             try:
@@ -321,7 +710,7 @@ class FileManager:
         for root in roots:
             _restore_layer_offsets(root)
 
-        # 2.6 同一親配下の順序を layer_order で復元
+        # 同一親配下の順序を layer_order で復元
         for parent in all_wins:
             children = getattr(parent, "child_windows", None)
             if not children:
@@ -331,9 +720,8 @@ class FileManager:
             except Exception:
                 pass
 
-        # 3. 接続の復元
-        connections_list = normalized.get("connections", [])
-        if isinstance(connections_list, list) and connections_list:
+        # 接続の復元
+        if connections_list:
             self._restore_connections(connections_list)
 
         # --- 追加: 読み込み完了後に念のため全コネクタの位置を更新する（描画遅延対策） ---
@@ -366,6 +754,36 @@ class FileManager:
         except Exception:
             pass
 
+    def _create_scene_windows(
+        self, window_specs: List[Dict[str, Any]], *, select_last: bool = True
+    ) -> List[Optional[Any]]:
+        """シーンのウィンドウ群を生成する。
+
+        WindowManager.create_windows があれば一括生成を使い、無ければ（軽量な代替実装など）
+        1件ずつ create_text_window_from_data / create_image_window_from_data を呼ぶ。
+
+        Args:
+            window_specs: ウィンドウ辞書のリスト。
+            select_last: 最後に生成したウィンドウを選択状態にするかどうか。
+
+        Returns:
+            List[Optional[Any]]: window_specs と同じ並び。生成できなかった要素は None。
+        """
+        create_windows = getattr(self.window_manager, "create_windows", None)
+        if callable(create_windows):
+            return list(create_windows(window_specs, select_last=select_last))
+
+        created: List[Optional[Any]] = []
+        for w_data in window_specs:
+            w_type = w_data.get("type") or ("image" if "image_path" in w_data else "text")
+            window: Optional[Any] = None
+            if w_type == "text":
+                window = self.create_text_window_from_data(w_data)
+            elif w_type == "image":
+                window = self.create_image_window_from_data(w_data)
+            created.append(window)
+        return created
+
     def _normalize_scene_data(self, data: Any) -> Dict[str, Any]:
         """読み込んだデータを「新形式（format_version: 1）」のシーン辞書に正規化する。
 
@@ -464,95 +882,106 @@ class FileManager:
 
                 new_conn = self.window_manager.connectors[-1]
 
-                # プロパティ設定（復元は setter / 変換を通して堅牢化）
-                if "color" in conn_data:
-                    try:
-                        c = QColor(str(conn_data["color"]))
-                        if c.isValid():
-                            if hasattr(new_conn, "set_line_color"):
-                                new_conn.set_line_color(c)
-                            else:
-                                new_conn.line_color = c
-                    except Exception:
-                        pass
+                self._apply_connection_properties(new_conn, conn_data)
 
-                if "width" in conn_data:
-                    try:
-                        new_conn.line_width = int(conn_data["width"])
-                    except Exception:
-                        pass
+    def _apply_connection_properties(self, connector: Any, conn_data: Dict[str, Any]) -> None:
+        """接続データの色・線幅・線種・矢印・ラベルをコネクタへ適用します。
 
-                if "pen_style" in conn_data:
-                    try:
-                        style_val = conn_data["pen_style"]
-                        # まず int へ
-                        try:
-                            style_int = int(getattr(style_val, "value", style_val))
-                        except Exception:
-                            style_int = int(style_val)
-
-                        pen_style = Qt.PenStyle(style_int)
-
-                        # 可能なら set_line_style 経由（updateも含めて安定）
-                        if hasattr(new_conn, "set_line_style"):
-                            new_conn.set_line_style(pen_style)
-                        else:
-                            new_conn.pen_style = pen_style
-                    except Exception:
-                        pass
+        Args:
+            connector: 対象の ConnectorLine。
+            conn_data: 接続情報（get_scene_data の connections 要素）。
+        """
+        # プロパティ設定（復元は setter / 変換を通して堅牢化）
+        if "color" in conn_data:
+            try:
+                c = QColor(str(conn_data["color"]))
+                if c.isValid():
+                    if hasattr(connector, "set_line_color"):
+                        connector.set_line_color(c)
+                    else:
+                        connector.line_color = c
+            except Exception:
+                pass
 
-                if "arrow_style" in conn_data:
-                    try:
-                        from models.enums import ArrowStyle
+        if "width" in conn_data:
+            try:
+                connector.line_width = int(conn_data["width"])
+            except Exception:
+                pass
 
-                        arrow = ArrowStyle(str(conn_data["arrow_style"]))
-                        if hasattr(new_conn, "set_arrow_style"):
-                            new_conn.set_arrow_style(arrow)
-                        else:
-                            new_conn.arrow_style = arrow
-                    except Exception:
-                        # フォールバック（文字列でも落とさない）
-                        try:
-                            new_conn.arrow_style = conn_data["arrow_style"]
-                        except Exception:
-                            pass
-
-                # ラベルデータの復元
-                label_data = conn_data.get("label_data")
-                if label_data and hasattr(new_conn, "label_window") and new_conn.label_window:
-                    try:
-                        config = new_conn.label_window.config
-                        for key, value in label_data.items():
-                            if hasattr(config, key):
-                                if key == "font_size" and isinstance(value, float):
-                                    value = int(value)
-                                setattr(config, key, value)
+        if "pen_style" in conn_data:
+            try:
+                style_val = conn_data["pen_style"]
+                # まず int へ
+                try:
+                    style_int = int(getattr(style_val, "value", style_val))
+                except Exception:
+                    style_int = int(style_val)
 
-                        if hasattr(new_conn.label_window, "auto_detect_offset_mode"):
-                            font = QFont(new_conn.label_window.font_family, int(new_conn.label_window.font_size))
-                            new_conn.label_window.auto_detect_offset_mode(font)
+                pen_style = Qt.PenStyle(style_int)
 
-                        # 追加: easing を runtime へ反映
-                        if hasattr(new_conn.label_window, "_apply_easing_from_config"):
-                            try:
-                                new_conn.label_window._apply_easing_from_config()
-                            except Exception:
-                                pass
+                # 可能なら set_line_style 経由（updateも含めて安定）
+                if hasattr(connector, "set_line_style"):
+                    connector.set_line_style(pen_style)
+                else:
+                    connector.pen_style = pen_style
+            except Exception:
+                pass
 
-                        new_conn.label_window.update_text()
+        if "arrow_style" in conn_data:
+            try:
+                from models.enums import ArrowStyle
 
-                        # 追加: ラベルもアニメ状態を復元
-                        self._resume_window_animations(new_conn.label_window)
+                arrow = ArrowStyle(str(conn_data["arrow_style"]))
+                if hasattr(connector, "set_arrow_style"):
+                    connector.set_arrow_style(arrow)
+                else:
+                    connector.arrow_style = arrow
+            except Exception:
+                # フォールバック（文字列でも落とさない）
+                try:
+                    connector.arrow_style = conn_data["arrow_style"]
+                except Exception:
+                    pass
 
+        # ラベルデータの復元
+        label_data = conn_data.get("label_data")
+        if label_data and hasattr(connector, "label_window") and connector.label_window:
+            try:
+                config = connector.label_window.config
+                for key, value in label_data.items():
+                    if hasattr(config, key):
+                        if key == "font_size" and isinstance(value, float):
+                            value = int(value)
+                        setattr(config, key, value)
+
+                if hasattr(connector.label_window, "auto_detect_offset_mode"):
+                    font = QFont(connector.label_window.font_family, int(connector.label_window.font_size))
+                    connector.label_window.auto_detect_offset_mode(font)
+
+                # 追加: easing を runtime へ反映
+                if hasattr(connector.label_window, "_apply_easing_from_config"):
+                    try:
+                        connector.label_window._apply_easing_from_config()
                     except Exception:
-                        pass  # Failed to restore label data
+                        pass
 
-                new_conn.update()
-                new_conn.update_position()
+                connector.label_window.update_text()
+
+                # 追加: ラベルもアニメ状態を復元
+                self._resume_window_animations(connector.label_window)
+
+            except Exception:
+                pass  # Failed to restore label data
+
+        connector.update()
+        connector.update_position()
 
     def create_text_window_from_data(self, text_data: Dict[str, Any]) -> Optional[TextWindow]:
         """データからTextWindowを生成・構成します。
 
+        生成は WindowManager.create_windows 経由（FREE制限・一括描画の経路を共通化）。
+
         Args:
             text_data (Dict[str, Any]): TextWindow の保存データ。
 
@@ -560,57 +989,9 @@ class FileManager:
             Optional[TextWindow]: 生成されたTextWindow。制限/失敗時は None。
         """
         try:
-            # 座標の解決
-            pos = text_data.get("position", {})
-            pos_x = pos.get("x") if isinstance(pos, dict) else text_data.get("x", 100)
-            pos_y = pos.get("y") if isinstance(pos, dict) else text_data.get("y", 100)
-
-            text_content = text_data.get("text", "Text")
-
-            # --- 重要：生成は WindowManager 経由（FREE制限を確実に効かせる） ---
-            window = self.window_manager.add_text_window(
-                text=text_content,
-                pos=QPoint(int(pos_x), int(pos_y)),
-                suppress_limit_message=True,
-            )
-            if window is None:
-                return None
-
-            # Configの一括適用
-            config_fields = window.config.model_dump().keys()
-            for key, value in text_data.items():
-                if key in config_fields:
-                    if key == "font_size" and isinstance(value, float):
-                        value = int(value)
-                    try:
-                        setattr(window.config, key, value)
-                    except Exception:
-                        pass
-                elif key == "font_color" and isinstance(value, str):
-                    window.config.font_color = value
-
-            # 追加: configに保存された easing を runtime に反映
-            if hasattr(window, "_apply_easing_from_config"):
-                try:
-                    window._apply_easing_from_config()
-                except Exception:
-                    pass
-
-            # 描画とプロパティの適用
-            # ★修正: 読み込み時はデバウンスせず、即時描画してサイズを確定させる（線のズレ防止）
-            if hasattr(window, "_update_text_immediate"):
-                window._update_text_immediate()
-            else:
-                window.update_text()
-
-            window.is_frontmost = window.config.is_frontmost
-            if window.config.is_click_through:
-                window.set_click_through(True)
-
-            # アニメーション状態の復元
-            self._resume_window_animations(window)
-
-            return window
+            spec = dict(text_data)
+            spec["type"] = "text"
+            return self.window_manager.create_windows([spec], select_last=True)[0]
 
         except Exception as e:
             QMessageBox.warning(self.main_window, tr("msg_error"), f"Failed to create text window: {e}")
@@ -641,6 +1022,8 @@ class FileManager:
     def create_image_window_from_data(self, data: Dict[str, Any]) -> Optional[ImageWindow]:
         """データからImageWindowを生成・構成します。
 
+        生成は WindowManager.create_windows 経由（FREE制限・一括描画の経路を共通化）。
+
         Args:
             data (Dict[str, Any]): 画像ウィンドウの構成データ。
 
@@ -648,51 +1031,9 @@ class FileManager:
             Optional[ImageWindow]: 生成されたウィンドウ。制限/失敗時はNone。
         """
         try:
-            image_path = data.get("image_path")
-
-            # 位置の解決（position / geometry の順で優先）
-            pos_x = 0
-            pos_y = 0
-
-            pos = data.get("position")
-            if isinstance(pos, dict):
-                pos_x = int(pos.get("x", 0))
-                pos_y = int(pos.get("y", 0))
-
-            geo = data.get("geometry")
-            if isinstance(geo, dict):
-                # geometry がある場合は、位置だけ geometry を優先しても良い
-                pos_x = int(geo.get("x", pos_x))
-                pos_y = int(geo.get("y", pos_y))
-
-            # --- 重要：生成は WindowManager 経由（FREE制限を確実に効かせる） ---
-            window = self.window_manager.add_image_window(
-                image_path=image_path or "",
-                pos=QPoint(pos_x, pos_y),
-                suppress_limit_message=True,
-            )
-            if window is None:
-                # WindowManager 側で制限メッセージは出る想定（show_limit_message）
-                return None
-
-            # apply_data で各種プロパティ適用（内部で load_image なども走る）
-            if hasattr(window, "apply_data"):
-                window.apply_data(data)
-
-            # 念のため：apply_dataで開始された可能性があるため、一旦止めてから正しいeasingで再開
-            if hasattr(window, "stop_all_animations"):
-                window.stop_all_animations()
-
-            if hasattr(window, "_apply_easing_from_config"):
-                try:
-                    window._apply_easing_from_config()
-                except Exception:
-                    pass
-
-            # 停止した分をここで復元
-            self._resume_window_animations(window)
-
-            return window
+            spec = dict(data)
+            spec["type"] = "image"
+            return self.window_manager.create_windows([spec], select_last=True)[0]
 
         except Exception as e:
             QMessageBox.warning(self.main_window, tr("msg_error"), f"Failed to create image window: {e}")
@@ -707,31 +1048,14 @@ class FileManager:
         """JSONデータを一時ファイル経由で安全に保存する（Atomic Save）。
 
         保存中にクラッシュしても元ファイルが破損しないようにする対策。
+        ユーザーが明示的に保存先を選ぶ操作で使うため、失敗を呼び出し元へ返せるよう同期で書き込む
+        （設定・シーンDBの暗黙保存は utils.write_behind 経由でバックグラウンド化している）。
 
         Args:
             path (str): 保存先パス。
             data (Any): JSONシリアライズ可能なデータ。
         """
-        # 一時ファイル名を作成（同じフォルダに .tmp を付ける）
-        temp_path = f"{path}.tmp"
-
-        try:
-            # 1. 一時ファイルへ書き込み
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-
-            # 2. 書き込み成功後にリネーム（アトミック操作）
-            # Windows/Posix 共に os.replace はアトミックまたはそれに準ずる安全な置換
-            os.replace(temp_path, path)
-
-        except Exception as e:
-            # 失敗時はゴミ（一時ファイル）を掃除してからエラーを再送出
-            if os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except Exception:
-                    pass
-            raise e
+        write_json_atomic(path, data, indent=4, fsync=True)
 
     def save_window_to_json(self, window: Any) -> None:
         """指定されたウィンドウの設定をJSONに保存します（安全保存対応）。
@@ -846,13 +1170,16 @@ class FileManager:
         """現在のシーンをJSONファイルとして保存します（安全保存対応）。"""
         try:
             path, _ = QFileDialog.getSaveFileName(
-                self.main_window, tr("title_save_json"), self.json_directory, "JSON Files (*.json)"
+                self.main_window, tr("title_save_json"), self.json_directory, self.SCENE_SAVE_FILTER
             )
             if not path:
                 return
 
-            # ★Atomic Save
-            self._save_json_atomic(path, self.get_scene_data())
+            # ★Atomic Save（拡張子 .ftivs ならコンパクト形式）
+            if path.lower().endswith(SCENE_STREAM_EXTENSION):
+                write_scene_stream(path, self.get_scene_data())
+            else:
+                self._save_json_atomic(path, self.get_scene_data())
 
             # 成功ログを追加
             logger.info(f"Scene saved successfully to: {path}")
@@ -866,50 +1193,64 @@ class FileManager:
         """JSONファイルを読み込んでシーンに展開します。"""
         try:
             path, _ = QFileDialog.getOpenFileName(
-                self.main_window, tr("menu_load_json"), self.json_directory, "JSON Files (*.json)"
+                self.main_window, tr("menu_load_json"), self.json_directory, self.SCENE_OPEN_FILTER
             )
             if not path:
                 return
 
-            with open(path, "r", encoding="utf-8") as f:
-                self.load_scene_from_data(json.load(f))
+            self.load_scene_from_file(path)
         except Exception as e:
             QMessageBox.critical(self.main_window, tr("msg_error"), f"Error loading JSON: {e}")
             traceback.print_exc()
 
     def save_project_as_json(self) -> None:
-        """プロジェクト全体をJSONファイルとして保存します（安全保存対応）。"""
+        """プロジェクト全体をJSONファイルとして保存します（安全保存対応）。
+
+        拡張子 .ftivz を選んだ場合は、画像を内容ハッシュで同梱したバンドルとして保存します。
+        """
         try:
             path, _ = QFileDialog.getSaveFileName(
-                self.main_window, tr("title_save_project"), self.json_directory, "Project Files (*.json)"
+                self.main_window, tr("title_save_project"), self.json_directory, self.PROJECT_SAVE_FILTER
             )
             if not path:
                 return
 
-            project_data = {
-                "type": "ftiv_project",
-                "version": "1.0",
-                # scenesも保存用にクリーンアップしたコピーを入れる
-                "scenes": self._get_clean_scenes_for_export(),
-                # current_state は get_scene_data() 側でクリーン寄り
-                "current_state": self.get_scene_data(),
-            }
-
-            # 念のため project全体にも None 除去をかける
-            project_data = self._prune_none(project_data)
+            project_data = self._build_project_data()
 
-            # ★Atomic Save
-            self._save_json_atomic(path, project_data)
+            if path.lower().endswith(BUNDLE_EXTENSION):
+                write_project_bundle(path, project_data)
+            else:
+                # ★Atomic Save
+                self._save_json_atomic(path, project_data)
 
         except Exception as e:
             QMessageBox.critical(self.main_window, tr("msg_error"), f"Error saving project: {e}")
             traceback.print_exc()
 
+    def _build_project_data(self) -> Dict[str, Any]:
+        """保存用のプロジェクト辞書（全シーン＋現在のシーン）を組み立てます。"""
+        project_data = {
+            "type": "ftiv_project",
+            "version": "1.0",
+            # scenesも保存用にクリーンアップしたコピーを入れる
+            "scenes": self._get_clean_scenes_for_export(),
+            # current_state は get_scene_data() 側でクリーン寄り
+            "current_state": self.get_scene_data(),
+        }
+
+        # 念のため project全体にも None 除去をかける
+        return self._prune_none(project_data)
+
+    @property
+    def bundle_cache_dir(self) -> str:
+        """バンドル（zip）から展開した画像を置く、内容ハッシュ名のキャッシュディレクトリ。"""
+        return os.path.join(self.json_directory, "bundle_cache")
+
     def load_project_from_json(self) -> None:
-        """プロジェクトJSONファイルを読み込みます。"""
+        """プロジェクトJSONファイル（またはプロジェクトバンドル）を読み込みます。"""
         try:
             path, _ = QFileDialog.getOpenFileName(
-                self.main_window, tr("title_load_project"), self.json_directory, "Project Files (*.json)"
+                self.main_window, tr("title_load_project"), self.json_directory, self.PROJECT_OPEN_FILTER
             )
             if not path:
                 return
@@ -917,80 +1258,245 @@ class FileManager:
             if hasattr(self.main_window, "undo_stack"):
                 self.main_window.undo_stack.clear()
 
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if path.lower().endswith(BUNDLE_EXTENSION) or os.path.basename(path) == MANIFEST_NAME:
+                with ProjectBundle(path) as bundle:
+                    data = bundle.load_project(self.bundle_cache_dir)
+            else:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
 
-            if isinstance(data, list):
-                self.load_scene_from_data(data)
+            if self._apply_project_data(data):
+                # 表示中のウィンドウは必要になった時点で展開済み。残りの画像は裏で展開しておく
+                start_deferred_extraction()
                 return
 
-            if isinstance(data, dict):
-                if data.get("type") == "ftiv_project":
-                    self.main_window.scenes = data.get("scenes", {})
-                    self.save_scenes_db()
-                    self.main_window.refresh_scene_tabs()
-
-                    current = data.get("current_state")
-                    if current:
-                        self.window_manager.clear_all()
-                        self.load_scene_from_data(current)
-                    return
-                elif any(k in data for k in ["windows", "image_path", "text"]):
-                    self.load_scene_from_data(data)
-                    return
-
             QMessageBox.warning(self.main_window, tr("msg_warning"), "Invalid file format.")
         except Exception as e:
             QMessageBox.critical(self.main_window, tr("msg_error"), f"Error loading project: {e}")
             traceback.print_exc()
 
+    def _apply_project_data(self, data: Any) -> bool:
+        """読み込んだプロジェクト（または旧形式のシーン）を適用します。
+
+        Returns:
+            bool: 適用できた場合 True。形式が不正な場合 False。
+        """
+        if isinstance(data, list):
+            self.load_scene_from_data(data)
+            return True
+
+        if isinstance(data, dict):
+            if data.get("type") == "ftiv_project":
+                self.main_window.scenes = data.get("scenes", {})
+                self.save_scenes_db()
+                self.main_window.refresh_scene_tabs()
+
+                current = data.get("current_state")
+                if current:
+                    self.cancel_scene_loading()
+                    self.window_manager.clear_all()
+                    self.load_scene_from_data(current)
+                return True
+            elif any(k in data for k in ["windows", "image_path", "text"]):
+                self.load_scene_from_data(data)
+                return True
+        return False
+
     # ==========================================
     # Scene Database Logic
     # ==========================================
 
+    @property
+    def scene_store(self) -> SceneStore:
+        """シーンDBのシャードストア（scene_db_path と同じフォルダの scenes/ 配下）。"""
+        db_path = str(self.main_window.scene_db_path)
+        store = self._scene_store
+        if store is None or store.legacy_db_path != db_path:
+            root_dir = os.path.join(os.path.dirname(db_path), "scenes")
+            store = SceneStore(root_dir, legacy_db_path=db_path)
+            self._scene_store = store
+        return store
+
+    @property
+    def info_store(self) -> "InfoStore":
+        """保存済みシーンのノート・タスク索引（シーンDBと同じ scenes/ 配下の SQLite）。
+
+        sqlite3 と索引モジュールは、シーンの保存や Info タブの検索で初めて必要になった時点で読み込む。
+        """
+        from managers.info_store import InfoStore
+
+        root_dir = self.scene_store.root_dir
+        store = self._info_store
+        if store is None or os.path.dirname(store.path) != root_dir:
+            if store is not None:
+                store.close()
+            store = InfoStore(os.path.join(root_dir, self.INFO_STORE_FILENAME))
+            self._info_store = store
+            self._info_store_backfilled = False
+        return store
+
+    def _update_info_store(self, label: str, action: Callable[["InfoStore"], None]) -> None:
+        """シーンの保存・削除を索引へ反映します。索引の失敗はシーンの保存には影響させません。"""
+        try:
+            action(self.info_store)
+        except Exception:
+            logger.warning(f"Failed to update info store: {label}", exc_info=True)
+
+    def backfill_info_store(self) -> int:
+        """索引に無い保存済みシーンを読み込んで索引します（1セッションにつき1回）。
+
+        読み込んだシーン本体は main_window.scenes にはキャッシュしません。
+
+        Returns:
+            int: 索引したシーン数。
+        """
+        if self._info_store_backfilled:
+            return 0
+        store = self.info_store
+        self._info_store_backfilled = True
+        indexed = store.indexed_scenes()
+        count = 0
+        for category, entries in list(self.main_window.scenes.items()):
+            if not isinstance(entries, dict):
+                continue
+            for name, body in list(entries.items()):
+                if (category, name) in indexed:
+                    continue
+                try:
+                    if body is None:
+                        body = self.scene_store.load_scene(category, name)
+                    if body is None:
+                        continue
+                    store.index_scene(category, name, body)
+                    count += 1
+                except Exception:
+                    logger.warning(f"Failed to index saved scene: {category}/{name}", exc_info=True)
+        if count:
+            logger.info(f"Indexed {count} saved scenes into the info store")
+        return count
+
+    def locate_saved_window(self, window_uuid: str) -> Optional[Tuple[str, str]]:
+        """ウィンドウを含む保存済みシーン（カテゴリ, シーン名）を返します。"""
+        try:
+            return self.info_store.locate(window_uuid)
+        except Exception:
+            logger.warning(f"Failed to locate saved window: {window_uuid}", exc_info=True)
+            return None
+
     def save_scenes_db(self) -> None:
-        """シーンデータベースを永続化保存します（安全保存対応）。"""
+        """シーンデータベース全体を永続化保存します（安全保存対応）。
+
+        未読込（本体が None）のシーンは既存シャードを書き換えません。
+        1シーン単位の変更は save_scene_entry / delete_scene_entry を使ってください。
+        """
         try:
-            scenes_data = self._get_clean_scenes_for_export()
-            # ★Atomic Save
-            self._save_json_atomic(self.main_window.scene_db_path, scenes_data)
+            scenes_data = self._prune_none(self.main_window.scenes)
+            for category, entries in self.main_window.scenes.items():
+                # _prune_none は None 値（未読込）を落とすため、未読込のシーン名を戻しておく
+                if isinstance(entries, dict):
+                    target = scenes_data.setdefault(category, {})
+                    for name, body in entries.items():
+                        if body is None:
+                            target[name] = None
+            self.scene_store.replace_all(scenes_data)
+        except Exception:
+            logger.error("Failed to save scenes db", exc_info=True)
+            return
+        self._update_info_store("all scenes", lambda store: store.sync_scenes(self.main_window.scenes))
+
+    def get_scene(self, category: str, name: str) -> Optional[Dict[str, Any]]:
+        """シーン本体を返します。未読込ならシャードから読み込んでキャッシュします。
+
+        Args:
+            category: カテゴリ名。
+            name: シーン名。
+
+        Returns:
+            Optional[Dict[str, Any]]: シーンデータ。存在しない場合は None。
+        """
+        entries = self.main_window.scenes.get(category)
+        if not isinstance(entries, dict) or name not in entries:
+            return None
+        body = entries.get(name)
+        if body is None:
+            body = self.scene_store.load_scene(category, name)
+            entries[name] = body
+        return body
+
+    def save_scene_entry(self, category: str, name: str) -> None:
+        """main_window.scenes[category][name] のシャードだけを保存します。"""
+        try:
+            body = self.main_window.scenes.get(category, {}).get(name)
+            if body is None:
+                return
+            self.scene_store.save_scene(category, name, self._prune_none(body))
+        except Exception:
+            logger.error(f"Failed to save scene: {category}/{name}", exc_info=True)
+            return
+        self._update_info_store(f"{category}/{name}", lambda store: store.index_scene(category, name, body))
+
+    def delete_scene_entry(self, category: str, name: str) -> None:
+        """シーンのシャードを削除します。"""
+        try:
+            self.scene_store.delete_scene(category, name)
         except Exception:
-            pass  # Error saving scenes db
+            logger.error(f"Failed to delete scene: {category}/{name}", exc_info=True)
+        self._update_info_store(f"{category}/{name}", lambda store: store.remove_scene(category, name))
+
+    def save_scene_category(self, category: str) -> None:
+        """カテゴリを索引に登録します。"""
+        try:
+            self.scene_store.ensure_category(category)
+        except Exception:
+            logger.error(f"Failed to save scene category: {category}", exc_info=True)
+
+    def delete_scene_category(self, category: str) -> None:
+        """カテゴリと配下のシーンのシャードを削除します。"""
+        try:
+            self.scene_store.delete_category(category)
+        except Exception:
+            logger.error(f"Failed to delete scene category: {category}", exc_info=True)
+        self._update_info_store(category, lambda store: store.remove_category(category))
+
+    def _load_all_scene_bodies(self) -> None:
+        """未読込のシーン本体をすべて読み込みます（エクスポート用）。"""
+        for category, entries in list(self.main_window.scenes.items()):
+            if not isinstance(entries, dict):
+                continue
+            for name in list(entries.keys()):
+                if entries[name] is None:
+                    self.get_scene(category, name)
 
     def load_scenes_db(self) -> None:
-        """シーンデータベースを読み込みます。ファイルがない場合は初期値を設定します。"""
+        """シーンDBの索引を読み込みます。シーン本体は get_scene で初めて読み込まれます。
+
+        索引が無く従来の単一ファイル形式がある場合は、シャード形式へ移行します。
+        ファイルがない場合は初期値を設定します。
+        """
         default_key = "__default__"
         default_aliases = {default_key, "未分類", "Uncategorized"}
 
-        def _normalize_scene_categories(raw: Dict[str, Any]) -> Dict[str, Any]:
-            normalized: Dict[str, Any] = {}
-            for key, value in raw.items():
-                target_key = default_key if key in default_aliases else key
-                if target_key == default_key and target_key in normalized and isinstance(normalized[target_key], dict):
-                    if isinstance(value, dict):
-                        normalized[target_key].update(value)
-                else:
-                    normalized[target_key] = value
-            return normalized
-
-        if not os.path.exists(self.main_window.scene_db_path):
+        store = self.scene_store
+        if not store.has_data():
             self.main_window.scenes = {default_key: {}}
             self.main_window.refresh_scene_tabs()
             return
 
         try:
-            with open(self.main_window.scene_db_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            if isinstance(data, dict):
-                self.main_window.scenes = _normalize_scene_categories(data)
-            else:
-                self.main_window.scenes = {default_key: {}}
-
+            index = store.load_index()
+            # 旧名の既定カテゴリを __default__ に統合
+            for key in list(index.keys()):
+                if key in default_aliases and key != default_key:
+                    store.rename_category(key, default_key)
+                    self._update_info_store(key, lambda info, old=key: info.rename_category(old, default_key))
+            index = store.load_index()
+
+            # 値 None = 未読込（get_scene で読み込む）
+            self.main_window.scenes = {category: dict.fromkeys(names) for category, names in index.items()}
             if not self.main_window.scenes:
                 self.main_window.scenes[default_key] = {}
         except Exception:
-            pass  # Error loading scenes db
+            logger.error("Failed to load scenes db", exc_info=True)
             self.main_window.scenes = {default_key: {}}
 
         self.main_window.refresh_scene_tabs()
@@ -1029,6 +1535,7 @@ class FileManager:
         - None を除去
         """
         try:
+            self._load_all_scene_bodies()
             # まず深いコピー（json経由が簡単で安全）
             scenes_copy = json.loads(json.dumps(self.main_window.scenes, ensure_ascii=False))
 
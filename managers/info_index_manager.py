@@ -1,10 +1,69 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Iterable, List, Literal, Sequence, Tuple, Union
-
-from utils.due_date import compose_due_datetime
+import bisect
+from dataclasses import dataclass, field, replace
+from datetime import datetime, time, timedelta
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Set, Tuple, Union
+
+from managers.info_search_index import InvertedTextIndex, TagFacetIndex
+from utils.due_date import compose_due_datetime, format_due_for_display
+
+
+def _parse_iso_or_min(value: str) -> datetime:
+    text = str(value or "").strip()
+    if not text:
+        return datetime.min
+    try:
+        return datetime.fromisoformat(text)
+    except Exception:
+        return datetime.min
+
+
+def evaluate_due_state(due_at: str, due_dt: Optional[datetime], due_precision: str, now: datetime) -> str:
+    """解析済みの期限から状態を返す: 'overdue' / 'today' / 'upcoming' / 'none' / 'invalid'。
+
+    utils.due_date.classify_due と同じ判定を、文字列の再解析なしで行う。
+    """
+    if not str(due_at or "").strip():
+        return "none"
+    if due_dt is None:
+        return "invalid"
+    if due_precision == "datetime":
+        if due_dt < now:
+            return "overdue"
+        return "today" if due_dt.date() == now.date() else "upcoming"
+    due_day = due_dt.date()
+    today = now.date()
+    if due_day == today:
+        return "today"
+    return "overdue" if due_day < today else "upcoming"
+
+
+def _precompute_item_fields(item: Any) -> None:
+    """インデックス作成時に日時の解析結果・期限の状態と表示文字列を item へ格納する。"""
+    due_dt = compose_due_datetime(
+        due_at=item.due_at,
+        due_time=item.due_time,
+        due_timezone=item.due_timezone,
+        due_precision=item.due_precision,
+    )
+    set_field = object.__setattr__
+    set_field(item, "updated_dt", _parse_iso_or_min(item.updated_at))
+    set_field(item, "created_dt", _parse_iso_or_min(item.created_at))
+    set_field(item, "due_dt", due_dt)
+    set_field(
+        item,
+        "due_text",
+        format_due_for_display(
+            item.due_at,
+            due_time=item.due_time,
+            due_timezone=item.due_timezone,
+            due_precision=item.due_precision,
+        ),
+    )
+    if not item.due_state:
+        set_field(item, "due_state", evaluate_due_state(item.due_at, due_dt, item.due_precision, datetime.now()))
 
 
 @dataclass(frozen=True)
@@ -24,6 +83,17 @@ class TaskIndexItem:
     due_timezone: str
     due_precision: str
     is_archived: bool
+    # 以下は作成時に算出する（due_state は日付の切り替わりで IncrementalInfoIndex が更新する）
+    due_state: str = field(default="", compare=False, repr=False)
+    # 保存済みシーン（InfoStore）由来のアイテムは（カテゴリ, シーン名）。開いているウィンドウは None
+    scene: Optional[Tuple[str, str]] = field(default=None, compare=False, repr=False)
+    updated_dt: datetime = field(init=False, compare=False, repr=False)
+    created_dt: datetime = field(init=False, compare=False, repr=False)
+    due_dt: Optional[datetime] = field(init=False, compare=False, repr=False)
+    due_text: str = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        _precompute_item_fields(self)
 
 
 @dataclass(frozen=True)
@@ -41,6 +111,15 @@ class NoteIndexItem:
     due_timezone: str
     due_precision: str
     is_archived: bool
+    due_state: str = field(default="", compare=False, repr=False)
+    scene: Optional[Tuple[str, str]] = field(default=None, compare=False, repr=False)
+    updated_dt: datetime = field(init=False, compare=False, repr=False)
+    created_dt: datetime = field(init=False, compare=False, repr=False)
+    due_dt: Optional[datetime] = field(init=False, compare=False, repr=False)
+    due_text: str = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        _precompute_item_fields(self)
 
 
 @dataclass(frozen=True)
@@ -110,13 +189,7 @@ class InfoIndexManager:
 
     @staticmethod
     def _parse_iso(value: str) -> datetime:
-        text = str(value or "").strip()
-        if not text:
-            return datetime.min
-        try:
-            return datetime.fromisoformat(text)
-        except Exception:
-            return datetime.min
+        return _parse_iso_or_min(value)
 
     @staticmethod
     def _parse_due_iso(value: str) -> datetime | None:
@@ -128,21 +201,10 @@ class InfoIndexManager:
         except Exception:
             return None
 
-    def _parse_due_for_sort(
-        self,
-        due_at: str,
-        due_time: str = "",
-        due_timezone: str = "",
-        due_precision: str = "date",
-    ) -> datetime:
-        parsed = compose_due_datetime(
-            due_at=due_at,
-            due_time=due_time,
-            due_timezone=due_timezone,
-            due_precision=due_precision,
-        )
+    @staticmethod
+    def _due_sort_value(item: MixedItem) -> datetime:
         # 要件: 不正値は安全側として末尾寄せしやすい datetime.max 扱い
-        return parsed if parsed is not None else datetime.max
+        return item.due_dt if item.due_dt is not None else datetime.max
 
     @staticmethod
     def _normalize_query_filters(query: InfoQuery) -> tuple[str, str]:
@@ -171,49 +233,37 @@ class InfoIndexManager:
         normalized_item = "task" if str(item_mode or "").strip().lower() == "task" else "note"
         return mode == normalized_item
 
-    def _matches_due(
-        self,
-        due_filter: str,
-        due_at: str,
-        due_time: str = "",
-        due_timezone: str = "",
-        due_precision: str = "date",
-    ) -> bool:
+    @staticmethod
+    def _item_matches_due(due_filter: str, item: MixedItem, now: datetime) -> bool:
+        """索引作成時に解析済みの due_dt で期限フィルタ（dated / undated / today / overdue / upcoming）を判定する。"""
         due_mode = str(due_filter or "").strip().lower()
         if due_mode in ("", "all"):
             return True
-
-        due_dt = compose_due_datetime(
-            due_at=due_at,
-            due_time=due_time,
-            due_timezone=due_timezone,
-            due_precision=due_precision,
-        )
+        due_dt = item.due_dt
         if due_mode == "dated":
             return due_dt is not None
         if due_mode == "undated":
             return due_dt is None
-
         if due_dt is None:
             return False
 
-        now = datetime.now()
         today = now.date()
         due_day = due_dt.date()
         if due_mode == "today":
             return due_day == today
+        is_datetime = item.due_precision == "datetime"
         if due_mode == "overdue":
-            precision = str(due_precision or "date").strip().lower()
-            if precision == "datetime":
-                return due_dt < now
-            return due_day < today
+            return due_dt < now if is_datetime else due_day < today
         if due_mode == "upcoming":
-            precision = str(due_precision or "date").strip().lower()
-            if precision == "datetime":
-                return due_dt > now
-            return due_day > today
+            return due_dt > now if is_datetime else due_day > today
         return True
 
+    @staticmethod
+    def _item_due_state(item: MixedItem) -> str:
+        """グループ分け用の期限状態（不正値は 'none' 扱い）。"""
+        state = item.due_state
+        return state if state in ("overdue", "today", "upcoming") else "none"
+
     @staticmethod
     def _build_display_title(title: str, first_line: str, window_uuid: str) -> str:
         if title:
@@ -224,38 +274,74 @@ class InfoIndexManager:
             return f"TextWindow {window_uuid[:8]}"
         return "TextWindow"
 
-    def build_index(self, text_windows: Sequence[Any]) -> tuple[List[TaskIndexItem], List[NoteIndexItem]]:
+    def build_window_items(self, window: Any) -> tuple[List[TaskIndexItem], NoteIndexItem | None]:
+        """1ウィンドウ分のタスク行アイテムとノートアイテムを構築する（未ソート）。"""
+        if window is None:
+            return [], None
+
+        window_uuid = str(getattr(window, "uuid", "") or "")
+        text = str(getattr(window, "text", "") or "")
+        first_line = text.split("\n", 1)[0].strip() if text else ""
+        title = str(getattr(window, "title", "") or "").strip()
+        tags = self._normalize_tags(getattr(window, "tags", []))
+        is_starred = bool(getattr(window, "is_starred", False))
+        created_at = str(getattr(window, "created_at", "") or "")
+        updated_at = str(getattr(window, "updated_at", "") or "")
+        due_at = str(getattr(window, "due_at", "") or "")
+        due_time = str(getattr(window, "due_time", "") or "")
+        due_timezone = str(getattr(window, "due_timezone", "") or "")
+        due_precision = str(getattr(window, "due_precision", "date") or "date").strip().lower()
+        if due_precision not in {"date", "datetime"}:
+            due_precision = "date"
+        is_archived = bool(getattr(window, "is_archived", False))
+        content_mode = str(getattr(window, "content_mode", "note") or "note").lower()
+        display_title = self._build_display_title(title, first_line, window_uuid)
+
+        note_item = NoteIndexItem(
+            window_uuid=window_uuid,
+            title=display_title,
+            first_line=first_line,
+            content_mode="task" if content_mode == "task" else "note",
+            tags=tags,
+            is_starred=is_starred,
+            created_at=created_at,
+            updated_at=updated_at,
+            due_at=due_at,
+            due_time=due_time,
+            due_timezone=due_timezone,
+            due_precision=due_precision,
+            is_archived=is_archived,
+        )
+
         task_items: List[TaskIndexItem] = []
-        note_items: List[NoteIndexItem] = []
+        if content_mode != "task":
+            return task_items, note_item
 
-        for window in list(text_windows or []):
-            if window is None:
+        if hasattr(window, "iter_task_items"):
+            refs: Iterable[Any] = window.iter_task_items()
+        else:
+            lines = text.split("\n")
+            states = list(getattr(window, "task_states", []) or [])
+            refs = [
+                SimpleNamespace(line_index=i, text=lines[i], done=bool(states[i]) if i < len(states) else False)
+                for i in range(len(lines))
+            ]
+
+        for ref in refs:
+            line_index = int(getattr(ref, "line_index", -1))
+            task_text = str(getattr(ref, "text", "") or "")
+            done = bool(getattr(ref, "done", False))
+            if line_index < 0:
                 continue
 
-            window_uuid = str(getattr(window, "uuid", "") or "")
-            text = str(getattr(window, "text", "") or "")
-            first_line = text.split("\n", 1)[0].strip() if text else ""
-            title = str(getattr(window, "title", "") or "").strip()
-            tags = self._normalize_tags(getattr(window, "tags", []))
-            is_starred = bool(getattr(window, "is_starred", False))
-            created_at = str(getattr(window, "created_at", "") or "")
-            updated_at = str(getattr(window, "updated_at", "") or "")
-            due_at = str(getattr(window, "due_at", "") or "")
-            due_time = str(getattr(window, "due_time", "") or "")
-            due_timezone = str(getattr(window, "due_timezone", "") or "")
-            due_precision = str(getattr(window, "due_precision", "date") or "date").strip().lower()
-            if due_precision not in {"date", "datetime"}:
-                due_precision = "date"
-            is_archived = bool(getattr(window, "is_archived", False))
-            content_mode = str(getattr(window, "content_mode", "note") or "note").lower()
-            display_title = self._build_display_title(title, first_line, window_uuid)
-
-            note_items.append(
-                NoteIndexItem(
+            task_items.append(
+                TaskIndexItem(
+                    item_key=f"{window_uuid}:{line_index}",
                     window_uuid=window_uuid,
                     title=display_title,
-                    first_line=first_line,
-                    content_mode="task" if content_mode == "task" else "note",
+                    text=task_text,
+                    line_index=line_index,
+                    done=done,
                     tags=tags,
                     is_starred=is_starred,
                     created_at=created_at,
@@ -267,70 +353,41 @@ class InfoIndexManager:
                     is_archived=is_archived,
                 )
             )
+        return task_items, note_item
 
-            if content_mode != "task":
-                continue
+    def task_sort_key(self, item: TaskIndexItem) -> tuple[Any, ...]:
+        """既定順（更新日時の降順）で並べるためのキー（昇順比較用）。"""
+        return (item.updated_dt, item.created_dt, item.window_uuid, item.line_index)
 
-            if hasattr(window, "iter_task_items"):
-                refs: Iterable[Any] = window.iter_task_items()
-            else:
-                lines = text.split("\n")
-                states = list(getattr(window, "task_states", []) or [])
-                refs = [
-                    {
-                        "line_index": i,
-                        "text": lines[i],
-                        "done": bool(states[i]) if i < len(states) else False,
-                    }
-                    for i in range(len(lines))
-                ]
-
-            for ref in refs:
-                line_index = int(getattr(ref, "line_index", -1))
-                task_text = str(getattr(ref, "text", "") or "")
-                done = bool(getattr(ref, "done", False))
-                if line_index < 0:
-                    continue
+    def note_sort_key(self, item: NoteIndexItem) -> tuple[Any, ...]:
+        """既定順（更新日時の降順）で並べるためのキー（昇順比較用）。"""
+        return (item.updated_dt, item.created_dt, item.window_uuid)
 
-                task_items.append(
-                    TaskIndexItem(
-                        item_key=f"{window_uuid}:{line_index}",
-                        window_uuid=window_uuid,
-                        title=display_title,
-                        text=task_text,
-                        line_index=line_index,
-                        done=done,
-                        tags=tags,
-                        is_starred=is_starred,
-                        created_at=created_at,
-                        updated_at=updated_at,
-                        due_at=due_at,
-                        due_time=due_time,
-                        due_timezone=due_timezone,
-                        due_precision=due_precision,
-                        is_archived=is_archived,
-                    )
-                )
+    def build_index(self, text_windows: Sequence[Any]) -> tuple[List[TaskIndexItem], List[NoteIndexItem]]:
+        task_items: List[TaskIndexItem] = []
+        note_items: List[NoteIndexItem] = []
 
-        task_items.sort(
-            key=lambda item: (
-                self._parse_iso(item.updated_at),
-                self._parse_iso(item.created_at),
-                item.window_uuid,
-                item.line_index,
-            ),
-            reverse=True,
-        )
-        note_items.sort(
-            key=lambda item: (
-                self._parse_iso(item.updated_at),
-                self._parse_iso(item.created_at),
-                item.window_uuid,
-            ),
-            reverse=True,
-        )
+        for window in list(text_windows or []):
+            window_tasks, note_item = self.build_window_items(window)
+            if note_item is None:
+                continue
+            note_items.append(note_item)
+            task_items.extend(window_tasks)
+
+        task_items.sort(key=self.task_sort_key, reverse=True)
+        note_items.sort(key=self.note_sort_key, reverse=True)
         return task_items, note_items
 
+    @staticmethod
+    def task_search_text(item: TaskIndexItem) -> str:
+        """タスク行の検索対象テキスト（タイトル・本文・タグ）。"""
+        return " ".join((item.title, item.text, " ".join(item.tags)))
+
+    @staticmethod
+    def note_search_text(item: NoteIndexItem) -> str:
+        """ノートの検索対象テキスト（タイトル・先頭行・タグ）。"""
+        return " ".join((item.title, item.first_line, " ".join(item.tags)))
+
     @staticmethod
     def _matches_search(search: str, parts: Sequence[str]) -> bool:
         query = str(search or "").strip().lower()
@@ -360,6 +417,7 @@ class InfoIndexManager:
         item_scope, _content_mode_filter = self._normalize_query_filters(query)
         if item_scope == "notes":
             return []
+        now = datetime.now()
         out: List[TaskIndexItem] = []
         for item in list(items or []):
             if archive_scope == "active" and item.is_archived:
@@ -370,17 +428,11 @@ class InfoIndexManager:
                 continue
             if query.open_tasks_only and item.done:
                 continue
-            if not self._matches_due(
-                query.due_filter,
-                item.due_at,
-                due_time=item.due_time,
-                due_timezone=item.due_timezone,
-                due_precision=item.due_precision,
-            ):
+            if not self._item_matches_due(query.due_filter, item, now):
                 continue
             if not self._matches_tag(query.tag, item.tags):
                 continue
-            if not self._matches_search(query.text, [item.title, item.text, " ".join(item.tags)]):
+            if not self._matches_search(query.text, [self.task_search_text(item)]):
                 continue
             out.append(item)
         return self._sort_tasks(out, query)
@@ -388,6 +440,7 @@ class InfoIndexManager:
     def query_notes(self, items: Sequence[NoteIndexItem], query: InfoQuery) -> List[NoteIndexItem]:
         archive_scope = self._effective_archive_scope(query)
         item_scope, content_mode_filter = self._normalize_query_filters(query)
+        now = datetime.now()
         out: List[NoteIndexItem] = []
         for item in list(items or []):
             if archive_scope == "active" and item.is_archived:
@@ -402,17 +455,11 @@ class InfoIndexManager:
                 continue
             if query.starred_only and not item.is_starred:
                 continue
-            if not self._matches_due(
-                query.due_filter,
-                item.due_at,
-                due_time=item.due_time,
-                due_timezone=item.due_timezone,
-                due_precision=item.due_precision,
-            ):
+            if not self._item_matches_due(query.due_filter, item, now):
                 continue
             if not self._matches_tag(query.tag, item.tags):
                 continue
-            if not self._matches_search(query.text, [item.title, item.first_line, " ".join(item.tags)]):
+            if not self._matches_search(query.text, [self.note_search_text(item)]):
                 continue
             out.append(item)
         return self._sort_notes(out, query)
@@ -430,41 +477,17 @@ class InfoIndexManager:
         if sort_by == "due":
             return sorted(
                 items,
-                key=lambda item: (
-                    self._parse_due_for_sort(
-                        item.due_at,
-                        due_time=item.due_time,
-                        due_timezone=item.due_timezone,
-                        due_precision=item.due_precision,
-                    ),
-                    self._parse_iso(item.updated_at),
-                    item.window_uuid,
-                    item.line_index,
-                ),
+                key=lambda item: (self._due_sort_value(item), item.updated_dt, item.window_uuid, item.line_index),
                 reverse=reverse,
             )
         if sort_by == "created":
             return sorted(
                 items,
-                key=lambda item: (
-                    self._parse_iso(item.created_at),
-                    self._parse_iso(item.updated_at),
-                    item.window_uuid,
-                    item.line_index,
-                ),
+                key=lambda item: (item.created_dt, item.updated_dt, item.window_uuid, item.line_index),
                 reverse=reverse,
             )
         # default: updated
-        return sorted(
-            items,
-            key=lambda item: (
-                self._parse_iso(item.updated_at),
-                self._parse_iso(item.created_at),
-                item.window_uuid,
-                item.line_index,
-            ),
-            reverse=reverse,
-        )
+        return sorted(items, key=self.task_sort_key, reverse=reverse)
 
     def _sort_notes(self, items: List[NoteIndexItem], query: InfoQuery) -> List[NoteIndexItem]:
         sort_by = str(query.sort_by or "updated").strip().lower()
@@ -475,65 +498,29 @@ class InfoIndexManager:
         if sort_by == "due":
             return sorted(
                 items,
-                key=lambda item: (
-                    self._parse_due_for_sort(
-                        item.due_at,
-                        due_time=item.due_time,
-                        due_timezone=item.due_timezone,
-                        due_precision=item.due_precision,
-                    ),
-                    self._parse_iso(item.updated_at),
-                    item.window_uuid,
-                ),
+                key=lambda item: (self._due_sort_value(item), item.updated_dt, item.window_uuid),
                 reverse=reverse,
             )
         if sort_by == "created":
             return sorted(
                 items,
-                key=lambda item: (
-                    self._parse_iso(item.created_at),
-                    self._parse_iso(item.updated_at),
-                    item.window_uuid,
-                ),
+                key=lambda item: (item.created_dt, item.updated_dt, item.window_uuid),
                 reverse=reverse,
             )
         # default: updated
-        return sorted(
-            items,
-            key=lambda item: (
-                self._parse_iso(item.updated_at),
-                self._parse_iso(item.created_at),
-                item.window_uuid,
-            ),
-            reverse=reverse,
-        )
+        return sorted(items, key=self.note_sort_key, reverse=reverse)
 
     def build_stats(self, tasks: Sequence[TaskIndexItem], notes: Sequence[NoteIndexItem]) -> InfoStats:
         open_tasks = 0
         done_tasks = 0
         overdue_tasks = 0
-        now = datetime.now()
-        today = now.date()
 
         for item in list(tasks or []):
             if item.done:
                 done_tasks += 1
                 continue
             open_tasks += 1
-            due_dt = compose_due_datetime(
-                due_at=item.due_at,
-                due_time=item.due_time,
-                due_timezone=item.due_timezone,
-                due_precision=item.due_precision,
-            )
-            precision = str(item.due_precision or "date").strip().lower()
-            if due_dt is None:
-                continue
-            if precision == "datetime":
-                is_overdue = due_dt < now
-            else:
-                is_overdue = due_dt.date() < today
-            if is_overdue:
+            if item.due_state == "overdue":
                 overdue_tasks += 1
 
         starred_notes = sum(1 for note in list(notes or []) if bool(note.is_starred))
@@ -544,36 +531,6 @@ class InfoIndexManager:
             starred_notes=starred_notes,
         )
 
-    def _classify_due_state(
-        self,
-        due_at: str,
-        due_time: str = "",
-        due_timezone: str = "",
-        due_precision: str = "date",
-    ) -> str:
-        """期限の状態を返す: 'overdue' / 'today' / 'upcoming' / 'none'."""
-        due_dt = compose_due_datetime(
-            due_at=due_at,
-            due_time=due_time,
-            due_timezone=due_timezone,
-            due_precision=due_precision,
-        )
-        if due_dt is None:
-            return "none"
-        now = datetime.now()
-        today = now.date()
-        due_day = due_dt.date()
-        precision = str(due_precision or "date").strip().lower()
-        if precision == "datetime":
-            if due_dt < now:
-                return "overdue"
-        else:
-            if due_day < today:
-                return "overdue"
-        if due_day == today:
-            return "today"
-        return "upcoming"
-
     def group_tasks_smart(self, items: List[TaskIndexItem]) -> List[GroupedTasks]:
         """タスクを 期限切れ→今日→スター付き→その他 にグループ分けする。"""
         overdue: List[TaskIndexItem] = []
@@ -583,12 +540,7 @@ class InfoIndexManager:
 
         for item in list(items or []):
             if not item.done:
-                due_state = self._classify_due_state(
-                    item.due_at,
-                    due_time=item.due_time,
-                    due_timezone=item.due_timezone,
-                    due_precision=item.due_precision,
-                )
+                due_state = self._item_due_state(item)
                 if due_state == "overdue":
                     overdue.append(item)
                     continue
@@ -722,12 +674,7 @@ class InfoIndexManager:
 
         for item in list(tasks or []):
             if not item.done:
-                due_state = self._classify_due_state(
-                    item.due_at,
-                    due_time=item.due_time,
-                    due_timezone=item.due_timezone,
-                    due_precision=item.due_precision,
-                )
+                due_state = self._item_due_state(item)
                 if due_state == "overdue":
                     overdue.append(item)
                     continue
@@ -795,3 +742,400 @@ class InfoIndexManager:
             label = f"{title}{star_mark} ({len(bucket)})"
             groups.append(GroupedMixed(label=label, group_key=f"window:{uid}", items=bucket))
         return groups
+
+
+@dataclass
+class _WindowEntry:
+    window: Any
+    token: Any
+    config: Any
+    task_items: List[TaskIndexItem]
+    task_keys: List[tuple[Any, ...]]
+    note_item: NoteIndexItem | None
+    note_key: tuple[Any, ...] | None
+
+
+class IncrementalInfoIndex:
+    """ウィンドウ単位で差分更新する情報インデックス。
+
+    タスク行・ノートのアイテムを既定順（更新日時の降順）のソート済み列として保持し、
+    変更のあったウィンドウのアイテムだけを取り除いて二分探索で挿入し直す。
+    変更判定は config の dump_revision（無ければ主要属性のシグネチャ）で行い、
+    本文全体のハッシュは取らない。
+    全文検索の転置インデックスとタグのファセット索引も同じ差分で更新する。
+
+    Attributes:
+        revision: 索引の内容が変わるたびに増える番号。
+        rebuilt_window_count: アイテムを作り直したウィンドウの累計数。
+    """
+
+    def __init__(self, manager: Optional[InfoIndexManager] = None) -> None:
+        self.manager = manager or InfoIndexManager()
+        self._entries: Dict[int, _WindowEntry] = {}
+        # 昇順のキー列とアイテム列（公開時に反転した降順を返す）
+        self._task_keys: List[tuple[Any, ...]] = []
+        self._task_items: List[TaskIndexItem] = []
+        self._note_keys: List[tuple[Any, ...]] = []
+        self._note_items: List[NoteIndexItem] = []
+        self._tasks_desc: Optional[List[TaskIndexItem]] = None
+        self._notes_desc: Optional[List[NoteIndexItem]] = None
+        # 全文検索用の転置インデックス（文書 ID は id(アイテム)）
+        self._search_index = InvertedTextIndex()
+        self._tag_index = TagFacetIndex()
+        self._items_by_id: Dict[int, MixedItem] = {}
+        # 時刻指定の期限（昇順）。日付単位の期限は深夜0時にまとめて再評価する
+        self._due_points: List[datetime] = []
+        self.revision: int = 0
+        self.rebuilt_window_count: int = 0
+
+    @property
+    def window_count(self) -> int:
+        """索引済みのウィンドウ数。"""
+        return len(self._entries)
+
+    @property
+    def task_items(self) -> List[TaskIndexItem]:
+        """タスク行アイテム（更新日時の降順）。変更が無ければ同じリストを返す。"""
+        if self._tasks_desc is None:
+            self._tasks_desc = self._task_items[::-1]
+        return self._tasks_desc
+
+    @property
+    def note_items(self) -> List[NoteIndexItem]:
+        """ノートアイテム（更新日時の降順）。変更が無ければ同じリストを返す。"""
+        if self._notes_desc is None:
+            self._notes_desc = self._note_items[::-1]
+        return self._notes_desc
+
+    @staticmethod
+    def window_signature(window: Any) -> tuple[Any, ...]:
+        """dump_revision を持たないウィンドウ用の変更判定シグネチャ。"""
+        text = str(getattr(window, "text", "") or "")
+        raw_tags = getattr(window, "tags", [])
+        tags = (
+            tuple(str(raw or "").strip().lower() for raw in raw_tags if str(raw or "").strip())
+            if isinstance(raw_tags, list)
+            else ()
+        )
+        raw_states = getattr(window, "task_states", [])
+        states = tuple(bool(v) for v in raw_states) if isinstance(raw_states, list) else ()
+        return (
+            str(getattr(window, "uuid", "") or ""),
+            str(getattr(window, "updated_at", "") or ""),
+            str(getattr(window, "content_mode", "note") or "note").strip().lower(),
+            bool(getattr(window, "is_archived", False)),
+            bool(getattr(window, "is_starred", False)),
+            str(getattr(window, "title", "") or ""),
+            tags,
+            str(getattr(window, "due_at", "") or ""),
+            str(getattr(window, "due_time", "") or ""),
+            str(getattr(window, "due_timezone", "") or ""),
+            str(getattr(window, "due_precision", "date") or "date").strip().lower(),
+            text,
+            states,
+        )
+
+    @classmethod
+    def _change_token(cls, window: Any) -> tuple[Any, Any]:
+        config = getattr(window, "config", None)
+        revision = getattr(config, "dump_revision", None)
+        if isinstance(revision, int):
+            # config が差し替えられた場合に備えて、同一オブジェクトかどうかも判定に含める
+            return config, (id(config), revision)
+        return None, cls.window_signature(window)
+
+    def _is_current(self, entry: _WindowEntry | None, window: Any) -> bool:
+        if entry is None or entry.window is not window:
+            return False
+        config, token = self._change_token(window)
+        return entry.config is config and entry.token == token
+
+    def sync(self, windows: Sequence[Any]) -> bool:
+        """ウィンドウ一覧と突き合わせ、追加・変更・削除されたウィンドウだけを反映する。
+
+        Returns:
+            bool: 索引が変化した場合 True。
+        """
+        changed = False
+        seen: set[int] = set()
+        for window in list(windows or []):
+            if window is None:
+                continue
+            key = id(window)
+            seen.add(key)
+            if self._is_current(self._entries.get(key), window):
+                continue
+            changed = self._reindex(window) or changed
+        for key in [k for k in self._entries if k not in seen]:
+            self._remove_entry(key)
+            changed = True
+        return changed
+
+    def update_windows(self, windows: Iterable[Any]) -> bool:
+        """指定したウィンドウだけを再索引する（変更イベント経由の更新用）。
+
+        Returns:
+            bool: 索引が変化した場合 True。
+        """
+        changed = False
+        for window in windows:
+            if window is None or self._is_current(self._entries.get(id(window)), window):
+                continue
+            changed = self._reindex(window) or changed
+        return changed
+
+    def contains(self, window: Any) -> bool:
+        """ウィンドウが索引済みかどうか。"""
+        return id(window) in self._entries
+
+    def remove_window(self, window: Any) -> bool:
+        """ウィンドウのアイテムを索引から取り除く。"""
+        if id(window) not in self._entries:
+            return False
+        self._remove_entry(id(window))
+        return True
+
+    def clear(self) -> None:
+        """索引を空にする。"""
+        self._entries.clear()
+        self._task_keys.clear()
+        self._task_items.clear()
+        self._note_keys.clear()
+        self._note_items.clear()
+        self._search_index.clear()
+        self._tag_index.clear()
+        self._items_by_id.clear()
+        self._due_points.clear()
+        self._touch()
+
+    def _touch(self) -> None:
+        self._tasks_desc = None
+        self._notes_desc = None
+        self.revision += 1
+
+    def _reindex(self, window: Any) -> bool:
+        key = id(window)
+        config, token = self._change_token(window)
+        mgr = self.manager
+        task_items, note_item = mgr.build_window_items(window)
+        self.rebuilt_window_count += 1
+
+        previous = self._entries.get(key)
+        if previous is not None and previous.window is window:
+            if (
+                previous.task_items == task_items
+                and previous.note_item == note_item
+                and self._due_states(previous.task_items, previous.note_item) == self._due_states(task_items, note_item)
+            ):
+                # 色やフォントなど一覧に出ない変更: 並びも内容も変わらない
+                previous.token = token
+                previous.config = config
+                return False
+            self._remove_entry(key)
+        elif previous is not None:
+            self._remove_entry(key)
+        entry = _WindowEntry(
+            window=window,
+            token=token,
+            config=config,
+            task_items=task_items,
+            task_keys=[mgr.task_sort_key(item) for item in task_items],
+            note_item=note_item,
+            note_key=mgr.note_sort_key(note_item) if note_item is not None else None,
+        )
+        for sort_key, item in zip(entry.task_keys, entry.task_items):
+            index = bisect.bisect_right(self._task_keys, sort_key)
+            self._task_keys.insert(index, sort_key)
+            self._task_items.insert(index, item)
+            self._add_search_item(item, mgr.task_search_text(item))
+        if entry.note_item is not None and entry.note_key is not None:
+            index = bisect.bisect_right(self._note_keys, entry.note_key)
+            self._note_keys.insert(index, entry.note_key)
+            self._note_items.insert(index, entry.note_item)
+            self._add_search_item(entry.note_item, mgr.note_search_text(entry.note_item))
+        self._entries[key] = entry
+        self._touch()
+        return True
+
+    @staticmethod
+    def _due_states(task_items: List[TaskIndexItem], note_item: NoteIndexItem | None) -> tuple[str, ...]:
+        return (*(item.due_state for item in task_items), note_item.due_state if note_item is not None else "")
+
+    def _remove_entry(self, key: int) -> None:
+        entry = self._entries.pop(key)
+        for sort_key, item in zip(entry.task_keys, entry.task_items):
+            self._remove_sorted(self._task_keys, self._task_items, sort_key, item)
+            self._remove_search_item(item)
+        if entry.note_item is not None and entry.note_key is not None:
+            self._remove_sorted(self._note_keys, self._note_items, entry.note_key, entry.note_item)
+            self._remove_search_item(entry.note_item)
+        self._touch()
+
+    def _add_search_item(self, item: MixedItem, text: str) -> None:
+        self._items_by_id[id(item)] = item
+        self._search_index.add(id(item), text)
+        self._tag_index.add(id(item), item.tags)
+        if item.due_precision == "datetime" and item.due_dt is not None:
+            bisect.insort(self._due_points, item.due_dt)
+
+    def _remove_search_item(self, item: MixedItem) -> None:
+        self._items_by_id.pop(id(item), None)
+        self._search_index.remove(id(item))
+        self._tag_index.remove(id(item))
+        if item.due_precision == "datetime" and item.due_dt is not None:
+            index = bisect.bisect_left(self._due_points, item.due_dt)
+            if index < len(self._due_points) and self._due_points[index] == item.due_dt:
+                del self._due_points[index]
+
+    # ==========================================
+    # Due state rollover
+    # ==========================================
+
+    def next_due_boundary(self, now: Optional[datetime] = None) -> datetime:
+        """期限の状態が次に変わりうる時刻（次の深夜0時、またはそれより前の時刻指定の期限）。"""
+        now = now or datetime.now()
+        boundary = datetime.combine(now.date() + timedelta(days=1), time())
+        index = bisect.bisect_right(self._due_points, now)
+        if index < len(self._due_points) and self._due_points[index] < boundary:
+            return self._due_points[index]
+        return boundary
+
+    def refresh_due_states(self, now: Optional[datetime] = None, windows: Optional[Iterable[Any]] = None) -> bool:
+        """アイテムの期限状態を now 時点で再評価し、変わったアイテムだけを差し替える。
+
+        文字列の再解析はせず、作成時に解析した due_dt との比較だけで判定する。
+
+        Args:
+            now: 判定時刻。
+            windows: 再評価するウィンドウ（DueScheduler の通知分）。省略時は全ウィンドウ。
+
+        Returns:
+            bool: 状態が変わったアイテムがあった場合 True。
+        """
+        now = now or datetime.now()
+        changed = False
+        mgr = self.manager
+        if windows is None:
+            entries: Iterable[_WindowEntry] = list(self._entries.values())
+        else:
+            entries = [e for e in (self._entries.get(id(w)) for w in windows) if e is not None]
+        for entry in entries:
+            for position, item in enumerate(entry.task_items):
+                state = evaluate_due_state(item.due_at, item.due_dt, item.due_precision, now)
+                if state == item.due_state:
+                    continue
+                updated = replace(item, due_state=state)
+                entry.task_items[position] = updated
+                self._swap_sorted(self._task_keys, self._task_items, entry.task_keys[position], item, updated)
+                self._remove_search_item(item)
+                self._add_search_item(updated, mgr.task_search_text(updated))
+                changed = True
+            note = entry.note_item
+            if note is None or entry.note_key is None:
+                continue
+            state = evaluate_due_state(note.due_at, note.due_dt, note.due_precision, now)
+            if state == note.due_state:
+                continue
+            updated_note = replace(note, due_state=state)
+            entry.note_item = updated_note
+            self._swap_sorted(self._note_keys, self._note_items, entry.note_key, note, updated_note)
+            self._remove_search_item(note)
+            self._add_search_item(updated_note, mgr.note_search_text(updated_note))
+            changed = True
+        if changed:
+            self._touch()
+        return changed
+
+    @staticmethod
+    def _swap_sorted(
+        keys: List[tuple[Any, ...]], items: List[Any], sort_key: tuple[Any, ...], old: Any, new: Any
+    ) -> None:
+        index = bisect.bisect_left(keys, sort_key)
+        while index < len(keys) and keys[index] == sort_key:
+            if items[index] is old:
+                items[index] = new
+                return
+            index += 1
+
+    def search(self, text: str) -> Optional[tuple[List[TaskIndexItem], List[NoteIndexItem]]]:
+        """全文検索に一致したタスク行・ノートを返す（順不同。並べ替えは query_* で行う）。
+
+        ラテン文字は単語の前方一致、日本語は文字 bigram で照合し、複数語は AND で絞り込む。
+
+        Returns:
+            Optional[tuple]: (タスク行, ノート)。記号のみなど索引で扱えないクエリの場合は None。
+        """
+        doc_ids = self._search_index.search(text)
+        if doc_ids is None:
+            return None
+        return self._split_docs(doc_ids)
+
+    def narrow(self, query: InfoQuery) -> tuple[List[TaskIndexItem], List[NoteIndexItem], InfoQuery]:
+        """全文検索とタグ絞り込みを索引で解決し、候補アイテムと残りの条件を返す。
+
+        索引で解決できた条件はクエリから外す（text / tag を空にする）ため、
+        query_tasks / query_notes では残りの条件だけを各アイテムに適用すればよい。
+
+        Returns:
+            tuple: (候補タスク行, 候補ノート, 残りのクエリ)。候補は順不同。
+                どちらの条件も索引で扱えない場合は全アイテムと元のクエリを返す。
+        """
+        doc_ids: Optional[Set[int]] = None
+        rest = query
+        if query.text:
+            found = self._search_index.search(query.text)
+            if found is not None:
+                doc_ids = found
+                rest = replace(rest, text="")
+        if str(query.tag or "").strip():
+            found = self._tag_index.match(query.tag)
+            doc_ids = found if doc_ids is None else doc_ids & found
+            rest = replace(rest, tag="")
+        if doc_ids is None:
+            return self.task_items, self.note_items, query
+        tasks, notes = self._split_docs(doc_ids)
+        return tasks, notes, rest
+
+    def _split_docs(self, doc_ids: Iterable[int]) -> tuple[List[TaskIndexItem], List[NoteIndexItem]]:
+        tasks: List[TaskIndexItem] = []
+        notes: List[NoteIndexItem] = []
+        for doc_id in doc_ids:
+            item = self._items_by_id.get(doc_id)
+            if isinstance(item, TaskIndexItem):
+                tasks.append(item)
+            elif isinstance(item, NoteIndexItem):
+                notes.append(item)
+        return tasks, notes
+
+    # ==========================================
+    # Tag facet
+    # ==========================================
+
+    def all_tags(self) -> List[str]:
+        """索引済みのタグ一覧（大文字小文字を区別しない昇順）。"""
+        return self._tag_index.tags()
+
+    def tag_counts(self, items: Optional[Iterable[MixedItem]] = None) -> Dict[str, int]:
+        """タグごとのアイテム数を返す。
+
+        Args:
+            items: 数える対象（現在の絞り込み結果など）。None の場合は索引済みの全アイテム。
+        """
+        if items is None:
+            return self._tag_index.counts()
+        return self._tag_index.counts(id(item) for item in items)
+
+    def complete_tags(self, prefix: str, limit: int = 20) -> List[str]:
+        """入力補完用に、前方一致するタグを使用数の多い順に返す。"""
+        return self._tag_index.complete(prefix, limit)
+
+    @staticmethod
+    def _remove_sorted(keys: List[tuple[Any, ...]], items: List[Any], sort_key: tuple[Any, ...], item: Any) -> None:
+        index = bisect.bisect_left(keys, sort_key)
+        # 同じキー（uuid 重複など）の並びから同一オブジェクトを探す
+        while index < len(keys) and keys[index] == sort_key:
+            if items[index] is item:
+                del keys[index]
+                del items[index]
+                return
+            index += 1
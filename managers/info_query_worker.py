@@ -0,0 +1,327 @@
+# managers/info_query_worker.py
+"""Info タブの絞り込み・並べ替え・グループ化をワーカースレッドで実行する。
+
+GUI スレッドはインデックスの不変スナップショット（アイテムのタプルとクエリ）を渡すだけにし、
+query_tasks / query_notes / build_stats / group_* はワーカーで実行する。
+スナップショットには世代番号を付け、新しい要求が来たら古い要求は実行前に破棄し、
+実行中のものも段階の合間で打ち切る。古い世代の結果は受け取り側でも捨てる。
+件数の少ない要求はスレッドの往復の方が高くつくため、呼び出し元スレッドでその場で実行する。
+保存済みシーンを含める場合は、InfoStore への SQL クエリもワーカー側で行う。
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, fields
+from typing import Callable, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, Signal
+
+from managers.info_index_manager import (
+    GroupedMixed,
+    GroupedNotes,
+    GroupedTasks,
+    InfoIndexManager,
+    InfoQuery,
+    InfoStats,
+    NoteIndexItem,
+    TaskIndexItem,
+)
+from managers.info_store import InfoStore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SavedScenesQuery:
+    """保存済みシーン（InfoStore）に対するクエリ。
+
+    Attributes:
+        store: 問い合わせ先のストア。
+        query: 絞り込み条件（索引で解決済みの条件も外さない元のクエリ）。
+        exclude_window_uuids: 開いているウィンドウ。開いている側の最新の内容を優先するため除外する。
+        limit: タスク行・ノートそれぞれの件数上限。統計は上限に関係なく全件で数える。
+    """
+
+    store: InfoStore
+    query: InfoQuery
+    exclude_window_uuids: Tuple[str, ...] = ()
+    limit: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class InfoQuerySnapshot:
+    """ワーカーへ渡すクエリ要求。アイテムは不変（frozen dataclass）のタプルで持つ。"""
+
+    generation: int
+    tasks: Tuple[TaskIndexItem, ...]
+    notes: Tuple[NoteIndexItem, ...]
+    query: InfoQuery
+    group_by: str
+    saved_scenes: Optional[SavedScenesQuery] = None
+
+
+@dataclass(frozen=True)
+class InfoQueryResult:
+    """クエリ・統計・グループ化の結果。"""
+
+    generation: int
+    tasks: List[TaskIndexItem]
+    notes: List[NoteIndexItem]
+    stats: InfoStats
+    task_groups: List[GroupedTasks]
+    note_groups: List[GroupedNotes]
+    mixed_groups: List[GroupedMixed]
+    elapsed_ms: float
+
+
+class _Superseded(Exception):
+    """新しい世代の要求が来たため、実行中の要求を打ち切る。"""
+
+
+def build_info_groups(
+    manager: InfoIndexManager, group_by: str, tasks: List[TaskIndexItem], notes: List[NoteIndexItem]
+) -> tuple[List[GroupedTasks], List[GroupedNotes], List[GroupedMixed]]:
+    """group_by（smart / tag / window / flat）に応じてタスク・ノート・統合一覧をグループ化する。"""
+    if group_by == "flat":
+        return [], [], []
+    if group_by == "tag":
+        return (
+            manager.group_tasks_by_tag(tasks),
+            manager.group_notes_by_tag(notes),
+            manager.group_mixed_by_tag(tasks, notes),
+        )
+    if group_by == "window":
+        return (
+            manager.group_tasks_by_window(tasks),
+            manager.group_notes_by_window(notes),
+            manager.group_mixed_by_window(tasks, notes),
+        )
+    return (
+        manager.group_tasks_smart(tasks),
+        manager.group_notes_smart(notes),
+        manager.group_mixed_smart(tasks, notes),
+    )
+
+
+def _query_saved_scenes(
+    saved: SavedScenesQuery,
+) -> tuple[List[TaskIndexItem], List[NoteIndexItem], InfoStats]:
+    """保存済みシーンを問い合わせる。ストアが使えない場合は空の結果にする（開いているウィンドウの結果は返す）。"""
+    store = saved.store
+    excluded = saved.exclude_window_uuids
+    try:
+        tasks = store.query_tasks(saved.query, limit=saved.limit, exclude_window_uuids=excluded)
+        notes = store.query_notes(saved.query, limit=saved.limit, exclude_window_uuids=excluded)
+        stats = store.build_stats(saved.query, exclude_window_uuids=excluded)
+    except Exception:
+        logger.warning("Info store query failed; showing open windows only", exc_info=True)
+        return [], [], InfoStats()
+    return tasks, notes, stats
+
+
+def run_info_query(
+    manager: InfoIndexManager,
+    snapshot: InfoQuerySnapshot,
+    is_stale: Optional[Callable[[], bool]] = None,
+) -> Optional[InfoQueryResult]:
+    """スナップショットに対してクエリ・統計・グループ化を実行する。
+
+    Args:
+        manager: クエリ関数を提供する InfoIndexManager。
+        snapshot: 実行する要求。
+        is_stale: 段階の合間に呼ばれ、True を返したら打ち切る。
+
+    Returns:
+        Optional[InfoQueryResult]: 結果。打ち切った場合は None。
+    """
+
+    def checkpoint() -> None:
+        if is_stale is not None and is_stale():
+            raise _Superseded()
+
+    started = time.perf_counter()
+    try:
+        tasks = manager.query_tasks(snapshot.tasks, snapshot.query)
+        checkpoint()
+        notes = manager.query_notes(snapshot.notes, snapshot.query)
+        checkpoint()
+        stats = manager.build_stats(tasks, notes)
+        saved = snapshot.saved_scenes
+        if saved is not None:
+            saved_tasks, saved_notes, saved_stats = _query_saved_scenes(saved)
+            checkpoint()
+            # どちらも並べ替え済みのため、結合後の並べ替えはほぼ併合だけで済む
+            tasks = manager._sort_tasks(tasks + saved_tasks, saved.query)
+            notes = manager._sort_notes(notes + saved_notes, saved.query)
+            stats = InfoStats(*(getattr(stats, f.name) + getattr(saved_stats, f.name) for f in fields(InfoStats)))
+        task_groups, note_groups, mixed_groups = build_info_groups(manager, snapshot.group_by, tasks, notes)
+        checkpoint()
+    except _Superseded:
+        return None
+    return InfoQueryResult(
+        generation=snapshot.generation,
+        tasks=tasks,
+        notes=notes,
+        stats=stats,
+        task_groups=task_groups,
+        note_groups=note_groups,
+        mixed_groups=mixed_groups,
+        elapsed_ms=(time.perf_counter() - started) * 1000.0,
+    )
+
+
+class InfoQueryWorker(QObject):
+    """最新の要求だけを実行するクエリワーカー。
+
+    submit() は待ち中の要求を置き換える（実行前に破棄された要求は superseded_count に数える）。
+    結果は finished シグナルで GUI スレッドへ届く。受け取り側は世代番号を
+    latest_generation と比べ、古い結果を捨てること。
+    アイテム数が inline_item_limit 以下で保存済みシーンを含まない要求は、
+    submit() の中でその場で実行し、finished も直接発行する。
+
+    Attributes:
+        inline_item_limit: その場で実行するアイテム数（タスク＋ノート）の上限。0 で常にワーカー。
+        completed_count: 結果を返した回数。
+        superseded_count: 新しい要求に置き換えられて実行・通知しなかった回数。
+    """
+
+    finished = Signal(object)
+
+    def __init__(
+        self,
+        manager: InfoIndexManager,
+        *,
+        synchronous: Optional[bool] = None,
+        inline_item_limit: int = 0,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        """InfoQueryWorkerを初期化します。
+
+        Args:
+            manager: クエリ関数を提供する InfoIndexManager。
+            synchronous: submit 時にその場で実行するか。None の場合は FTIV_TEST_MODE=1 のとき同期。
+            inline_item_limit: この件数以下の要求はワーカーへ渡さずその場で実行する。
+            parent: 親 QObject。
+        """
+        super().__init__(parent)
+        self.manager = manager
+        self._synchronous: Optional[bool] = synchronous
+        self.inline_item_limit: int = max(0, int(inline_item_limit))
+        self._cond = threading.Condition()
+        self._pending: Optional[InfoQuerySnapshot] = None
+        self._latest_generation: int = 0
+        self._running: bool = False
+        self._closed: bool = False
+        self._thread: Optional[threading.Thread] = None
+        self.completed_count: int = 0
+        self.superseded_count: int = 0
+
+    @property
+    def synchronous(self) -> bool:
+        """同期実行モードかどうか。"""
+        if self._synchronous is not None:
+            return self._synchronous
+        return os.getenv("FTIV_TEST_MODE") == "1"
+
+    @property
+    def latest_generation(self) -> int:
+        """最後に受け付けた要求の世代番号。"""
+        return self._latest_generation
+
+    def is_busy(self) -> bool:
+        """未実行または実行中の要求があるかどうか。"""
+        with self._cond:
+            return self._pending is not None or self._running
+
+    def submit(self, snapshot: InfoQuerySnapshot) -> None:
+        """要求を登録する。待ち中の古い要求は破棄される。"""
+        with self._cond:
+            self._latest_generation = snapshot.generation
+            if self._pending is not None:
+                self.superseded_count += 1
+            self._pending = None
+            if not (self.synchronous or self._closed or self._runs_inline(snapshot)):
+                self._pending = snapshot
+                self._ensure_thread()
+                self._cond.notify_all()
+                return
+        self._execute(snapshot)
+
+    def close(self) -> None:
+        """待ち中の要求を破棄してワーカーを停止する。以降の要求は同期実行になる。"""
+        with self._cond:
+            self._closed = True
+            self._pending = None
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+
+    def _runs_inline(self, snapshot: InfoQuerySnapshot) -> bool:
+        # 保存済みシーンの SQL は件数に関係なく重くなり得るため、常にワーカーで行う
+        if snapshot.saved_scenes is not None:
+            return False
+        return len(snapshot.tasks) + len(snapshot.notes) <= self.inline_item_limit
+
+    def _is_stale(self, generation: int) -> bool:
+        return generation != self._latest_generation
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="InfoQueryWorker", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                snapshot = self._pending
+                self._pending = None
+                self._running = True
+            try:
+                self._execute(snapshot)
+            finally:
+                with self._cond:
+                    self._running = False
+                    self._cond.notify_all()
+
+    def _execute(self, snapshot: InfoQuerySnapshot) -> None:
+        generation = snapshot.generation
+        try:
+            result = run_info_query(self.manager, snapshot, lambda: self._is_stale(generation))
+        except Exception:
+            logger.error(f"Info query failed (generation={generation})", exc_info=True)
+            return
+        if result is None or self._is_stale(generation):
+            with self._cond:
+                self.superseded_count += 1
+            return
+        with self._cond:
+            self.completed_count += 1
+        self.finished.emit(result)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """要求の実行が終わるまで待つ（計測・テスト用）。結果の受け取りにはイベント処理が別途必要。
+
+        Args:
+            timeout: 最大待ち時間（秒）。None で無制限。
+
+        Returns:
+            bool: 時間内にアイドルになった場合 True。
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending is not None or self._running:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining if remaining is not None else 0.1)
+        return True
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import bisect
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# 日本語（ひらがな・カタカナ・漢字・半角カナ）とハングルは分かち書きが無いため文字 bigram で索引する
+_CJK_CHARS = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uff66-\uff9f\uac00-\ud7af"
+_TOKEN_RE = re.compile(rf"[{_CJK_CHARS}]+|[^\W{_CJK_CHARS}]+")
+_CJK_RUN_RE = re.compile(rf"[{_CJK_CHARS}]+")
+
+_KIND_WORD = "word"
+_KIND_CJK = "cjk"
+
+
+def normalize_search_text(text: str) -> str:
+    """検索・索引の両方で使う正規化（小文字化）。"""
+    return str(text or "").lower()
+
+
+def _cjk_grams(run: str) -> List[str]:
+    """CJK の連続部分を 1 文字 + 2 文字 bigram に分解する。"""
+    grams = list(run)
+    grams.extend(run[i : i + 2] for i in range(len(run) - 1))
+    return grams
+
+
+def tokenize_search_text(text: str) -> Set[str]:
+    """索引用トークンを返す。
+
+    ラテン文字・数字は単語単位、日本語は 1 文字と 2 文字 bigram に分割する。
+    """
+    tokens: Set[str] = set()
+    for match in _TOKEN_RE.finditer(normalize_search_text(text)):
+        token = match.group(0)
+        if _CJK_RUN_RE.fullmatch(token):
+            tokens.update(_cjk_grams(token))
+        else:
+            tokens.add(token)
+    return tokens
+
+
+def word_token_key(text: str) -> str:
+    """ラテン文字・数字の語を出現順に空白区切りで連ねたキー（前後にも空白を付ける）を返す。
+
+    ' ' + 語 の部分一致が「その語で始まる単語がある」と同じになるため、
+    SQL（instr）で単語の前方一致を判定するのに使う。
+    """
+    words = [m.group(0) for m in _TOKEN_RE.finditer(normalize_search_text(text))]
+    return " " + " ".join(w for w in words if not _CJK_RUN_RE.fullmatch(w)) + " "
+
+
+def _query_terms(query: str) -> List[Tuple[str, str]]:
+    terms: List[Tuple[str, str]] = []
+    for match in _TOKEN_RE.finditer(normalize_search_text(query)):
+        token = match.group(0)
+        terms.append((_KIND_CJK if _CJK_RUN_RE.fullmatch(token) else _KIND_WORD, token))
+    return terms
+
+
+class InvertedTextIndex:
+    """文書 ID（int）→ テキストの転置インデックス。
+
+    単語は前方一致（入力途中の語もヒットする）、日本語は bigram の積集合で候補を絞り、
+    3 文字以上の語だけ本文で連続しているかを確認する。
+    複数語のクエリは各語の結果の積集合（AND）を返す。
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[int]] = {}
+        # 前方一致用にソート済みの語彙
+        self._vocabulary: List[str] = []
+        self._doc_tokens: Dict[int, Set[str]] = {}
+        self._doc_text: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._doc_tokens)
+
+    @property
+    def vocabulary_size(self) -> int:
+        """索引済みの語彙数。"""
+        return len(self._vocabulary)
+
+    def add(self, doc_id: int, text: str) -> None:
+        """文書を索引に追加する（既にあれば置き換える）。"""
+        if doc_id in self._doc_tokens:
+            self.remove(doc_id)
+        tokens = tokenize_search_text(text)
+        self._doc_tokens[doc_id] = tokens
+        self._doc_text[doc_id] = normalize_search_text(text)
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = set()
+                bisect.insort(self._vocabulary, token)
+            posting.add(doc_id)
+
+    def remove(self, doc_id: int) -> None:
+        """文書を索引から取り除く。"""
+        tokens = self._doc_tokens.pop(doc_id, None)
+        self._doc_text.pop(doc_id, None)
+        if not tokens:
+            return
+        for token in tokens:
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            posting.discard(doc_id)
+            if not posting:
+                del self._postings[token]
+                index = bisect.bisect_left(self._vocabulary, token)
+                if index < len(self._vocabulary) and self._vocabulary[index] == token:
+                    del self._vocabulary[index]
+
+    def clear(self) -> None:
+        """索引を空にする。"""
+        self._postings.clear()
+        self._vocabulary.clear()
+        self._doc_tokens.clear()
+        self._doc_text.clear()
+
+    def _prefix_docs(self, prefix: str) -> Set[int]:
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        docs: Set[int] = set()
+        for token in self._vocabulary[start:]:
+            if not token.startswith(prefix):
+                break
+            docs.update(self._postings[token])
+        return docs
+
+    def _cjk_docs(self, run: str) -> Set[int]:
+        grams = _cjk_grams(run) if len(run) == 1 else [run[i : i + 2] for i in range(len(run) - 1)]
+        postings = [self._postings.get(gram) for gram in grams]
+        if any(p is None for p in postings):
+            return set()
+        postings.sort(key=len)
+        docs = set(postings[0])
+        for posting in postings[1:]:
+            docs &= posting
+            if not docs:
+                break
+        return docs
+
+    def search(self, query: str) -> Optional[Set[int]]:
+        """クエリに一致する文書 ID の集合を返す。
+
+        Returns:
+            Optional[Set[int]]: 一致した文書 ID。クエリに索引可能な語が無い場合（記号のみ等）は None。
+        """
+        terms = _query_terms(query)
+        if not terms:
+            return None
+
+        result: Set[int] = set()
+        long_runs: List[str] = []
+        for position, (kind, term) in enumerate(terms):
+            if kind == _KIND_CJK:
+                docs = self._cjk_docs(term)
+                if len(term) > 2:
+                    long_runs.append(term)
+            else:
+                docs = self._prefix_docs(term)
+            result = docs if position == 0 else result & docs
+            if not result:
+                return set()
+
+        for run in long_runs:
+            result = {doc_id for doc_id in result if run in self._doc_text.get(doc_id, "")}
+        return result
+
+
+class TagFacetIndex:
+    """タグ（小文字化したキー）→ 文書 ID 集合のファセット索引。
+
+    タグ絞り込みは語彙（異なるタグの数）だけを走査して該当タグの集合を合併し、
+    各アイテムのタグは見ない。語彙はソート済みで保持し、入力補完の前方一致は二分探索で引く。
+    表示用には最初に登録された表記（大文字小文字）を返す。
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[int]] = {}
+        self._vocabulary: List[str] = []
+        self._display: Dict[str, str] = {}
+        self._doc_tags: Dict[int, Tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._doc_tags)
+
+    @property
+    def vocabulary_size(self) -> int:
+        """索引済みの異なるタグの数。"""
+        return len(self._vocabulary)
+
+    def add(self, doc_id: int, tags: Sequence[str]) -> None:
+        """文書のタグを登録する（既にあれば置き換える）。"""
+        if doc_id in self._doc_tags:
+            self.remove(doc_id)
+        keys: List[str] = []
+        for raw in tags:
+            tag = str(raw or "").strip()
+            key = normalize_search_text(tag)
+            if not key or key in keys:
+                continue
+            keys.append(key)
+            posting = self._postings.get(key)
+            if posting is None:
+                posting = self._postings[key] = set()
+                bisect.insort(self._vocabulary, key)
+                self._display[key] = tag
+            posting.add(doc_id)
+        if keys:
+            self._doc_tags[doc_id] = tuple(keys)
+
+    def remove(self, doc_id: int) -> None:
+        """文書のタグを索引から取り除く。"""
+        for key in self._doc_tags.pop(doc_id, ()):
+            posting = self._postings.get(key)
+            if posting is None:
+                continue
+            posting.discard(doc_id)
+            if not posting:
+                del self._postings[key]
+                self._display.pop(key, None)
+                index = bisect.bisect_left(self._vocabulary, key)
+                if index < len(self._vocabulary) and self._vocabulary[index] == key:
+                    del self._vocabulary[index]
+
+    def clear(self) -> None:
+        """索引を空にする。"""
+        self._postings.clear()
+        self._vocabulary.clear()
+        self._display.clear()
+        self._doc_tags.clear()
+
+    def tags(self) -> List[str]:
+        """登録済みのタグ（表示用の表記、キーの昇順）。"""
+        return [self._display[key] for key in self._vocabulary]
+
+    def match(self, tag_filter: str) -> Set[int]:
+        """タグ絞り込み（部分一致・大文字小文字を区別しない）に一致する文書 ID を返す。"""
+        query = normalize_search_text(tag_filter).strip()
+        docs: Set[int] = set()
+        for key in self._vocabulary:
+            if query in key:
+                docs.update(self._postings[key])
+        return docs
+
+    def counts(self, doc_ids: Optional[Iterable[int]] = None) -> Dict[str, int]:
+        """タグごとの件数を返す。
+
+        Args:
+            doc_ids: 数える対象の文書 ID（現在の絞り込み結果など）。None の場合は全文書。
+
+        Returns:
+            Dict[str, int]: 表示用のタグ表記 → 件数。
+        """
+        if doc_ids is None:
+            return {self._display[key]: len(self._postings[key]) for key in self._vocabulary}
+        counter: Dict[str, int] = {}
+        for doc_id in doc_ids:
+            for key in self._doc_tags.get(doc_id, ()):
+                counter[key] = counter.get(key, 0) + 1
+        return {self._display[key]: counter[key] for key in sorted(counter)}
+
+    def complete(self, prefix: str, limit: int = 20) -> List[str]:
+        """前方一致するタグを件数の多い順（同数はキー順）に返す。"""
+        key_prefix = normalize_search_text(prefix).strip()
+        start = bisect.bisect_left(self._vocabulary, key_prefix)
+        found: List[str] = []
+        for key in self._vocabulary[start:]:
+            if not key.startswith(key_prefix):
+                break
+            found.append(key)
+        found.sort(key=lambda key: -len(self._postings[key]))
+        return [self._display[key] for key in found[: max(0, int(limit))]]
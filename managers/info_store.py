@@ -0,0 +1,589 @@
+# managers/info_store.py
+"""保存済みの全シーンのノート・タスクを索引する SQLite ストア。
+
+Info タブの通常の索引（IncrementalInfoIndex）は開いているウィンドウだけを扱う。
+このストアはシーン保存時にシーン内のテキストウィンドウをタスク行・ノートの行として書き込み、
+InfoQuery の条件（アーカイブ範囲・種類・スター・未完了・期限・タグ・全文検索・並べ替え）を
+SQL で評価して TaskIndexItem / NoteIndexItem を返す。
+全文検索は Info タブの転置インデックス（InvertedTextIndex）と同じ規則で評価する。
+クエリを語に分け、ラテン文字の語は単語の前方一致、日本語は部分一致とし、全ての語を AND で絞り込む。
+FTS5 の trigram トークナイザが使えれば候補の絞り込みに使い、判定は instr で確定させる。
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import replace
+from datetime import datetime, time, timedelta
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from managers.info_index_manager import InfoIndexManager, InfoQuery, InfoStats, NoteIndexItem, TaskIndexItem
+from managers.info_search_index import _KIND_CJK, _query_terms, word_token_key
+
+logger = logging.getLogger(__name__)
+
+INFO_STORE_SCHEMA_VERSION: int = 2
+
+# タグは小文字化して改行区切りで保持する（クエリ側は改行を含まないため、タグをまたいで一致しない）
+_TAG_SEPARATOR = "\n"
+# 期限が無い・不正なアイテムの due_sort。期限順で末尾に寄る（_due_sort_value の datetime.max と同じ扱い）。
+# NULL にしないのは、期限順の ORDER BY で索引を使えるようにするため
+_DUE_SORT_MAX = "9999-12-31T23:59:59.999999"
+# FTS5 の trigram は 3 文字未満の語を索引から引けない
+_FTS_MIN_QUERY_LENGTH = 3
+
+_ITEM_COLUMNS = (
+    "kind",
+    "category",
+    "scene",
+    "window_uuid",
+    "item_key",
+    "line_index",
+    "text",
+    "done",
+    "title",
+    "title_key",
+    "first_line",
+    "content_mode",
+    "tags",
+    "tags_key",
+    "is_starred",
+    "is_archived",
+    "created_at",
+    "updated_at",
+    "due_at",
+    "due_time",
+    "due_timezone",
+    "due_precision",
+    "created_sort",
+    "updated_sort",
+    "due_sort",
+    "search_key",
+    "search_words",
+)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    {", ".join(f"{column} {'INTEGER' if column in ('line_index', 'done', 'is_starred', 'is_archived') else 'TEXT'}" for column in _ITEM_COLUMNS)}
+);
+CREATE INDEX IF NOT EXISTS idx_items_scene ON items (category, scene);
+CREATE INDEX IF NOT EXISTS idx_items_window ON items (window_uuid);
+CREATE INDEX IF NOT EXISTS idx_items_updated ON items (kind, is_archived, updated_sort);
+CREATE INDEX IF NOT EXISTS idx_items_due ON items (kind, is_archived, due_sort);
+CREATE INDEX IF NOT EXISTS idx_items_starred ON items (kind, is_starred, is_archived);
+"""
+
+
+def _sort_text(value: Optional[datetime]) -> Optional[str]:
+    """datetime を辞書順で比較できる ISO 文字列にする（タイムゾーン情報は落とす）。"""
+    if value is None:
+        return None
+    return value.replace(tzinfo=None).isoformat(timespec="microseconds")
+
+
+def _iter_text_window_dicts(body: Any) -> Iterator[Dict[str, Any]]:
+    """シーンデータからテキストウィンドウの辞書を取り出す（新形式・旧 list 形式の両方）。"""
+    if isinstance(body, dict) and body.get("type") == "ftiv_project":
+        body = body.get("current_state")
+    if isinstance(body, dict):
+        windows = body.get("windows") if "windows" in body else [body]
+    elif isinstance(body, list):
+        windows = body
+    else:
+        return
+    for data in windows if isinstance(windows, list) else []:
+        if not isinstance(data, dict):
+            continue
+        if str(data.get("type", "text") or "text") != "text" or "text" not in data:
+            continue
+        yield data
+
+
+class InfoStore:
+    """保存済みシーンのノート・タスクを SQLite に索引するストア。
+
+    シーン単位（カテゴリ + シーン名）で行を置き換える。接続は 1 本をロックで共有し、
+    Info タブのクエリワーカーからも呼び出せるようにしている。
+
+    Attributes:
+        path: データベースファイルのパス（":memory:" も可）。
+        fts_enabled: FTS5（trigram）で全文検索しているかどうか。
+        revision: 索引の内容が変わるたびに増える番号。
+    """
+
+    def __init__(self, path: str = ":memory:", manager: Optional[InfoIndexManager] = None) -> None:
+        """InfoStoreを初期化します。
+
+        Args:
+            path: データベースファイルのパス。
+            manager: アイテムの構築に使う InfoIndexManager。
+        """
+        self.path = path
+        self.manager = manager or InfoIndexManager()
+        self._lock = threading.RLock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self.fts_enabled: bool = False
+        self.revision: int = 0
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        with self._lock, self._conn:
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            row = self._conn.execute("SELECT name FROM sqlite_master WHERE name = 'meta'").fetchone()
+            version = None
+            if row is not None:
+                found = self._conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+                version = int(found["value"]) if found is not None else None
+            if version not in (None, INFO_STORE_SCHEMA_VERSION):
+                # 索引は保存済みシーンから作り直せるため、形式が変わったら捨てる
+                logger.info(f"Info store schema changed ({version} -> {INFO_STORE_SCHEMA_VERSION}); rebuilding")
+                self._conn.execute("DROP TABLE IF EXISTS items")
+                self._conn.execute("DROP TABLE IF EXISTS items_fts")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(INFO_STORE_SCHEMA_VERSION),),
+            )
+            try:
+                self._conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(search_key, tokenize='trigram')"
+                )
+                self.fts_enabled = True
+            except sqlite3.OperationalError:
+                logger.info("SQLite FTS5 (trigram) is not available; Info store falls back to substring scans")
+                self.fts_enabled = False
+
+    def close(self) -> None:
+        """接続を閉じる。"""
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                logger.debug("Failed to close info store", exc_info=True)
+
+    # ==========================================
+    # Indexing
+    # ==========================================
+
+    def _rows_for_window(self, data: Dict[str, Any]) -> List[Tuple[Any, ...]]:
+        """テキストウィンドウの辞書からタスク行・ノートの行を作る（build_window_items と同じ規則）。"""
+        window = SimpleNamespace(
+            uuid=data.get("uuid", ""),
+            text=data.get("text", ""),
+            title=data.get("title", ""),
+            tags=list(data.get("tags", []) or []),
+            is_starred=data.get("is_starred", False),
+            created_at=data.get("created_at", ""),
+            updated_at=data.get("updated_at", ""),
+            due_at=data.get("due_at", ""),
+            due_time=data.get("due_time", ""),
+            due_timezone=data.get("due_timezone", ""),
+            due_precision=data.get("due_precision", "date"),
+            is_archived=data.get("is_archived", False),
+            content_mode=data.get("content_mode", "note"),
+            task_states=list(data.get("task_states", []) or []),
+        )
+        mgr = self.manager
+        task_items, note_item = mgr.build_window_items(window)
+        rows: List[Tuple[Any, ...]] = []
+        if note_item is not None:
+            rows.append(self._item_row("note", note_item, mgr.note_search_text(note_item)))
+        rows.extend(self._item_row("task", item, mgr.task_search_text(item)) for item in task_items)
+        return rows
+
+    @staticmethod
+    def _item_row(kind: str, item: Any, search_text: str) -> Tuple[Any, ...]:
+        is_task = kind == "task"
+        return (
+            kind,
+            item.window_uuid,
+            item.item_key if is_task else "",
+            item.line_index if is_task else -1,
+            item.text if is_task else "",
+            int(item.done) if is_task else 0,
+            item.title,
+            str(item.title).lower(),
+            "" if is_task else item.first_line,
+            "task" if is_task else item.content_mode,
+            _TAG_SEPARATOR.join(item.tags),
+            _TAG_SEPARATOR.join(tag.lower() for tag in item.tags),
+            int(item.is_starred),
+            int(item.is_archived),
+            item.created_at,
+            item.updated_at,
+            item.due_at,
+            item.due_time,
+            item.due_timezone,
+            item.due_precision,
+            _sort_text(item.created_dt),
+            _sort_text(item.updated_dt),
+            _sort_text(item.due_dt) or _DUE_SORT_MAX,
+            str(search_text or "").lower(),
+            word_token_key(search_text),
+        )
+
+    def index_scene(self, category: str, name: str, body: Any) -> int:
+        """シーンのノート・タスクを索引する（既存の行は置き換える）。
+
+        Args:
+            category: カテゴリ名。
+            name: シーン名。
+            body: シーンデータ（get_scene_data の形式、または旧形式）。
+
+        Returns:
+            int: 書き込んだ行数。
+        """
+        rows: List[Tuple[Any, ...]] = []
+        for data in _iter_text_window_dicts(body):
+            try:
+                rows.extend(self._rows_for_window(data))
+            except Exception:
+                logger.warning(f"Skipped an unreadable window while indexing scene {category}/{name}", exc_info=True)
+        with self._lock, self._conn:
+            self._delete_where("category = ? AND scene = ?", (category, name))
+            self._insert_rows(category, name, rows)
+            self.revision += 1
+        return len(rows)
+
+    def _insert_rows(self, category: str, name: str, rows: Sequence[Tuple[Any, ...]]) -> None:
+        if not rows:
+            return
+        placeholders = ", ".join("?" for _ in _ITEM_COLUMNS)
+        cursor = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM items")
+        first_id = int(cursor.fetchone()[0]) + 1
+        ids = range(first_id, first_id + len(rows))
+        self._conn.executemany(
+            f"INSERT INTO items (id, {', '.join(_ITEM_COLUMNS)}) VALUES (?, {placeholders})",
+            ((row_id, row[0], category, name, *row[1:]) for row_id, row in zip(ids, rows)),
+        )
+        if self.fts_enabled:
+            self._conn.executemany(
+                "INSERT INTO items_fts (rowid, search_key) VALUES (?, ?)",
+                ((row_id, row[-2]) for row_id, row in zip(ids, rows)),
+            )
+
+    def _delete_where(self, condition: str, params: Tuple[Any, ...]) -> None:
+        if self.fts_enabled:
+            self._conn.execute(f"DELETE FROM items_fts WHERE rowid IN (SELECT id FROM items WHERE {condition})", params)
+        self._conn.execute(f"DELETE FROM items WHERE {condition}", params)
+
+    def remove_scene(self, category: str, name: str) -> None:
+        """シーンの行を取り除く。"""
+        with self._lock, self._conn:
+            self._delete_where("category = ? AND scene = ?", (category, name))
+            self.revision += 1
+
+    def remove_category(self, category: str) -> None:
+        """カテゴリ配下の全シーンの行を取り除く。"""
+        with self._lock, self._conn:
+            self._delete_where("category = ?", (category,))
+            self.revision += 1
+
+    def rename_category(self, old: str, new: str) -> None:
+        """カテゴリ名を付け替える。new に同名のシーンがある場合は new 側を残す（SceneStore と同じ）。"""
+        if old == new:
+            return
+        with self._lock, self._conn:
+            self._delete_where("category = ? AND scene IN (SELECT scene FROM items WHERE category = ?)", (old, new))
+            self._conn.execute("UPDATE items SET category = ? WHERE category = ?", (new, old))
+            self.revision += 1
+
+    def sync_scenes(self, scenes: Dict[str, Dict[str, Any]]) -> None:
+        """シーンDB全体の保存に合わせて索引を揃える。
+
+        本体が None（未読込）のシーンは既存の行をそのまま残し、scenes に無いシーンの行は取り除く。
+
+        Args:
+            scenes: {category: {scene_name: body_or_None}}。
+        """
+        keep = {
+            (str(category), str(name))
+            for category, entries in scenes.items()
+            if isinstance(entries, dict)
+            for name in entries
+        }
+        for category, name in self.indexed_scenes() - keep:
+            self.remove_scene(category, name)
+        for category, entries in scenes.items():
+            if not isinstance(entries, dict):
+                continue
+            for name, body in entries.items():
+                if body is not None:
+                    self.index_scene(str(category), str(name), body)
+
+    def indexed_scenes(self) -> set[Tuple[str, str]]:
+        """索引済みの（カテゴリ, シーン名）。ウィンドウを持たないシーンは含まれない。"""
+        with self._lock:
+            rows = self._conn.execute("SELECT DISTINCT category, scene FROM items").fetchall()
+        return {(str(row["category"]), str(row["scene"])) for row in rows}
+
+    def count(self) -> int:
+        """索引済みの行数（タスク行 + ノート）。"""
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM items").fetchone()[0])
+
+    def locate(self, window_uuid: str) -> Optional[Tuple[str, str]]:
+        """ウィンドウを含むシーン（カテゴリ, シーン名）を返す。複数あれば最後に更新されたもの。"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT category, scene FROM items WHERE window_uuid = ? AND kind = 'note' "
+                "ORDER BY updated_sort DESC LIMIT 1",
+                (str(window_uuid or ""),),
+            ).fetchone()
+        if row is None:
+            return None
+        return str(row["category"]), str(row["scene"])
+
+    # ==========================================
+    # Query
+    # ==========================================
+
+    def _where(
+        self, kind: str, query: InfoQuery, now: datetime, exclude_window_uuids: Iterable[str]
+    ) -> Tuple[str, List[Any]]:
+        mgr = self.manager
+        clauses: List[str] = ["i.kind = ?"]
+        params: List[Any] = [kind]
+
+        archive_scope = mgr._effective_archive_scope(query)
+        if archive_scope == "active":
+            clauses.append("i.is_archived = 0")
+        elif archive_scope == "archived":
+            clauses.append("i.is_archived = 1")
+
+        item_scope, content_mode_filter = mgr._normalize_query_filters(query)
+        if kind == "note":
+            if item_scope in ("tasks", "notes"):
+                clauses.append("i.content_mode = ?")
+                params.append("task" if item_scope == "tasks" else "note")
+            elif content_mode_filter in ("task", "note"):
+                clauses.append("i.content_mode = ?")
+                params.append(content_mode_filter)
+        elif query.open_tasks_only:
+            clauses.append("i.done = 0")
+
+        if query.starred_only:
+            clauses.append("i.is_starred = 1")
+
+        due_mode = str(query.due_filter or "").strip().lower()
+        if due_mode not in ("", "all"):
+            today = datetime.combine(now.date(), time())
+            today_text = _sort_text(today)
+            tomorrow_text = _sort_text(today + timedelta(days=1))
+            now_text = _sort_text(now)
+            if due_mode == "dated":
+                clauses.append("i.due_sort < ?")
+                params.append(_DUE_SORT_MAX)
+            elif due_mode == "undated":
+                clauses.append("i.due_sort = ?")
+                params.append(_DUE_SORT_MAX)
+            elif due_mode == "today":
+                clauses.append("i.due_sort >= ? AND i.due_sort < ?")
+                params.extend([today_text, tomorrow_text])
+            elif due_mode == "overdue":
+                clauses.append(
+                    "((i.due_precision = 'datetime' AND i.due_sort < ?) "
+                    "OR (i.due_precision <> 'datetime' AND i.due_sort < ?))"
+                )
+                params.extend([now_text, today_text])
+            elif due_mode == "upcoming":
+                clauses.append(
+                    "i.due_sort < ? AND ((i.due_precision = 'datetime' AND i.due_sort > ?) "
+                    "OR (i.due_precision <> 'datetime' AND i.due_sort >= ?))"
+                )
+                params.extend([_DUE_SORT_MAX, now_text, tomorrow_text])
+
+        tag = str(query.tag or "").strip().lower()
+        if tag:
+            clauses.append("instr(i.tags_key, ?) > 0")
+            params.append(tag)
+
+        text = str(query.text or "").strip().lower()
+        if text:
+            self._append_text_clauses(text, clauses, params)
+
+        excluded = sorted({str(uuid) for uuid in exclude_window_uuids if uuid})
+        if excluded:
+            clauses.append(f"i.window_uuid NOT IN ({', '.join('?' for _ in excluded)})")
+            params.extend(excluded)
+        return " AND ".join(clauses), params
+
+    def _append_text_clauses(self, text: str, clauses: List[str], params: List[Any]) -> None:
+        """全文検索の条件を語ごとに追加する（InvertedTextIndex.search と同じ一致規則）。"""
+        terms = _query_terms(text)
+        if not terms:
+            # 記号のみなど語に分けられないクエリは、Info タブと同じく部分一致で評価する
+            clauses.append("instr(i.search_key, ?) > 0")
+            params.append(text)
+            return
+        if self.fts_enabled:
+            # trigram のフレーズ一致（部分一致）で候補を絞り、語ごとの判定は instr で確定させる
+            phrases = [term for _kind, term in terms if len(term) >= _FTS_MIN_QUERY_LENGTH]
+            if phrases:
+                clauses.append("i.id IN (SELECT rowid FROM items_fts WHERE items_fts MATCH ?)")
+                params.append(" AND ".join('"' + term.replace('"', '""') + '"' for term in phrases))
+        for kind, term in terms:
+            if kind == _KIND_CJK:
+                clauses.append("instr(i.search_key, ?) > 0")
+                params.append(term)
+            else:
+                # 単語の前方一致（語の直前が区切りの空白）
+                clauses.append("instr(i.search_words, ?) > 0")
+                params.append(" " + term)
+
+    @staticmethod
+    def _order_by(kind: str, query: InfoQuery) -> str:
+        direction = "DESC" if query.sort_desc else "ASC"
+        sort_by = str(query.sort_by or "updated").strip().lower()
+        if sort_by == "title":
+            keys = ["i.title_key", "i.window_uuid"]
+        elif sort_by == "due":
+            keys = ["i.due_sort", "i.updated_sort", "i.window_uuid"]
+        elif sort_by == "created":
+            keys = ["i.created_sort", "i.updated_sort", "i.window_uuid"]
+        else:
+            keys = ["i.updated_sort", "i.created_sort", "i.window_uuid"]
+        if kind == "task":
+            keys.append("i.line_index")
+        return ", ".join(f"{key} {direction}" for key in keys)
+
+    def _select(
+        self,
+        kind: str,
+        query: InfoQuery,
+        limit: Optional[int],
+        exclude_window_uuids: Iterable[str],
+        now: Optional[datetime],
+    ) -> List[sqlite3.Row]:
+        where, params = self._where(kind, query, now or datetime.now(), exclude_window_uuids)
+        sql = f"SELECT i.* FROM items AS i WHERE {where} ORDER BY {self._order_by(kind, query)}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(max(0, int(limit)))
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def query_tasks(
+        self,
+        query: InfoQuery,
+        *,
+        limit: Optional[int] = None,
+        exclude_window_uuids: Iterable[str] = (),
+        now: Optional[datetime] = None,
+    ) -> List[TaskIndexItem]:
+        """条件に一致するタスク行を並べ替え済みで返す（InfoIndexManager.query_tasks と同じ条件）。
+
+        Args:
+            query: 絞り込み・並べ替え条件。
+            limit: 返す件数の上限。None で無制限。
+            exclude_window_uuids: 除外するウィンドウ（開いているウィンドウなど）。
+            now: 期限判定の基準時刻。None で現在時刻。
+        """
+        item_scope, _content_mode_filter = self.manager._normalize_query_filters(query)
+        if item_scope == "notes":
+            return []
+        rows = self._select("task", query, limit, exclude_window_uuids, now)
+        return [self._task_from_row(row) for row in rows]
+
+    def query_notes(
+        self,
+        query: InfoQuery,
+        *,
+        limit: Optional[int] = None,
+        exclude_window_uuids: Iterable[str] = (),
+        now: Optional[datetime] = None,
+    ) -> List[NoteIndexItem]:
+        """条件に一致するノートを並べ替え済みで返す（InfoIndexManager.query_notes と同じ条件）。
+
+        Args:
+            query: 絞り込み・並べ替え条件。
+            limit: 返す件数の上限。None で無制限。
+            exclude_window_uuids: 除外するウィンドウ（開いているウィンドウなど）。
+            now: 期限判定の基準時刻。None で現在時刻。
+        """
+        rows = self._select("note", query, limit, exclude_window_uuids, now)
+        return [self._note_from_row(row) for row in rows]
+
+    def build_stats(
+        self, query: InfoQuery, *, exclude_window_uuids: Iterable[str] = (), now: Optional[datetime] = None
+    ) -> InfoStats:
+        """条件に一致するアイテムの統計を SQL の集計で返す（件数の上限に関係なく全件が対象）。"""
+        now = now or datetime.now()
+        today_text = _sort_text(datetime.combine(now.date(), time()))
+        item_scope, _content_mode_filter = self.manager._normalize_query_filters(query)
+        open_tasks = done_tasks = overdue_tasks = 0
+        with self._lock:
+            if item_scope != "notes":
+                where, params = self._where("task", query, now, exclude_window_uuids)
+                row = self._conn.execute(
+                    "SELECT COALESCE(SUM(i.done = 0), 0), COALESCE(SUM(i.done = 1), 0), "
+                    "COALESCE(SUM(i.done = 0 AND ((i.due_precision = 'datetime' AND i.due_sort < ?) "
+                    "OR (i.due_precision <> 'datetime' AND i.due_sort < ?))), 0) "
+                    f"FROM items AS i WHERE {where}",
+                    [_sort_text(now), today_text, *params],
+                ).fetchone()
+                open_tasks, done_tasks, overdue_tasks = (int(value) for value in row)
+            where, params = self._where("note", replace(query, starred_only=True), now, exclude_window_uuids)
+            starred_notes = int(
+                self._conn.execute(f"SELECT COUNT(*) FROM items AS i WHERE {where}", params).fetchone()[0]
+            )
+        return InfoStats(
+            open_tasks=open_tasks,
+            done_tasks=done_tasks,
+            overdue_tasks=overdue_tasks,
+            starred_notes=starred_notes,
+        )
+
+    @staticmethod
+    def _tags_from_row(row: sqlite3.Row) -> Tuple[str, ...]:
+        raw = str(row["tags"] or "")
+        return tuple(raw.split(_TAG_SEPARATOR)) if raw else ()
+
+    def _task_from_row(self, row: sqlite3.Row) -> TaskIndexItem:
+        return TaskIndexItem(
+            item_key=row["item_key"],
+            window_uuid=row["window_uuid"],
+            title=row["title"],
+            text=row["text"],
+            line_index=int(row["line_index"]),
+            done=bool(row["done"]),
+            tags=self._tags_from_row(row),
+            is_starred=bool(row["is_starred"]),
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            due_at=row["due_at"],
+            due_time=row["due_time"],
+            due_timezone=row["due_timezone"],
+            due_precision=row["due_precision"],
+            is_archived=bool(row["is_archived"]),
+            scene=(row["category"], row["scene"]),
+        )
+
+    def _note_from_row(self, row: sqlite3.Row) -> NoteIndexItem:
+        return NoteIndexItem(
+            window_uuid=row["window_uuid"],
+            title=row["title"],
+            first_line=row["first_line"],
+            content_mode=row["content_mode"],
+            tags=self._tags_from_row(row),
+            is_starred=bool(row["is_starred"]),
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            due_at=row["due_at"],
+            due_time=row["due_time"],
+            due_timezone=row["due_timezone"],
+            due_precision=row["due_precision"],
+            is_archived=bool(row["is_archived"]),
+            scene=(row["category"], row["scene"]),
+        )
@@ -0,0 +1,269 @@
+# managers/operation_log_store.py
+"""Info タブの操作ログ（一括操作の履歴）を JSONL へ追記する専用ストア。
+
+以前は AppSettings.info_operation_logs に最大 200 件を持ち、追記のたびに設定 JSON 全体を
+保存し直していた。ここでは 1 件 = 1 行の追記だけを行い、ファイルが max_bytes を超えたら
+logging.handlers.RotatingFileHandler と同じ命名（.1, .2, ...）で世代を回す。
+直近の件数分はメモリのリングバッファに持ち、Info タブの要約表示はファイルを読まない。
+古い履歴は read_page() で新しい順にページ単位で読む。
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+OPERATION_LOG_FILENAME = "operation_logs.jsonl"
+DEFAULT_MAX_BYTES = 512 * 1024
+DEFAULT_BACKUP_COUNT = 8
+DEFAULT_BUFFER_SIZE = 200
+_DETAIL_MAX_CHARS = 80
+
+
+def sanitize_operation_log_entry(raw: Any) -> Optional[Dict[str, Any]]:
+    """操作ログ 1 件を正規化する。不正な場合は None。"""
+    if not isinstance(raw, dict):
+        return None
+    at = str(raw.get("at", "") or "").strip()
+    action = str(raw.get("action", "") or "").strip()
+    try:
+        target_count = int(raw.get("target_count", 0))
+    except Exception:
+        return None
+    if not at or not action or target_count < 1:
+        return None
+    return {
+        "at": at,
+        "action": action,
+        "target_count": target_count,
+        "detail": str(raw.get("detail", "") or "").strip()[:_DETAIL_MAX_CHARS],
+    }
+
+
+class OperationLogStore:
+    """操作ログの追記専用ストア（世代ローテーションつき JSONL + リングバッファ）。
+
+    path が None の場合はファイルへ書かず、リングバッファだけで動く。
+
+    Attributes:
+        revision: 追記・消去のたびに増える番号（表示側の再構築判定用）。
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        """OperationLogStoreを初期化します。
+
+        Args:
+            path: JSONL ファイルのパス。None でメモリのみ。
+            max_bytes: 現行ファイルの上限サイズ。超える追記の前に世代を回す。
+            backup_count: 残す旧世代の数。
+            buffer_size: メモリに持つ直近の件数。
+        """
+        self.path = path
+        self.max_bytes = max(1024, int(max_bytes))
+        self.backup_count = max(0, int(backup_count))
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=max(1, int(buffer_size)))
+        # 旧世代ファイルの件数キャッシュ: path -> ((size, mtime_ns), count)
+        self._line_counts: Dict[str, Tuple[Tuple[int, int], int]] = {}
+        self.revision: int = 0
+        self._load_recent()
+
+    # ==========================================
+    # Write
+    # ==========================================
+
+    def append(self, entry: Dict[str, Any]) -> bool:
+        """1 件を追記する。
+
+        Returns:
+            bool: 追記した場合 True（不正な内容は捨てる）。
+        """
+        normalized = sanitize_operation_log_entry(entry)
+        if normalized is None:
+            return False
+        self._recent.append(normalized)
+        self.revision += 1
+        if self.path:
+            self._write_lines([json.dumps(normalized, ensure_ascii=False, separators=(",", ":"))])
+        return True
+
+    def extend(self, entries: Sequence[Dict[str, Any]]) -> int:
+        """複数件を（古い順に）追記する。設定ファイルからの移行用。
+
+        Returns:
+            int: 追記した件数。
+        """
+        lines: List[str] = []
+        for raw in entries or []:
+            normalized = sanitize_operation_log_entry(raw)
+            if normalized is None:
+                continue
+            self._recent.append(normalized)
+            lines.append(json.dumps(normalized, ensure_ascii=False, separators=(",", ":")))
+        if lines:
+            self.revision += 1
+            if self.path:
+                self._write_lines(lines)
+        return len(lines)
+
+    def clear(self) -> None:
+        """すべての履歴（旧世代を含む）を消す。"""
+        self._recent.clear()
+        self._line_counts.clear()
+        self.revision += 1
+        for path in self._file_paths():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except Exception:
+                logger.warning(f"Failed to remove operation log: {path}", exc_info=True)
+
+    # ==========================================
+    # Read
+    # ==========================================
+
+    def recent(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """メモリ上の直近の履歴（古い順）。ファイルは読まない。"""
+        entries = [dict(entry) for entry in self._recent]
+        if limit is None:
+            return entries
+        if int(limit) <= 0:
+            return []
+        return entries[-int(limit) :]
+
+    def read_page(self, offset: int = 0, limit: int = 50) -> List[Dict[str, Any]]:
+        """新しい順に offset 件を飛ばして limit 件を返す（旧世代のファイルまで遡る）。"""
+        offset = max(0, int(offset))
+        limit = max(0, int(limit))
+        if limit == 0:
+            return []
+        if not self.path:
+            newest_first = list(reversed(self._recent))
+            return [dict(entry) for entry in newest_first[offset : offset + limit]]
+
+        page: List[Dict[str, Any]] = []
+        skipped = 0
+        for path in self._file_paths():
+            if skipped + (count := self._count_lines(path)) <= offset:
+                # このファイルは丸ごと読み飛ばせる
+                skipped += count
+                continue
+            for entry in self._iter_file_newest_first(path):
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                page.append(entry)
+                if len(page) >= limit:
+                    return page
+        return page
+
+    def count(self) -> int:
+        """保存済みの件数（旧世代を含む）。"""
+        if not self.path:
+            return len(self._recent)
+        return sum(self._count_lines(path) for path in self._file_paths())
+
+    # ==========================================
+    # Internal
+    # ==========================================
+
+    def _file_paths(self) -> List[str]:
+        """現行ファイルと旧世代（新しい順）のうち存在するもの。"""
+        if not self.path:
+            return []
+        candidates = [self.path] + [f"{self.path}.{i}" for i in range(1, self.backup_count + 1)]
+        return [p for p in candidates if os.path.exists(p)]
+
+    def _write_lines(self, lines: List[str]) -> None:
+        payload = "".join(f"{line}\n" for line in lines).encode("utf-8")
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            try:
+                size = os.path.getsize(self.path)
+            except OSError:
+                size = 0
+            if size > 0 and size + len(payload) > self.max_bytes:
+                self._rotate()
+            elif size > 0 and not self._ends_with_newline():
+                # 書き込み途中で終了した行に続けて書かない
+                payload = b"\n" + payload
+            with open(self.path, "ab") as f:
+                f.write(payload)
+        except Exception:
+            logger.warning(f"Failed to append operation log: {self.path}", exc_info=True)
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _rotate(self) -> None:
+        """現行ファイルを .1 へ、.N を .N+1 へずらす（最古の世代は捨てる）。"""
+        if self.backup_count <= 0:
+            os.remove(self.path)
+            return
+        oldest = f"{self.path}.{self.backup_count}"
+        if os.path.exists(oldest):
+            os.remove(oldest)
+        for i in range(self.backup_count - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+        # 旧世代のファイル名がずれたため、件数キャッシュは stat で照合し直す
+        self._line_counts.clear()
+
+    def _count_lines(self, path: str) -> int:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return 0
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        cached = self._line_counts.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        count = sum(1 for _ in self._iter_file_newest_first(path))
+        self._line_counts[path] = (stamp, count)
+        return count
+
+    @staticmethod
+    def _iter_file_newest_first(path: str) -> Iterator[Dict[str, Any]]:
+        try:
+            with open(path, "rb") as f:
+                raw_lines = f.read().splitlines()
+        except OSError:
+            return
+        for raw in reversed(raw_lines):
+            if not raw.strip():
+                continue
+            try:
+                entry = sanitize_operation_log_entry(json.loads(raw))
+            except ValueError:
+                # 書き込み途中で終了した行など
+                continue
+            if entry is not None:
+                yield entry
+
+    def _load_recent(self) -> None:
+        if not self.path:
+            return
+        try:
+            newest_first = self.read_page(0, self._recent.maxlen or DEFAULT_BUFFER_SIZE)
+        except Exception:
+            logger.warning(f"Failed to read operation logs: {self.path}", exc_info=True)
+            return
+        self._recent.extend(reversed(newest_first))
@@ -0,0 +1,471 @@
+# managers/project_bundle.py
+"""画像を同梱した自己完結型プロジェクト（バンドル）の保存と読み込み。
+
+バンドルは zip（拡張子 .ftivz）またはディレクトリで、次の構成を持つ:
+    ftiv_bundle.json          マニフェスト（画像ハッシュ → 拡張子・元ファイル名・サイズ・プレビュー）
+    project.json              プロジェクトデータ（image_path はバンドル内の相対パス）
+    images/<sha256><ext>      画像本体（内容ハッシュで1つだけ保存し、シーン間の重複を除く）
+    previews/<sha256>.png     任意。縮小済みの先頭フレーム（読み込み直後の仮表示用）
+
+zip の読み込みでは中央ディレクトリだけを読み、画像は内容ハッシュ名のキャッシュ上のパスへ
+解決するだけにする。未展開の画像は最初に必要になった時点（ensure_bundle_image）で取り出し、
+残りはバックグラウンドで展開する（同じ画像は二度展開しない）。
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import zipfile
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_EXTENSION: str = ".ftivz"
+MANIFEST_NAME: str = "ftiv_bundle.json"
+PROJECT_NAME: str = "project.json"
+BUNDLE_VERSION: int = 1
+IMAGES_DIR: str = "images"
+PREVIEWS_DIR: str = "previews"
+# プレビューの長辺（px）
+PREVIEW_MAX_SIDE: int = 256
+
+_HASH_CHUNK: int = 1024 * 1024
+
+# 展開を遅らせている画像: キャッシュ上の絶対パス → (zip のパス, メンバー名)
+_deferred_members: Dict[str, Tuple[str, str]] = {}
+_deferred_lock = threading.Lock()
+
+
+def hash_file(path: str) -> str:
+    """ファイル内容の SHA-256（16進）を返す。"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_window_specs(project_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """プロジェクト内の全ウィンドウ辞書（current_state と保存済みシーン）を列挙する。"""
+    current = project_data.get("current_state")
+    if isinstance(current, dict):
+        yield from (w for w in current.get("windows", []) if isinstance(w, dict))
+    scenes = project_data.get("scenes")
+    if isinstance(scenes, dict):
+        for entries in scenes.values():
+            if not isinstance(entries, dict):
+                continue
+            for scene in entries.values():
+                if isinstance(scene, dict):
+                    yield from (w for w in scene.get("windows", []) if isinstance(w, dict))
+
+
+def _build_preview(image_path: str, dest_path: str) -> Optional[Dict[str, int]]:
+    """先頭フレームを縮小した PNG を書き出し、元画像のサイズ情報を返す。失敗時は None。"""
+    try:
+        from PIL import Image
+
+        with Image.open(image_path) as img:
+            info = {"width": int(img.width), "height": int(img.height), "frames": int(getattr(img, "n_frames", 1))}
+            frame = img.convert("RGBA")
+            frame.thumbnail((PREVIEW_MAX_SIDE, PREVIEW_MAX_SIDE))
+            frame.save(dest_path, format="PNG")
+        return info
+    except Exception:
+        logger.warning(f"Failed to build bundle preview: {image_path}", exc_info=True)
+        return None
+
+
+# ==========================================
+# Write
+# ==========================================
+
+
+def write_project_bundle(
+    path: str,
+    project_data: Dict[str, Any],
+    *,
+    as_zip: Optional[bool] = None,
+    include_previews: bool = True,
+) -> Dict[str, Any]:
+    """プロジェクトを画像同梱のバンドルとして保存する。
+
+    存在する image_path は内容ハッシュで images/ に1回だけ格納し、
+    project.json 内では相対パス（images/<hash><ext>）に置き換える。
+    見つからない画像のパスはそのまま残す。
+
+    Args:
+        path: 保存先（.ftivz ファイル、またはディレクトリ）。
+        project_data: save_project_as_json と同じ形式のプロジェクト辞書（変更しない）。
+        as_zip: True で zip、False でディレクトリ。None の場合は拡張子で判定する。
+        include_previews: 縮小プレビューを同梱するかどうか。
+
+    Returns:
+        Dict[str, Any]: 書き込んだマニフェスト。
+    """
+    if as_zip is None:
+        as_zip = path.lower().endswith(BUNDLE_EXTENSION)
+
+    data = json.loads(json.dumps(project_data, ensure_ascii=False))
+    images: Dict[str, Dict[str, Any]] = {}
+    sources: Dict[str, str] = {}  # hash -> 元ファイル
+    hashed_paths: Dict[str, Optional[str]] = {}  # 元パス -> hash（同じパスは1回だけ読む）
+
+    for spec in iter_window_specs(data):
+        image_path = spec.get("image_path")
+        if not isinstance(image_path, str) or not image_path:
+            continue
+        if image_path not in hashed_paths:
+            digest: Optional[str] = None
+            # 展開を遅らせているバンドル画像は、ここで取り出してから読む
+            if ensure_bundle_image(image_path) and os.path.isfile(image_path):
+                try:
+                    digest = hash_file(image_path)
+                except OSError:
+                    logger.warning(f"Failed to read image for bundle: {image_path}", exc_info=True)
+            hashed_paths[image_path] = digest
+        digest = hashed_paths[image_path]
+        if digest is None:
+            continue
+        ext = os.path.splitext(image_path)[1].lower()
+        if digest not in images:
+            images[digest] = {
+                "file": f"{IMAGES_DIR}/{digest}{ext}",
+                "original_name": os.path.basename(image_path),
+                "size": os.path.getsize(image_path),
+            }
+            sources[digest] = image_path
+        spec["image_path"] = images[digest]["file"]
+
+    manifest: Dict[str, Any] = {"bundle_version": BUNDLE_VERSION, "images": images}
+    writer = _ZipWriter(path) if as_zip else _DirWriter(path)
+    try:
+        for digest, entry in images.items():
+            writer.add_file(sources[digest], entry["file"])
+            if include_previews:
+                preview_name = f"{PREVIEWS_DIR}/{digest}.png"
+                info = writer.add_generated(preview_name, lambda dest, src=sources[digest]: _build_preview(src, dest))
+                if info:
+                    entry["preview"] = preview_name
+                    entry.update(info)
+        writer.add_json(PROJECT_NAME, data)
+        writer.add_json(MANIFEST_NAME, manifest)
+        writer.commit()
+    except Exception:
+        writer.abort()
+        raise
+
+    logger.info(f"Project bundle saved: {path} ({len(images)} unique images from {len(hashed_paths)} image paths)")
+    return manifest
+
+
+class _DirWriter:
+    def __init__(self, root: str) -> None:
+        self.root = root
+        os.makedirs(os.path.join(root, IMAGES_DIR), exist_ok=True)
+        os.makedirs(os.path.join(root, PREVIEWS_DIR), exist_ok=True)
+
+    def _target(self, name: str) -> str:
+        return os.path.join(self.root, *name.split("/"))
+
+    def add_file(self, source: str, name: str) -> None:
+        target = self._target(name)
+        # 内容ハッシュ名なので、既にあれば同一内容
+        if not os.path.exists(target):
+            shutil.copyfile(source, target)
+
+    def add_generated(self, name: str, build: Callable[[str], Optional[Dict[str, int]]]) -> Optional[Dict[str, int]]:
+        return build(self._target(name))
+
+    def add_json(self, name: str, data: Any) -> None:
+        temp_path = f"{self._target(name)}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self._target(name))
+
+    def commit(self) -> None:
+        pass
+
+    def abort(self) -> None:
+        pass
+
+
+class _ZipWriter:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.temp_path = f"{path}.tmp"
+        self.zf = zipfile.ZipFile(self.temp_path, "w")
+
+    def add_file(self, source: str, name: str) -> None:
+        # 画像は既に圧縮済みの形式が多いので無圧縮で格納する（展開も速い）
+        self.zf.write(source, name, compress_type=zipfile.ZIP_STORED)
+
+    def add_generated(self, name: str, build: Callable[[str], Optional[Dict[str, int]]]) -> Optional[Dict[str, int]]:
+        scratch = f"{self.temp_path}.preview"
+        try:
+            info = build(scratch)
+            if info:
+                self.zf.write(scratch, name, compress_type=zipfile.ZIP_STORED)
+            return info
+        finally:
+            if os.path.exists(scratch):
+                os.remove(scratch)
+
+    def add_json(self, name: str, data: Any) -> None:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        self.zf.writestr(name, payload, compress_type=zipfile.ZIP_DEFLATED)
+
+    def commit(self) -> None:
+        self.zf.close()
+        os.replace(self.temp_path, self.path)
+
+    def abort(self) -> None:
+        try:
+            self.zf.close()
+        finally:
+            if os.path.exists(self.temp_path):
+                os.remove(self.temp_path)
+
+
+# ==========================================
+# Read
+# ==========================================
+
+
+def _extract_member(zip_path: str, name: str, target: str) -> None:
+    """zip のメンバーを一時ファイル経由で target へ展開する。"""
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    temp_path = f"{target}.{threading.get_ident()}.tmp"
+    try:
+        with zipfile.ZipFile(zip_path) as zf, zf.open(name) as src, open(temp_path, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(temp_path, target)
+    except Exception:
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except Exception:
+                pass
+        raise
+
+
+def ensure_bundle_image(path: str) -> bool:
+    """path がバンドルから展開を遅らせている画像なら、その場で展開する。
+
+    Args:
+        path: 画像の絶対パス。
+
+    Returns:
+        bool: path のファイルが存在する場合 True。
+    """
+    if not path:
+        return False
+    key = os.path.abspath(path)
+    if key not in _deferred_members:
+        return os.path.exists(path)
+    with _deferred_lock:
+        source = _deferred_members.get(key)
+        if source is not None and not os.path.exists(key):
+            try:
+                _extract_member(source[0], source[1], key)
+                logger.debug(f"Extracted bundle image on demand: {key}")
+            except Exception:
+                logger.warning(f"Failed to extract bundle image: {source[1]} ({source[0]})", exc_info=True)
+                return False
+        _deferred_members.pop(key, None)
+    return os.path.exists(key)
+
+
+def has_deferred_bundle_images() -> bool:
+    """展開を遅らせている画像が残っているかどうか。"""
+    return bool(_deferred_members)
+
+
+def extract_deferred_bundle_images() -> int:
+    """展開を遅らせている画像をすべて展開する（バックグラウンドスレッドから呼ぶ想定）。
+
+    保存済みシーンはキャッシュ上のパスを参照するため、次回起動時にも画像が揃っているよう
+    読み込み後に残りを展開しておく。
+
+    Returns:
+        int: 展開した画像数。
+    """
+    count = 0
+    while True:
+        with _deferred_lock:
+            if not _deferred_members:
+                return count
+            path = next(iter(_deferred_members))
+        existed = os.path.exists(path)
+        if ensure_bundle_image(path) and not existed:
+            count += 1
+        else:
+            with _deferred_lock:
+                _deferred_members.pop(path, None)
+
+
+def start_deferred_extraction() -> Optional[threading.Thread]:
+    """残りの画像を展開するバックグラウンドスレッドを開始する。展開待ちが無ければ None。"""
+    if not has_deferred_bundle_images():
+        return None
+    thread = threading.Thread(target=extract_deferred_bundle_images, name="BundleExtract", daemon=True)
+    thread.start()
+    return thread
+
+
+def is_project_bundle(path: str) -> bool:
+    """path がバンドル（zip またはマニフェストを含むディレクトリ/マニフェスト自体）かどうか。"""
+    if os.path.isdir(path):
+        return os.path.isfile(os.path.join(path, MANIFEST_NAME))
+    if os.path.basename(path) == MANIFEST_NAME:
+        return True
+    return zipfile.is_zipfile(path) if os.path.isfile(path) else False
+
+
+class ProjectBundle:
+    """読み込み用に開いたバンドル。
+
+    Attributes:
+        path: バンドルのパス（zip ファイルまたはディレクトリ）。
+        manifest: マニフェスト辞書。
+        extracted_count: 今回キャッシュへ展開したファイル数（プレビューを含む）。
+        reused_count: キャッシュに既にあり展開を省略したファイル数。
+        deferred_count: 展開を最初に必要になる時点まで遅らせた画像数。
+    """
+
+    def __init__(self, path: str) -> None:
+        """バンドルを開き、マニフェストだけを読み込みます。
+
+        Args:
+            path: .ftivz ファイル、バンドルディレクトリ、またはそのマニフェストのパス。
+
+        Raises:
+            ValueError: バンドルとして読めない場合。
+        """
+        if os.path.basename(path) == MANIFEST_NAME:
+            path = os.path.dirname(path)
+        self.path = path
+        self.is_zip = not os.path.isdir(path)
+        self._zip: Optional[zipfile.ZipFile] = zipfile.ZipFile(path) if self.is_zip else None
+        manifest = self._read_json(MANIFEST_NAME)
+        if not isinstance(manifest, dict) or "images" not in manifest:
+            self.close()
+            raise ValueError(f"Not a project bundle: {path}")
+        self.manifest: Dict[str, Any] = manifest
+        self.extracted_count: int = 0
+        self.reused_count: int = 0
+        self.deferred_count: int = 0
+
+    def close(self) -> None:
+        """zip を閉じる。"""
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    def __enter__(self) -> "ProjectBundle":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    def _read_json(self, name: str) -> Any:
+        if self._zip is not None:
+            try:
+                return json.loads(self._zip.read(name).decode("utf-8"))
+            except KeyError:
+                return None
+        target = os.path.join(self.path, name)
+        if not os.path.isfile(target):
+            return None
+        with open(target, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _materialize(self, name: str, cache_dir: str) -> str:
+        """バンドル内ファイルの実パスを返す。zip の場合はキャッシュへ未展開なら展開する。"""
+        if self._zip is None:
+            return os.path.join(self.path, *name.split("/"))
+        target = os.path.join(cache_dir, os.path.basename(name))
+        if os.path.exists(target):
+            self.reused_count += 1
+            return target
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_path = f"{target}.tmp"
+        with self._zip.open(name) as src, open(temp_path, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(temp_path, target)
+        self.extracted_count += 1
+        return target
+
+    def _resolve_image(self, name: str, cache_dir: str) -> str:
+        """画像の実パスを返す。zip の未展開の画像は展開せず、ensure_bundle_image 用に登録する。"""
+        if self._zip is None:
+            return os.path.join(self.path, *name.split("/"))
+        target = os.path.abspath(os.path.join(cache_dir, os.path.basename(name)))
+        if os.path.exists(target):
+            self.reused_count += 1
+            return target
+        with _deferred_lock:
+            _deferred_members[target] = (os.path.abspath(self.path), name)
+        self.deferred_count += 1
+        return target
+
+    def load_project(self, cache_dir: str) -> Dict[str, Any]:
+        """project.json を読み、image_path を実ファイルの絶対パスへ解決して返す。
+
+        zip の画像本体はここでは展開しない（ensure_bundle_image / start_deferred_extraction）。
+        current_state のウィンドウには、プレビューがあれば "_preview_path" と元画像サイズの
+        "_preview_size"（いずれも一時キー）を付ける。プレビューは current_state で使う分だけ展開する。
+
+        Args:
+            cache_dir: zip から画像を展開する内容ハッシュ名のキャッシュディレクトリ。
+
+        Returns:
+            Dict[str, Any]: プロジェクト辞書。
+        """
+        data = self._read_json(PROJECT_NAME)
+        if not isinstance(data, dict):
+            raise ValueError(f"Project bundle has no {PROJECT_NAME}: {self.path}")
+
+        by_file: Dict[str, Tuple[str, Dict[str, Any]]] = {
+            entry["file"]: (digest, entry)
+            for digest, entry in self.manifest.get("images", {}).items()
+            if isinstance(entry, dict) and "file" in entry
+        }
+        current_files = {w.get("image_path") for w in _current_windows(data)}
+        resolved: Dict[str, str] = {}
+        previews: Dict[str, Tuple[str, Optional[List[int]]]] = {}
+        for name, (_digest, entry) in by_file.items():
+            resolved[name] = os.path.abspath(self._resolve_image(name, os.path.join(cache_dir, IMAGES_DIR)))
+            preview = entry.get("preview")
+            if preview and name in current_files:
+                preview_path = os.path.abspath(self._materialize(preview, os.path.join(cache_dir, PREVIEWS_DIR)))
+                size = [int(entry["width"]), int(entry["height"])] if "width" in entry and "height" in entry else None
+                previews[name] = (preview_path, size)
+
+        current_ids = {id(w) for w in _current_windows(data)}
+        for spec in iter_window_specs(data):
+            rel = spec.get("image_path")
+            if rel not in resolved:
+                continue
+            spec["image_path"] = resolved[rel]
+            if id(spec) in current_ids and rel in previews:
+                spec["_preview_path"], size = previews[rel]
+                if size:
+                    spec["_preview_size"] = size
+
+        logger.info(
+            f"Project bundle opened: {self.path} "
+            f"(images: {len(resolved)}, extracted: {self.extracted_count}, reused: {self.reused_count}, "
+            f"deferred: {self.deferred_count})"
+        )
+        return data
+
+
+def _current_windows(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    current = data.get("current_state")
+    if not isinstance(current, dict):
+        return []
+    return [w for w in current.get("windows", []) if isinstance(w, dict)]
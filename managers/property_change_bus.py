@@ -0,0 +1,243 @@
+# managers/property_change_bus.py
+"""ウィンドウのプロパティ変更を、変わったフィールドと分類つきで配信するイベントバス。
+
+sig_properties_changed はウィンドウしか運ばないため、受け取り側は何が変わったかを知らずに
+毎回まとめて更新していた。バスは config の変更フィールド（WindowConfigBase.take_changed_fields）を
+visual / metadata / geometry / animation に分類し、同じイベントループ周回の間の通知を
+ウィンドウごとに 1 件へ合流してから、購読した分類に該当する購読者へだけ配る。
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Literal, Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer
+
+logger = logging.getLogger(__name__)
+
+ChangeCategory = Literal["visual", "metadata", "geometry", "animation"]
+
+CHANGE_CATEGORIES: FrozenSet[str] = frozenset({"visual", "metadata", "geometry", "animation"})
+
+# 一覧・検索・期限など、内容として扱うフィールド
+_METADATA_FIELDS: FrozenSet[str] = frozenset(
+    {
+        "uuid",
+        "title",
+        "tags",
+        "is_starred",
+        "is_archived",
+        "created_at",
+        "updated_at",
+        "text",
+        "content_mode",
+        "task_states",
+        "task_schema_version",
+        "due_at",
+        "due_time",
+        "due_timezone",
+        "due_precision",
+        "image_path",
+    }
+)
+# 位置・大きさ・重なり順・表示状態
+_GEOMETRY_FIELDS: FrozenSet[str] = frozenset(
+    {
+        "position",
+        "geometry",
+        "parent_uuid",
+        "layer_offset",
+        "layer_order",
+        "anchor_position",
+        "is_frontmost",
+        "is_hidden",
+        "is_click_through",
+        "is_locked",
+    }
+)
+_ANIMATION_FIELDS: FrozenSet[str] = frozenset(
+    {"start_position", "end_position", "is_fading_enabled", "animation_speed_factor"}
+)
+_ANIMATION_PREFIXES: Tuple[str, ...] = ("move_", "fade_")
+
+PropertyChangeSubscriber = Callable[[List["PropertyChangeEvent"]], None]
+
+
+def categorize_field(field_name: str) -> str:
+    """フィールド名の分類。どれにも当たらないものは描画に関わる visual とする。"""
+    if field_name in _METADATA_FIELDS:
+        return "metadata"
+    if field_name in _GEOMETRY_FIELDS:
+        return "geometry"
+    if field_name in _ANIMATION_FIELDS or field_name.startswith(_ANIMATION_PREFIXES):
+        return "animation"
+    return "visual"
+
+
+def categorize_fields(fields: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """フィールド群の分類。fields が None（何が変わったか不明）の場合は全分類。"""
+    if fields is None:
+        return CHANGE_CATEGORIES
+    return frozenset(categorize_field(name) for name in fields)
+
+
+@dataclass(frozen=True)
+class PropertyChangeEvent:
+    """1 ウィンドウ分の（合流済みの）変更。
+
+    Attributes:
+        window: 変更されたウィンドウ。
+        fields: 変わった config フィールド。None は不明（config の差し替えなど）で、全フィールド扱い。
+        categories: fields の分類。
+    """
+
+    window: Any
+    fields: Optional[FrozenSet[str]]
+    categories: FrozenSet[str]
+
+    def affects(self, *categories: str) -> bool:
+        """いずれかの分類に該当するかどうか。"""
+        return not self.categories.isdisjoint(categories)
+
+    def touches(self, *field_names: str) -> bool:
+        """いずれかのフィールドが変わったかどうか（fields が不明なら True）。"""
+        return self.fields is None or not self.fields.isdisjoint(field_names)
+
+
+class PropertyChangeBus(QObject):
+    """プロパティ変更をイベントループ 1 周ごとに合流して配信する。
+
+    publish() はウィンドウごとの保留分へ変更フィールドを足すだけで、配信は次の周回で
+    flush() がまとめて行う。購読者は subscribe() で分類を指定し、該当するイベントの
+    リストを 1 周につき 1 回だけ受け取る。
+
+    Attributes:
+        published_count: publish() の呼び出し回数。
+        delivered_count: 合流後に配信したイベント数。
+    """
+
+    def __init__(self, parent: Optional[QObject] = None, *, synchronous: Optional[bool] = None) -> None:
+        """PropertyChangeBusを初期化します。
+
+        Args:
+            parent: 親 QObject。
+            synchronous: publish 時にその場で配信するか。None の場合は FTIV_TEST_MODE=1 のとき同期。
+        """
+        super().__init__(parent)
+        self._synchronous: Optional[bool] = synchronous
+        self._subscribers: List[Tuple[PropertyChangeSubscriber, Optional[FrozenSet[str]]]] = []
+        # id(window) -> (window, 変更フィールド。None は不明)
+        self._pending: Dict[int, Tuple[Any, Optional[set[str]]]] = {}
+        # id(window) -> 前回見た config。差し替えられていたら変更フィールドは不明とする
+        self._configs: Dict[int, Any] = {}
+        self._flush_scheduled: bool = False
+        self.published_count: int = 0
+        self.delivered_count: int = 0
+
+    @property
+    def synchronous(self) -> bool:
+        """同期配信モードかどうか。"""
+        if self._synchronous is not None:
+            return self._synchronous
+        return os.getenv("FTIV_TEST_MODE") == "1"
+
+    def subscribe(self, callback: PropertyChangeSubscriber, categories: Optional[Iterable[str]] = None) -> None:
+        """購読者を登録する。
+
+        Args:
+            callback: callback(events) で呼ばれる。events は該当する PropertyChangeEvent のリスト。
+            categories: 受け取る分類。None の場合はすべて。
+        """
+        wanted = frozenset(categories) if categories is not None else None
+        self.unsubscribe(callback)
+        self._subscribers.append((callback, wanted))
+
+    def unsubscribe(self, callback: PropertyChangeSubscriber) -> None:
+        """subscribe() で登録した購読者を外す。"""
+        self._subscribers = [(cb, cats) for cb, cats in self._subscribers if cb != callback]
+
+    def publish(self, window: Any, fields: Optional[Iterable[str]] = None) -> None:
+        """変更を保留に加える。
+
+        Args:
+            window: 変更されたウィンドウ。
+            fields: 変わったフィールド。None の場合は config の変更記録から取り出す
+                （config が無い・差し替えられた場合は「不明」として全分類に配る）。
+        """
+        if window is None:
+            return
+        self.published_count += 1
+        changed = self._collect_fields(window, fields)
+        key = id(window)
+        entry = self._pending.get(key)
+        if entry is None or entry[0] is not window:
+            self._pending[key] = (window, changed)
+        elif entry[1] is not None:
+            if changed is None:
+                self._pending[key] = (window, None)
+            else:
+                entry[1].update(changed)
+        if self.synchronous:
+            self.flush()
+            return
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self.flush)
+
+    def forget(self, window: Any) -> None:
+        """閉じたウィンドウの保留分と記録を捨てる。"""
+        key = id(window)
+        entry = self._pending.get(key)
+        if entry is not None and entry[0] is window:
+            del self._pending[key]
+        self._configs.pop(key, None)
+
+    def flush(self) -> List[PropertyChangeEvent]:
+        """保留中の変更を合流したイベントとして配信する。
+
+        Returns:
+            List[PropertyChangeEvent]: 配信したイベント（どの分類にも当たらない空の変更は除く）。
+        """
+        self._flush_scheduled = False
+        pending = self._pending
+        if not pending:
+            return []
+        self._pending = {}
+        events: List[PropertyChangeEvent] = []
+        for window, changed in pending.values():
+            fields = frozenset(changed) if changed is not None else None
+            categories = categorize_fields(fields)
+            if categories:
+                events.append(PropertyChangeEvent(window=window, fields=fields, categories=categories))
+        if not events:
+            return events
+        self.delivered_count += len(events)
+        for callback, wanted in list(self._subscribers):
+            matched = events if wanted is None else [e for e in events if not e.categories.isdisjoint(wanted)]
+            if not matched:
+                continue
+            try:
+                callback(matched)
+            except Exception:
+                logger.warning(f"Property change subscriber failed: {callback!r}", exc_info=True)
+        return events
+
+    def _collect_fields(self, window: Any, fields: Optional[Iterable[str]]) -> Optional[set[str]]:
+        config = getattr(window, "config", None)
+        take = getattr(config, "take_changed_fields", None)
+        if not callable(take):
+            return set(fields) if fields is not None else None
+        key = id(window)
+        previous = self._configs.get(key)
+        self._configs[key] = config
+        if previous is not None and previous is not config:
+            # シーン読み込み等で config ごと差し替えられた: どのフィールドが変わったかは分からない
+            take()
+            return None
+        if fields is not None:
+            # 呼び出し側が明示したフィールド（config の変更記録は次の通知で取り出す）
+            return set(fields)
+        return set(take())
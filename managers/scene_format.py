@@ -0,0 +1,192 @@
+# managers/scene_format.py
+"""シーンファイルのコンパクト形式（レコードストリーム）と形式判定。
+
+従来形式は `{"format_version":1, "windows":[...], "connections":[...]}` を indent=4 で
+書いた1つの JSON で、読み込みは json.load で全体をパースしてからウィンドウを生成していた。
+
+コンパクト形式（拡張子 .ftivs）は UTF-8 の JSON Lines:
+    1行目: ヘッダ {"ftiv_scene_stream": 1, "format_version": 1, "window_count": N, ...}
+    以降:   ["w", {ウィンドウ辞書}] / ["c", {接続辞書}] を1行1レコード
+インデント無しで、orjson があれば高速エンコーダを使う（無ければ標準 json）。
+1行ずつ読めるため、全体のパースを待たずにウィンドウ生成を始められる。
+"""
+
+import json
+import os
+from typing import IO, Any, Dict, Iterator, List, NamedTuple, Union
+
+try:
+    import orjson as _orjson
+except ImportError:  # 任意依存。無ければ標準 json を使う
+    _orjson = None
+
+SCENE_STREAM_MAGIC: str = "ftiv_scene_stream"
+SCENE_STREAM_VERSION: int = 1
+SCENE_STREAM_EXTENSION: str = ".ftivs"
+
+FORMAT_JSON: str = "json"
+FORMAT_STREAM: str = "stream"
+
+_KIND_WINDOW: str = "w"
+_KIND_CONNECTION: str = "c"
+
+
+class SceneRecord(NamedTuple):
+    """ストリームから読み出した1レコード。
+
+    Attributes:
+        kind: "header" / "window" / "connection"。
+        data: レコード本体の辞書。
+    """
+
+    kind: str
+    data: Dict[str, Any]
+
+
+def json_backend() -> str:
+    """使用中の JSON エンコーダ名を返す（"orjson" または "json"）。"""
+    return "orjson" if _orjson is not None else "json"
+
+
+def dumps_compact(obj: Any) -> bytes:
+    """インデント無しの UTF-8 JSON バイト列を返す。"""
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads_compact(data: Union[bytes, str]) -> Any:
+    """dumps_compact の逆変換。"""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+# ==========================================
+# Write
+# ==========================================
+
+
+def write_scene_stream(path: str, scene_data: Dict[str, Any]) -> None:
+    """シーン辞書をコンパクト形式で保存する（一時ファイル → os.replace）。
+
+    Args:
+        path: 保存先パス。
+        scene_data: get_scene_data() 形式のシーン辞書。
+    """
+    windows = [w for w in scene_data.get("windows", []) if isinstance(w, dict)]
+    connections = [c for c in scene_data.get("connections", []) if isinstance(c, dict)]
+    # 形式判定を先頭数バイトで済ませるため、マジックキーを先頭に置く
+    header: Dict[str, Any] = {SCENE_STREAM_MAGIC: SCENE_STREAM_VERSION}
+    header.update({key: value for key, value in scene_data.items() if key not in ("windows", "connections")})
+    header.setdefault("format_version", 1)
+    header["window_count"] = len(windows)
+    header["connection_count"] = len(connections)
+
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(dumps_compact(header))
+            f.write(b"\n")
+            for window in windows:
+                f.write(dumps_compact([_KIND_WINDOW, window]))
+                f.write(b"\n")
+            for conn in connections:
+                f.write(dumps_compact([_KIND_CONNECTION, conn]))
+                f.write(b"\n")
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except Exception:
+                pass
+        raise
+
+
+# ==========================================
+# Read
+# ==========================================
+
+
+def detect_scene_format(path: str) -> str:
+    """ファイル先頭を見て形式を判定する。
+
+    Returns:
+        str: FORMAT_STREAM（コンパクト形式）または FORMAT_JSON（従来形式）。
+    """
+    with open(path, "rb") as f:
+        head = f.read(64)
+    if head.startswith(b"\xef\xbb\xbf"):
+        head = head[3:]
+    prefix = b'{"' + SCENE_STREAM_MAGIC.encode("ascii") + b'"'
+    return FORMAT_STREAM if head.lstrip().startswith(prefix) else FORMAT_JSON
+
+
+def iter_scene_stream(source: Union[str, IO[bytes]]) -> Iterator[SceneRecord]:
+    """コンパクト形式を1行ずつ読み、ヘッダ → ウィンドウ → 接続の順にレコードを返す。
+
+    Args:
+        source: ファイルパス、またはバイナリモードのファイルオブジェクト。
+
+    Yields:
+        SceneRecord: 読み出したレコード。
+
+    Raises:
+        ValueError: ヘッダが無い、または不正なレコードがある場合。
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            yield from iter_scene_stream(f)
+        return
+
+    header_line = source.readline()
+    header = loads_compact(header_line) if header_line.strip() else None
+    if not isinstance(header, dict) or SCENE_STREAM_MAGIC not in header:
+        raise ValueError("Not a scene stream: header is missing")
+    yield SceneRecord("header", header)
+
+    for line_no, line in enumerate(source, start=2):
+        if not line.strip():
+            continue
+        record = loads_compact(line)
+        if not isinstance(record, list) or len(record) != 2 or not isinstance(record[1], dict):
+            raise ValueError(f"Invalid scene stream record at line {line_no}")
+        kind, data = record
+        if kind == _KIND_WINDOW:
+            yield SceneRecord("window", data)
+        elif kind == _KIND_CONNECTION:
+            yield SceneRecord("connection", data)
+        # 未知の種類は将来拡張として読み飛ばす
+
+
+def read_scene_stream(source: Union[str, IO[bytes]]) -> Dict[str, Any]:
+    """コンパクト形式を従来形式のシーン辞書に組み立てて返す。"""
+    scene: Dict[str, Any] = {}
+    windows: List[Dict[str, Any]] = []
+    connections: List[Dict[str, Any]] = []
+    for record in iter_scene_stream(source):
+        if record.kind == "header":
+            scene.update(
+                {
+                    k: v
+                    for k, v in record.data.items()
+                    if k not in (SCENE_STREAM_MAGIC, "window_count", "connection_count")
+                }
+            )
+        elif record.kind == "window":
+            windows.append(record.data)
+        else:
+            connections.append(record.data)
+    scene.setdefault("format_version", 1)
+    scene["windows"] = windows
+    scene["connections"] = connections
+    return scene
+
+
+def read_scene_file(path: str) -> Any:
+    """形式を自動判定してシーンファイルを読み込む（従来形式はそのまま json.load の結果）。"""
+    if detect_scene_format(path) == FORMAT_STREAM:
+        return read_scene_stream(path)
+    with open(path, "r", encoding="utf-8-sig") as f:
+        return json.load(f)
@@ -0,0 +1,222 @@
+# managers/scene_loader.py
+
+import logging
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Set
+
+from PySide6.QtCore import QObject, QRect, QTimer, Signal
+from PySide6.QtGui import QGuiApplication
+
+logger = logging.getLogger(__name__)
+
+# 1 tick あたりの生成に使ってよい時間（ms）。60fps の1フレーム弱に収める。
+DEFAULT_TICK_BUDGET_MS: float = 12.0
+# 1 tick あたりの生成件数の上下限（計測値から自動調整する）
+_MIN_CHUNK: int = 1
+_MAX_CHUNK: int = 64
+_INITIAL_CHUNK: int = 4
+
+
+def load_priority(spec: Dict[str, Any], screen_rect: Optional[QRect] = None) -> int:
+    """ウィンドウ辞書の読み込み優先度を返す（小さいほど先に生成する）。
+
+    0: 表示・最前面・画面内 / 1: 表示・画面内 / 2: 表示・画面外 / 3: 非表示・アーカイブ
+
+    Args:
+        spec: ウィンドウ辞書。
+        screen_rect: 全スクリーンを包含する矩形。None の場合は画面内判定をしない。
+
+    Returns:
+        int: 優先度。
+    """
+    if spec.get("is_hidden") or spec.get("is_archived"):
+        return 3
+
+    on_screen = True
+    if screen_rect is not None:
+        pos = spec.get("position") or spec.get("geometry") or {}
+        try:
+            on_screen = screen_rect.contains(int(pos.get("x", 0)), int(pos.get("y", 0)))
+        except Exception:
+            on_screen = True
+
+    if not on_screen:
+        return 2
+    return 0 if spec.get("is_frontmost", True) else 1
+
+
+def _virtual_screen_rect() -> Optional[QRect]:
+    """接続中の全スクリーンを包含する矩形を返す。取得できない場合は None。"""
+    try:
+        rect = QRect()
+        for screen in QGuiApplication.screens():
+            rect = rect.united(screen.geometry())
+        return rect if rect.isValid() else None
+    except Exception:
+        return None
+
+
+class ProgressiveSceneLoader(QObject):
+    """シーンのウィンドウ生成をイベントループの複数 tick に分散して行うローダー。
+
+    表示中・最前面・画面内のウィンドウから順に生成し、非表示/アーカイブは後回しにする。
+    1 tick あたりの生成件数は直前の実測値から時間予算に収まるよう調整する。
+    コネクタは両端のウィンドウが揃った時点で接続し、親子関係・レイヤー順などの
+    後処理は全件生成後に FileManager._finish_scene_load で1回だけ行う。
+
+    Signals:
+        sig_progress(int, int): 処理済み件数, 全件数。
+        sig_first_visible(object): 最初に表示されたウィンドウ。
+        sig_finished(): 全件の生成と後処理が完了した。
+    """
+
+    sig_progress = Signal(int, int)
+    sig_first_visible = Signal(object)
+    sig_finished = Signal()
+
+    def __init__(
+        self,
+        file_manager: Any,
+        window_specs: List[Dict[str, Any]],
+        connections: List[Dict[str, Any]],
+        *,
+        tick_budget_ms: float = DEFAULT_TICK_BUDGET_MS,
+    ) -> None:
+        """ProgressiveSceneLoaderを初期化します。
+
+        Args:
+            file_manager: 生成と後処理を委譲する FileManager。
+            window_specs: ウィンドウ辞書のリスト（保存順）。
+            connections: 接続情報のリスト。
+            tick_budget_ms: 1 tick あたりの生成時間の目安（ms）。
+        """
+        super().__init__()
+        self.file_manager = file_manager
+        self.window_specs: List[Dict[str, Any]] = list(window_specs)
+        self.tick_budget_ms: float = max(1.0, float(tick_budget_ms))
+
+        screen_rect = _virtual_screen_rect()
+        # 安定ソートなので同じ優先度内では保存順（=レイヤー順）を保つ
+        self._order: List[int] = sorted(
+            range(len(self.window_specs)), key=lambda i: load_priority(self.window_specs[i], screen_rect)
+        )
+        self._cursor: int = 0
+        self._chunk_size: int = _INITIAL_CHUNK
+        self._created: List[Optional[Any]] = [None] * len(self.window_specs)
+        self._pending_connections: List[Dict[str, Any]] = [c for c in connections if isinstance(c, dict)]
+        self._known_uuids: Set[str] = set()
+        self._first_visible_emitted: bool = False
+        self._running: bool = False
+        self._finished: bool = False
+
+    @property
+    def total(self) -> int:
+        """生成対象のウィンドウ件数。"""
+        return len(self.window_specs)
+
+    @property
+    def processed(self) -> int:
+        """生成を試みた（成功/スキップ含む）ウィンドウ件数。"""
+        return self._cursor
+
+    def is_running(self) -> bool:
+        """読み込み途中かどうかを返す。"""
+        return self._running and not self._finished
+
+    def start(self) -> None:
+        """読み込みを開始する。最初の chunk は次の tick で処理する。"""
+        if self._running or self._finished:
+            return
+        self._running = True
+        wm = self.file_manager.window_manager
+        self._known_uuids = {w.uuid for w in wm.text_windows + wm.image_windows}
+        self.sig_progress.emit(0, self.total)
+        QTimer.singleShot(0, self._process_tick)
+
+    def finish_now(self) -> None:
+        """残りを同期的に全て生成して後処理まで完了させる。"""
+        if self._finished:
+            return
+        self._running = True
+        while self._cursor < len(self._order):
+            self._create_chunk(len(self._order) - self._cursor)
+        self._finish()
+
+    def cancel(self) -> None:
+        """以降の生成を打ち切る。生成済みのウィンドウはそのまま残す。"""
+        if self._finished:
+            return
+        self._finished = True
+        self._running = False
+        logger.info(f"Progressive scene load cancelled at {self._cursor}/{self.total}")
+
+    def _process_tick(self) -> None:
+        if self._finished or not self._running:
+            return
+        try:
+            self._create_chunk(self._chunk_size)
+        except Exception:
+            logger.error("Progressive scene load chunk failed", exc_info=True)
+
+        if self._cursor >= len(self._order):
+            self._finish()
+        else:
+            QTimer.singleShot(0, self._process_tick)
+
+    def _create_chunk(self, count: int) -> None:
+        indices = self._order[self._cursor : self._cursor + max(1, count)]
+        if not indices:
+            return
+
+        t0 = perf_counter()
+        chunk_specs = [self.window_specs[i] for i in indices]
+        results = self.file_manager._create_scene_windows(chunk_specs, select_last=False)
+        elapsed_ms = (perf_counter() - t0) * 1000.0
+
+        for index, window in zip(indices, results):
+            self._created[index] = window
+            if window is None:
+                continue
+            self._known_uuids.add(window.uuid)
+            if not self._first_visible_emitted and not getattr(window.config, "is_hidden", False):
+                self._first_visible_emitted = True
+                self.sig_first_visible.emit(window)
+
+        self._cursor += len(indices)
+        self._attach_ready_connections()
+        self.sig_progress.emit(self._cursor, self.total)
+
+        # 1件あたりの実測から、次の chunk が時間予算に収まる件数を見積もる
+        per_window_ms = elapsed_ms / len(indices)
+        if per_window_ms > 0:
+            estimate = int(self.tick_budget_ms / per_window_ms)
+            self._chunk_size = max(_MIN_CHUNK, min(_MAX_CHUNK, estimate))
+
+    def _attach_ready_connections(self) -> None:
+        if not self._pending_connections:
+            return
+        ready: List[Dict[str, Any]] = []
+        waiting: List[Dict[str, Any]] = []
+        for conn in self._pending_connections:
+            if conn.get("from_uuid") in self._known_uuids and conn.get("to_uuid") in self._known_uuids:
+                ready.append(conn)
+            else:
+                waiting.append(conn)
+        self._pending_connections = waiting
+        if ready:
+            self.file_manager._restore_connections(ready)
+
+    def _finish(self) -> None:
+        self._finished = True
+        self._running = False
+        try:
+            # 片側が最後まで現れなかった接続は _restore_connections 側で読み飛ばされる
+            self.file_manager._finish_scene_load(self.window_specs, self._created, self._pending_connections)
+            self._pending_connections = []
+            last = next((w for w in reversed(self._created) if w is not None), None)
+            select = getattr(self.file_manager.window_manager, "set_selected_window", None)
+            if last is not None and callable(select):
+                select(last)
+        except Exception:
+            logger.error("Failed to finalize progressive scene load", exc_info=True)
+        self.sig_finished.emit()
@@ -0,0 +1,264 @@
+# managers/scene_store.py
+
+import json
+import logging
+import os
+import uuid
+from typing import Any, Dict, List, Optional
+
+from utils.write_behind import JsonWriteBehind, get_write_behind
+
+logger = logging.getLogger(__name__)
+
+SCENE_INDEX_SCHEMA_VERSION: int = 1
+
+
+class SceneStore:
+    """シーンDBを「1シーン1ファイル（シャード）＋小さな索引ファイル」で保存するストア。
+
+    索引（index.json）にはカテゴリとシーン名、シャードのファイル名だけを持つ。
+    シーン本体は get 時に初めて読み込み、保存・削除は対象シャードと索引だけを書き換える。
+    従来の単一ファイル形式（scenes_db.json）が残っていれば、初回の索引読み込み時に移行する。
+    書き込み・削除は JsonWriteBehind 経由で行い、GUI スレッドではシリアライズしない。
+
+    Attributes:
+        root_dir: シャードと索引を置くディレクトリ。
+        legacy_db_path: 移行元の単一ファイル形式のパス。
+    """
+
+    INDEX_FILENAME: str = "index.json"
+
+    def __init__(
+        self,
+        root_dir: str,
+        legacy_db_path: Optional[str] = None,
+        *,
+        writer: Optional[JsonWriteBehind] = None,
+    ) -> None:
+        """SceneStoreを初期化します。
+
+        Args:
+            root_dir: シャードと索引を置くディレクトリ。
+            legacy_db_path: 移行元の単一ファイル形式のパス。
+            writer: 書き込みに使うライター。None の場合はアプリ共通のものを使う。
+        """
+        self.root_dir = root_dir
+        self.legacy_db_path = legacy_db_path
+        self.writer: JsonWriteBehind = writer if writer is not None else get_write_behind()
+        # {category: {scene_name: shard_filename}}（挿入順 = 表示順）
+        self._index: Optional[Dict[str, Dict[str, str]]] = None
+
+    @property
+    def index_path(self) -> str:
+        """索引ファイルのパス。"""
+        return os.path.join(self.root_dir, self.INDEX_FILENAME)
+
+    def has_data(self) -> bool:
+        """索引または移行元ファイルが存在するかどうかを返す。"""
+        if os.path.exists(self.index_path) or self.writer.has_pending(self.index_path):
+            return True
+        return bool(self.legacy_db_path) and os.path.exists(str(self.legacy_db_path))
+
+    # ==========================================
+    # Index
+    # ==========================================
+
+    def load_index(self) -> Dict[str, List[str]]:
+        """索引を読み込み、カテゴリごとのシーン名一覧を返す（本体は読まない）。
+
+        索引が無く単一ファイル形式が存在する場合は、ここでシャード形式へ移行する。
+
+        Returns:
+            Dict[str, List[str]]: {category: [scene_name, ...]}。
+        """
+        index = self._ensure_index()
+        return {category: list(entries.keys()) for category, entries in index.items()}
+
+    def _ensure_index(self) -> Dict[str, Dict[str, str]]:
+        if self._index is not None:
+            return self._index
+
+        self.writer.flush(self.index_path)
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            categories = payload.get("categories", {}) if isinstance(payload, dict) else {}
+            self._index = {
+                str(category): {str(name): str(shard) for name, shard in entries.items()}
+                for category, entries in categories.items()
+                if isinstance(entries, dict)
+            }
+            return self._index
+
+        self._index = {}
+        if self.legacy_db_path and os.path.exists(self.legacy_db_path):
+            self._migrate_legacy_db(self.legacy_db_path)
+        return self._index
+
+    def _write_index(self) -> None:
+        os.makedirs(self.root_dir, exist_ok=True)
+        # 書き込みはワーカー側で行うため、以後の変更が混ざらないようコピーを渡す
+        categories = {category: dict(entries) for category, entries in (self._index or {}).items()}
+        payload = {"schema_version": SCENE_INDEX_SCHEMA_VERSION, "categories": categories}
+        self.writer.submit(self.index_path, payload, indent=2)
+
+    def _migrate_legacy_db(self, legacy_path: str) -> None:
+        """単一ファイル形式のシーンDBをシャード形式へ書き出す（元ファイルは残す）。"""
+        with open(legacy_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            return
+
+        migrated = 0
+        for category, scenes in data.items():
+            if not isinstance(scenes, dict):
+                continue
+            entries = self._index.setdefault(str(category), {})
+            for name, body in scenes.items():
+                shard = self._new_shard_name()
+                self._write_shard(shard, body)
+                entries[str(name)] = shard
+                migrated += 1
+        self._write_index()
+        logger.info(f"Migrated scene DB to sharded store: {migrated} scenes from {legacy_path}")
+
+    # ==========================================
+    # Shards
+    # ==========================================
+
+    @staticmethod
+    def _new_shard_name() -> str:
+        return f"{uuid.uuid4().hex}.json"
+
+    def _shard_path(self, shard: str) -> str:
+        return os.path.join(self.root_dir, shard)
+
+    def _write_shard(self, shard: str, body: Any) -> None:
+        os.makedirs(self.root_dir, exist_ok=True)
+        self.writer.submit(self._shard_path(shard), body)
+
+    def _remove_shard(self, shard: str) -> None:
+        path = self._shard_path(shard)
+        try:
+            self.writer.remove(path)
+        except Exception:
+            logger.warning(f"Failed to remove scene shard: {path}", exc_info=True)
+
+    def load_scene(self, category: str, name: str) -> Optional[Any]:
+        """シーン本体をシャードから読み込む。
+
+        Args:
+            category: カテゴリ名。
+            name: シーン名。
+
+        Returns:
+            Optional[Any]: シーンデータ。索引に無い/読めない場合は None。
+        """
+        shard = self._ensure_index().get(category, {}).get(name)
+        if not shard:
+            return None
+        path = self._shard_path(shard)
+        # 書き込み待ちがあればディスクへ反映してから読む
+        self.writer.flush(path)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            logger.warning(f"Failed to load scene shard: {category}/{name}", exc_info=True)
+            return None
+
+    def save_scene(self, category: str, name: str, body: Any) -> None:
+        """1シーン分のシャードを書き込み、新規の場合のみ索引を更新する。
+
+        Args:
+            category: カテゴリ名。
+            name: シーン名。
+            body: JSONシリアライズ可能なシーンデータ。
+        """
+        index = self._ensure_index()
+        entries = index.setdefault(category, {})
+        shard = entries.get(name)
+        is_new = shard is None
+        if is_new:
+            shard = self._new_shard_name()
+        self._write_shard(shard, body)
+        if is_new:
+            entries[name] = shard
+            self._write_index()
+
+    def delete_scene(self, category: str, name: str) -> None:
+        """シーンのシャードを削除し、索引から外す。"""
+        entries = self._ensure_index().get(category)
+        if not entries or name not in entries:
+            return
+        shard = entries.pop(name)
+        self._write_index()
+        self._remove_shard(shard)
+
+    def ensure_category(self, category: str) -> None:
+        """カテゴリを索引に追加する（既にあれば何もしない）。"""
+        index = self._ensure_index()
+        if category in index:
+            return
+        index[category] = {}
+        self._write_index()
+
+    def delete_category(self, category: str) -> None:
+        """カテゴリと配下の全シャードを削除する。"""
+        index = self._ensure_index()
+        entries = index.pop(category, None)
+        if entries is None:
+            return
+        self._write_index()
+        for shard in entries.values():
+            self._remove_shard(shard)
+
+    def rename_category(self, old: str, new: str) -> None:
+        """カテゴリ名を変更する。new が既にある場合は配下のシーンを統合する（同名は new 側を優先）。"""
+        if old == new:
+            return
+        index = self._ensure_index()
+        entries = index.pop(old, None)
+        if entries is None:
+            return
+        target = index.setdefault(new, {})
+        for name, shard in entries.items():
+            if name in target:
+                self._remove_shard(shard)
+            else:
+                target[name] = shard
+        self._write_index()
+
+    def replace_all(self, scenes: Dict[str, Dict[str, Any]]) -> None:
+        """ストア全体を scenes の内容で置き換える。
+
+        本体が None（未読込）のシーンは既存シャードをそのまま残す。
+        scenes に無くなったシーンのシャードは削除する。
+
+        Args:
+            scenes: {category: {scene_name: body_or_None}}。
+        """
+        old_index = self._ensure_index()
+        new_index: Dict[str, Dict[str, str]] = {}
+        for category, entries in scenes.items():
+            if not isinstance(entries, dict):
+                continue
+            old_entries = old_index.get(category, {})
+            new_entries = new_index.setdefault(str(category), {})
+            for name, body in entries.items():
+                shard = old_entries.get(name)
+                if body is None:
+                    if shard:
+                        new_entries[str(name)] = shard
+                    continue
+                if not shard:
+                    shard = self._new_shard_name()
+                self._write_shard(shard, body)
+                new_entries[str(name)] = shard
+
+        kept = {shard for entries in new_index.values() for shard in entries.values()}
+        stale = [shard for entries in old_index.values() for shard in entries.values() if shard not in kept]
+        self._index = new_index
+        self._write_index()
+        for shard in stale:
+            self._remove_shard(shard)
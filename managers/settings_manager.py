@@ -1,15 +1,16 @@
 import json
 import logging
 import os
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
-from PySide6.QtCore import QRect, Qt
+from PySide6.QtCore import QObject, QRect, Qt, Signal, Slot
 from PySide6.QtGui import QGuiApplication, QIcon
 from PySide6.QtWidgets import QMessageBox
 
 from utils.app_settings import AppSettings, load_app_settings, save_app_settings
 from utils.overlay_settings import OverlaySettings, load_overlay_settings, save_overlay_settings
 from utils.translator import tr
+from utils.write_behind import get_write_behind
 
 if TYPE_CHECKING:
     from ui.main_window import MainWindow
@@ -17,6 +18,22 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class _SaveErrorRelay(QObject):
+    """バックグラウンド保存の失敗を GUI スレッドへ渡す中継オブジェクト。"""
+
+    failed = Signal(str, str)  # (種別, エラー文字列)
+
+    def __init__(self, handler: Callable[[str, str], None]) -> None:
+        super().__init__()
+        self._handler = handler
+        # ワーカースレッドから emit されるため、常にキュー経由で GUI スレッドに届ける
+        self.failed.connect(self._deliver, Qt.ConnectionType.QueuedConnection)
+
+    @Slot(str, str)
+    def _deliver(self, kind: str, message: str) -> None:
+        self._handler(kind, message)
+
+
 class SettingsManager:
     """アプリケーション設定とオーバーレイ設定を一元管理するクラス。"""
 
@@ -25,6 +42,7 @@ class SettingsManager:
         self.app_settings: Optional[AppSettings] = None
         self.overlay_settings: Optional[OverlaySettings] = None
         self.base_directory = getattr(self.mw, "base_directory", os.getcwd())
+        self._save_error_relay = _SaveErrorRelay(self._show_save_error)
 
     def load_settings(self) -> None:
         """設定をロードする。MainWindowの初期化時に呼ぶこと。"""
@@ -33,15 +51,40 @@ class SettingsManager:
 
     def save_app_settings(self) -> None:
         if self.app_settings:
-            save_app_settings(self.mw, self.base_directory, self.app_settings)
+            save_app_settings(
+                self.mw, self.base_directory, self.app_settings, on_error=self._make_save_error_callback("app")
+            )
 
     def save_overlay_settings(self) -> None:
         if self.overlay_settings:
-            save_overlay_settings(self.mw, self.base_directory, self.overlay_settings)
+            save_overlay_settings(
+                self.mw, self.base_directory, self.overlay_settings, on_error=self._make_save_error_callback("overlay")
+            )
+
+    def _make_save_error_callback(self, kind: str) -> Callable[[str, BaseException], None]:
+        """ワーカースレッドでの書き込み失敗を GUI スレッドへ通知するコールバックを返す。"""
+        relay = self._save_error_relay
+
+        def _on_error(_path: str, error: BaseException) -> None:
+            relay.failed.emit(kind, str(error))
+
+        return _on_error
+
+    def _show_save_error(self, kind: str, message: str) -> None:
+        """バックグラウンド保存の失敗をユーザーへ表示する（GUI スレッド）。"""
+        if kind == "app":
+            text = tr("msg_failed_to_save_app_settings").format(err=message)
+        else:
+            text = f"Failed to save overlay settings: {message}"
+        try:
+            QMessageBox.critical(self.mw, tr("msg_error"), text)
+        except Exception:
+            logger.error(f"Failed to show save error dialog: {text}", exc_info=True)
 
     def load_text_archetype(self) -> dict:
         """TextWindowの初期スタイル（Archetype）を取得する。"""
         path = os.path.join(self.base_directory, "json", "text_archetype.json")
+        get_write_behind().flush(path)
         if not os.path.exists(path):
             return {}
         try:
@@ -52,12 +95,14 @@ class SettingsManager:
             return {}
 
     def save_text_archetype(self, data: dict) -> bool:
-        """TextWindowのデフォルトスタイルを保存する。"""
+        """TextWindowのデフォルトスタイルを保存する。
+
+        ユーザー操作による保存で結果をすぐ表示するため、その場でディスクへ書き込む。
+        """
         path = os.path.join(self.base_directory, "json", "text_archetype.json")
         try:
             os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
+            get_write_behind().write_now(path, data, indent=4)
             return True
         except Exception as e:
             logger.error(f"Failed to save text archetype: {e}")
@@ -1,10 +1,14 @@
 # managers/window_manager.py
 
+import copy
+import functools
 import logging
 import math
 import traceback
-from typing import TYPE_CHECKING, Any, List, Optional
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from pydantic import ValidationError
 from PySide6.QtCore import QObject, QPoint, Qt, QTimer, Signal
 from PySide6.QtWidgets import QMessageBox
 
@@ -21,6 +25,12 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _default_config_dump(config_cls: type) -> Dict[str, Any]:
+    """config クラスの既定値を JSON 形式で返す（呼び出し側で書き換えないこと）。"""
+    return config_cls().model_dump(mode="json")
+
+
 class WindowManager(QObject):
     """
     シーン内の全てのオブジェクト（テキスト、画像、接続線）の生成、削除、選択、
@@ -33,6 +43,7 @@ class WindowManager(QObject):
     sig_status_message = Signal(str)  # フッターメッセージ用
     sig_undo_command_requested = Signal(object)  # Undoコマンド発行用
     sig_layer_structure_changed = Signal()  # Layer構造変更時（LayerTab再構築用）
+    sig_windows_added = Signal(list)  # create_windows による一括追加完了時（バッチ単位で1回）
 
     def __init__(self, main_window: "MainWindow"):
         super().__init__()
@@ -51,6 +62,121 @@ class WindowManager(QObject):
         """テキストと画像の全ウィンドウリストを返す"""
         return self.text_windows + self.image_windows
 
+    # ==========================================
+    # Registry (イベント駆動の参照管理)
+    # ==========================================
+
+    def _register_window(self, window: "TextWindow | ImageWindow") -> None:
+        """ウィンドウ破棄時に管理リストから自動除去されるよう destroyed を購読する。
+
+        close 経路は sig_window_closed -> remove_window が担当し、
+        こちらは deleteLater / 親破棄などで close を経ずに消えるケースを拾う。
+        """
+        try:
+            window.destroyed.connect(self._make_destroyed_hook(self._on_window_destroyed, window))
+        except Exception:
+            logger.debug("Failed to hook destroyed for window", exc_info=True)
+
+    def _register_connector(self, connector: ConnectorLine) -> None:
+        """コネクタ破棄時に管理リストから自動除去されるよう destroyed を購読する。"""
+        try:
+            connector.destroyed.connect(self._make_destroyed_hook(self._on_connector_destroyed, connector))
+        except Exception:
+            logger.debug("Failed to hook destroyed for connector", exc_info=True)
+
+    @staticmethod
+    def _make_destroyed_hook(handler: Any, obj: QObject) -> Any:
+        """destroyed 用のスロットを作る。
+
+        obj は弱参照で持つ（強参照だと obj 自身のシグナル接続が obj を生かし続け、
+        閉じたウィンドウが解放されなくなる）。
+        """
+        ref = weakref.ref(obj)
+
+        def _on_destroyed(*_args: Any) -> None:
+            target = ref()
+            if target is not None:
+                handler(target)
+
+        return _on_destroyed
+
+    def _on_window_destroyed(self, window: Any, *_args: Any) -> None:
+        """破棄済みウィンドウへの参照を管理リスト・選択・コネクタから外す。
+
+        Note:
+            C++ 側はすでに破棄されているため、Qt メソッドは呼ばない（Python 属性のみ参照）。
+        """
+        if not self._is_alive():
+            return
+        removed = False
+        if any(w is window for w in self.text_windows):
+            self.text_windows = [w for w in self.text_windows if w is not window]
+            removed = True
+        if any(w is window for w in self.image_windows):
+            self.image_windows = [w for w in self.image_windows if w is not window]
+            removed = True
+
+        if self.last_selected_window is window:
+            # set_selected(False) は死んだ C++ に触れるため呼ばない
+            self.last_selected_window = None
+            self.sig_selection_changed.emit(None)
+
+        attached = [
+            c
+            for c in self.connectors
+            if getattr(c, "start_window", None) is window or getattr(c, "end_window", None) is window
+        ]
+        for c in attached:
+            try:
+                self.delete_connector(c)
+            except Exception:
+                logger.debug("Failed to delete connector of destroyed window", exc_info=True)
+
+        for w in self.all_windows:
+            children = getattr(w, "child_windows", None)
+            if children and any(c is window for c in children):
+                w.child_windows = [c for c in children if c is not window]
+
+        if removed:
+            self.sig_layer_structure_changed.emit()
+            logger.debug("Window deregistered on destroy: UUID=%s", getattr(window, "uuid", "?"))
+
+    def _on_connector_destroyed(self, connector: Any, *_args: Any) -> None:
+        """破棄済みコネクタへの参照を管理リストと端点ウィンドウから外す。"""
+        if not self._is_alive():
+            return
+        if self.last_selected_window is connector:
+            self.last_selected_window = None
+            self.sig_selection_changed.emit(None)
+        self.connectors = [c for c in self.connectors if c is not connector]
+        for end in (getattr(connector, "start_window", None), getattr(connector, "end_window", None)):
+            lines = getattr(end, "connected_lines", None)
+            if lines and any(c is connector for c in lines):
+                end.connected_lines = [c for c in lines if c is not connector]
+
+    def _is_alive(self) -> bool:
+        """アプリ終了時など、WindowManager 自身が先に破棄されていないかを返す。"""
+        try:
+            import shiboken6
+
+            return bool(shiboken6.isValid(self))
+        except Exception:
+            return True
+
+    def _debug_check_refs(self) -> None:
+        """デバッグ時のみ、管理リストに無効参照が残っていないか検査する。
+
+        通常は destroyed / sig_window_closed による登録解除で整合が保たれるため、
+        全件走査はログレベルが DEBUG のときに限定する（選択や保存のホットパスに載せない）。
+        """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        before = (len(self.text_windows), len(self.image_windows), len(self.connectors))
+        self._prune_invalid_refs()
+        after = (len(self.text_windows), len(self.image_windows), len(self.connectors))
+        if before != after:
+            logger.warning("Stale refs found by debug sweep (text/image/conn): %s -> %s", before, after)
+
     def _prune_invalid_refs(self) -> None:
         """WindowManager が保持する参照から、無効なQObject参照を除去する。
 
@@ -59,7 +185,8 @@ class WindowManager(QObject):
             - 保存/一括操作/選択変更での RuntimeError を減らす
 
         注意:
-            - できるだけ軽くする（頻繁に呼んでも落ちないように）
+            - 全件走査のため、ホットパス（選択変更・保存）では呼ばない。
+              通常は _register_window / _register_connector の destroyed 購読で整合が保たれる。
         """
         try:
             import shiboken6
@@ -172,6 +299,7 @@ class WindowManager(QObject):
             logger.warning(f"Failed to apply text archetype during creation: {e}")
 
         self._setup_window_connections(window)
+        self._register_window(window)
 
         self.text_windows.append(window)
         window.show()
@@ -211,6 +339,7 @@ class WindowManager(QObject):
             window = ImageWindow(self.main_window, image_path, position=pos)
 
             self._setup_window_connections(window)
+            self._register_window(window)
 
             self.image_windows.append(window)
             window.show()
@@ -226,6 +355,357 @@ class WindowManager(QObject):
             QMessageBox.critical(self.main_window, tr("msg_error"), f"Failed to add image: {e}")
             return None
 
+    # ==========================================
+    # Batch Creation (一括生成)
+    # ==========================================
+
+    def create_windows(
+        self,
+        batch_specs: List[Dict[str, Any]],
+        *,
+        select_last: bool = False,
+        suppress_limit_message: bool = True,
+    ) -> List[Optional["TextWindow | ImageWindow"]]:
+        """保存形式のウィンドウ辞書から複数ウィンドウを一括生成する。
+
+        add_text_window / add_image_window を1件ずつ呼ぶと、ウィンドウごとに
+        既定テキストの描画・シグナル接続・表示・選択変更・一覧更新通知が走る。
+        ここでは非表示のまま生成して config を一括適用し、描画は1回だけ行う。
+        シグナル接続と表示はまとめて行い、最後に sig_windows_added と
+        sig_layer_structure_changed をバッチ単位で1回ずつ発行する。
+
+        Args:
+            batch_specs (List[Dict[str, Any]]): ウィンドウ辞書のリスト。
+                "type" は "text" / "image"（省略時は image_path の有無で判定）。
+            select_last (bool): True の場合、最後に生成したウィンドウを選択する。
+            suppress_limit_message (bool): False の場合、上限到達時にメッセージを1回だけ出す。
+
+        Returns:
+            List[Optional[TextWindow | ImageWindow]]: batch_specs と同じ並び。
+            上限や生成失敗でスキップした要素は None。
+        """
+        results: List[Optional[Any]] = [None] * len(batch_specs)
+        limits = get_limits(get_edition(self.main_window, getattr(self.main_window, "base_directory", None)))
+        text_count = len(self.text_windows)
+        image_count = len(self.image_windows)
+        limit_key: Optional[str] = None
+        archetype: Optional[Dict[str, Any]] = None
+
+        # 1) 非表示で生成・config 適用・1回描画（シグナル未接続なので通知は飛ばない）
+        created: list[tuple[Any, str]] = []
+        for i, spec in enumerate(batch_specs):
+            if not isinstance(spec, dict):
+                continue
+            w_type = spec.get("type") or ("image" if "image_path" in spec else "text")
+            try:
+                if w_type == "text":
+                    if is_over_limit(text_count, limits.max_text_windows):
+                        limit_key = limit_key or "msg_limit_text_windows"
+                        continue
+                    if archetype is None:
+                        archetype = self._load_text_archetype()
+                    window: Any = self._build_text_window(spec, archetype)
+                    text_count += 1
+                elif w_type == "image":
+                    if is_over_limit(image_count, limits.max_image_windows):
+                        limit_key = limit_key or "msg_limit_image_windows"
+                        continue
+                    window = self._build_image_window(spec)
+                    image_count += 1
+                else:
+                    continue
+            except Exception as e:
+                logger.error(f"Failed to build {w_type} window in batch: {e}\n{traceback.format_exc()}")
+                continue
+            results[i] = window
+            created.append((window, w_type))
+
+        # 2) シグナル接続・登録
+        for window, w_type in created:
+            self._setup_window_connections(window)
+            self._register_window(window)
+            if w_type == "text":
+                self.text_windows.append(window)
+            else:
+                self.image_windows.append(window)
+
+        # 3) 表示・アニメーション再開
+        for window, _w_type in created:
+            try:
+                if not window.config.is_hidden:
+                    window.show()
+                self._resume_window_animations(window)
+            except Exception:
+                logger.warning("Failed to show batch-created window", exc_info=True)
+
+        if limit_key and not suppress_limit_message:
+            show_limit_message(self.main_window, limit_key)
+
+        # 4) 通知はバッチ単位で1回
+        if created:
+            if select_last:
+                self.set_selected_window(created[-1][0])
+            self.sig_windows_added.emit([w for w, _t in created])
+            self.sig_layer_structure_changed.emit()
+            logger.info(f"Batch created {len(created)}/{len(batch_specs)} windows")
+        return results
+
+    def _load_text_archetype(self) -> Dict[str, Any]:
+        """テキスト既定スタイル（Archetype）を読み込む。バッチ生成では1回だけ呼ぶ。"""
+        try:
+            if hasattr(self.main_window, "settings_manager"):
+                archetype = self.main_window.settings_manager.load_text_archetype()
+                if isinstance(archetype, dict):
+                    return {k: v for k, v in archetype.items() if k not in ("uuid", "position", "text")}
+        except Exception as e:
+            logger.warning(f"Failed to load text archetype: {e}")
+        return {}
+
+    @staticmethod
+    def _apply_config_values(window: Any, values: Dict[str, Any]) -> None:
+        """辞書の値をウィンドウの config へ一括適用する。
+
+        通常は WindowConfigBase.with_updates で検証を1回にまとめて config を差し替える。
+        不正値を含む場合のみ、従来どおりフィールド単位で適用して不正キーをスキップする。
+        """
+        config = window.config
+        if "font_size" in values and isinstance(values["font_size"], float):
+            values = dict(values)
+            values["font_size"] = int(values["font_size"])
+        try:
+            window.config = config.with_updates(values)
+            return
+        except ValidationError as e:
+            logger.debug(f"Bulk config hydration failed, falling back to per-field: {e.error_count()} errors")
+
+        fields = type(config).model_fields
+        for key, value in values.items():
+            if key not in fields:
+                continue
+            try:
+                setattr(config, key, value)
+            except Exception as e:
+                logger.debug(f"Failed to apply config key {key}: {e}")
+
+    @staticmethod
+    def _apply_window_flags_from_config(window: Any) -> None:
+        """frontmost / click-through を show() せずにウィンドウフラグへ反映する。"""
+        flags = window.windowFlags()
+        if window.config.is_frontmost:
+            flags |= Qt.WindowStaysOnTopHint
+        else:
+            flags &= ~Qt.WindowStaysOnTopHint
+        if window.config.is_click_through:
+            flags |= Qt.WindowTransparentForInput
+        else:
+            flags &= ~Qt.WindowTransparentForInput
+        window.setWindowFlags(flags)
+        window.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+
+    def _build_text_window(self, spec: Dict[str, Any], archetype: Dict[str, Any]) -> TextWindow:
+        """TextWindow を非表示のまま生成し、Archetype → spec の順に適用して1回だけ描画する。"""
+        pos = spec.get("position")
+        if isinstance(pos, dict):
+            pos_x, pos_y = pos.get("x", 100), pos.get("y", 100)
+        else:
+            pos_x, pos_y = spec.get("x", 100), spec.get("y", 100)
+        text = spec.get("text")
+        if text is None:
+            text = tr("new_text_default")
+
+        window = TextWindow(self.main_window, str(text), QPoint(int(pos_x), int(pos_y)))
+        values = dict(archetype)
+        values.update(spec)
+        self._apply_config_values(window, values)
+
+        if hasattr(window, "_apply_easing_from_config"):
+            window._apply_easing_from_config()
+
+        # __init__ で予約されたデバウンス描画は捨て、確定した config で1回だけ描画する
+        render_timer = getattr(window, "_render_timer", None)
+        if render_timer is not None:
+            render_timer.stop()
+        window._update_text_immediate()
+        self._apply_window_flags_from_config(window)
+        return window
+
+    def _build_image_window(self, spec: Dict[str, Any]) -> ImageWindow:
+        """ImageWindow を非表示のまま生成し、config 適用後に1回だけ描画する。
+
+        spec に "_clone_source"（既存 ImageWindow）がある場合は、画像を再読込せず
+        そのフレームを共有する（複製の高速化）。
+        "_preview_path"（プロジェクトバンドルの縮小プレビュー）がある場合は、それを仮表示して
+        本体の読み込みをイベントループへ遅延する。
+        """
+        pos_x, pos_y = 0, 0
+        pos = spec.get("position")
+        if isinstance(pos, dict):
+            pos_x, pos_y = int(pos.get("x", 0)), int(pos.get("y", 0))
+        geo = spec.get("geometry")
+        if isinstance(geo, dict):
+            pos_x, pos_y = int(geo.get("x", pos_x)), int(geo.get("y", pos_y))
+
+        source = spec.get("_clone_source")
+        if source is not None and hasattr(source, "ensure_full_image"):
+            # プレビュー表示中の複製元は、先に元画像をデコードしてから共有する
+            source.ensure_full_image()
+        frames = getattr(source, "frames", None) if source is not None else None
+        image_path = str(spec.get("image_path") or "")
+        preview_path = spec.get("_preview_path")
+        if isinstance(frames, list) and frames:
+            window = ImageWindow(self.main_window, "", position=QPoint(pos_x, pos_y))
+            window.frames = frames[:]
+            window.current_frame = int(getattr(source, "current_frame", 0) or 0)
+            window.original_speed = int(getattr(source, "original_speed", 100) or 100)
+        elif preview_path and image_path:
+            # バンドルのプレビューで先に表示し、本体のデコードは後回しにする
+            window = ImageWindow(self.main_window, "", position=QPoint(pos_x, pos_y))
+            window.image_path = image_path
+            if not window.show_preview(str(preview_path), spec.get("_preview_size")):
+                window.load_image(image_path)
+        else:
+            window = ImageWindow(self.main_window, image_path, position=QPoint(pos_x, pos_y))
+
+        self._apply_config_values(window, spec)
+        if hasattr(window, "_apply_easing_from_config"):
+            window._apply_easing_from_config()
+        window._update_animation_timer()
+
+        if isinstance(geo, dict):
+            window.setGeometry(pos_x, pos_y, int(geo.get("width", 100)), int(geo.get("height", 100)))
+        else:
+            window.move(pos_x, pos_y)
+        window.config.position = {"x": pos_x, "y": pos_y}
+
+        window.update_image()
+        self._apply_window_flags_from_config(window)
+        return window
+
+    @staticmethod
+    def _resume_window_animations(window: Any) -> None:
+        """config に保存されたアニメーション状態を再開する。"""
+        if window.move_loop_enabled:
+            window.start_move_animation()
+        elif window.move_position_only_enabled:
+            window.start_move_position_only_animation()
+
+        if window.is_fading_enabled:
+            window.start_fade_in()
+        elif window.fade_in_only_loop_enabled:
+            window.start_fade_in_only()
+        elif window.fade_out_only_loop_enabled:
+            window.start_fade_out_only()
+
+    # 差分更新で値が変わっても再描画が不要なフィールド（位置・レイヤー情報・タイムスタンプ）
+    _NON_RENDER_FIELDS = frozenset({"position", "geometry", "layer_offset", "layer_order", "created_at", "updated_at"})
+    _ANIMATION_FIELD_PREFIXES = ("move_", "fade_", "is_fading", "animation_")
+
+    # 新規生成時にコンストラクタが決めるため、spec に無ければ既存の値を保つフィールド
+    _SPEC_ONLY_FIELDS = frozenset({"position", "geometry", "created_at", "updated_at"})
+
+    @classmethod
+    def _diff_config_values(
+        cls, config: Any, spec: Dict[str, Any], base: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """spec を新規に読み込んだ場合の config と現在の config を比べ、値が異なるフィールドだけを返す。
+
+        新規読み込みは「モデル既定値 → base（テキストの Archetype など）→ spec」の順に適用されるため、
+        spec に無いフィールドも既定値 / base との差分として扱う（旧版・部分的なシーンデータでも
+        前のシーンの値が残らない）。uuid と parent_uuid（親子関係は別途復元）は対象外。
+        """
+        target = copy.deepcopy(_default_config_dump(type(config)))
+        if base:
+            target.update(base)
+        target.update(spec)
+        current = config.model_dump(mode="json")
+        changed: Dict[str, Any] = {}
+        for key in type(config).model_fields:
+            if key in ("uuid", "parent_uuid"):
+                continue
+            if key not in spec and key in cls._SPEC_ONLY_FIELDS:
+                continue
+            if key in target and target[key] != current.get(key):
+                changed[key] = target[key]
+        return changed
+
+    @staticmethod
+    def _text_constructor_values(window: Any) -> Dict[str, Any]:
+        """TextWindow のコンストラクタがモデル既定値から変える値（テキスト既定値の余白）。"""
+        try:
+            return dict(window.margin_values_from_defaults(window.load_text_defaults()))
+        except Exception:
+            logger.debug("Failed to load text defaults for scene switch diff", exc_info=True)
+            return {}
+
+    def reconfigure_window(self, window: Any, spec: Dict[str, Any], archetype: Optional[Dict[str, Any]] = None) -> bool:
+        """既存ウィンドウを spec の状態へ差分で更新する（シーン切替でウィジェットを再利用するため）。
+
+        変化したフィールドだけを config に適用し、描画に関わる変更がある場合のみ再描画する。
+        結果は load_scene_from_data で新規生成した場合と同じ config になる。
+
+        Args:
+            window: 更新対象の TextWindow / ImageWindow。
+            spec: 切替先シーンのウィンドウ辞書。
+            archetype: テキストの既定スタイル。None の場合はここで読み込む（複数件なら呼び出し側で1回読む）。
+
+        Returns:
+            bool: 何らかの変更を適用した場合 True。
+        """
+        base: Optional[Dict[str, Any]] = None
+        if isinstance(window, TextWindow):
+            if archetype is None:
+                archetype = self._load_text_archetype()
+            # 新規生成時と同じく、余白はテキスト既定値、text が無ければ既定文言になる
+            base = self._text_constructor_values(window)
+            text = spec.get("text")
+            base["text"] = tr("new_text_default") if text is None else str(text)
+            # コンストラクタは Archetype の適用より先に、テキストの行数分の task_states を用意する
+            base["task_states"] = window._normalize_task_states([], len(window._split_lines(base["text"])))
+            base.update(archetype)
+        changed = self._diff_config_values(window.config, spec, base)
+        if not changed:
+            return False
+
+        animations_changed = any(key.startswith(self._ANIMATION_FIELD_PREFIXES) for key in changed)
+        if animations_changed:
+            # stop_* は config のフラグを落とすため、差分適用より先に止める
+            window.stop_all_animations()
+
+        self._apply_config_values(window, changed)
+        if hasattr(window, "_apply_easing_from_config"):
+            window._apply_easing_from_config()
+
+        pos = window.config.position
+        if "position" in changed and isinstance(pos, dict):
+            window.move(int(pos.get("x", window.x())), int(pos.get("y", window.y())))
+
+        needs_render = any(key not in self._NON_RENDER_FIELDS for key in changed)
+        if isinstance(window, ImageWindow):
+            geo = window.config.geometry
+            if "geometry" in changed and isinstance(geo, dict):
+                window.setGeometry(
+                    int(geo.get("x", window.x())),
+                    int(geo.get("y", window.y())),
+                    int(geo.get("width", window.width())),
+                    int(geo.get("height", window.height())),
+                )
+            if needs_render:
+                window._update_animation_timer()
+                window.update_image()
+        elif needs_render:
+            window.update_text()
+
+        if "is_frontmost" in changed or "is_click_through" in changed:
+            # setWindowFlags は表示中のウィンドウを隠すため、下の表示状態の反映とセットで行う
+            self._apply_window_flags_from_config(window)
+        if window.config.is_hidden:
+            window.hide()
+        elif not window.isVisible():
+            window.show()
+        if animations_changed and not window.config.is_hidden:
+            self._resume_window_animations(window)
+        return True
+
     def add_connector(
         self, start_window: "TextWindow | ImageWindow", end_window: "TextWindow | ImageWindow"
     ) -> Optional[ConnectorLine]:
@@ -255,6 +735,7 @@ class WindowManager(QObject):
 
         line.sig_connector_selected.connect(self.set_selected_window)
         line.sig_connector_deleted.connect(self.delete_connector)
+        self._register_connector(line)
 
         self.connectors.append(line)
         start_window.connected_lines.append(line)
@@ -544,7 +1025,6 @@ class WindowManager(QObject):
             _deferred_close()
 
     def clear_all(self) -> None:
-        self._prune_invalid_refs()
         """シーン内の全オブジェクト（コネクタ/テキスト/画像）を安全に削除する。
 
         方針:
@@ -552,6 +1032,9 @@ class WindowManager(QObject):
             - 次に Text/Image を close（closeEvent -> remove_window を想定）
             - 最後に選択状態をクリア
         """
+        # 一括削除は頻度が低いので、保険として全件走査を残す
+        self._prune_invalid_refs()
+
         # 1) コネクタを全削除（delete_connector に統一）
         try:
             for c in list(self.connectors):
@@ -751,13 +1234,15 @@ class WindowManager(QObject):
     # ==========================================
 
     def set_selected_window(self, window: Optional[QObject]):
-        self._prune_invalid_refs()
-
+        # 無効参照は destroyed 購読で除去済みのため、ここでは全件走査しない（ウィンドウ数に非依存）
         old_selected = self.last_selected_window
 
         if old_selected and old_selected != window:
             if hasattr(old_selected, "set_selected"):
-                old_selected.set_selected(False)
+                try:
+                    old_selected.set_selected(False)
+                except RuntimeError:
+                    logger.debug("Previous selection already deleted", exc_info=True)
 
         self.last_selected_window = window
 
@@ -840,6 +1325,42 @@ class WindowManager(QObject):
     # Node Logic (Clone & Create Related)
     # ==========================================
 
+    def clone_windows(self, sources: List[Any], offset: QPoint = QPoint(20, 20)) -> List[Any]:
+        """複数の Text/Image ウィンドウを一括で複製する（create_windows ベース）。
+
+        Args:
+            sources (List[Any]): 複製元ウィンドウのリスト。
+            offset (QPoint): 複製先の位置オフセット。
+
+        Returns:
+            List[Any]: 生成されたウィンドウのリスト（上限到達分は含まない）。
+        """
+        specs: List[Dict[str, Any]] = []
+        for source in sources:
+            try:
+                new_pos = source.pos() + offset
+                if isinstance(source, ImageWindow):
+                    exclude: set[str] = {"uuid", "position", "geometry", "parent_uuid"}
+                    spec = source.config.model_dump(mode="json", exclude=exclude)
+                    spec["type"] = "image"
+                    spec["image_path"] = str(getattr(source, "image_path", "") or "")
+                    spec["_clone_source"] = source
+                elif isinstance(source, TextWindow):
+                    exclude = {"uuid", "position", "parent_uuid"}
+                    spec = source.config.model_dump(mode="json", exclude=exclude)
+                    spec["type"] = "text"
+                else:
+                    continue
+                spec["position"] = {"x": int(new_pos.x()), "y": int(new_pos.y())}
+                specs.append(spec)
+            except Exception as e:
+                logger.error("Failed to build clone spec: %s\n%s", e, traceback.format_exc())
+
+        if not specs:
+            return []
+        created = self.create_windows(specs, select_last=True, suppress_limit_message=False)
+        return [w for w in created if w is not None]
+
     def clone_text_window(self, source: TextWindow) -> None:
         """TextWindow を複製する。制限到達時は何もしない。
 
@@ -847,52 +1368,7 @@ class WindowManager(QObject):
             source (TextWindow): 複製元（TextWindow想定）。
         """
         try:
-            # 生成（WindowManager 正規ルート）
-            new_window = self.add_text_window(
-                text=str(getattr(source, "text", tr("new_text_default"))),
-                pos=source.pos() + QPoint(20, 20),
-                suppress_limit_message=False,
-            )
-            if new_window is None:
-                return
-
-            # config をコピー（個体差のあるフィールドは除外）
-            exclude: set[str] = {"uuid", "position", "parent_uuid", "connected_lines"}
-            src_data: dict[str, Any] = source.config.model_dump(mode="json", exclude=exclude)
-
-            for k, v in src_data.items():
-                if hasattr(new_window.config, k):
-                    try:
-                        setattr(new_window.config, k, v)
-                    except Exception as e:
-                        logger.debug(f"Config copy failed for {k}: {e}")
-
-            # easing を runtime に反映（あるなら）
-            if hasattr(new_window, "_apply_easing_from_config"):
-                try:
-                    new_window._apply_easing_from_config()
-                except Exception:
-                    logger.warning("Failed to apply easing from config", exc_info=True)
-
-            # 描画更新
-            new_window.update_text()
-
-            # アニメの再開（保存値がONなら）
-            try:
-                if getattr(new_window, "move_loop_enabled", False):
-                    new_window.start_move_animation()
-                elif getattr(new_window, "move_position_only_enabled", False):
-                    new_window.start_move_position_only_animation()
-
-                if getattr(new_window, "is_fading_enabled", False):
-                    new_window.start_fade_in()
-                elif getattr(new_window, "fade_in_only_loop_enabled", False):
-                    new_window.start_fade_in_only()
-                elif getattr(new_window, "fade_out_only_loop_enabled", False):
-                    new_window.start_fade_out_only()
-            except Exception:
-                logger.warning("Failed to update connector label visibility", exc_info=True)
-
+            self.clone_windows([source])
         except Exception as e:
             logger.error("Failed to clone TextWindow: %s\n%s", e, traceback.format_exc())
 
@@ -900,122 +1376,15 @@ class WindowManager(QObject):
         """ImageWindow を複製する。
 
         方針:
-            - 生成は add_image_window（WindowManager正規ルート）
-            - config をコピー（uuid/position/geometry/parent_uuid/image_path は除外）
-            - frames を可能ならコピーして高速化
-            - タイマーを更新し、見た目を更新
+            - 生成は create_windows（WindowManager正規ルート）
+            - config をコピー（uuid/position/geometry/parent_uuid は除外）
+            - frames を共有して画像の再読込を省く
 
         Args:
             source (ImageWindow): 複製元（ImageWindow想定）。
         """
         try:
-            # ImageWindow 判定（循環import耐性のため名前でも判定）
-            is_img = False
-            try:
-                from windows.image_window import ImageWindow
-
-                is_img = isinstance(source, ImageWindow)
-            except Exception:
-                is_img = type(source).__name__ == "ImageWindow"
-
-            if not is_img:
-                return
-
-            src_path: str = str(getattr(source, "image_path", "") or "")
-            new_pos: QPoint = source.pos() + QPoint(20, 20)
-
-            new_window = self.add_image_window(
-                image_path=src_path,
-                pos=new_pos,
-                suppress_limit_message=False,
-            )
-            if new_window is None:
-                return
-
-            # config をコピー（個体差/生成依存のものは除外）
-            exclude: set[str] = {"uuid", "position", "geometry", "parent_uuid", "image_path"}
-            try:
-                src_data: dict[str, Any] = source.config.model_dump(mode="json", exclude=exclude)
-            except Exception:
-                src_data = {}
-
-            for k, v in src_data.items():
-                if hasattr(new_window.config, k):
-                    try:
-                        setattr(new_window.config, k, v)
-                    except Exception as e:
-                        logger.debug(f"Image config copy failed for {k}: {e}")
-
-            # easing を runtime に反映（あるなら）
-            if hasattr(new_window, "_apply_easing_from_config"):
-                try:
-                    new_window._apply_easing_from_config()
-                except Exception:
-                    logger.warning("Failed to apply easing from config", exc_info=True)
-
-            # frames をコピーできるならコピー（ロード高速化）
-            try:
-                frames = getattr(source, "frames", None)
-                if isinstance(frames, list) and frames:
-                    new_window.frames = frames[:]
-                    try:
-                        new_window.current_frame = int(getattr(source, "current_frame", 0))
-                    except Exception:
-                        new_window.current_frame = 0
-
-                    try:
-                        new_window.original_speed = int(getattr(source, "original_speed", 100))
-                    except Exception:
-                        pass
-            except Exception:
-                logger.warning("Failed to copy image frames/speed", exc_info=True)
-
-            # 位置の確定（念のため）
-            try:
-                new_window.move(new_pos)
-                new_window.config.position = {"x": int(new_window.x()), "y": int(new_window.y())}
-            except Exception:
-                logger.warning("Failed to move new window", exc_info=True)
-
-            # タイマー・描画
-            try:
-                if hasattr(new_window, "_update_animation_timer"):
-                    new_window._update_animation_timer()
-            except Exception:
-                logger.warning("Failed to update animation timer", exc_info=True)
-
-            try:
-                if hasattr(new_window, "update_image"):
-                    new_window.update_image()
-            except Exception:
-                logger.warning("Failed to update image content", exc_info=True)
-
-            # 表示状態
-            try:
-                if getattr(new_window, "is_hidden", False):
-                    if hasattr(new_window, "hide_action"):
-                        new_window.hide_action()
-                    else:
-                        new_window.hide()
-            except Exception:
-                logger.warning("Failed to restore hidden state", exc_info=True)
-
-            # アニメーション状態の復元
-            try:
-                if getattr(new_window, "move_loop_enabled", False):
-                    new_window.start_move_animation()
-                elif getattr(new_window, "move_position_only_enabled", False):
-                    new_window.start_move_position_only_animation()
-
-                if getattr(new_window, "is_fading_enabled", False):
-                    new_window.start_fade_in()
-                elif getattr(new_window, "fade_in_only_loop_enabled", False):
-                    new_window.start_fade_in_only()
-                elif getattr(new_window, "fade_out_only_loop_enabled", False):
-                    new_window.start_fade_out_only()
-            except Exception:
-                logger.warning("Failed to restart animation loop", exc_info=True)
-
+            self.clone_windows([source])
         except Exception as e:
             logger.error("Failed to clone ImageWindow: %s\n%s", e, traceback.format_exc())
 
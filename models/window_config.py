@@ -1,11 +1,13 @@
 # models/window_config.py
 
-from typing import Dict, List, Literal, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Literal, Mapping, Optional, Self, Set, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from .enums import AnchorPosition
 
+_MISSING = object()
+
 
 class WindowConfigBase(BaseModel):
     """すべてのウィンドウに共通の設定"""
@@ -62,6 +64,66 @@ class WindowConfigBase(BaseModel):
     # 同階層内での表示順（0=最背面）。未設定時はロード順。
     layer_order: Optional[int] = None
 
+    # フィールド代入ごとに進むリビジョン（シリアライズ結果のキャッシュ判定用）
+    _dump_revision: int = PrivateAttr(default=0)
+    # 前回 take_changed_fields() してから変わったフィールド名（変更イベントの分類用）
+    _changed_fields: Set[str] = PrivateAttr(default_factory=set)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        old = self.__dict__.get(name, _MISSING)
+        super().__setattr__(name, value)
+        if name not in type(self).model_fields:
+            return
+        new = self.__dict__.get(name)
+        # list/dict は中身を直接書き換えてから再代入される場合があるため、等値でも変更扱いにする
+        if isinstance(new, (list, dict)) or new != old:
+            self._dump_revision += 1
+            self._changed_fields.add(name)
+
+    @property
+    def dump_revision(self) -> int:
+        """値が変わるフィールド代入のたびに増えるリビジョン。"""
+        return self._dump_revision
+
+    def mark_dirty(self, field_name: Optional[str] = None) -> None:
+        """list/dict フィールドを直接書き換えた後に呼び、リビジョンを進める。
+
+        Args:
+            field_name: 書き換えたフィールド名。分かる場合は変更フィールドとして記録する。
+        """
+        self._dump_revision += 1
+        if field_name in type(self).model_fields:
+            self._changed_fields.add(field_name)
+
+    def take_changed_fields(self) -> FrozenSet[str]:
+        """前回の呼び出し以降に値が変わったフィールド名を返し、記録を空にする。"""
+        changed = frozenset(self._changed_fields)
+        self._changed_fields.clear()
+        return changed
+
+    def with_updates(self, data: Mapping[str, Any]) -> Self:
+        """data の既知フィールドで上書きした新しい config を、1回の検証で生成して返す。
+
+        validate_assignment=True のため setattr を繰り返すとフィールドごとに検証が走る。
+        シーンロード等の一括復元ではこちらで検証を1回にまとめ、呼び出し側で config を差し替える。
+
+        Args:
+            data (Mapping[str, Any]): 適用する値（未知キーは無視）。
+
+        Returns:
+            Self: 新しい config。更新が無い場合は self。
+
+        Raises:
+            pydantic.ValidationError: 不正値を含む場合（呼び出し側でフィールド単位の適用へフォールバックする）。
+        """
+        fields = type(self).model_fields
+        updates = {k: v for k, v in data.items() if k in fields}
+        if not updates:
+            return self
+        merged = dict(self.__dict__)
+        merged.update(updates)
+        return type(self).model_validate(merged)
+
 
 class TextWindowConfig(WindowConfigBase):
     """TextWindow用の設定モデル"""
@@ -4,6 +4,14 @@
 Modes:
 - monitor: run measurement in monitoring mode (no threshold enforcement)
 - enforce: run measurement with threshold enforcement
+
+The default scenario set (config/perf/phase9e_scenarios.json) covers cold start to
+first paint, scene restore / switch and project save at 100 windows; enforce mode
+checks median / p95 and, where configured, peak RSS against
+config/perf/phase9e_performance_thresholds.json.
+
+Both modes also run the cold-start import-time gate (scripts/measure_importtime.py)
+against config/perf/import_time_budget.json.
 """
 # ruff: noqa: E402
 
@@ -19,7 +27,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 
-from scripts import measure_phase9e
+from scripts import measure_importtime, measure_phase9e
 
 DEFAULT_SCENARIOS = ("P9E-S06", "P9E-S05", "P9E-S02")
 DEFAULT_SCENARIOS_RELATIVE_PATH = Path("config/perf/phase9e_scenarios.json")
@@ -100,8 +108,12 @@ def run_lane(
             os.environ.pop(measure_phase9e.ENV_PERF_ENFORCE, None)
 
         rc = int(measure_phase9e.main(measure_args))
+        import_args = ["--base-dir", str(base_dir)]
+        if output_dir is not None:
+            import_args.extend(["--output-dir", str(output_dir)])
+        import_rc = int(measure_importtime.main(import_args))
         # Normalize exit status for CI consumers: success=0, failure=1.
-        return 0 if rc == 0 else 1
+        return 0 if rc == 0 and import_rc == 0 else 1
     finally:
         if prev_enforce is None:
             os.environ.pop(measure_phase9e.ENV_PERF_ENFORCE, None)
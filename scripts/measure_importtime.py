@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+"""Cold-start import-time benchmark (`python -X importtime`).
+
+Runs `import <target>` in fresh interpreters, parses the importtime report and
+checks it against `config/perf/import_time_budget.json`:
+
+- median / p95 of the target's cumulative import time
+- modules that must stay deferred (e.g. Pillow, manual text) and must not be
+  imported at startup
+
+Threshold violations fail only when enforcement is enabled
+(`--enforce` or FTIV_PERF_ENFORCE=1). Deferred-module violations always fail,
+because they do not depend on machine speed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+ENV_PERF_ENFORCE = "FTIV_PERF_ENFORCE"
+DEFAULT_BUDGET_RELATIVE_PATH = Path("config/perf/import_time_budget.json")
+DEFAULT_TARGET = "main"
+DEFAULT_SAMPLES = 5
+_TOP_MODULES = 15
+
+
+@dataclass
+class ImportTimeSample:
+    """1 回分の importtime レポート。時間はすべてマイクロ秒。"""
+
+    total_us: int
+    # module -> (self_us, cumulative_us)
+    modules: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+
+@dataclass
+class ImportTimeBudget:
+    target: str
+    samples: int
+    median_ms: float | None
+    p95_ms: float | None
+    deferred_modules: list[str]
+
+
+def parse_importtime(stderr: str, target: str) -> ImportTimeSample:
+    """`-X importtime` の出力を解析する。
+
+    Raises:
+        ValueError: target の行が無い場合（import に失敗した等）。
+    """
+    modules: dict[str, tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            # ヘッダ行（self [us] | cumulative | imported package）
+            continue
+        modules[parts[2].strip()] = (self_us, cumulative_us)
+    if target not in modules:
+        raise ValueError(f"importtime report does not contain target module: {target}")
+    return ImportTimeSample(total_us=modules[target][1], modules=modules)
+
+
+def load_budget(path: Path) -> ImportTimeBudget:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict):
+        raise ValueError("import time budget must be an object")
+    budget = payload.get("budget") or {}
+    if not isinstance(budget, dict):
+        raise ValueError("import time budget key 'budget' must be an object")
+    deferred = payload.get("deferred_modules") or []
+    if not isinstance(deferred, list):
+        raise ValueError("import time budget key 'deferred_modules' must be a list")
+    median_ms = budget.get("median_ms")
+    p95_ms = budget.get("p95_ms")
+    return ImportTimeBudget(
+        target=str(payload.get("target_module") or DEFAULT_TARGET),
+        samples=max(1, int(payload.get("samples") or DEFAULT_SAMPLES)),
+        median_ms=float(median_ms) if median_ms is not None else None,
+        p95_ms=float(p95_ms) if p95_ms is not None else None,
+        deferred_modules=[str(name) for name in deferred if str(name).strip()],
+    )
+
+
+def run_importtime(base_dir: Path, target: str) -> ImportTimeSample:
+    """新しいインタプリタで `import target` を実行して計測する。"""
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(base_dir), env.get("PYTHONPATH", "")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=str(base_dir),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.strip().splitlines()[-5:])
+        raise RuntimeError(f"import {target} failed (rc={proc.returncode}):\n{tail}")
+    return parse_importtime(proc.stderr, target)
+
+
+def _percentile(values: list[float], ratio: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(ratio * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(samples: list[ImportTimeSample]) -> dict[str, object]:
+    totals_ms = [sample.total_us / 1000.0 for sample in samples]
+    median_ms = statistics.median(totals_ms)
+    # 中央値に最も近い回の内訳を代表として出す
+    representative = min(samples, key=lambda sample: abs(sample.total_us / 1000.0 - median_ms))
+    top = sorted(representative.modules.items(), key=lambda item: item[1][1], reverse=True)
+    imported: set[str] = set()
+    for sample in samples:
+        imported.update(sample.modules)
+    return {
+        "elapsed_ms": {
+            "median": round(median_ms, 3),
+            "p95": round(_percentile(totals_ms, 0.95), 3),
+            "min": round(min(totals_ms), 3),
+            "max": round(max(totals_ms), 3),
+        },
+        "module_count": len(representative.modules),
+        "top_cumulative": [
+            {"module": name, "self_ms": round(times[0] / 1000.0, 3), "cumulative_ms": round(times[1] / 1000.0, 3)}
+            for name, times in top[:_TOP_MODULES]
+        ],
+        "imported_modules": sorted(imported),
+    }
+
+
+def find_deferred_violations(imported: list[str] | set[str], deferred_modules: list[str]) -> list[str]:
+    """起動時に読み込まれてしまった遅延対象のモジュール（パッケージ配下も含む）。"""
+    found: list[str] = []
+    for deferred in deferred_modules:
+        prefix = f"{deferred}."
+        if any(name == deferred or name.startswith(prefix) for name in imported):
+            found.append(deferred)
+    return found
+
+
+def find_budget_violations(elapsed_ms: dict[str, float], budget: ImportTimeBudget) -> list[str]:
+    violations: list[str] = []
+    if budget.median_ms is not None and elapsed_ms["median"] > budget.median_ms:
+        violations.append(f"median {elapsed_ms['median']:.1f}ms > budget {budget.median_ms:.1f}ms")
+    if budget.p95_ms is not None and elapsed_ms["p95"] > budget.p95_ms:
+        violations.append(f"p95 {elapsed_ms['p95']:.1f}ms > budget {budget.p95_ms:.1f}ms")
+    return violations
+
+
+def _is_enforce_enabled(flag: bool) -> bool:
+    return flag or os.getenv(ENV_PERF_ENFORCE) == "1"
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Measure cold-start import time with python -X importtime.")
+    parser.add_argument(
+        "--base-dir",
+        type=Path,
+        default=Path(__file__).resolve().parent.parent,
+        help="Project base directory (default: repository root).",
+    )
+    parser.add_argument(
+        "--budget",
+        type=Path,
+        default=None,
+        help=f"Budget file (default: <base-dir>/{DEFAULT_BUDGET_RELATIVE_PATH.as_posix()}).",
+    )
+    parser.add_argument("--samples", type=int, default=None, help="Measured runs (default: from budget file).")
+    parser.add_argument("--output-dir", type=Path, default=None, help="Optional output directory for a JSON report.")
+    parser.add_argument("--enforce", action="store_true", help=f"Fail on budget violations (or {ENV_PERF_ENFORCE}=1).")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    base_dir = args.base_dir.resolve()
+    budget_path = args.budget if args.budget is not None else base_dir / DEFAULT_BUDGET_RELATIVE_PATH
+    if not budget_path.exists():
+        print(f"[IMPORTTIME] budget file not found, skipped: {budget_path}")
+        return 0
+    try:
+        budget = load_budget(budget_path)
+    except Exception as exc:
+        print(f"[IMPORTTIME] invalid budget file {budget_path}: {exc}")
+        return 2
+
+    samples_count = max(1, int(args.samples)) if args.samples is not None else budget.samples
+    try:
+        # 1 回目はバイトコードの生成を含むため捨てる
+        run_importtime(base_dir, budget.target)
+        samples = [run_importtime(base_dir, budget.target) for _ in range(samples_count)]
+    except Exception as exc:
+        print(f"[IMPORTTIME] measurement failed: {exc}")
+        return 1
+
+    summary = summarize(samples)
+    elapsed = summary["elapsed_ms"]
+    print(
+        f"[IMPORTTIME] import {budget.target}: median={elapsed['median']:.1f}ms "
+        f"p95={elapsed['p95']:.1f}ms modules={summary['module_count']}"
+    )
+    for entry in summary["top_cumulative"][:5]:
+        print(f"[IMPORTTIME]   {entry['cumulative_ms']:8.1f}ms  {entry['module']}")
+
+    deferred_violations = find_deferred_violations(summary["imported_modules"], budget.deferred_modules)
+    budget_violations = find_budget_violations(elapsed, budget)
+    enforce = _is_enforce_enabled(args.enforce)
+
+    if args.output_dir is not None:
+        output_dir = args.output_dir.resolve()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        report_path = output_dir / f"importtime_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        report = {
+            "target_module": budget.target,
+            "samples": samples_count,
+            "enforce": enforce,
+            "budget": {"median_ms": budget.median_ms, "p95_ms": budget.p95_ms},
+            "deferred_violations": deferred_violations,
+            "budget_violations": budget_violations,
+            **summary,
+        }
+        report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"[IMPORTTIME] json report: {report_path}")
+
+    for name in deferred_violations:
+        print(f"[IMPORTTIME] deferred module imported at startup: {name}")
+    for message in budget_violations:
+        print(f"[IMPORTTIME] budget exceeded: {message}")
+
+    if deferred_violations:
+        return 1
+    if budget_violations and enforce:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,25 +8,33 @@ Key properties:
 - writes JSON + Markdown reports
 - keeps partial results when a scenario fails
 - supports scenario filtering for fast local iteration
+- records peak RSS per scenario (per-scenario on Linux, process high-water mark elsewhere)
+- scene restore / switch / save scenarios (S18-S26) run on seeded `synthetic_workload` scenes
 """
 # ruff: noqa: E402
 
 from __future__ import annotations
 
 import argparse
+import atexit
+import copy
 import json
 import os
 import platform
+import shutil
 import statistics
 import subprocess
 import sys
+import tempfile
 import traceback
-from dataclasses import dataclass
+from contextlib import ExitStack
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
 from time import perf_counter
 from types import SimpleNamespace
 from typing import Callable
+from unittest.mock import MagicMock, patch
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
@@ -34,14 +42,22 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 
-from PySide6.QtCore import QPoint, Qt
+from PySide6.QtCore import QEvent, QModelIndex, QObject, QPoint, Qt
+from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QApplication
 
+from managers.file_manager import FileManager
+from managers.scene_format import iter_scene_stream, json_backend, read_scene_file, write_scene_stream
+from managers.window_manager import WindowManager
 from models.window_config import TextWindowConfig
+from scripts.synthetic_workload import PROFILES as WORKLOAD_PROFILES
+from scripts.synthetic_workload import generate_workload
+from scripts.utils.process_memory import peak_rss_mb, reset_peak_rss
 from ui.property_panel import PropertyPanel
 from ui.property_panel_sections.text_content_section import build_text_content_section
 from ui.property_panel_sections.text_style_section import build_text_style_section
 from ui.tabs.info_tab import InfoTab
+from utils.write_behind import write_json_atomic
 from windows.text_renderer import TextRenderer
 from windows.text_window_parts import metadata_ops, task_ops
 
@@ -71,6 +87,7 @@ class ScenarioResult:
     elapsed_ms: dict[str, float]
     counters: Counters
     error: str = ""
+    peak_rss_mb: float = 0.0
 
 
 def _git_commit(base_dir: Path) -> str:
@@ -318,11 +335,11 @@ class _InfoActionsStub:
         return []
 
 
-def _make_info_tab() -> InfoTab:
+def _make_info_tab(scale: int = 1) -> InfoTab:
     _ensure_qapp()
 
     task_windows: list[object] = []
-    for i in range(200):
+    for i in range(200 * scale):
         if i % 3 == 0:
             due_at = "2001-01-01T00:00:00"
         elif i % 3 == 1:
@@ -341,7 +358,8 @@ def _make_info_tab() -> InfoTab:
         )
 
     note_windows = [
-        _BenchInfoNoteWindow(uuid=f"n-{i}", is_starred=(i % 5 == 0), is_archived=(i % 12 == 0)) for i in range(300)
+        _BenchInfoNoteWindow(uuid=f"n-{i}", is_starred=(i % 5 == 0), is_archived=(i % 12 == 0))
+        for i in range(300 * scale)
     ]
     text_windows = [*task_windows, *note_windows]
 
@@ -409,6 +427,16 @@ def _count_note_rows(tab: InfoTab) -> int:
 
 def _iter_tree_items(tree: object) -> list[object]:
     result: list[object] = []
+    model_fn = getattr(tree, "model", None)
+    if callable(model_fn) and not hasattr(tree, "topLevelItemCount"):
+        # QTreeView + モデル: トップレベル + 子のインデックスを列挙する
+        model = model_fn()
+        for i in range(model.rowCount()):
+            top = model.index(i, 0)
+            result.append(top)
+            for j in range(model.rowCount(top)):
+                result.append(model.index(j, 0, top))
+        return result
     top_level_count = getattr(tree, "topLevelItemCount", None)
     top_level_item = getattr(tree, "topLevelItem", None)
     if not callable(top_level_count) or not callable(top_level_item):
@@ -430,6 +458,9 @@ def _iter_tree_items(tree: object) -> list[object]:
 
 
 def _item_user_key(item: object) -> str:
+    if isinstance(item, QModelIndex):
+        # 引数違いの TypeError 経由（shiboken のエラー整形が重い）を計測に含めない
+        return str(item.data(Qt.ItemDataRole.UserRole) or "")
     data_fn = getattr(item, "data", None)
     if not callable(data_fn):
         return ""
@@ -628,11 +659,19 @@ def _scenario_s04_metadata_update() -> ScenarioFn:
     return run
 
 
+def _wait_info_results(tab: InfoTab) -> None:
+    # 絞り込みがワーカーで行われる場合は、結果が一覧に反映されるまでを計測に含める
+    wait = getattr(tab, "wait_for_query_results", None)
+    if callable(wait) and not wait(30.0):
+        raise RuntimeError("Info query results did not arrive in time")
+
+
 def _scenario_s05_info_refresh_all() -> ScenarioFn:
     tab = _make_info_tab()
 
     def run() -> Counters:
         tab.refresh_data(immediate=True)
+        _wait_info_results(tab)
         return {
             "task_item_count": _count_task_rows(tab),
             "note_item_count": _count_note_rows(tab),
@@ -641,14 +680,17 @@ def _scenario_s05_info_refresh_all() -> ScenarioFn:
     return run
 
 
-def _scenario_s06_info_filter_switch() -> ScenarioFn:
-    tab = _make_info_tab()
+def _info_filter_switch_runner(scale: int) -> ScenarioFn:
+    tab = _make_info_tab(scale)
     idx_today = tab.cmb_due_filter.findData("today")
     idx_overdue = tab.cmb_due_filter.findData("overdue")
     btn_starred = tab._smart_view_buttons.get("starred")
     btn_all = tab._smart_view_buttons.get("all")
+    worker = getattr(tab, "_query_worker", None)
 
     def run() -> Counters:
+        superseded_before = int(getattr(worker, "superseded_count", 0))
+        t0 = perf_counter()
         tab.cmb_due_filter.setCurrentIndex(idx_today if idx_today >= 0 else 0)
         tab.refresh_data(immediate=True)
         tab.cmb_due_filter.setCurrentIndex(idx_overdue if idx_overdue >= 0 else 0)
@@ -659,8 +701,13 @@ def _scenario_s06_info_filter_switch() -> ScenarioFn:
         if btn_all is not None:
             btn_all.click()
         tab.refresh_data(immediate=True)
+        # GUI スレッドが連続したフィルタ切り替えで塞がっていた時間（結果待ちは含まない）
+        gui_blocking_ms = (perf_counter() - t0) * 1000.0
+        _wait_info_results(tab)
         return {
             "filter_apply_count": 3,
+            "gui_blocking_ms": round(gui_blocking_ms, 3),
+            "superseded_query_count": int(getattr(worker, "superseded_count", 0)) - superseded_before,
             "task_item_count": _count_task_rows(tab),
             "note_item_count": _count_note_rows(tab),
         }
@@ -668,6 +715,14 @@ def _scenario_s06_info_filter_switch() -> ScenarioFn:
     return run
 
 
+def _scenario_s06_info_filter_switch() -> ScenarioFn:
+    return _info_filter_switch_runner(1)
+
+
+def _scenario_s15_info_filter_switch_10x() -> ScenarioFn:
+    return _info_filter_switch_runner(10)
+
+
 def _scenario_s07_property_content_sync() -> ScenarioFn:
     panel, target = _make_property_panel()
     tick = {"n": 0}
@@ -727,6 +782,569 @@ def _scenario_s08_property_style_sync() -> ScenarioFn:
     return run
 
 
+def _scenario_s09_config_hydration() -> ScenarioFn:
+    payloads: list[dict[str, object]] = []
+    for i in range(100):
+        cfg = TextWindowConfig(
+            text=f"hydrate-{i}",
+            font_size=20 + (i % 30),
+            title=f"title-{i}",
+            tags=["alpha", f"tag-{i % 7}"],
+            position={"x": i * 3, "y": i * 5},
+        )
+        payloads.append(cfg.model_dump(mode="json"))
+
+    fields = TextWindowConfig.model_fields
+
+    def _hydrate_per_field(payload: dict[str, object]) -> TextWindowConfig:
+        # 一括適用の導入前（および不正値を含む場合のフォールバック）と同じく、1フィールドずつ代入検証する
+        config = TextWindowConfig()
+        for key, value in payload.items():
+            if key not in fields:
+                continue
+            try:
+                setattr(config, key, value)
+            except Exception:
+                pass
+        return config
+
+    def run() -> Counters:
+        t0 = perf_counter()
+        per_field = [_hydrate_per_field(payload) for payload in payloads]
+        t1 = perf_counter()
+        bulk = [TextWindowConfig().with_updates(payload) for payload in payloads]
+        t2 = perf_counter()
+
+        hydrated = 0
+        mismatched = 0
+        for payload, a, b in zip(payloads, per_field, bulk):
+            hydrated += int(b.text == payload["text"])
+            mismatched += int(a.model_dump(mode="json") != b.model_dump(mode="json"))
+        per_field_ms = (t1 - t0) * 1000.0
+        bulk_ms = (t2 - t1) * 1000.0
+        return {
+            "hydrated_count": hydrated,
+            "mismatched_count": mismatched,
+            "field_count": len(fields),
+            "per_field_ms": round(per_field_ms, 4),
+            "bulk_ms": round(bulk_ms, 4),
+            "per_field_to_bulk_ratio": round(per_field_ms / bulk_ms, 4) if bulk_ms > 0 else 0.0,
+        }
+
+    return run
+
+
+_SCENE_LOAD_WINDOW_COUNT = 200
+
+
+def _make_scene_host() -> tuple[FileManager, WindowManager]:
+    _ensure_qapp()
+    mw = MagicMock()
+    # QAction 共有と QColor 既定値は実体が必要
+    del mw.undo_action
+    del mw.redo_action
+    mw.default_line_width = 2
+    mw.default_line_color = QColor("white")
+    mw.json_directory = str(BASE_DIR / "json")
+    window_manager = WindowManager(mw)
+    mw.window_manager = window_manager
+    return FileManager(mw), window_manager
+
+
+def _make_scene_load_payload(count: int) -> dict[str, object]:
+    windows: list[dict[str, object]] = []
+    for i in range(count):
+        windows.append(
+            {
+                "type": "text",
+                "uuid": f"bench-{i}",
+                "text": f"scene load {i}",
+                "font_size": 18 + (i % 12),
+                "position": {"x": 20 + (i % 20) * 40, "y": 20 + (i // 20) * 30},
+                # 1割は非表示（後回しにされる側）
+                "is_hidden": i % 10 == 0,
+            }
+        )
+    connections = [{"from_uuid": f"bench-{i}", "to_uuid": f"bench-{i + 1}"} for i in range(0, count - 1, 10)]
+    return {"format_version": 1, "windows": windows, "connections": connections}
+
+
+def _clear_scene_host(file_manager: FileManager, window_manager: WindowManager) -> None:
+    app = _ensure_qapp()
+    file_manager.cancel_scene_loading()
+    window_manager.clear_all()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    app.processEvents()
+    # MagicMock の呼び出し履歴が引数のウィンドウを保持し続けるため消す
+    file_manager.main_window.reset_mock()
+
+
+def _run_progressive_load(
+    file_manager: FileManager, payload: dict[str, object], *, stop_at_first_visible: bool
+) -> Counters:
+    app = _ensure_qapp()
+    marks: dict[str, float] = {}
+    t0 = perf_counter()
+    file_manager.load_scene_from_data(payload, progressive=True)
+    loader = file_manager.scene_loader
+    if loader is None:
+        raise RuntimeError("progressive loader was not started")
+    loader.sig_first_visible.connect(lambda _w: marks.setdefault("first_visible", perf_counter()))
+    loader.sig_finished.connect(lambda: marks.setdefault("finished", perf_counter()))
+
+    target = "first_visible" if stop_at_first_visible else "finished"
+    ticks = 0
+    while target not in marks:
+        app.processEvents()
+        ticks += 1
+    counters: Counters = {
+        "first_visible_ms": round((marks["first_visible"] - t0) * 1000.0, 4),
+        "loaded_window_count": loader.processed,
+        "tick_count": ticks,
+    }
+    if "finished" in marks:
+        counters["fully_loaded_ms"] = round((marks["finished"] - t0) * 1000.0, 4)
+    return counters
+
+
+def _scenario_s10_scene_first_visible() -> ScenarioFn:
+    file_manager, window_manager = _make_scene_host()
+    payload = _make_scene_load_payload(_SCENE_LOAD_WINDOW_COUNT)
+
+    def run() -> Counters:
+        return _run_progressive_load(file_manager, payload, stop_at_first_visible=True)
+
+    run.reset = lambda: _clear_scene_host(file_manager, window_manager)  # type: ignore[attr-defined]
+    return run
+
+
+def _scenario_s11_scene_fully_loaded() -> ScenarioFn:
+    file_manager, window_manager = _make_scene_host()
+    payload = _make_scene_load_payload(_SCENE_LOAD_WINDOW_COUNT)
+
+    def run() -> Counters:
+        return _run_progressive_load(file_manager, payload, stop_at_first_visible=False)
+
+    run.reset = lambda: _clear_scene_host(file_manager, window_manager)  # type: ignore[attr-defined]
+    return run
+
+
+_SCENE_FILE_WINDOW_COUNT = 10_000
+
+
+def _make_scene_file_payload(count: int) -> dict[str, object]:
+    payload = _make_scene_load_payload(count)
+    for window in payload["windows"]:  # type: ignore[union-attr]
+        window.update(  # type: ignore[union-attr]
+            {
+                "title": f"note {window['uuid']}",  # type: ignore[index]
+                "tags": ["bench", "scene-io"],
+                "font_color": "#FFFFFFFF",
+                "background_color": "#CC000000",
+            }
+        )
+    return payload
+
+
+def _scenario_s12_scene_stream_write() -> ScenarioFn:
+    payload = _make_scene_file_payload(_SCENE_FILE_WINDOW_COUNT)
+    work_dir = Path(tempfile.mkdtemp(prefix="ftiv_p9e_s12_"))
+    atexit.register(shutil.rmtree, work_dir, True)
+    legacy_path = work_dir / "scene.json"
+    stream_path = work_dir / "scene.ftivs"
+    # 従来形式（indent=4 の json.dump）は比較用に1回だけ計測する
+    t0 = perf_counter()
+    write_json_atomic(str(legacy_path), payload, indent=4)
+    legacy_ms = (perf_counter() - t0) * 1000.0
+
+    def run() -> Counters:
+        write_scene_stream(str(stream_path), payload)
+        return {
+            "window_count": _SCENE_FILE_WINDOW_COUNT,
+            "stream_bytes": stream_path.stat().st_size,
+            "legacy_bytes": legacy_path.stat().st_size,
+            "legacy_write_ms": round(legacy_ms, 4),
+            "fast_encoder": int(json_backend() == "orjson"),
+        }
+
+    return run
+
+
+def _scenario_s13_scene_stream_read() -> ScenarioFn:
+    payload = _make_scene_file_payload(_SCENE_FILE_WINDOW_COUNT)
+    work_dir = Path(tempfile.mkdtemp(prefix="ftiv_p9e_s13_"))
+    atexit.register(shutil.rmtree, work_dir, True)
+    legacy_path = work_dir / "scene.json"
+    stream_path = work_dir / "scene.ftivs"
+    write_json_atomic(str(legacy_path), payload, indent=4)
+    write_scene_stream(str(stream_path), payload)
+    t0 = perf_counter()
+    read_scene_file(str(legacy_path))
+    legacy_ms = (perf_counter() - t0) * 1000.0
+
+    def run() -> Counters:
+        t_start = perf_counter()
+        first_window_ms = 0.0
+        windows = 0
+        for record in iter_scene_stream(str(stream_path)):
+            if record.kind != "window":
+                continue
+            if windows == 0:
+                first_window_ms = (perf_counter() - t_start) * 1000.0
+            windows += 1
+        return {
+            "window_count": windows,
+            "first_window_ms": round(first_window_ms, 4),
+            "legacy_full_parse_ms": round(legacy_ms, 4),
+        }
+
+    return run
+
+
+_SCENE_CAPTURE_WINDOW_COUNT = 1000
+
+
+class _CaptureWindow:
+    """get_scene_data の対象になる最小限のテキストウィンドウ（Qt ウィジェットを作らない）。"""
+
+    def __init__(self, index: int) -> None:
+        self.config = TextWindowConfig(
+            uuid=f"capture-{index}",
+            text=f"capture note {index}\nsecond line",
+            tags=["bench", f"group-{index % 10}"],
+            position={"x": index % 50, "y": index // 50},
+        )
+
+    def x(self) -> int:
+        return int(self.config.position["x"])
+
+    def y(self) -> int:
+        return int(self.config.position["y"])
+
+
+def _scenario_s14_scene_capture_after_edit() -> ScenarioFn:
+    mw = MagicMock()
+    windows = [_CaptureWindow(i) for i in range(_SCENE_CAPTURE_WINDOW_COUNT)]
+    mw.window_manager.text_windows = windows
+    mw.window_manager.image_windows = []
+    mw.window_manager.connectors = []
+    file_manager = FileManager(mw)
+    # キャッシュが空の状態（全件シリアライズ）を比較用に1回だけ計測する
+    t0 = perf_counter()
+    file_manager.get_scene_data()
+    full_capture_ms = (perf_counter() - t0) * 1000.0
+    edits = {"count": 0}
+
+    def run() -> Counters:
+        edits["count"] += 1
+        target = windows[edits["count"] % len(windows)]
+        target.config.text = f"edited {edits['count']}"
+        hits_before = file_manager.dump_cache_hits
+        misses_before = file_manager.dump_cache_misses
+        scene = file_manager.get_scene_data()
+        return {
+            "window_count": len(scene["windows"]),
+            "cache_hits": file_manager.dump_cache_hits - hits_before,
+            "cache_misses": file_manager.dump_cache_misses - misses_before,
+            "full_capture_ms": round(full_capture_ms, 4),
+        }
+
+    return run
+
+
+_FIRST_PAINT_TIMEOUT_S = 5.0
+
+
+class _FirstPaintProbe(QObject):
+    """MainWindow 自身への最初の Paint イベントの時刻を記録する。"""
+
+    def __init__(self, window_type: type) -> None:
+        super().__init__()
+        self._window_type = window_type
+        self.painted_at: float | None = None
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:  # noqa: N802
+        if self.painted_at is None and event.type() == QEvent.Type.Paint and isinstance(watched, self._window_type):
+            self.painted_at = perf_counter()
+        return False
+
+
+def _scenario_s16_main_window_first_paint() -> ScenarioFn:
+    from ui.main_window import MainWindow
+
+    app = _ensure_qapp()
+    holder: dict[str, object] = {}
+    original_init_paths = MainWindow._init_paths
+
+    def _init_paths_in_work_dir(work_dir: str) -> Callable[[MainWindow], None]:
+        def _init_paths(self: MainWindow) -> None:
+            original_init_paths(self)
+            self.base_directory = work_dir
+            self.json_directory = os.path.join(work_dir, "json")
+            os.makedirs(self.json_directory, exist_ok=True)
+
+        return _init_paths
+
+    def run() -> Counters:
+        # 設定・シーンDBは一時ディレクトリへ向け、自動保存ジャーナル（復旧ダイアログ）は止める
+        stack = ExitStack()
+        work_dir = tempfile.mkdtemp(prefix="ftiv_p9e_s16_")
+        stack.callback(shutil.rmtree, work_dir, True)
+        stack.enter_context(patch.dict(os.environ, {"FTIV_TEST_MODE": "1"}))
+        stack.enter_context(patch.object(MainWindow, "_init_paths", _init_paths_in_work_dir(work_dir)))
+        holder["stack"] = stack
+
+        probe = _FirstPaintProbe(MainWindow)
+        app.installEventFilter(probe)
+        try:
+            t0 = perf_counter()
+            mw = MainWindow()
+            constructed_at = perf_counter()
+            holder["window"] = mw
+            deadline = constructed_at + _FIRST_PAINT_TIMEOUT_S
+            while probe.painted_at is None and perf_counter() < deadline:
+                app.processEvents()
+        finally:
+            app.removeEventFilter(probe)
+        if probe.painted_at is None:
+            raise RuntimeError("MainWindow was not painted within the timeout")
+
+        tabs = mw.tabs
+        built_tabs = sum(1 for i in range(tabs.count()) if getattr(tabs.widget(i), "is_built", True))
+        return {
+            "construct_ms": round((constructed_at - t0) * 1000.0, 4),
+            "first_paint_ms": round((probe.painted_at - t0) * 1000.0, 4),
+            "tabs_total": tabs.count(),
+            "tabs_built": built_tabs,
+            "property_panel_built": int(mw.is_lazy_built("property_panel")),
+        }
+
+    def reset() -> None:
+        mw = holder.pop("window", None)
+        if mw is not None:
+            mw.close()
+            mw.deleteLater()
+            app.processEvents()
+        stack = holder.pop("stack", None)
+        if isinstance(stack, ExitStack):
+            stack.close()
+
+    run.reset = reset  # type: ignore[attr-defined]
+    return run
+
+
+_COLD_START_PROBE = BASE_DIR / "scripts" / "perf_cold_start_probe.py"
+
+
+def _last_json_line(stdout: str) -> dict[str, object] | None:
+    for line in reversed(stdout.strip().splitlines()):
+        try:
+            payload = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(payload, dict):
+            return payload
+    return None
+
+
+def _scenario_s17_cold_start_first_paint() -> ScenarioFn:
+    def run() -> Counters:
+        work_dir = tempfile.mkdtemp(prefix="ftiv_p9e_s17_")
+        try:
+            env = dict(os.environ)
+            env["QT_QPA_PLATFORM"] = "offscreen"
+            proc = subprocess.run(
+                [sys.executable, str(_COLD_START_PROBE), "--work-dir", work_dir],
+                cwd=str(BASE_DIR),
+                env=env,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        finally:
+            shutil.rmtree(work_dir, True)
+        report = _last_json_line(proc.stdout)
+        if proc.returncode != 0 or report is None or "error" in report:
+            detail = (report or {}).get("error") or "\n".join(proc.stderr.strip().splitlines()[-5:])
+            raise RuntimeError(f"cold start probe failed (rc={proc.returncode}): {detail}")
+        # peak_rss_mb は子プロセス自身の値（_run_one がこのプロセスの値の代わりに使う）
+        return {
+            key: report[key]  # type: ignore[misc]
+            for key in ("import_ms", "app_ready_ms", "construct_ms", "first_paint_ms", "tabs_built", "peak_rss_mb")
+            if key in report
+        }
+
+    return run
+
+
+_SCENE_SCALES = (10, 100, 1000)
+# 合成シーンは synthetic_workload の既定構成（装飾・画像・GIF・階層・コネクタの混在）で固定シードから作る
+WORKLOAD_SEED = 9049
+
+
+def _make_fixture_dir(prefix: str) -> Path:
+    work_dir = Path(tempfile.mkdtemp(prefix=prefix))
+    atexit.register(shutil.rmtree, work_dir, True)
+    return work_dir
+
+
+def _make_workload_scene(count: int, fixture_dir: Path) -> dict[str, object]:
+    profile = replace(WORKLOAD_PROFILES["production"], window_count=count)
+    return generate_workload(profile, seed=WORKLOAD_SEED, fixture_dir=fixture_dir).scene
+
+
+def _make_switch_target_payload(scene: dict[str, object]) -> tuple[dict[str, object], int]:
+    """切替先のシーン: 偶数番は同じ UUID で内容・位置だけ変え、奇数番は別のウィンドウにする。
+
+    Returns:
+        tuple[dict, int]: (切替先シーン, UUID を引き継ぐウィンドウ数)
+    """
+    payload = copy.deepcopy(scene)
+    windows: list[dict[str, object]] = payload["windows"]  # type: ignore[assignment]
+    renamed = {str(w["uuid"]): f"switched-{i}" for i, w in enumerate(windows) if i % 2 == 1}
+    for i, window in enumerate(windows):
+        window["uuid"] = renamed.get(str(window["uuid"]), window["uuid"])
+        if window.get("parent_uuid") in renamed:
+            window["parent_uuid"] = renamed[str(window["parent_uuid"])]
+        if i % 2 == 0:
+            position = dict(window["position"])  # type: ignore[arg-type]
+            position["x"] = int(position["x"]) + 7
+            window["position"] = position
+            if window.get("type") == "text":
+                window["text"] = f"switched {i}\n{window['text']}"
+    for connection in payload["connections"]:  # type: ignore[union-attr]
+        for key in ("from_uuid", "to_uuid"):
+            connection[key] = renamed.get(connection[key], connection[key])
+    return payload, len(windows) - len(renamed)
+
+
+def _scene_window_counts(window_manager: WindowManager) -> Counters:
+    return {
+        "window_count": len(window_manager.text_windows) + len(window_manager.image_windows),
+        "image_window_count": len(window_manager.image_windows),
+    }
+
+
+def _scene_restore_runner(count: int) -> ScenarioFn:
+    file_manager, window_manager = _make_scene_host()
+    payload = _make_workload_scene(count, _make_fixture_dir("ftiv_p9e_restore_"))
+    # アプリと同じ判定（件数が多いときだけ段階的読み込み）
+    progressive = count >= file_manager.PROGRESSIVE_LOAD_MIN_WINDOWS
+
+    def run() -> Counters:
+        if progressive:
+            counters = _run_progressive_load(file_manager, payload, stop_at_first_visible=False)
+        else:
+            file_manager.load_scene_from_data(payload, progressive=False)
+            counters = {}
+        # 読み込み後に溜まった描画・レイアウトを処理し終えた時点を操作可能とみなす
+        _ensure_qapp().processEvents()
+        counters.update(_scene_window_counts(window_manager))
+        counters["progressive"] = int(progressive)
+        return counters
+
+    run.reset = lambda: _clear_scene_host(file_manager, window_manager)  # type: ignore[attr-defined]
+    return run
+
+
+def _scene_switch_runner(count: int) -> ScenarioFn:
+    app = _ensure_qapp()
+    file_manager, window_manager = _make_scene_host()
+    source = _make_workload_scene(count, _make_fixture_dir("ftiv_p9e_switch_"))
+    target, reused = _make_switch_target_payload(source)
+    scenes = [source, target]
+    file_manager.load_scene_from_data(scenes[0], progressive=False)
+    app.processEvents()
+    state = {"current": 0}
+
+    def run() -> Counters:
+        target = 1 - state["current"]
+        file_manager.switch_scene_from_data(scenes[target])
+        state["current"] = target
+        # 閉じたウィンドウの破棄までを切替に含める
+        app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        app.processEvents()
+        counters = _scene_window_counts(window_manager)
+        counters["reused_window_count"] = reused
+        return counters
+
+    run.teardown = lambda: _clear_scene_host(file_manager, window_manager)  # type: ignore[attr-defined]
+    return run
+
+
+def _project_save_runner(count: int) -> ScenarioFn:
+    file_manager, window_manager = _make_scene_host()
+    work_dir = _make_fixture_dir("ftiv_p9e_save_")
+    mw = file_manager.main_window
+    mw.json_directory = str(work_dir)
+    mw.scenes = {}
+    file_manager.load_scene_from_data(_make_workload_scene(count, work_dir), progressive=False)
+    _ensure_qapp().processEvents()
+    # 読み込み直後の 1 回目（全件シリアライズ）は計測に含めない
+    file_manager.get_scene_data()
+    target_path = work_dir / "project.json"
+    edits = {"count": 0}
+
+    def run() -> Counters:
+        # 1 件編集してから保存する（変更の無いウィンドウは dump キャッシュが効く）
+        edits["count"] += 1
+        window = window_manager.text_windows[edits["count"] % len(window_manager.text_windows)]
+        window.config.text = f"edited {edits['count']}"
+        misses_before = file_manager.dump_cache_misses
+        with (
+            patch("managers.file_manager.QFileDialog") as dialog,
+            patch("managers.file_manager.QMessageBox") as message_box,
+        ):
+            dialog.getSaveFileName.return_value = (str(target_path), "")
+            file_manager.save_project_as_json()
+        if message_box.critical.called:
+            raise RuntimeError(f"project save failed: {message_box.critical.call_args}")
+        return {
+            **_scene_window_counts(window_manager),
+            "project_bytes": target_path.stat().st_size,
+            "cache_misses": file_manager.dump_cache_misses - misses_before,
+        }
+
+    run.teardown = lambda: _clear_scene_host(file_manager, window_manager)  # type: ignore[attr-defined]
+    return run
+
+
+def _scenario_s18_scene_restore_10() -> ScenarioFn:
+    return _scene_restore_runner(_SCENE_SCALES[0])
+
+
+def _scenario_s19_scene_restore_100() -> ScenarioFn:
+    return _scene_restore_runner(_SCENE_SCALES[1])
+
+
+def _scenario_s20_scene_restore_1000() -> ScenarioFn:
+    return _scene_restore_runner(_SCENE_SCALES[2])
+
+
+def _scenario_s21_scene_switch_10() -> ScenarioFn:
+    return _scene_switch_runner(_SCENE_SCALES[0])
+
+
+def _scenario_s22_scene_switch_100() -> ScenarioFn:
+    return _scene_switch_runner(_SCENE_SCALES[1])
+
+
+def _scenario_s23_scene_switch_1000() -> ScenarioFn:
+    return _scene_switch_runner(_SCENE_SCALES[2])
+
+
+def _scenario_s24_project_save_10() -> ScenarioFn:
+    return _project_save_runner(_SCENE_SCALES[0])
+
+
+def _scenario_s25_project_save_100() -> ScenarioFn:
+    return _project_save_runner(_SCENE_SCALES[1])
+
+
+def _scenario_s26_project_save_1000() -> ScenarioFn:
+    return _project_save_runner(_SCENE_SCALES[2])
+
+
 def _scenario_specs() -> list[ScenarioSpec]:
     return [
         ScenarioSpec("P9E-S01", "TextRenderer render (DS-01)", _scenario_s01_renderer_render),
@@ -739,24 +1357,60 @@ def _scenario_specs() -> list[ScenarioSpec]:
         ScenarioSpec("P9E-S06", "InfoTab filter switch sequence", _scenario_s06_info_filter_switch),
         ScenarioSpec("P9E-S07", "PropertyPanel text content sync", _scenario_s07_property_content_sync),
         ScenarioSpec("P9E-S08", "PropertyPanel text style sync", _scenario_s08_property_style_sync),
+        ScenarioSpec("P9E-S09", "WindowConfig bulk hydration (100 windows)", _scenario_s09_config_hydration),
+        ScenarioSpec("P9E-S10", "Scene load time to first visible (200 windows)", _scenario_s10_scene_first_visible),
+        ScenarioSpec("P9E-S11", "Scene load time to fully loaded (200 windows)", _scenario_s11_scene_fully_loaded),
+        ScenarioSpec("P9E-S12", "Compact scene stream write (10k windows)", _scenario_s12_scene_stream_write),
+        ScenarioSpec("P9E-S13", "Compact scene stream read (10k windows)", _scenario_s13_scene_stream_read),
+        ScenarioSpec("P9E-S14", "Scene capture after one edit (1000 windows)", _scenario_s14_scene_capture_after_edit),
+        ScenarioSpec("P9E-S15", "InfoTab filter switch sequence (10x dataset)", _scenario_s15_info_filter_switch_10x),
+        ScenarioSpec("P9E-S16", "MainWindow construction to first paint", _scenario_s16_main_window_first_paint),
+        ScenarioSpec("P9E-S17", "Cold start to first paint (fresh process)", _scenario_s17_cold_start_first_paint),
+        ScenarioSpec("P9E-S18", "Scene restore to interactive (10 windows)", _scenario_s18_scene_restore_10),
+        ScenarioSpec("P9E-S19", "Scene restore to interactive (100 windows)", _scenario_s19_scene_restore_100),
+        ScenarioSpec("P9E-S20", "Scene restore to interactive (1000 windows)", _scenario_s20_scene_restore_1000),
+        ScenarioSpec("P9E-S21", "Scene switch with half reused (10 windows)", _scenario_s21_scene_switch_10),
+        ScenarioSpec("P9E-S22", "Scene switch with half reused (100 windows)", _scenario_s22_scene_switch_100),
+        ScenarioSpec("P9E-S23", "Scene switch with half reused (1000 windows)", _scenario_s23_scene_switch_1000),
+        ScenarioSpec("P9E-S24", "Project save after one edit (10 windows)", _scenario_s24_project_save_10),
+        ScenarioSpec("P9E-S25", "Project save after one edit (100 windows)", _scenario_s25_project_save_100),
+        ScenarioSpec("P9E-S26", "Project save after one edit (1000 windows)", _scenario_s26_project_save_1000),
     ]
 
 
 def _run_one(spec: ScenarioSpec, *, warmup: int, samples: int) -> ScenarioResult:
     runner = spec.build_runner()
+    # 計測対象外の後始末（生成したウィンドウの破棄など）。runner.reset があれば毎回呼ぶ
+    reset = getattr(runner, "reset", None)
+    # シナリオ終了時の後始末（サンプル間で状態を持ち越すシナリオ用）。runner.teardown があれば最後に 1 回呼ぶ
+    teardown = getattr(runner, "teardown", None)
     durations: list[float] = []
     counter_samples: list[Counters] = []
+    # 子プロセスで計測するシナリオは counters["peak_rss_mb"] で子のピーク RSS を返す
+    child_peaks: list[float] = []
+
+    def _peak() -> float:
+        return round(max(child_peaks), 2) if child_peaks else peak_rss_mb()
 
     try:
         for _ in range(max(0, warmup)):
             _ = runner()
+            if callable(reset):
+                reset()
 
+        # 準備とウォームアップで増えた分を除き、計測中のピークだけを残す（Linux のみ）
+        reset_peak_rss()
         for _ in range(max(1, samples)):
             t0 = perf_counter()
             counters = runner()
             dt_ms = (perf_counter() - t0) * 1000.0
             durations.append(dt_ms)
+            child_peak = counters.pop("peak_rss_mb", None)
+            if child_peak is not None:
+                child_peaks.append(float(child_peak))
             counter_samples.append(counters)
+            if callable(reset):
+                reset()
 
         return ScenarioResult(
             scenario_id=spec.scenario_id,
@@ -766,6 +1420,7 @@ def _run_one(spec: ScenarioSpec, *, warmup: int, samples: int) -> ScenarioResult
             samples=max(1, samples),
             elapsed_ms=_stats(durations),
             counters=_aggregate_counters(counter_samples),
+            peak_rss_mb=_peak(),
         )
     except Exception:
         err = traceback.format_exc()
@@ -778,7 +1433,11 @@ def _run_one(spec: ScenarioSpec, *, warmup: int, samples: int) -> ScenarioResult
             elapsed_ms=_stats(durations),
             counters=_aggregate_counters(counter_samples),
             error=err.strip(),
+            peak_rss_mb=_peak(),
         )
+    finally:
+        if callable(teardown):
+            teardown()
 
 
 def _write_json(path: Path, payload: dict[str, object]) -> None:
@@ -797,15 +1456,17 @@ def _write_markdown(path: Path, payload: dict[str, object], results: list[Scenar
         f.write(f"- Python: `{meta['python']}`\n")
         f.write(f"- OS: `{meta['os']}`\n")
         f.write(f"- Window size baseline: `{meta['window_size'][0]} x {meta['window_size'][1]}`\n")
-        f.write(f"- Warmup/Samples: `{meta['warmup']}/{meta['samples']}`\n\n")
+        f.write(f"- Warmup/Samples: `{meta['warmup']}/{meta['samples']}`\n")
+        f.write(f"- Peak RSS scope: `{meta.get('peak_rss_scope', 'process')}`\n")
+        f.write(f"- Synthetic workload seed: `{meta.get('workload_seed', '-')}`\n\n")
 
         f.write("## Scenario Summary\n\n")
-        f.write("| ID | Status | Median ms | p95 ms | Max ms |\n")
-        f.write("|---|---|---:|---:|---:|\n")
+        f.write("| ID | Status | Median ms | p95 ms | Max ms | Peak RSS MB |\n")
+        f.write("|---|---|---:|---:|---:|---:|\n")
         for r in results:
             f.write(
                 f"| {r.scenario_id} | {r.status} | {r.elapsed_ms.get('median', 0.0):.4f} | "
-                f"{r.elapsed_ms.get('p95', 0.0):.4f} | {r.elapsed_ms.get('max', 0.0):.4f} |\n"
+                f"{r.elapsed_ms.get('p95', 0.0):.4f} | {r.elapsed_ms.get('max', 0.0):.4f} | {r.peak_rss_mb:.1f} |\n"
             )
 
         f.write("\n## Scenario Details\n\n")
@@ -816,6 +1477,7 @@ def _write_markdown(path: Path, payload: dict[str, object], results: list[Scenar
                 f"- Elapsed ms: median={r.elapsed_ms.get('median', 0.0):.4f}, "
                 f"p95={r.elapsed_ms.get('p95', 0.0):.4f}, max={r.elapsed_ms.get('max', 0.0):.4f}\n"
             )
+            f.write(f"- Peak RSS MB: `{r.peak_rss_mb:.1f}`\n")
             if r.counters:
                 f.write("- Counters:\n")
                 for key, value in sorted(r.counters.items()):
@@ -885,6 +1547,7 @@ def _resolve_thresholds_path(base_dir: Path) -> Path:
 
 
 def _load_threshold_rules(path: Path) -> dict[str, dict[str, float]]:
+    """シナリオごとの閾値（median_ms / p95_ms は必須、peak_rss_mb は任意）を読み込む。"""
     if not path.exists():
         raise FileNotFoundError(f"threshold file not found: {path}")
 
@@ -908,6 +1571,11 @@ def _load_threshold_rules(path: Path) -> dict[str, dict[str, float]]:
         if median_ms <= 0 or p95_ms <= 0:
             raise ValueError(f"threshold rule for {scenario_id} must be positive")
         out[str(scenario_id)] = {"median_ms": median_ms, "p95_ms": p95_ms, "samples": samples}
+        if "peak_rss_mb" in rule:
+            peak_rss_mb = float(rule["peak_rss_mb"])
+            if peak_rss_mb <= 0:
+                raise ValueError(f"threshold rule for {scenario_id} must have positive peak_rss_mb")
+            out[str(scenario_id)]["peak_rss_mb"] = peak_rss_mb
     return out
 
 
@@ -931,6 +1599,12 @@ def _collect_threshold_violations(
             violations.append(f"{result.scenario_id}: median {actual_median:.4f}ms > threshold {limit_median:.4f}ms")
         if actual_p95 > limit_p95:
             violations.append(f"{result.scenario_id}: p95 {actual_p95:.4f}ms > threshold {limit_p95:.4f}ms")
+        # ピーク RSS が取れない環境（0.0）では判定しない
+        limit_rss = rule.get("peak_rss_mb")
+        if limit_rss is not None and result.peak_rss_mb > 0 and result.peak_rss_mb > float(limit_rss):
+            violations.append(
+                f"{result.scenario_id}: peak RSS {result.peak_rss_mb:.1f}MB > threshold {float(limit_rss):.1f}MB"
+            )
 
     return violations, matched_ids
 
@@ -993,13 +1667,15 @@ def main(argv: list[str] | None = None) -> int:
     json_path = output_dir / f"{measurement_id}.json"
     md_path = output_dir / f"{measurement_id}.md"
 
+    peak_rss_scope = "scenario" if reset_peak_rss() else "process"
     results: list[ScenarioResult] = []
     for spec in run_specs:
         print(f"[Phase9E] running {spec.scenario_id} ...")
         result = _run_one(spec, warmup=max(0, int(args.warmup)), samples=max(1, int(args.samples)))
         results.append(result)
         print(
-            f"[Phase9E] {spec.scenario_id} status={result.status} median={result.elapsed_ms.get('median', 0.0):.4f}ms"
+            f"[Phase9E] {spec.scenario_id} status={result.status} median={result.elapsed_ms.get('median', 0.0):.4f}ms "
+            f"peak_rss={result.peak_rss_mb:.1f}MB"
         )
 
     payload: dict[str, object] = {
@@ -1013,6 +1689,8 @@ def main(argv: list[str] | None = None) -> int:
             "warmup": max(0, int(args.warmup)),
             "samples": max(1, int(args.samples)),
             "scenarios": [spec.scenario_id for spec in run_specs],
+            "peak_rss_scope": peak_rss_scope,
+            "workload_seed": WORKLOAD_SEED,
         },
         "scenarios": [
             {
@@ -1024,6 +1702,7 @@ def main(argv: list[str] | None = None) -> int:
                 "elapsed_ms": r.elapsed_ms,
                 "counters": r.counters,
                 "error": r.error,
+                "peak_rss_mb": r.peak_rss_mb,
             }
             for r in results
         ],
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""Cold-start probe launched by `measure_phase9e.py` (P9E-S17) in a fresh interpreter.
+
+Follows `main.run_app()` up to the first paint of MainWindow:
+`import main` -> QApplication -> language -> theme -> MainWindow -> first Paint event.
+Logging setup and ConfigGuardian are skipped (they write into the install directory),
+and settings / scene DB are redirected to `--work-dir`.
+
+Prints one JSON line with the phase timings (ms since this script started) and the
+peak RSS of this process, then exits immediately so the parent's wall time is the
+time to first paint.
+"""
+# ruff: noqa: E402
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from time import perf_counter
+
+_T_START = perf_counter()
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# 自動保存ジャーナル（復旧ダイアログ）や非同期保存を止める
+os.environ["FTIV_TEST_MODE"] = "1"
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+_FIRST_PAINT_TIMEOUT_S = 10.0
+
+
+def _elapsed_ms(mark: float) -> float:
+    return round((mark - _T_START) * 1000.0, 4)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure MainWindow cold start in this process.")
+    parser.add_argument("--work-dir", required=True, help="Directory for settings and scene DB.")
+    args = parser.parse_args(argv)
+
+    import main as _app_main  # noqa: F401  アプリ本体と同じ import 経路
+
+    t_imported = perf_counter()
+
+    from PySide6.QtCore import QEvent, QObject
+    from PySide6.QtWidgets import QApplication
+
+    from scripts.utils.process_memory import peak_rss_mb
+    from ui.main_window import MainWindow
+    from utils.theme_manager import ThemeManager
+    from utils.translator import set_lang
+
+    app = QApplication(sys.argv[:1])
+    set_lang("jp")
+    ThemeManager.load_theme(app)
+
+    original_init_paths = MainWindow._init_paths
+
+    def _init_paths(self: MainWindow) -> None:
+        original_init_paths(self)
+        self.base_directory = args.work_dir
+        self.json_directory = os.path.join(args.work_dir, "json")
+        os.makedirs(self.json_directory, exist_ok=True)
+
+    MainWindow._init_paths = _init_paths  # type: ignore[method-assign]
+
+    marks: dict[str, float] = {}
+
+    class _FirstPaintFilter(QObject):
+        def eventFilter(self, watched: QObject, event: QEvent) -> bool:  # noqa: N802
+            if "painted" not in marks and event.type() == QEvent.Type.Paint and isinstance(watched, MainWindow):
+                marks["painted"] = perf_counter()
+            return False
+
+    paint_filter = _FirstPaintFilter()
+    app.installEventFilter(paint_filter)
+    t_construct = perf_counter()
+    window = MainWindow()
+    t_constructed = perf_counter()
+    deadline = t_constructed + _FIRST_PAINT_TIMEOUT_S
+    while "painted" not in marks and perf_counter() < deadline:
+        app.processEvents()
+    app.removeEventFilter(paint_filter)
+
+    if "painted" not in marks:
+        print(json.dumps({"error": "MainWindow was not painted within the timeout"}), flush=True)
+        os._exit(1)
+
+    tabs = window.tabs
+    report = {
+        "import_ms": _elapsed_ms(t_imported),
+        "app_ready_ms": _elapsed_ms(t_construct),
+        "construct_ms": round((t_constructed - t_construct) * 1000.0, 4),
+        "first_paint_ms": _elapsed_ms(marks["painted"]),
+        "tabs_built": sum(1 for i in range(tabs.count()) if getattr(tabs.widget(i), "is_built", True)),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    print(json.dumps(report), flush=True)
+    # 終了処理（ウィンドウ破棄・設定保存）は計測に含めない
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,525 @@
+#!/usr/bin/env python
+"""Seeded synthetic workload generator for perf scenarios and stress tests.
+
+Emits a scene (the same shape as `FileManager.get_scene_data()`) together with the
+image fixtures it references. The mix of window kinds and styles is controlled by
+the ratios of a `WorkloadProfile`:
+
+- styled text: outlines (up to three), shadow / outline blur, text and background
+  gradients, vertical layout, task lists with due dates
+- image windows backed by static PNGs and animated GIFs
+- layer trees (parent_uuid / layer_offset / layer_order) and connectors with labels
+
+Ratios are applied as exact quotas (round(ratio * population)), so the same profile
+and seed always produce the same scene and byte-identical fixtures.
+
+Usage:
+  python scripts/synthetic_workload.py --output-dir /tmp/workload --windows 500 --seed 7
+  python scripts/synthetic_workload.py --output-dir /tmp/workload --profile plain --set image_ratio=0.5
+"""
+# ruff: noqa: E402
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import uuid
+from dataclasses import dataclass, field, fields, replace
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from PIL import Image, ImageDraw
+
+from managers.scene_format import SCENE_STREAM_EXTENSION, write_scene_stream
+from models.enums import ArrowStyle
+from utils.write_behind import write_json_atomic
+
+DEFAULT_SEED = 0
+DEFAULT_PROFILE = "production"
+
+_BASE_TIME = datetime(2026, 1, 15, 9, 0, 0)
+_DESKTOP_SIZE = (1920, 1080)
+_FONTS = ("Arial", "Meiryo", "Yu Gothic", "Segoe UI", "Noto Sans JP")
+_WORDS = (
+    "review",
+    "draft",
+    "meeting",
+    "deploy",
+    "budget",
+    "release",
+    "memo",
+    "idea",
+    "follow",
+    "up",
+    "買い物",
+    "打ち合わせ",
+    "資料",
+    "確認",
+    "締め切り",
+    "メモ",
+    "連絡",
+    "予定",
+)
+_TAGS = ("work", "home", "urgent", "idea", "later", "project-a", "project-b", "読書", "買い物")
+# Qt.PenStyle: SolidLine .. DashDotDotLine
+_PEN_STYLES = (1, 2, 3, 4, 5)
+
+
+@dataclass(frozen=True)
+class WorkloadProfile:
+    """合成ワークロードの構成。ratio はすべて 0..1 の割合で、対象の母数に対する件数になる。
+
+    Attributes:
+        window_count: ウィンドウ総数。
+        image_ratio: 全ウィンドウのうち画像ウィンドウの割合。
+        animated_image_ratio: 画像ウィンドウのうちアニメーション GIF の割合。
+        task_ratio: テキストウィンドウのうちタスクリストの割合。
+        vertical_ratio: ノート（タスク以外のテキスト）のうち縦書きの割合。
+        outline_ratio: テキストウィンドウのうち縁取りありの割合（うち一部は 2 重・3 重）。
+        blur_ratio: テキストウィンドウのうち影・縁取りのぼかしありの割合。
+        gradient_ratio: テキストウィンドウのうちグラデーションありの割合。
+        child_ratio: 全ウィンドウのうち、他のウィンドウの子（レイヤー）になる割合。
+        max_layer_depth: レイヤー木の最大の深さ（ルートが 0）。
+        connector_ratio: ウィンドウ数に対するコネクタ数の割合。
+        label_ratio: コネクタのうちラベル付きの割合。
+        hidden_ratio: 全ウィンドウのうち非表示の割合。
+        due_ratio: タスクウィンドウのうち期限付きの割合。
+        text_lines: ノートの行数の範囲。
+        task_lines: タスクの行数の範囲。
+        static_fixture_count: 静止画フィクスチャの種類数（ウィンドウ間で使い回す）。
+        animated_fixture_count: GIF フィクスチャの種類数。
+        image_edges: 画像フィクスチャの一辺の候補（px）。
+        gif_frames: GIF のフレーム数の範囲。
+    """
+
+    window_count: int = 100
+    image_ratio: float = 0.2
+    animated_image_ratio: float = 0.3
+    task_ratio: float = 0.3
+    vertical_ratio: float = 0.15
+    outline_ratio: float = 0.4
+    blur_ratio: float = 0.2
+    gradient_ratio: float = 0.2
+    child_ratio: float = 0.3
+    max_layer_depth: int = 3
+    connector_ratio: float = 0.1
+    label_ratio: float = 0.3
+    hidden_ratio: float = 0.1
+    due_ratio: float = 0.5
+    text_lines: tuple[int, int] = (1, 6)
+    task_lines: tuple[int, int] = (2, 8)
+    static_fixture_count: int = 4
+    animated_fixture_count: int = 2
+    image_edges: tuple[int, ...] = (64, 160, 320)
+    gif_frames: tuple[int, int] = (4, 10)
+
+    def __post_init__(self) -> None:
+        for f in fields(self):
+            if f.name.endswith("_ratio"):
+                value = getattr(self, f.name)
+                if not 0.0 <= float(value) <= 1.0:
+                    raise ValueError(f"{f.name} must be within 0..1: {value}")
+        if self.window_count < 0:
+            raise ValueError(f"window_count must not be negative: {self.window_count}")
+        if self.max_layer_depth < 1:
+            raise ValueError(f"max_layer_depth must be at least 1: {self.max_layer_depth}")
+        for name in ("text_lines", "task_lines", "gif_frames"):
+            low, high = getattr(self, name)
+            if not 1 <= low <= high:
+                raise ValueError(f"{name} must be a range 1 <= low <= high: {(low, high)}")
+        if self.static_fixture_count < 1 or self.animated_fixture_count < 1 or not self.image_edges:
+            raise ValueError("fixture counts and image_edges must not be empty")
+
+
+PROFILES: dict[str, WorkloadProfile] = {
+    # 実運用に近い混在（既定）
+    "production": WorkloadProfile(),
+    # 装飾・画像・階層なしのテキストだけ（従来のストレステスト相当）
+    "plain": WorkloadProfile(
+        image_ratio=0.0,
+        task_ratio=0.0,
+        vertical_ratio=0.0,
+        outline_ratio=0.0,
+        blur_ratio=0.0,
+        gradient_ratio=0.0,
+        child_ratio=0.0,
+        connector_ratio=0.0,
+        hidden_ratio=0.0,
+    ),
+    # 描画負荷の高い装飾とアニメーションを多めにする
+    "heavy_style": WorkloadProfile(
+        image_ratio=0.3,
+        animated_image_ratio=0.6,
+        vertical_ratio=0.3,
+        outline_ratio=0.9,
+        blur_ratio=0.6,
+        gradient_ratio=0.6,
+        child_ratio=0.4,
+        connector_ratio=0.2,
+    ),
+}
+
+
+@dataclass
+class SyntheticWorkload:
+    """生成結果。scene はそのまま FileManager.load_scene_from_data() へ渡せる。"""
+
+    seed: int
+    profile: WorkloadProfile
+    scene: dict[str, Any]
+    image_paths: list[str] = field(default_factory=list)
+
+    def summary(self) -> dict[str, int]:
+        return summarize_scene(self.scene)
+
+    def write_scene(self, path: Path) -> None:
+        """シーンを保存する（拡張子 .ftivs ならコンパクト形式、それ以外は JSON）。"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix.lower() == SCENE_STREAM_EXTENSION:
+            write_scene_stream(str(path), self.scene)
+        else:
+            write_json_atomic(str(path), self.scene, indent=4)
+
+
+def _quota(rng: random.Random, population: list[int], ratio: float) -> set[int]:
+    """population から round(ratio * 件数) 件を選ぶ。"""
+    count = min(len(population), round(len(population) * ratio))
+    return set(rng.sample(population, count)) if count else set()
+
+
+def _color(rng: random.Random) -> str:
+    return f"#{rng.randrange(0x1000000):06x}"
+
+
+def _timestamp(rng: random.Random, *, days: int) -> str:
+    return (_BASE_TIME + timedelta(minutes=rng.randrange(days * 24 * 60))).isoformat(timespec="seconds")
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(2, 7)))
+
+
+def _draw_frame(rng: random.Random, size: tuple[int, int], background: tuple[int, ...], step: int) -> Image.Image:
+    image = Image.new("RGBA", size, background)
+    draw = ImageDraw.Draw(image)
+    width, height = size
+    for _ in range(3):
+        x0 = (rng.randrange(width) + step * 7) % width
+        y0 = rng.randrange(height)
+        x1 = min(width - 1, x0 + rng.randint(4, max(5, width // 2)))
+        y1 = min(height - 1, y0 + rng.randint(4, max(5, height // 2)))
+        draw.rectangle((x0, y0, x1, y1), fill=(rng.randrange(256), rng.randrange(256), rng.randrange(256), 255))
+    return image
+
+
+def write_image_fixtures(
+    rng: random.Random, profile: WorkloadProfile, fixture_dir: Path, *, animated: bool
+) -> list[str]:
+    """静止画（PNG）またはアニメーション GIF のフィクスチャを書き出す。"""
+    fixture_dir.mkdir(parents=True, exist_ok=True)
+    paths: list[str] = []
+    count = profile.animated_fixture_count if animated else profile.static_fixture_count
+    for i in range(count):
+        edge = rng.choice(profile.image_edges)
+        size = (edge, max(16, edge * rng.choice((2, 3, 4)) // 4))
+        background = (rng.randrange(256), rng.randrange(256), rng.randrange(256), rng.choice((255, 200, 128)))
+        if not animated:
+            path = fixture_dir / f"static_{i:02d}.png"
+            _draw_frame(rng, size, background, 0).save(path, format="PNG")
+        else:
+            path = fixture_dir / f"anim_{i:02d}.gif"
+            frames = [
+                _draw_frame(rng, size, background, step).convert("P")
+                for step in range(rng.randint(*profile.gif_frames))
+            ]
+            frames[0].save(path, format="GIF", save_all=True, append_images=frames[1:], duration=80, loop=0)
+        paths.append(str(path))
+    return paths
+
+
+def _text_window(rng: random.Random, profile: WorkloadProfile, index: int, traits: set[str]) -> dict[str, Any]:
+    is_task = "task" in traits
+    low, high = profile.task_lines if is_task else profile.text_lines
+    lines = [_sentence(rng) for _ in range(rng.randint(low, high))]
+    spec: dict[str, Any] = {
+        "type": "text",
+        "title": f"{'Task' if is_task else 'Note'} {index}: {rng.choice(_WORDS)}",
+        "tags": sorted(set(rng.sample(_TAGS, rng.randint(0, 3)))),
+        "is_starred": rng.random() < 0.1,
+        "is_archived": rng.random() < 0.05,
+        "text": "\n".join(lines),
+        "content_mode": "task" if is_task else "note",
+        "font": rng.choice(_FONTS),
+        "font_size": rng.randint(14, 72),
+        "font_color": _color(rng),
+        "background_color": _color(rng),
+        "background_opacity": rng.choice((0, 40, 80, 100)),
+        "background_corner_ratio": round(rng.uniform(0.0, 0.4), 2),
+        # 既定値（ユーザーのアーキタイプ）に左右されないよう、分布で決める項目は常に明示する
+        "is_vertical": False,
+        "note_vertical_preference": False,
+        "outline_enabled": False,
+        "second_outline_enabled": False,
+        "third_outline_enabled": False,
+        "background_outline_enabled": False,
+        "shadow_enabled": False,
+        "text_gradient_enabled": False,
+        "background_gradient_enabled": False,
+    }
+    if is_task:
+        spec["task_states"] = [rng.random() < 0.4 for _ in lines]
+        if "due" in traits:
+            due = _BASE_TIME.date() + timedelta(days=rng.randint(-10, 30))
+            spec["due_at"] = f"{due.isoformat()}T00:00:00"
+    if "vertical" in traits:
+        spec.update(is_vertical=True, note_vertical_preference=True)
+    if "outline" in traits:
+        layers = rng.choices((1, 2, 3), weights=(6, 3, 1))[0]
+        spec.update(outline_enabled=True, outline_color=_color(rng), outline_width=round(rng.uniform(2.0, 10.0), 1))
+        if layers >= 2:
+            spec.update(second_outline_enabled=True, second_outline_color=_color(rng))
+        if layers >= 3:
+            spec.update(third_outline_enabled=True, third_outline_color=_color(rng))
+    if "blur" in traits:
+        spec.update(shadow_enabled=True, shadow_color=_color(rng), shadow_blur=rng.randint(4, 20))
+        if "outline" in traits:
+            spec["outline_blur"] = rng.randint(2, 12)
+    if "gradient" in traits:
+        spec.update(
+            text_gradient_enabled=True,
+            text_gradient=[(0.0, _color(rng)), (1.0, _color(rng))],
+            text_gradient_angle=rng.randrange(0, 360, 15),
+        )
+        if rng.random() < 0.5:
+            spec.update(
+                background_gradient_enabled=True,
+                background_gradient=[(0.0, _color(rng)), (0.5, _color(rng)), (1.0, _color(rng))],
+                background_gradient_angle=rng.randrange(0, 360, 15),
+            )
+    return spec
+
+
+def _image_window(rng: random.Random, image_path: str) -> dict[str, Any]:
+    spec: dict[str, Any] = {
+        "type": "image",
+        "image_path": image_path,
+        "scale_factor": round(rng.uniform(0.25, 1.5), 2),
+        "opacity": round(rng.uniform(0.6, 1.0), 2),
+    }
+    if rng.random() < 0.2:
+        spec["rotation_angle"] = float(rng.randrange(0, 360, 15))
+    if rng.random() < 0.1:
+        spec["flip_horizontal"] = True
+    return spec
+
+
+def _assign_layers(rng: random.Random, profile: WorkloadProfile, windows: list[dict[str, Any]]) -> None:
+    """一部のウィンドウを、先に現れたウィンドウの子にしてレイヤー木を作る。"""
+    depth = [0] * len(windows)
+    children = _quota(rng, list(range(1, len(windows))), profile.child_ratio)
+    sibling_counts: dict[int, int] = {}
+    for i in range(1, len(windows)):
+        if i not in children:
+            continue
+        candidates = [j for j in range(i) if depth[j] < profile.max_layer_depth]
+        parent = rng.choice(candidates)
+        depth[i] = depth[parent] + 1
+        windows[i]["parent_uuid"] = windows[parent]["uuid"]
+        windows[i]["layer_offset"] = {"x": rng.randint(10, 200), "y": rng.randint(10, 150)}
+        windows[i]["layer_order"] = sibling_counts.get(parent, 0)
+        sibling_counts[parent] = sibling_counts.get(parent, 0) + 1
+
+
+def _connections(rng: random.Random, profile: WorkloadProfile, windows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    count = min(round(len(windows) * profile.connector_ratio), len(windows) * (len(windows) - 1) // 2)
+    pairs: set[frozenset[int]] = set()
+    while len(pairs) < count:
+        a, b = rng.sample(range(len(windows)), 2)
+        pairs.add(frozenset((a, b)))
+    labeled = _quota(rng, list(range(count)), profile.label_ratio)
+    connections: list[dict[str, Any]] = []
+    for n, pair in enumerate(sorted(pairs, key=sorted)):
+        a, b = sorted(pair)
+        conn: dict[str, Any] = {
+            "from_uuid": windows[a]["uuid"],
+            "to_uuid": windows[b]["uuid"],
+            "color": f"#ff{rng.randrange(0x1000000):06x}",
+            "width": rng.randint(2, 8),
+            "arrow_style": rng.choice(list(ArrowStyle)).value,
+            "pen_style": rng.choice(_PEN_STYLES),
+        }
+        if n in labeled:
+            conn["label_data"] = {"text": _sentence(rng), "font_size": rng.randint(12, 24)}
+        connections.append(conn)
+    return connections
+
+
+def generate_workload(
+    profile: WorkloadProfile | None = None, *, seed: int = DEFAULT_SEED, fixture_dir: Path
+) -> SyntheticWorkload:
+    """profile と seed からシーンと画像フィクスチャを生成する。
+
+    Args:
+        profile: 構成。None の場合は PROFILES["production"]。
+        seed: 乱数シード。同じ profile・seed・fixture_dir なら同じ結果になる。
+        fixture_dir: 画像フィクスチャの出力先（シーンの image_path はこの下を指す）。
+
+    Returns:
+        SyntheticWorkload: 生成結果。
+    """
+    profile = profile or PROFILES[DEFAULT_PROFILE]
+    rng = random.Random(seed)
+    count = profile.window_count
+    indices = list(range(count))
+
+    image_indices = _quota(rng, indices, profile.image_ratio)
+    text_indices = [i for i in indices if i not in image_indices]
+    animated = _quota(rng, sorted(image_indices), profile.animated_image_ratio)
+    tasks = _quota(rng, text_indices, profile.task_ratio)
+    traits: dict[int, set[str]] = {i: set() for i in text_indices}
+    # タスクモードは常に横書きなので、縦書きはノートの中から選ぶ
+    for i in _quota(rng, [i for i in text_indices if i not in tasks], profile.vertical_ratio):
+        traits[i].add("vertical")
+    for trait, ratio in (
+        ("outline", profile.outline_ratio),
+        ("blur", profile.blur_ratio),
+        ("gradient", profile.gradient_ratio),
+    ):
+        for i in _quota(rng, text_indices, ratio):
+            traits[i].add(trait)
+    for i in tasks:
+        traits[i].add("task")
+    for i in _quota(rng, sorted(tasks), profile.due_ratio):
+        traits[i].add("due")
+    hidden = _quota(rng, indices, profile.hidden_ratio)
+
+    static_paths = write_image_fixtures(rng, profile, fixture_dir, animated=False) if image_indices - animated else []
+    animated_paths = write_image_fixtures(rng, profile, fixture_dir, animated=True) if animated else []
+
+    columns = max(1, int(count**0.5 * 1.6))
+    cell_w = _DESKTOP_SIZE[0] // columns
+    cell_h = max(1, _DESKTOP_SIZE[1] // max(1, (count + columns - 1) // columns))
+    windows: list[dict[str, Any]] = []
+    for i in indices:
+        if i in image_indices:
+            pool = animated_paths if i in animated else static_paths
+            spec = _image_window(rng, rng.choice(pool))
+        else:
+            spec = _text_window(rng, profile, i, traits[i])
+        created_at = _timestamp(rng, days=30)
+        spec.update(
+            uuid=str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            created_at=created_at,
+            updated_at=max(created_at, _timestamp(rng, days=60)),
+            position={
+                "x": (i % columns) * cell_w + rng.randrange(max(1, cell_w // 3)),
+                "y": (i // columns) * cell_h + rng.randrange(max(1, cell_h // 3)),
+            },
+            is_hidden=i in hidden,
+        )
+        windows.append(spec)
+
+    _assign_layers(rng, profile, windows)
+    scene = {"format_version": 1, "windows": windows, "connections": _connections(rng, profile, windows)}
+    return SyntheticWorkload(seed=seed, profile=profile, scene=scene, image_paths=[*static_paths, *animated_paths])
+
+
+def summarize_scene(scene: dict[str, Any]) -> dict[str, int]:
+    """シーンの構成を数える（分布の確認用）。"""
+    windows = [w for w in scene.get("windows", []) if isinstance(w, dict)]
+    by_uuid = {w.get("uuid"): w for w in windows}
+
+    def _depth(window: dict[str, Any]) -> int:
+        depth, seen = 0, set()
+        while window.get("parent_uuid") in by_uuid and window["parent_uuid"] not in seen:
+            seen.add(window["parent_uuid"])
+            window = by_uuid[window["parent_uuid"]]
+            depth += 1
+        return depth
+
+    texts = [w for w in windows if w.get("type", "text") == "text"]
+    images = [w for w in windows if w.get("type") == "image"]
+    connections = [c for c in scene.get("connections", []) if isinstance(c, dict)]
+    return {
+        "windows": len(windows),
+        "text_windows": len(texts),
+        "task_windows": sum(1 for w in texts if w.get("content_mode") == "task"),
+        "due_tasks": sum(1 for w in texts if w.get("due_at")),
+        "vertical_windows": sum(1 for w in texts if w.get("is_vertical")),
+        "outlined_windows": sum(1 for w in texts if w.get("outline_enabled")),
+        "blurred_windows": sum(1 for w in texts if w.get("shadow_enabled")),
+        "gradient_windows": sum(1 for w in texts if w.get("text_gradient_enabled")),
+        "image_windows": len(images),
+        "animated_image_windows": sum(1 for w in images if str(w.get("image_path", "")).lower().endswith(".gif")),
+        "hidden_windows": sum(1 for w in windows if w.get("is_hidden")),
+        "child_windows": sum(1 for w in windows if w.get("parent_uuid")),
+        "max_layer_depth": max((_depth(w) for w in windows), default=0),
+        "connections": len(connections),
+        "labeled_connections": sum(1 for c in connections if c.get("label_data")),
+    }
+
+
+def apply_overrides(profile: WorkloadProfile, overrides: list[str]) -> WorkloadProfile:
+    """`name=value` 形式の上書きを適用する（値は既定値と同じ型へ変換する）。"""
+    types = {f.name: type(getattr(profile, f.name)) for f in fields(profile)}
+    changes: dict[str, Any] = {}
+    for raw in overrides:
+        name, sep, value = raw.partition("=")
+        name = name.strip()
+        if not sep or name not in types:
+            raise ValueError(f"unknown profile override: {raw}")
+        if types[name] is tuple:
+            changes[name] = tuple(int(part) for part in value.split(",") if part.strip())
+        else:
+            changes[name] = types[name](value)
+    return replace(profile, **changes)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Generate a seeded synthetic scene and its image fixtures.")
+    parser.add_argument("--output-dir", type=Path, required=True, help="Directory for the scene and fixtures.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default=DEFAULT_PROFILE, help="Base distribution.")
+    parser.add_argument("--windows", type=int, default=None, help="Override window_count.")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help=f"Random seed (default: {DEFAULT_SEED}).")
+    parser.add_argument(
+        "--set",
+        dest="overrides",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="Override a profile field (e.g. --set image_ratio=0.5 --set text_lines=2,4).",
+    )
+    parser.add_argument(
+        "--scene-name", default="scene.json", help="Scene file name; use a .ftivs suffix for the compact format."
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    try:
+        profile = apply_overrides(PROFILES[args.profile], list(args.overrides))
+        if args.windows is not None:
+            profile = replace(profile, window_count=int(args.windows))
+    except ValueError as exc:
+        print(f"[WORKLOAD] invalid profile: {exc}")
+        return 2
+
+    output_dir = args.output_dir.resolve()
+    workload = generate_workload(profile, seed=int(args.seed), fixture_dir=output_dir / "fixtures")
+    scene_path = output_dir / args.scene_name
+    workload.write_scene(scene_path)
+    print(f"[WORKLOAD] profile={args.profile} seed={workload.seed} scene: {scene_path}")
+    print(f"[WORKLOAD] {json.dumps(workload.summary(), ensure_ascii=False)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
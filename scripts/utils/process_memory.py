@@ -0,0 +1,74 @@
+"""Peak RSS helpers shared by the perf harness and its child-process probes."""
+
+from __future__ import annotations
+
+import sys
+
+
+def maxrss_to_mb(maxrss: float) -> float:
+    """getrusage の ru_maxrss を MB へ換算する（macOS ではバイト、Linux 等では KB）。"""
+    divisor = 1024.0 * 1024.0 if sys.platform == "darwin" else 1024.0
+    return round(float(maxrss) / divisor, 2)
+
+
+def reset_peak_rss() -> bool:
+    """プロセスのピーク RSS を現在値へ戻す（Linux の /proc/self/clear_refs のみ対応）。
+
+    Returns:
+        bool: 戻せた場合 True。False の場合、peak_rss_mb() はプロセス開始以来の最大値になる。
+    """
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _windows_peak_rss_mb() -> float:
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class _ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = _ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        psapi = ctypes.windll.psapi  # type: ignore[attr-defined]
+        if not psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+            return 0.0
+        return round(counters.PeakWorkingSetSize / (1024.0 * 1024.0), 2)
+    except Exception:
+        return 0.0
+
+
+def peak_rss_mb() -> float:
+    """このプロセスのピーク RSS（MB）。取得できない環境では 0.0。
+
+    Linux では /proc/self/status の VmHWM を使う（exec 前の fork 元の値を含まない）。
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024.0, 2)
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return _windows_peak_rss_mb()
+    return maxrss_to_mb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
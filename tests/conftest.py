@@ -28,6 +28,20 @@ def qapp():
     # but scope="session" keeps it alive until the end.
 
 
+@pytest.fixture(autouse=True)
+def isolated_base_dir(request, tmp_path, monkeypatch):
+    """MainWindow を使うテストでは、設定・シーンDB等の書き込み先を一時ディレクトリにする。
+
+    リポジトリの json/ にテスト実行時の設定（MagicMock の値など）が書き込まれないようにする。
+    MainWindow._init_paths は utils.paths.get_base_dir を呼び出し時に import するため、そこを差し替える。
+    SettingsManager は _init_paths より先に作られ、カレントディレクトリを基準にするため移動もする。
+    """
+    if getattr(request.module, "MainWindow", None) is None:
+        return
+    monkeypatch.setattr("utils.paths.get_base_dir", lambda: str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+
+
 @pytest.fixture(autouse=True)
 def auto_close_widgets(qapp):
     """Automatically close and delete all top-level widgets after each test."""
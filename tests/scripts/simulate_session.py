@@ -202,8 +202,9 @@ def run_session(config_path: str, mode: str):
             category = "Default"
             scene_name = "AutoSave"
 
-            if category in mw.scenes and scene_name in mw.scenes[category]:
-                scene_data = mw.scenes[category][scene_name]
+            # Scene bodies are loaded lazily from their shard
+            scene_data = mw.file_manager.get_scene(category, scene_name)
+            if scene_data:
                 mw.file_manager.load_scene_from_data(scene_data)
                 print("DEBUG: Forced Load Complete")
 
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from managers.autosave_journal import AutosaveJournal
+from managers.property_change_bus import PropertyChangeBus
+from models.window_config import TextWindowConfig
+from utils.commands import PropertyChangeCommand
+
+
+class _DummyWindow:
+    def __init__(self, uuid: str, text: str, main_window: Any = None) -> None:
+        self.config = TextWindowConfig(uuid=uuid, text=text)
+        self.main_window = main_window
+        self.update_calls = 0
+
+    @property
+    def text(self) -> str:
+        return self.config.text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self.config.text = value
+
+    @property
+    def font_size(self) -> int:
+        return self.config.font_size
+
+    @font_size.setter
+    def font_size(self, value: int) -> None:
+        self.config.font_size = value
+
+    def update_text(self) -> None:
+        self.update_calls += 1
+
+
+class _Scene:
+    def __init__(self, windows: list[_DummyWindow]) -> None:
+        self.windows = windows
+
+    def get_scene_data(self) -> dict[str, Any]:
+        return {
+            "format_version": 1,
+            "windows": [{**w.config.model_dump(mode="json", exclude_none=True), "type": "text"} for w in self.windows],
+            "connections": [],
+        }
+
+
+@pytest.fixture
+def journal_env(qapp, tmp_path: Path):
+    owner = SimpleNamespace()
+    windows = [_DummyWindow("w1", "alpha", owner), _DummyWindow("w2", "beta", owner)]
+    scene = _Scene(windows)
+    journal = AutosaveJournal(str(tmp_path / "autosave"), scene.get_scene_data, compact_every=1000)
+    journal.start()
+    # MainWindow.on_property_command_applied の代わりにジャーナルへ直接記録する
+    owner.on_property_command_applied = journal.record_property
+    yield journal, windows
+    journal.close()
+
+
+def _leave_stale_lock(lock_path: str) -> None:
+    """ロックを取得したまま終了した（クラッシュした）プロセスのロックファイルを残す。"""
+    code = f"import os\nfrom PySide6.QtCore import QLockFile\nlock = QLockFile({lock_path!r})\nlock.tryLock(0)\nos._exit(0)"
+    subprocess.run([sys.executable, "-c", code], check=True, timeout=60)
+    assert os.path.exists(lock_path)
+
+
+def _simulate_crash(journal: AutosaveJournal) -> AutosaveJournal:
+    """ファイルを残したまま記録を止め、次回起動相当のインスタンスを返す。"""
+    assert journal.flush()
+    # 同じプロセス内なので、ロックだけ「終了済みプロセスのもの」に差し替える
+    journal._session_lock.unlock()
+    _leave_stale_lock(journal.lock_path)
+    restarted = AutosaveJournal(journal.base_dir, lambda: {})
+    assert restarted.claim_session()
+    assert restarted.root_dir == journal.root_dir
+    return restarted
+
+
+def test_replays_undoable_changes_after_crash(journal_env) -> None:
+    journal, (w1, w2) = journal_env
+    PropertyChangeCommand(w1, "text", "alpha", "alpha v2").redo()
+    PropertyChangeCommand(w2, "font_size", w2.font_size, 64).redo()
+    undo = PropertyChangeCommand(w1, "text", "alpha v2", "alpha v3")
+    undo.redo()
+    undo.undo()
+
+    restarted = _simulate_crash(journal)
+    assert restarted.had_unclean_shutdown()
+    scene = restarted.recover()
+
+    by_uuid = {w["uuid"]: w for w in scene["windows"]}
+    assert by_uuid["w1"]["text"] == "alpha v2"
+    assert by_uuid["w2"]["font_size"] == 64
+
+
+def test_property_commands_notify_only_the_owning_main_window(qapp) -> None:
+    _ = qapp
+    recorded: list[tuple[str, str]] = []
+    owner = SimpleNamespace(on_property_command_applied=lambda t, name: recorded.append((t.config.uuid, name)))
+    window = _DummyWindow("w1", "alpha", owner)
+
+    command = PropertyChangeCommand(window, "text", "alpha", "beta")
+    command.redo()
+    command.undo()
+    # 所有者の無い対象（Undo スタックを持たない）は誰にも通知しない
+    PropertyChangeCommand(_DummyWindow("w2", "x"), "text", "x", "y").redo()
+
+    assert recorded == [("w1", "text"), ("w1", "text")]
+
+
+def test_compaction_folds_entries_into_snapshot(journal_env) -> None:
+    journal, (w1, _w2) = journal_env
+    journal.compact_every = 3
+    for i in range(7):
+        PropertyChangeCommand(w1, "text", w1.text, f"v{i}").redo()
+    assert journal.flush()
+
+    journal_lines = Path(journal.journal_path).read_text(encoding="utf-8").splitlines()
+    snapshot = json.loads(Path(journal.snapshot_path).read_text(encoding="utf-8"))
+    assert len(journal_lines) == 1
+    assert snapshot["seq"] == 6
+    assert _simulate_crash(journal).recover()["windows"][0]["text"] == "v6"
+
+
+def test_truncated_tail_and_non_config_properties_are_ignored(journal_env) -> None:
+    journal, (w1, _w2) = journal_env
+    PropertyChangeCommand(w1, "text", w1.text, "kept").redo()
+    journal.record_property(w1, "not_a_field")
+    journal.record_property(object(), "text")
+    assert journal.flush()
+    with open(journal.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"seq": 99, "uuid": "w1", "field": "te')
+
+    scene = _simulate_crash(journal).recover()
+    assert scene["windows"][0]["text"] == "kept"
+    assert len(Path(journal.journal_path).read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_fsync_is_bounded_and_clean_close_removes_files(qapp, tmp_path: Path) -> None:
+    window = _DummyWindow("w1", "a")
+    journal = AutosaveJournal(
+        str(tmp_path / "autosave"), _Scene([window]).get_scene_data, fsync_interval_sec=60.0, compact_every=1000
+    )
+    journal.start()
+    for i in range(100):
+        window.text = f"t{i}"
+        journal.record_property(window, "text")
+    assert journal.flush()
+    assert journal._writer.fsync_count <= 2
+
+    journal.close()
+    assert not journal.had_unclean_shutdown()
+    assert list((tmp_path / "autosave").iterdir()) == []
+
+
+def test_second_instance_uses_its_own_directory(qapp, tmp_path: Path) -> None:
+    root = tmp_path / "autosave"
+    first = AutosaveJournal(str(root), _Scene([_DummyWindow("w1", "first")]).get_scene_data)
+    first.start()
+    assert first.flush()
+
+    # 生存中のインスタンスのロック・スナップショットは復旧対象にしない
+    second = AutosaveJournal(str(root), _Scene([_DummyWindow("w2", "second")]).get_scene_data)
+    assert second.claim_session()
+    assert not second.had_unclean_shutdown()
+    assert second.root_dir != first.root_dir
+
+    second.start()
+    assert second.flush()
+    assert json.loads(Path(first.snapshot_path).read_text(encoding="utf-8"))["scene"]["windows"][0]["uuid"] == "w1"
+
+    # 片方の正常終了で、もう片方の記録は消えない
+    second.close()
+    assert Path(first.snapshot_path).exists() and Path(first.lock_path).exists()
+    assert not Path(second.root_dir).exists()
+    first.close()
+    assert list(root.iterdir()) == []
+
+
+def test_legacy_pid_lock_of_dead_process_is_recovered(qapp, tmp_path: Path) -> None:
+    root = tmp_path / "autosave"
+    root.mkdir()
+    proc = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+    (root / AutosaveJournal.LOCK_FILENAME).write_text(proc.stdout.strip(), encoding="utf-8")
+    (root / AutosaveJournal.SNAPSHOT_FILENAME).write_text(
+        json.dumps({"seq": 0, "scene": {"windows": [{"uuid": "w1", "type": "text"}]}}), encoding="utf-8"
+    )
+
+    journal = AutosaveJournal(str(root), lambda: {})
+    assert journal.claim_session()
+    assert journal.root_dir == str(root)
+    assert journal.had_unclean_shutdown()
+
+
+def test_bus_events_record_latest_values_once_per_tick(qapp, tmp_path: Path) -> None:
+    window = _DummyWindow("w1", "a")
+    scene = _Scene([window])
+    journal = AutosaveJournal(str(tmp_path / "autosave"), scene.get_scene_data, compact_every=1000)
+    journal.start()
+    bus = PropertyChangeBus(synchronous=False)
+    bus.subscribe(journal.record_changes)
+    try:
+        for i in range(5):
+            PropertyChangeCommand(window, "text", window.text, f"t{i}").redo()
+            bus.publish(window, ("text",))
+        bus.flush()
+        assert journal.flush()
+        entries = [json.loads(line) for line in Path(journal.journal_path).read_text(encoding="utf-8").splitlines()]
+        assert [(e["field"], e["value"]) for e in entries] == [("text", "t4")]
+
+        window.config = window.config.with_updates({"font_size": 10})
+        bus.publish(window)
+        bus.publish(window)
+        bus.flush()
+        assert journal._structure_timer.isActive()
+    finally:
+        journal.close()
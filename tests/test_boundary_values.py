@@ -5,6 +5,9 @@ This module focuses on testing values at the boundaries of valid input ranges.
 Industry standard: test at min, max, min-1, max+1, and typical values.
 """
 
+import pytest
+from pydantic import ValidationError
+
 from models.enums import AnchorPosition, ArrowStyle
 from models.window_config import ImageWindowConfig, TextWindowConfig, WindowConfigBase
 
@@ -163,3 +166,49 @@ class TestEnumBoundary:
         assert len(styles) > 0
         assert ArrowStyle.NONE in styles
         assert ArrowStyle.END in styles
+
+
+class TestConfigWithUpdates:
+    """Test bulk hydration via WindowConfigBase.with_updates."""
+
+    def test_applies_known_fields_and_ignores_unknown(self) -> None:
+        """Known keys are applied, unknown keys (e.g. type/uuid extras) are ignored."""
+        base = TextWindowConfig()
+        config = base.with_updates({"text": "hello", "font_size": 42, "type": "text", "unknown": 1})
+        assert config is not base
+        assert config.text == "hello"
+        assert config.font_size == 42
+        assert base.text != "hello"
+
+    def test_returns_self_when_nothing_to_apply(self) -> None:
+        """No known keys means no re-validation and the same instance."""
+        base = ImageWindowConfig()
+        assert base.with_updates({"unknown": 1}) is base
+
+    def test_invalid_value_raises_validation_error(self) -> None:
+        """Invalid values surface as ValidationError so callers can fall back."""
+        with pytest.raises(ValidationError):
+            TextWindowConfig().with_updates({"font_size": "not-a-number"})
+
+    def test_enum_values_are_normalized(self) -> None:
+        """use_enum_values is honored on the bulk path as well."""
+        config = WindowConfigBase().with_updates({"anchor_position": AnchorPosition.TOP})
+        assert config.anchor_position == AnchorPosition.TOP.value
+
+
+class TestConfigDumpRevision:
+    def test_revision_advances_only_on_real_changes(self):
+        from models.window_config import TextWindowConfig
+
+        config = TextWindowConfig(text="a")
+        start = config.dump_revision
+        config.text = "a"
+        assert config.dump_revision == start
+        config.text = "b"
+        assert config.dump_revision == start + 1
+        # list/dict は中身を書き換えてからの再代入があり得るため常に進める
+        config.tags = list(config.tags)
+        assert config.dump_revision == start + 2
+        config.mark_dirty()
+        assert config.dump_revision == start + 3
+        assert "_dump_revision" not in config.model_dump()
@@ -78,3 +78,27 @@ def test_replace_failure_preserves_original(file_manager):
         # So even if replace fails, it cleans up the temp file!
         # Let's verify that cleanup happens.
         assert not os.path.exists(target_path + ".tmp")
+
+
+def test_background_write_failure_preserves_original():
+    """
+    Chaos Test: A failed write-behind save must keep the original file and report the error.
+    """
+    from utils.write_behind import JsonWriteBehind
+
+    writer = JsonWriteBehind(coalesce_sec=0.0, synchronous=False)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        target_path = os.path.join(tmpdir, "target.json")
+        original_data = {"key": "original"}
+        with open(target_path, "w", encoding="utf-8") as f:
+            json.dump(original_data, f)
+
+        with patch("os.replace", side_effect=OSError("Simulated Disk Error")):
+            writer.submit(target_path, {"key": "NEW_DATA"})
+            assert writer.wait_idle(timeout=5.0)
+        writer.close()
+
+        with open(target_path, "r", encoding="utf-8") as f:
+            assert json.load(f) == original_data
+        assert not os.path.exists(target_path + ".tmp")
+        assert isinstance(writer.last_error, OSError)
@@ -88,3 +88,24 @@ def test_load_default_scenarios_does_not_use_legacy_contract(tmp_path: Path) ->
     legacy_contract.write_text('{"ci_default_scenarios": ["P9E-S99"]}', encoding="utf-8")
     scenarios = ci_perf_lane._load_default_scenarios(tmp_path)
     assert scenarios == list(ci_perf_lane.DEFAULT_SCENARIOS)
+
+
+def test_run_lane_fails_when_import_time_gate_fails(monkeypatch, tmp_path: Path) -> None:
+    called = {}
+
+    def fake_importtime(args: list[str]) -> int:
+        called["args"] = args
+        return 1
+
+    monkeypatch.setattr(ci_perf_lane.measure_phase9e, "main", lambda _args: 0)
+    monkeypatch.setattr(ci_perf_lane.measure_importtime, "main", fake_importtime)
+    result = ci_perf_lane.run_lane(
+        mode="monitor",
+        base_dir=tmp_path,
+        output_dir=tmp_path / "out",
+        scenarios=["P9E-S02"],
+        warmup=0,
+        samples=1,
+    )
+    assert result == 1
+    assert called["args"] == ["--base-dir", str(tmp_path), "--output-dir", str(tmp_path / "out")]
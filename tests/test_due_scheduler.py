@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from managers.due_scheduler import DueBoundaryHeap, DueScheduler, due_state_boundaries
+from managers.info_index_manager import IncrementalInfoIndex
+from utils.due_date import classify_due
+
+
+def _window(uuid: str, due_at: str = "", due_time: str = "", due_timezone: str = "", precision: str = "date"):
+    return SimpleNamespace(
+        uuid=uuid,
+        text=uuid,
+        due_at=due_at,
+        due_time=due_time,
+        due_timezone=due_timezone,
+        due_precision=precision,
+        _refresh_overlay_meta_tooltip=MagicMock(),
+    )
+
+
+def test_boundaries_match_classify_due_transitions():
+    cases = [
+        ("2030-05-01", "", "", "date"),
+        ("2030-05-01", "15:00", "", "datetime"),
+        ("2030-05-01", "23:30", "UTC", "datetime"),
+        ("2030-05-01", "", "", "datetime"),
+    ]
+    for due_at, due_time, tz, precision in cases:
+        boundaries = due_state_boundaries(due_at, due_time, tz, precision)
+        assert boundaries and list(boundaries) == sorted(boundaries)
+        for boundary in boundaries:
+            # 境界の直前と直後で状態が切り替わる
+            states = []
+            for now in (boundary - timedelta(seconds=1), boundary + timedelta(seconds=1)):
+                kwargs = {"due_time": due_time, "due_timezone": tz, "due_precision": precision, "now": now}
+                states.append(classify_due(due_at, now.date(), **kwargs))
+            assert states[0] != states[1], (due_at, due_time, tz, precision, boundary)
+
+    assert due_state_boundaries("") == ()
+    assert due_state_boundaries("not a date") == ()
+    assert due_state_boundaries("2030-05-01", "15:00", "No/Such_Zone", "datetime") == ()
+
+
+def test_heap_replaces_and_pops_keys_in_boundary_order():
+    heap = DueBoundaryHeap()
+    now = datetime(2030, 5, 1, 9, 0)
+    heap.schedule("a", [datetime(2030, 5, 1, 12, 0), datetime(2030, 5, 2)], now)
+    heap.schedule("b", [datetime(2030, 5, 1, 10, 0)], now)
+    heap.schedule("past", [datetime(2030, 4, 30)], now)
+    assert len(heap) == 2 and "past" not in heap
+    assert heap.peek() == datetime(2030, 5, 1, 10, 0)
+
+    # 差し替えた古い境界は読み捨てられる
+    heap.schedule("b", [datetime(2030, 5, 1, 11, 0)], now)
+    assert heap.pop_due(datetime(2030, 5, 1, 10, 30)) == []
+    assert heap.pop_due(datetime(2030, 5, 1, 12, 30)) == ["b", "a"]
+    assert "b" not in heap and "a" in heap
+    assert heap.peek() == datetime(2030, 5, 2)
+
+    heap.discard("a")
+    assert heap.peek() is None and len(heap) == 0
+
+
+def test_scheduler_reevaluates_only_windows_past_their_boundary(qapp):
+    _ = qapp
+    now = datetime(2030, 5, 1, 9, 0)
+    soon = _window("soon", "2030-05-01", "15:00", precision="datetime")
+    later = _window("later", "2030-05-03")
+    plain = _window("plain")
+    scheduler = DueScheduler()
+    reached = []
+    scheduler.sig_due_reached.connect(reached.append)
+
+    scheduler.track_many([soon, later, plain], now=now)
+    assert scheduler.tracked_count == 2
+    assert scheduler.next_boundary() == datetime(2030, 5, 1, 15, 0)
+    assert scheduler.is_armed()
+
+    assert scheduler.process_due(datetime(2030, 5, 1, 15, 1)) == [soon]
+    assert reached == [[soon]]
+    soon._refresh_overlay_meta_tooltip.assert_called_once_with()
+    later._refresh_overlay_meta_tooltip.assert_not_called()
+    assert scheduler.next_boundary() == datetime(2030, 5, 3)
+
+    # 期限が変わらない再登録は無視し、変わったら境界を差し替える
+    scheduler.track(later, now=now)
+    assert scheduler.next_boundary() == datetime(2030, 5, 3)
+    later.due_at = "2030-05-02"
+    scheduler.track(later, now=now)
+    assert scheduler.next_boundary() == datetime(2030, 5, 2)
+
+    scheduler.sync([soon], now=now)
+    assert scheduler.next_boundary() is None and not scheduler.is_armed()
+
+
+def test_index_refreshes_due_states_for_notified_windows_only():
+    early = _window("early", "2030-05-01", "10:00", precision="datetime")
+    late = _window("late", "2030-05-01", "11:00", precision="datetime")
+    index = IncrementalInfoIndex()
+    index.sync([early, late])
+    index.refresh_due_states(datetime(2030, 5, 1, 9, 0))
+
+    assert index.refresh_due_states(datetime(2030, 5, 1, 12, 0), windows=[early]) is True
+    states = {item.window_uuid: item.due_state for item in index.note_items}
+    assert states == {"early": "overdue", "late": "today"}
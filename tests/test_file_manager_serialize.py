@@ -160,3 +160,66 @@ class TestGetSceneData:
         assert len(result["windows"]) == 1
         assert result["windows"][0]["type"] == "text"
         assert result["windows"][0]["text"] == "Test"
+
+
+class TestSceneDumpCache:
+    def _text_window(self, uuid: str, text: str) -> MagicMock:
+        tw = MagicMock()
+        tw.config = TextWindowConfig(uuid=uuid, text=text)
+        tw.x.return_value = 10
+        tw.y.return_value = 20
+        return tw
+
+    def test_only_changed_windows_are_reserialized(self, fm):
+        windows = [self._text_window(f"w{i}", f"note {i}") for i in range(50)]
+        fm.window_manager.text_windows = windows
+        fm.window_manager.image_windows = []
+        fm.window_manager.connectors = []
+
+        fm.get_scene_data()
+        assert fm.dump_cache_stats() == {"hits": 0, "misses": 50, "entries": 50}
+
+        windows[7].config.text = "edited"
+        result = fm.get_scene_data()
+
+        assert fm.dump_cache_stats() == {"hits": 49, "misses": 51, "entries": 50}
+        assert result["windows"][7]["text"] == "edited"
+
+    def test_position_change_and_config_replacement_invalidate(self, fm):
+        tw = self._text_window("w1", "a")
+        fm.window_manager.text_windows = [tw]
+        fm.window_manager.image_windows = []
+        fm.window_manager.connectors = []
+        fm.get_scene_data()
+
+        tw.x.return_value = 99
+        assert fm.get_scene_data()["windows"][0]["position"] == {"x": 99, "y": 20}
+        tw.config = tw.config.with_updates({"text": "b"})
+        assert fm.get_scene_data()["windows"][0]["text"] == "b"
+        assert fm.dump_cache_misses == 3
+
+    def test_returned_dicts_do_not_alias_the_cache(self, fm):
+        tw = self._text_window("w1", "a")
+        tw.config.tags = ["x"]
+        fm.window_manager.text_windows = [tw]
+        fm.window_manager.image_windows = []
+        fm.window_manager.connectors = []
+
+        first = fm.get_scene_data()
+        first["windows"][0]["tags"].append("mutated")
+        first["windows"][0]["text"] = "mutated"
+
+        second = fm.get_scene_data()
+        assert second["windows"][0]["tags"] == ["x"]
+        assert second["windows"][0]["text"] == "a"
+
+    def test_closed_windows_are_evicted(self, fm):
+        windows = [self._text_window("w1", "a"), self._text_window("w2", "b")]
+        fm.window_manager.text_windows = windows
+        fm.window_manager.image_windows = []
+        fm.window_manager.connectors = []
+        fm.get_scene_data()
+
+        fm.window_manager.text_windows = windows[:1]
+        fm.get_scene_data()
+        assert fm.dump_cache_stats()["entries"] == 1
@@ -1,5 +1,6 @@
+import os
 from types import SimpleNamespace
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from ui.controllers.info_actions import InfoActions
 
@@ -105,9 +106,9 @@ def test_bulk_archive_updates_multiple_windows_dedupes_and_logs():
     assert refreshed["count"] == 1
     assert mw.undo_stack.beginMacro.call_count == 1
     assert mw.undo_stack.endMacro.call_count == 1
-    assert len(mw.app_settings.info_operation_logs) == 1
-    assert mw.app_settings.info_operation_logs[0]["action"] == "bulk_archive"
-    assert mw.app_settings.info_operation_logs[0]["target_count"] == 2
+    assert len(actions.get_operation_logs()) == 1
+    assert actions.get_operation_logs()[0]["action"] == "bulk_archive"
+    assert actions.get_operation_logs()[0]["target_count"] == 2
 
 
 def test_bulk_archive_false_restores_and_logs():
@@ -119,7 +120,7 @@ def test_bulk_archive_false_restores_and_logs():
     actions.bulk_archive(["w1"], False)
 
     assert w1.is_archived is False
-    assert mw.app_settings.info_operation_logs[-1]["action"] == "bulk_restore"
+    assert actions.get_operation_logs()[-1]["action"] == "bulk_restore"
 
 
 def test_bulk_set_star_updates_and_logs():
@@ -133,8 +134,8 @@ def test_bulk_set_star_updates_and_logs():
     assert w1.is_starred is True
     assert w2.is_starred is True
     assert refreshed["count"] == 1
-    assert mw.app_settings.info_operation_logs[-1]["action"] == "bulk_star"
-    assert mw.app_settings.info_operation_logs[-1]["target_count"] == 2
+    assert actions.get_operation_logs()[-1]["action"] == "bulk_star"
+    assert actions.get_operation_logs()[-1]["target_count"] == 2
 
 
 def test_bulk_merge_tags_add_remove_and_remove_wins():
@@ -150,7 +151,7 @@ def test_bulk_merge_tags_add_remove_and_remove_wins():
     assert w1.tags == ["B", "D"]
     assert w2.tags == ["c", "b", "D"]
     assert refreshed["count"] == 1
-    assert mw.app_settings.info_operation_logs[-1]["action"] == "bulk_tags_merge"
+    assert actions.get_operation_logs()[-1]["action"] == "bulk_tags_merge"
 
 
 def test_bulk_merge_tags_empty_input_noop():
@@ -161,7 +162,7 @@ def test_bulk_merge_tags_empty_input_noop():
     actions.bulk_merge_tags(["w1"], add_tags=[], remove_tags=[])
 
     assert refreshed["count"] == 0
-    assert mw.app_settings.info_operation_logs == []
+    assert actions.get_operation_logs() == []
 
 
 def test_bulk_set_task_done_groups_by_window_and_logs():
@@ -175,8 +176,8 @@ def test_bulk_set_task_done_groups_by_window_and_logs():
     assert ("bulk_set_task_done", ([0, 2], True)) in w1.calls
     assert ("bulk_set_task_done", ([1], True)) in w2.calls
     assert refreshed["count"] == 1
-    assert mw.app_settings.info_operation_logs[-1]["action"] == "bulk_complete"
-    assert mw.app_settings.info_operation_logs[-1]["target_count"] == 3
+    assert actions.get_operation_logs()[-1]["action"] == "bulk_complete"
+    assert actions.get_operation_logs()[-1]["target_count"] == 3
 
 
 def test_get_and_clear_operation_logs():
@@ -195,7 +196,7 @@ def test_get_and_clear_operation_logs():
     assert refreshed["count"] == 1
 
 
-def test_operation_logs_trim_to_200():
+def test_operation_logs_keep_recent_200_in_memory_without_saving_settings():
     w1 = _DummyTextWindow("w1")
     mw, _ = _make_main_window(w1)
     actions = InfoActions(mw)
@@ -203,6 +204,51 @@ def test_operation_logs_trim_to_200():
     for i in range(205):
         actions._append_operation_log(f"bulk_{i}", 1, "x")
 
-    assert len(mw.app_settings.info_operation_logs) == 200
-    assert mw.app_settings.info_operation_logs[0]["action"] == "bulk_5"
-    assert mw.app_settings.info_operation_logs[-1]["action"] == "bulk_204"
+    logs = actions.get_operation_logs()
+    assert len(logs) == 200
+    assert logs[0]["action"] == "bulk_5"
+    assert logs[-1]["action"] == "bulk_204"
+    assert [e["action"] for e in actions.get_operation_log_page(0, 2)] == ["bulk_204", "bulk_203"]
+    assert mw.settings_manager.save_count == 0
+    assert mw.app_settings.info_operation_logs == []
+
+
+def test_operation_logs_move_out_of_app_settings(tmp_path):
+    mw, _ = _make_main_window()
+    mw.json_directory = str(tmp_path)
+    mw.app_settings.info_operation_logs = [
+        {"at": "2030-01-01T00:00:00", "action": "bulk_star", "target_count": 2, "detail": "star"}
+    ]
+    actions = InfoActions(mw)
+
+    with patch.dict(os.environ, {"FTIV_TEST_MODE": "0"}):
+        actions._append_operation_log("bulk_archive", 1, "archive")
+
+    assert [e["action"] for e in actions.get_operation_logs()] == ["bulk_star", "bulk_archive"]
+    assert mw.app_settings.info_operation_logs == []
+    assert mw.settings_manager.save_count == 1
+    assert len((tmp_path / "operation_logs.jsonl").read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_focus_window_opens_owning_saved_scene():
+    mw, _ = _make_main_window()
+    opened = _DummyTextWindow("saved-1")
+
+    def _switch(_data) -> None:
+        mw.window_manager.text_windows.append(opened)
+
+    mw.window_manager.set_selected_window = MagicMock()
+    mw.file_manager = SimpleNamespace(
+        locate_saved_window=lambda uuid: ("cat", "scene") if uuid == "saved-1" else None,
+        get_scene=lambda category, name: {"windows": []},
+        switch_scene_from_data=MagicMock(side_effect=_switch),
+        finish_scene_loading=MagicMock(),
+    )
+    actions = InfoActions(mw)
+
+    actions.focus_window("missing")
+    mw.file_manager.switch_scene_from_data.assert_not_called()
+
+    actions.focus_window("saved-1")
+    mw.file_manager.finish_scene_loading.assert_called_once()
+    mw.window_manager.set_selected_window.assert_called_once_with(opened)
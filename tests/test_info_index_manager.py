@@ -1,6 +1,7 @@
 from types import SimpleNamespace
 
-from managers.info_index_manager import InfoIndexManager, InfoQuery
+from managers.info_index_manager import IncrementalInfoIndex, InfoIndexManager, InfoQuery
+from models.window_config import TextWindowConfig
 
 
 def _make_task_ref(line_index: int, text: str, done: bool):
@@ -514,3 +515,167 @@ class TestInfoIndexManager:
         assert len(groups) == 1
         assert groups[0].group_key == "window:w1"
         assert len(groups[0].items) == 2  # 1 task + 1 note (from same window)
+
+
+class TestIncrementalInfoIndex:
+    @staticmethod
+    def _windows():
+        return [
+            _make_window(uuid="n1", text="first", updated_at="2026-02-10T10:00:00"),
+            _make_window(
+                uuid="t1",
+                text="a\nb",
+                content_mode="task",
+                updated_at="2026-02-11T10:00:00",
+                task_refs=[_make_task_ref(0, "a", False), _make_task_ref(1, "b", True)],
+            ),
+            _make_window(uuid="n2", text="second", updated_at="2026-02-12T10:00:00"),
+        ]
+
+    def test_matches_full_build(self):
+        windows = self._windows()
+        index = IncrementalInfoIndex()
+        assert index.sync(windows) is True
+
+        assert (index.task_items, index.note_items) == tuple(InfoIndexManager().build_index(windows))
+        assert index.sync(windows) is False
+        assert index.rebuilt_window_count == 3
+
+    def test_changed_window_is_moved_without_rebuilding_others(self):
+        windows = self._windows()
+        index = IncrementalInfoIndex()
+        index.sync(windows)
+
+        windows[0].updated_at = "2026-02-13T10:00:00"
+        windows[0].text = "first edited"
+        assert index.update_windows([windows[0]]) is True
+
+        assert index.rebuilt_window_count == 4
+        assert [item.window_uuid for item in index.note_items] == ["n1", "n2", "t1"]
+        assert index.note_items[0].first_line == "first edited"
+        assert index.note_items == InfoIndexManager().build_index(windows)[1]
+
+    def test_sync_removes_missing_windows_and_tracks_config_revision(self):
+        config = TextWindowConfig(uuid="cfg", text="from config")
+        window = _make_window(uuid="cfg", text="from config", updated_at="2026-02-09T10:00:00")
+        window.config = config
+        windows = [*self._windows(), window]
+        index = IncrementalInfoIndex()
+        index.sync(windows)
+
+        assert index.sync(windows[1:]) is True
+        assert "n1" not in [item.window_uuid for item in index.note_items]
+        assert index.task_items[0].window_uuid == "t1"
+
+        revision = index.revision
+        window.text = "ignored until the config changes"
+        assert index.update_windows([window]) is False
+        config.text = "edited"
+        window.text = "edited"
+        assert index.update_windows([window]) is True
+        assert index.revision > revision
+        config.font_size = config.font_size + 1
+        assert index.update_windows([window]) is False
+
+    def test_search_tracks_incremental_updates(self):
+        windows = self._windows()
+        index = IncrementalInfoIndex()
+        index.sync(windows)
+
+        tasks, notes = index.search("firs")
+        assert (tasks, [n.window_uuid for n in notes]) == ([], ["n1"])
+
+        windows[0].text = "会議の資料"
+        index.update_windows([windows[0]])
+        assert index.search("first") == ([], [])
+        tasks, notes = index.search("会議")
+        assert [n.window_uuid for n in notes] == ["n1"]
+        assert index.search("#") is None
+
+        index.sync(windows[1:])
+        assert index.search("会議") == ([], [])
+
+    def test_tag_facet_tracks_incremental_updates(self):
+        windows = self._windows()
+        windows[0].tags = ["Work", "home"]
+        windows[1].tags = ["work"]
+        index = IncrementalInfoIndex()
+        index.sync(windows)
+        manager = InfoIndexManager()
+
+        query = InfoQuery(tag="WOR", open_tasks_only=True)
+        tasks, notes, rest = index.narrow(query)
+        assert rest.tag == "" and rest.open_tasks_only is True
+        assert manager.query_tasks(tasks, rest) == manager.query_tasks(index.task_items, query)
+        assert manager.query_notes(notes, rest) == manager.query_notes(index.note_items, query)
+        assert index.tag_counts() == {"home": 1, "Work": 4}
+        assert index.tag_counts(notes) == {"home": 1, "Work": 2}
+        assert index.complete_tags("w") == ["Work"]
+
+        windows[0].tags = ["home"]
+        index.update_windows([windows[0]])
+        assert index.tag_counts() == {"home": 1, "Work": 3}
+        assert [n.window_uuid for n in index.narrow(InfoQuery(tag="work"))[1]] == ["t1"]
+
+        index.sync(windows[:1])
+        assert index.all_tags() == ["home"]
+        assert index.narrow(InfoQuery(tag="work"))[:2] == ([], [])
+        assert index.narrow(InfoQuery()) == (index.task_items, index.note_items, InfoQuery())
+
+    def test_due_states_roll_over_at_boundaries(self):
+        from datetime import datetime
+
+        windows = [
+            _make_window(uuid="d1", text="due that day", due_at="2030-05-01"),
+            _make_window(
+                uuid="d2",
+                text="due soon",
+                due_at="2030-05-01",
+                due_time="15:00",
+                due_precision="datetime",
+            ),
+            _make_window(uuid="d3", text="no due"),
+        ]
+        index = IncrementalInfoIndex()
+        index.sync(windows)
+
+        def states():
+            return {item.window_uuid: item.due_state for item in index.note_items}
+
+        morning = datetime(2030, 5, 1, 9, 0)
+        assert index.refresh_due_states(morning) is True
+        assert states() == {"d1": "today", "d2": "today", "d3": "none"}
+        assert index.refresh_due_states(morning) is False
+        assert index.next_due_boundary(morning) == datetime(2030, 5, 1, 15, 0)
+
+        afternoon = datetime(2030, 5, 1, 16, 0)
+        revision = index.revision
+        assert index.refresh_due_states(afternoon) is True
+        assert states() == {"d1": "today", "d2": "overdue", "d3": "none"}
+        assert index.revision > revision
+        assert index.next_due_boundary(afternoon) == datetime(2030, 5, 2, 0, 0)
+
+        assert index.refresh_due_states(datetime(2030, 5, 2, 0, 1)) is True
+        assert states()["d1"] == "overdue"
+        assert [n.window_uuid for n in index.search("soon")[1]] == ["d2"]
+
+    def test_query_uses_precomputed_due_fields(self):
+        manager = InfoIndexManager()
+        tasks, notes = manager.build_index(
+            [
+                _make_window(uuid="n1", text="late", due_at="2000-01-01T00:00:00"),
+                _make_window(uuid="n2", text="bad", due_at="not-a-date"),
+                _make_window(uuid="n3", text="later", due_at="2999-01-01T00:00:00"),
+            ]
+        )
+        by_uuid = {n.window_uuid: n for n in notes}
+        assert (by_uuid["n1"].due_state, by_uuid["n2"].due_state, by_uuid["n3"].due_state) == (
+            "overdue",
+            "invalid",
+            "upcoming",
+        )
+        assert by_uuid["n1"].due_text == "2000-01-01"
+        overdue = manager.query_notes(notes, InfoQuery(due_filter="overdue"))
+        assert [n.window_uuid for n in overdue] == ["n1"]
+        by_due = manager.query_notes(notes, InfoQuery(sort_by="due", sort_desc=False))
+        assert [n.window_uuid for n in by_due] == ["n1", "n3", "n2"]
@@ -0,0 +1,151 @@
+from types import SimpleNamespace
+
+from PySide6.QtCore import QItemSelectionModel, QPersistentModelIndex, Qt
+from PySide6.QtTest import QAbstractItemModelTester
+
+from managers.info_index_manager import NoteIndexItem, TaskIndexItem
+from ui.info_list_model import ROLE_CHECKED, ROLE_KEY, ROLE_KIND, ROW_NOTE, ROW_TASK, InfoListModel
+
+
+def _task(uuid: str, line: int = 0, done: bool = False, text: str = "") -> TaskIndexItem:
+    return TaskIndexItem(
+        item_key=f"{uuid}:{line}",
+        window_uuid=uuid,
+        title=uuid,
+        text=text or f"task {uuid}:{line}",
+        line_index=line,
+        done=done,
+        tags=(),
+        is_starred=False,
+        created_at="",
+        updated_at="",
+        due_at="",
+        due_time="",
+        due_timezone="",
+        due_precision="date",
+        is_archived=False,
+    )
+
+
+def _note(uuid: str, starred: bool = False) -> NoteIndexItem:
+    return NoteIndexItem(
+        window_uuid=uuid,
+        title=uuid,
+        first_line="",
+        tags=(),
+        is_starred=starred,
+        is_archived=False,
+        content_mode="note",
+        created_at="",
+        updated_at="",
+        due_at="",
+        due_time="",
+        due_timezone="",
+        due_precision="date",
+    )
+
+
+def _make_model(qapp) -> InfoListModel:
+    _ = qapp
+    model = InfoListModel(lambda item: (getattr(item, "text", "") or item.title, None))
+    # 差分通知の整合性（begin/end の対応・parent/index の一貫性）を Qt 側で検証する
+    model.tester = QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+    return model
+
+
+def _keys(model: InfoListModel) -> list[str]:
+    return [str(index.data(ROLE_KEY)) for index in model.iter_indexes()]
+
+
+def test_row_diff_keeps_persistent_indexes(qapp):
+    model = _make_model(qapp)
+    a, b, c = _task("a"), _task("b"), _task("c")
+    model.set_items([a, b, c])
+    kept = QPersistentModelIndex(model.find_index(ROW_TASK, "b:0"))
+    inserts, removes, resets = [], [], []
+    model.rowsInserted.connect(lambda _p, first, last: inserts.append((first, last)))
+    model.rowsRemoved.connect(lambda _p, first, last: removes.append((first, last)))
+    model.modelReset.connect(lambda: resets.append(True))
+
+    model.set_items([_task("new"), a, b])
+
+    assert _keys(model) == ["new:0", "a:0", "b:0"]
+    assert inserts == [(0, 0)] and removes == [(2, 2)] and resets == []
+    assert kept.isValid() and kept.row() == 2
+
+    # 並べ替えでも同じ行を指し続ける
+    model.set_items([b, a, model.find_index(ROW_TASK, "new:0").internalPointer().item])
+    assert _keys(model) == ["b:0", "a:0", "new:0"]
+    assert kept.row() == 0
+
+
+def test_changed_item_emits_data_changed_only_for_its_row(qapp):
+    model = _make_model(qapp)
+    items = [_task("a"), _task("b"), _task("c")]
+    model.set_items(items)
+    changed = []
+    model.dataChanged.connect(lambda top, bottom, _roles: changed.append((top.row(), bottom.row())))
+
+    model.set_items(items)
+    assert changed == []
+
+    done_b = _task("b", done=True)
+    model.set_items([items[0], done_b, items[2]])
+    assert changed == [(1, 1)]
+    assert model.find_index(ROW_TASK, "b:0").data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+
+
+def test_groups_move_rows_between_headers_and_keep_selection(qapp):
+    model = _make_model(qapp)
+    selection = QItemSelectionModel(model)
+    a, b = _note("a"), _note("b")
+    groups = [
+        SimpleNamespace(group_key="starred", label="★ 1", items=[a]),
+        SimpleNamespace(group_key="other", label="1", items=[b]),
+    ]
+    model.set_groups(groups)
+    selection.select(model.find_index(ROW_NOTE, "b"), QItemSelectionModel.SelectionFlag.Select)
+
+    starred_a = _note("a", starred=True)
+    model.set_groups(
+        [
+            SimpleNamespace(group_key="starred", label="★ 2", items=[starred_a, b]),
+        ]
+    )
+
+    assert _keys(model) == ["", "a", "b"]
+    header = model.index(0, 0)
+    assert header.data() == "──── ★ 2 ────"
+    assert model.rowCount(header) == 2
+    # 別グループへ移った行は新しい行として扱われる（選択は移動元とともに外れる）
+    assert [index.data(ROLE_KEY) for index in selection.selectedIndexes()] == []
+
+    model.set_items([starred_a, b])
+    selection.select(model.find_index(ROW_NOTE, "b"), QItemSelectionModel.SelectionFlag.Select)
+    model.set_items([b, starred_a])
+    assert [index.data(ROLE_KEY) for index in selection.selectedIndexes()] == ["b"]
+
+
+def test_rows_render_lazily_and_report_check_toggles(qapp):
+    model = _make_model(qapp)
+    model.tester = None  # テスターは全行の data() を読むため、遅延生成の確認では外す
+    model.set_items([_task(f"t{i}") for i in range(2000)] + [_note("n")])
+    assert model.rowCount() == 2001
+    assert model.render_count == 0
+
+    index = model.find_index(ROW_NOTE, "n")
+    assert index.data() == "n"
+    assert index.data() == "n"
+    assert model.render_count == 1
+    assert index.data(ROLE_KIND) == "note"
+
+    toggled = []
+    model.check_toggled.connect(lambda idx, checked: toggled.append((idx.data(ROLE_KEY), checked)))
+    assert model.setData(index, Qt.CheckState.Checked, Qt.ItemDataRole.CheckStateRole)
+    assert toggled == [("n", True)]
+    # 実データが更新されるまでチェック状態は変わらない
+    assert index.data(ROLE_CHECKED) is False
+
+    model.set_empty("empty")
+    assert model.rowCount() == 1
+    assert model.flags(model.index(0, 0)) == Qt.ItemFlag.NoItemFlags
@@ -0,0 +1,123 @@
+import threading
+
+from managers.info_index_manager import InfoIndexManager, InfoQuery, TaskIndexItem
+from managers.info_query_worker import InfoQuerySnapshot, InfoQueryWorker, build_info_groups, run_info_query
+
+
+def _task(uuid: str, done: bool = False, tags: tuple[str, ...] = ()) -> TaskIndexItem:
+    return TaskIndexItem(
+        item_key=f"{uuid}:0",
+        window_uuid=uuid,
+        title=uuid,
+        text=f"task {uuid}",
+        line_index=0,
+        done=done,
+        tags=tags,
+        is_starred=False,
+        created_at="",
+        updated_at="",
+        due_at="",
+        due_time="",
+        due_timezone="",
+        due_precision="date",
+        is_archived=False,
+    )
+
+
+_TASKS = (_task("a", tags=("work",)), _task("b", done=True), _task("c", tags=("home",)))
+
+
+def _snapshot(generation: int, *, open_only: bool = False, group_by: str = "tag") -> InfoQuerySnapshot:
+    return InfoQuerySnapshot(generation, _TASKS, (), InfoQuery(open_tasks_only=open_only), group_by)
+
+
+class _BlockingManager(InfoIndexManager):
+    """最初の query_tasks で止まり、テスト側が解放するまで待つ。"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self._blocked_once = False
+
+    def query_tasks(self, items, query):
+        if not self._blocked_once:
+            self._blocked_once = True
+            self.entered.set()
+            self.release.wait(5.0)
+        return super().query_tasks(items, query)
+
+
+def test_run_info_query_filters_and_groups() -> None:
+    manager = InfoIndexManager()
+    result = run_info_query(manager, _snapshot(3, open_only=True))
+
+    assert result is not None and result.generation == 3
+    assert {item.item_key for item in result.tasks} == {"a:0", "c:0"}
+    assert result.stats.open_tasks == 2
+    assert [g.group_key for g in result.task_groups] == [
+        g.group_key for g in build_info_groups(manager, "tag", result.tasks, [])[0]
+    ]
+    assert run_info_query(manager, _snapshot(4), is_stale=lambda: True) is None
+
+
+def test_synchronous_worker_emits_immediately(qapp) -> None:
+    _ = qapp
+    worker = InfoQueryWorker(InfoIndexManager(), synchronous=True)
+    results = []
+    worker.finished.connect(results.append)
+
+    worker.submit(_snapshot(1, group_by="flat"))
+
+    assert [r.generation for r in results] == [1]
+    assert results[0].task_groups == []
+
+
+def test_superseded_generations_are_dropped(qapp) -> None:
+    manager = _BlockingManager()
+    worker = InfoQueryWorker(manager, synchronous=False)
+    results = []
+    worker.finished.connect(results.append)
+    try:
+        worker.submit(_snapshot(1))
+        assert manager.entered.wait(5.0)
+        # 1 の実行中に 2, 3 が来る: 2 は実行前に捨てられ、1 は段階の合間で打ち切られる
+        worker.submit(_snapshot(2))
+        worker.submit(_snapshot(3, open_only=True))
+        manager.release.set()
+        assert worker.wait_idle(5.0)
+        for _ in range(20):
+            qapp.processEvents()
+            if results:
+                break
+    finally:
+        worker.close()
+
+    assert [r.generation for r in results] == [3]
+    assert worker.completed_count == 1
+    assert worker.superseded_count == 2
+
+
+def test_small_requests_run_inline_without_the_worker_thread(qapp) -> None:
+    _ = qapp
+    worker = InfoQueryWorker(InfoIndexManager(), synchronous=False, inline_item_limit=len(_TASKS))
+    threads = []
+    worker.finished.connect(lambda result: threads.append((result.generation, threading.current_thread().name)))
+    try:
+        worker.submit(_snapshot(1))
+        # 件数が上限以下なら submit の中で結果まで届き、スレッドは起動しない
+        assert threads == [(1, threading.current_thread().name)]
+        assert worker._thread is None
+
+        worker.inline_item_limit = len(_TASKS) - 1
+        worker.submit(_snapshot(2))
+        assert worker.wait_idle(5.0)
+        for _ in range(20):
+            qapp.processEvents()
+            if len(threads) == 2:
+                break
+    finally:
+        worker.close()
+
+    assert threads[1] == (2, threading.current_thread().name)
+    assert worker._thread is not None and worker.completed_count == 2
@@ -0,0 +1,68 @@
+from managers.info_search_index import InvertedTextIndex, TagFacetIndex, tokenize_search_text
+
+
+def _index(**docs: str) -> InvertedTextIndex:
+    index = InvertedTextIndex()
+    for doc_id, text in docs.items():
+        index.add(int(doc_id[1:]), text)
+    return index
+
+
+def test_tokenizer_splits_words_and_japanese_bigrams():
+    tokens = tokenize_search_text("Buy MILK 東京都")
+
+    assert {"buy", "milk"} <= tokens
+    assert {"東京", "京都", "東", "京", "都"} <= tokens
+    assert "東京都" not in tokens
+
+
+def test_word_terms_match_by_prefix_and_intersect():
+    index = _index(d1="buy milk today", d2="milkshake recipe", d3="buy bread")
+
+    assert index.search("mil") == {1, 2}
+    assert index.search("BUY mil") == {1}
+    assert index.search("ilk") == set()
+    assert index.search("!!") is None
+
+
+def test_japanese_terms_require_contiguous_text():
+    index = _index(d1="東京都の会議", d2="東京 京都 メモ", d3="ミルク")
+
+    assert index.search("東京都") == {1}
+    assert index.search("京") == {1, 2}
+    assert index.search("ク") == {3}
+    assert index.search("メモ 東京") == {2}
+
+
+def test_remove_and_replace_update_postings():
+    index = _index(d1="alpha beta", d2="alpha")
+
+    index.add(1, "gamma")
+    assert index.search("alpha") == {2}
+    assert index.search("gam") == {1}
+
+    index.remove(2)
+    assert index.search("alpha") == set()
+    assert index.vocabulary_size == 1
+    assert len(index) == 1
+
+
+def test_tag_facet_matches_counts_and_completes():
+    facet = TagFacetIndex()
+    facet.add(1, ["Work", "home"])
+    facet.add(2, ["work", "homework"])
+    facet.add(3, ["hobby"])
+
+    assert facet.match("WORK") == {1, 2}
+    assert facet.match("ho") == {1, 2, 3}
+    assert facet.counts() == {"hobby": 1, "home": 1, "homework": 1, "Work": 2}
+    assert facet.counts([2, 3]) == {"hobby": 1, "homework": 1, "Work": 1}
+    assert facet.complete("HO") == ["hobby", "home", "homework"]
+    assert facet.complete("w") == ["Work"]
+
+    facet.add(1, ["home"])
+    facet.remove(2)
+    assert facet.tags() == ["hobby", "home"]
+    assert facet.match("work") == set()
+    assert facet.complete("home", limit=1) == ["home"]
+    assert len(facet) == 2 and facet.vocabulary_size == 2
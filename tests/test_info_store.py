@@ -0,0 +1,161 @@
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from managers.info_index_manager import IncrementalInfoIndex, InfoIndexManager, InfoQuery
+from managers.info_store import InfoStore
+
+_TODAY = date.today().isoformat()
+_TOMORROW = (date.today() + timedelta(days=1)).isoformat()
+
+
+def _window(uuid: str, text: str, **overrides) -> dict:
+    data = {
+        "type": "text",
+        "uuid": uuid,
+        "text": text,
+        "title": "",
+        "tags": [],
+        "content_mode": "note",
+        "task_states": [],
+        "is_starred": False,
+        "is_archived": False,
+        "created_at": "2026-01-01T09:00:00",
+        "updated_at": "2026-01-02T09:00:00",
+        "due_at": "",
+        "due_time": "",
+        "due_timezone": "",
+        "due_precision": "date",
+    }
+    data.update(overrides)
+    return data
+
+
+_WINDOWS = [
+    _window("n1", "Meeting notes\nagenda", tags=["Work", "team"], is_starred=True, due_at="2000-01-01"),
+    _window("n2", "買い物メモ", tags=["home"], updated_at="2026-01-05T09:00:00", due_at=_TODAY),
+    _window("n3", "archived idea", is_archived=True, title="Old"),
+    _window(
+        "t1",
+        "buy milk\ncall mom\nwrite report",
+        content_mode="task",
+        task_states=[True, False],
+        tags=["home"],
+        due_at=_TOMORROW,
+        updated_at="2026-01-03T09:00:00",
+    ),
+    _window(
+        "t2",
+        "ship release",
+        content_mode="task",
+        title="Release",
+        due_at="2001-02-03",
+        due_time="10:30",
+        due_precision="datetime",
+    ),
+    {"type": "image", "uuid": "img"},
+]
+
+_QUERIES = [
+    InfoQuery(),
+    InfoQuery(text="mil"),
+    InfoQuery(text="メモ"),
+    InfoQuery(text="a"),
+    InfoQuery(text="mom call"),
+    InfoQuery(text="rel shi"),
+    InfoQuery(text="ease"),
+    InfoQuery(text="買い 会議"),
+    InfoQuery(text="#"),
+    InfoQuery(tag="HOM"),
+    InfoQuery(starred_only=True),
+    InfoQuery(open_tasks_only=True, sort_by="due", sort_desc=False),
+    InfoQuery(archive_scope="all", sort_by="title"),
+    InfoQuery(archive_scope="archived"),
+    InfoQuery(item_scope="tasks"),
+    InfoQuery(item_scope="notes", sort_by="created"),
+    InfoQuery(content_mode_filter="note"),
+    *(InfoQuery(due_filter=due) for due in ("today", "overdue", "upcoming", "dated", "undated")),
+]
+
+
+def _item_count(windows: list[dict]) -> int:
+    manager = InfoIndexManager()
+    tasks, notes = manager.build_index([SimpleNamespace(**data) for data in windows if data["type"] == "text"])
+    return len(tasks) + len(notes)
+
+
+@pytest.fixture
+def store() -> InfoStore:
+    info_store = InfoStore()
+    info_store.index_scene("cat", "scene", {"windows": _WINDOWS, "connections": []})
+    return info_store
+
+
+@pytest.mark.parametrize("query", _QUERIES)
+def test_queries_match_in_memory_manager(store: InfoStore, query: InfoQuery) -> None:
+    # Info タブと同じく、全文検索・タグは索引で絞ってから残りの条件を適用する
+    manager = InfoIndexManager()
+    index = IncrementalInfoIndex(manager)
+    index.sync([SimpleNamespace(**data) for data in _WINDOWS if data["type"] == "text"])
+    tasks, notes, rest = index.narrow(query)
+    expected_tasks = manager.query_tasks(tasks, rest)
+    expected_notes = manager.query_notes(notes, rest)
+
+    assert store.query_tasks(query) == expected_tasks
+    assert store.query_notes(query) == expected_notes
+    assert store.build_stats(query) == manager.build_stats(expected_tasks, expected_notes)
+
+
+@pytest.mark.parametrize("fts_enabled", [True, False])
+def test_text_search_matches_word_prefixes_of_every_term(store: InfoStore, fts_enabled: bool) -> None:
+    store.fts_enabled = store.fts_enabled and fts_enabled
+
+    assert [item.text for item in store.query_tasks(InfoQuery(text="MOM"))] == ["call mom"]
+    assert [item.window_uuid for item in store.query_notes(InfoQuery(text="meeting"))] == ["n1"]
+    # 語の順序・位置を問わず、全ての語を含むものだけ
+    assert [item.window_uuid for item in store.query_notes(InfoQuery(text="team meet"))] == ["n1"]
+    assert store.query_notes(InfoQuery(text="team milk")) == []
+    # 単語の途中からは一致しない（"ask" は "task" に一致しない）
+    assert store.query_tasks(InfoQuery(text="elease")) == []
+    assert store.query_tasks(InfoQuery(text="ilk")) == []
+    assert [item.text for item in store.query_tasks(InfoQuery(text="rep wri"))] == ["write report"]
+    # 日本語は部分一致
+    assert [item.window_uuid for item in store.query_notes(InfoQuery(text="物メ"))] == ["n2"]
+
+
+def test_scene_updates_limits_and_locate(store: InfoStore) -> None:
+    assert store.indexed_scenes() == {("cat", "scene")}
+    assert store.locate("t1") == ("cat", "scene")
+    assert store.query_notes(InfoQuery())[0].scene == ("cat", "scene")
+    assert len(store.query_tasks(InfoQuery(), limit=2)) == 2
+    assert store.build_stats(InfoQuery(), exclude_window_uuids=["t1"]).done_tasks == 0
+
+    store.index_scene("other", "s2", [_window("x1", "other scene")])
+    revision = store.revision
+    store.index_scene("cat", "scene", {"windows": [_window("n1", "replaced")]})
+    assert store.revision > revision
+    assert [n.first_line for n in store.query_notes(InfoQuery(text="replaced"))] == ["replaced"]
+    assert store.query_tasks(InfoQuery()) == []
+
+    store.rename_category("other", "cat")
+    assert store.locate("x1") == ("cat", "s2")
+    store.sync_scenes({"cat": {"s2": None}})
+    assert store.indexed_scenes() == {("cat", "s2")}
+    store.remove_category("cat")
+    assert store.count() == 0
+
+
+def test_store_persists_between_sessions(tmp_path: Path) -> None:
+    path = tmp_path / "scenes" / "info_store.sqlite3"
+    first = InfoStore(str(path))
+    first.index_scene("cat", "scene", {"windows": _WINDOWS})
+    first.close()
+
+    second = InfoStore(str(path))
+    try:
+        assert second.count() == _item_count(_WINDOWS)
+        assert [n.window_uuid for n in second.query_notes(InfoQuery(text="meet"))] == ["n1"]
+    finally:
+        second.close()
@@ -1,8 +1,13 @@
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QItemSelectionModel, Qt
 
+from managers.due_scheduler import DueScheduler
+from managers.info_store import InfoStore
+from managers.operation_log_store import OperationLogStore
+from managers.property_change_bus import PropertyChangeBus
+from ui.dialogs import BulkTagEditDialog
 from ui.tabs.info_tab import InfoTab
 from utils.tag_ops import merge_tags
 from utils.translator import tr
@@ -214,23 +219,20 @@ def _make_main_window(task_windows=None, note_windows=None):
 
 
 def _iter_all_tree_items(tree):
-    """QTreeWidget の全アイテム（トップレベル + 子）をフラットに列挙する。"""
+    """一覧ビューの全行（トップレベル + 子）のインデックスをフラットに列挙する。"""
+    model = tree.model()
     result = []
-    for i in range(tree.topLevelItemCount()):
-        top = tree.topLevelItem(i)
-        if top is None:
-            continue
+    for i in range(model.rowCount()):
+        top = model.index(i, 0)
         result.append(top)
-        for j in range(top.childCount()):
-            child = top.child(j)
-            if child is not None:
-                result.append(child)
+        for j in range(model.rowCount(top)):
+            result.append(model.index(j, 0, top))
     return result
 
 
 def _find_note_item(tab: InfoTab, window_uuid: str):
     for item in _iter_all_tree_items(tab.notes_tree):
-        if str(item.data(0, Qt.ItemDataRole.UserRole) or "") == window_uuid:
+        if str(item.data(Qt.ItemDataRole.UserRole) or "") == window_uuid:
             return item
     return None
 
@@ -238,7 +240,7 @@ def _find_note_item(tab: InfoTab, window_uuid: str):
 def _count_task_items(tab: InfoTab) -> int:
     count = 0
     for item in _iter_all_tree_items(tab.tasks_tree):
-        if ":" in str(item.data(0, Qt.ItemDataRole.UserRole) or ""):
+        if ":" in str(item.data(Qt.ItemDataRole.UserRole) or ""):
             count += 1
     return count
 
@@ -246,7 +248,7 @@ def _count_task_items(tab: InfoTab) -> int:
 def _find_first_task_item(tab: InfoTab):
     """最初の実タスクアイテム（グループヘッダーを除く）を返す。"""
     for item in _iter_all_tree_items(tab.tasks_tree):
-        if ":" in str(item.data(0, Qt.ItemDataRole.UserRole) or ""):
+        if ":" in str(item.data(Qt.ItemDataRole.UserRole) or ""):
             return item
     return None
 
@@ -262,7 +264,7 @@ def test_task_item_changed_safe_when_action_refreshes(qapp):
 
     # Must not crash even if action refreshes list immediately.
     # Action is deferred via QTimer.singleShot(0), so processEvents is needed.
-    item.setCheckState(0, Qt.CheckState.Checked)
+    tab.tasks_model.setData(item, Qt.CheckState.Checked, Qt.ItemDataRole.CheckStateRole)
     qapp.processEvents()
     task_window = text_windows[0]
     assert isinstance(task_window, _DummyTaskWindow)
@@ -281,7 +283,7 @@ def test_note_item_changed_safe_when_action_refreshes(qapp):
 
     # Must not crash even if action refreshes list immediately.
     # Action is deferred via QTimer.singleShot(0), so processEvents is needed.
-    item.setCheckState(0, Qt.CheckState.Checked)
+    tab.notes_model.setData(item, Qt.CheckState.Checked, Qt.ItemDataRole.CheckStateRole)
     qapp.processEvents()
     assert note_window.is_starred is True
 
@@ -299,7 +301,7 @@ def test_smart_view_overdue_filters_tasks(qapp):
     assert _count_task_items(tab) == 1
     first = _find_first_task_item(tab)
     assert first is not None
-    assert str(first.data(0, Qt.ItemDataRole.UserRole)).startswith("t-overdue:")
+    assert str(first.data(Qt.ItemDataRole.UserRole)).startswith("t-overdue:")
 
 
 def test_bulk_archive_selected_updates_windows(qapp):
@@ -313,7 +315,7 @@ def test_bulk_archive_selected_updates_windows(qapp):
 
     note_item = _find_note_item(tab, "n-1")
     assert note_item is not None
-    note_item.setSelected(True)
+    tab.notes_tree.selectionModel().select(note_item, QItemSelectionModel.SelectionFlag.Select)
 
     tab._archive_selected()
     assert note_window.is_archived is True
@@ -329,8 +331,8 @@ def test_bulk_complete_selected_updates_task_states(qapp):
     mw.main_controller = SimpleNamespace(info_actions=actions)
 
     for item in _iter_all_tree_items(tab.tasks_tree):
-        if ":" in str(item.data(0, Qt.ItemDataRole.UserRole) or ""):
-            item.setSelected(True)
+        if ":" in str(item.data(Qt.ItemDataRole.UserRole) or ""):
+            tab.tasks_tree.selectionModel().select(item, QItemSelectionModel.SelectionFlag.Select)
 
     tab._apply_bulk_task_done(True)
     assert task_window._states == [True, True]
@@ -349,7 +351,7 @@ def test_mode_filter_task_limits_note_list(qapp):
 
     note_rows = []
     for item in _iter_all_tree_items(tab.notes_tree):
-        uuid = str(item.data(0, Qt.ItemDataRole.UserRole) or "")
+        uuid = str(item.data(Qt.ItemDataRole.UserRole) or "")
         if uuid:
             note_rows.append(uuid)
     assert note_rows == ["t-1"]
@@ -368,7 +370,7 @@ def test_due_filter_upcoming_limits_tasks(qapp):
     assert _count_task_items(tab) == 1
     first = _find_first_task_item(tab)
     assert first is not None
-    assert str(first.data(0, Qt.ItemDataRole.UserRole)).startswith("t-future:")
+    assert str(first.data(Qt.ItemDataRole.UserRole)).startswith("t-future:")
 
 
 def test_smart_view_today_applies_due_sort_controls(qapp):
@@ -434,7 +436,7 @@ def test_overdue_badge_rendered_on_task_item(qapp):
 
     first = _find_first_task_item(tab)
     assert first is not None
-    assert f"[{tr('info_badge_overdue')}]" in first.text(0)
+    assert f"[{tr('info_badge_overdue')}]" in first.data()
 
 
 def test_archive_scope_archived_filters_task_rows(qapp):
@@ -450,7 +452,7 @@ def test_archive_scope_archived_filters_task_rows(qapp):
     assert _count_task_items(tab) == 1
     first = _find_first_task_item(tab)
     assert first is not None
-    assert str(first.data(0, Qt.ItemDataRole.UserRole)).startswith("t-archived:")
+    assert str(first.data(Qt.ItemDataRole.UserRole)).startswith("t-archived:")
 
 
 def test_builtin_archived_preset_sets_archive_scope(qapp):
@@ -476,7 +478,7 @@ def test_restore_selected_updates_windows(qapp):
     tab.refresh_data(immediate=True)
     note_item = _find_note_item(tab, "n-1")
     assert note_item is not None
-    note_item.setSelected(True)
+    tab.notes_tree.selectionModel().select(note_item, QItemSelectionModel.SelectionFlag.Select)
 
     tab._restore_selected()
     assert note_window.is_archived is False
@@ -493,7 +495,7 @@ def test_bulk_star_selected_updates_windows(qapp):
 
     note_item = _find_note_item(tab, "n-1")
     assert note_item is not None
-    note_item.setSelected(True)
+    tab.notes_tree.selectionModel().select(note_item, QItemSelectionModel.SelectionFlag.Select)
 
     tab._apply_bulk_star(True)
     assert note_window.is_starred is True
@@ -510,7 +512,7 @@ def test_bulk_edit_tags_selected_calls_dialog_and_action(qapp):
 
     note_item = _find_note_item(tab, "n-1")
     assert note_item is not None
-    note_item.setSelected(True)
+    tab.notes_tree.selectionModel().select(note_item, QItemSelectionModel.SelectionFlag.Select)
 
     with patch("ui.tabs.info_tab.BulkTagEditDialog.ask", return_value=(["new"], ["old"])):
         tab._edit_tags_selected()
@@ -519,6 +521,62 @@ def test_bulk_edit_tags_selected_calls_dialog_and_action(qapp):
     assert actions.last_bulk_tags == (["n-1"], ["new"], ["old"])
 
 
+def test_tag_facet_filters_and_completes_after_bulk_merge(qapp):
+    _ = qapp
+    notes = [_DummyNoteWindow(uuid="n-1", tags=["work"]), _DummyNoteWindow(uuid="n-2", tags=["home"])]
+    mw, text_windows = _make_main_window(task_windows=[], note_windows=notes)
+    tab = InfoTab(mw)
+    actions = _DummyInfoActions(tab, text_windows)
+    mw.main_controller = SimpleNamespace(info_actions=actions)
+
+    actions.bulk_merge_tags(["n-2"], ["Workshop"], [])
+    tab.edit_tag_filter.setText("WORK")
+    tab.refresh_data(immediate=True)
+
+    assert sorted(_find_note_item(tab, uuid) is not None for uuid in ("n-1", "n-2")) == [True, True]
+    assert tab.complete_tags("wo") == ["work", "Workshop"]
+    assert tab.current_tag_counts() == {"home": 1, "work": 1, "Workshop": 1}
+
+    dialog = BulkTagEditDialog(tab, tag_provider=tab.complete_tags)
+    assert dialog.add_completer.candidates("work, wo") == ["Workshop"]
+    assert dialog.add_completer.candidates("work, ") == []
+    dialog.edit_add.setText("home, wo")
+    dialog.add_completer.insert_tag("Workshop")
+    assert dialog.edit_add.text() == "home, Workshop"
+    assert dialog.get_values() == (["home", "Workshop"], [])
+
+
+def test_saved_scenes_toggle_merges_store_results(qapp):
+    _ = qapp
+    mw, _ = _make_main_window(task_windows=[], note_windows=[_DummyNoteWindow(uuid="open-1")])
+    store = InfoStore()
+    store.index_scene(
+        "cat",
+        "Archive",
+        {
+            "windows": [
+                {"type": "text", "uuid": "saved-1", "text": "saved memo", "is_starred": True},
+                {"type": "text", "uuid": "open-1", "text": "stale copy of the open note"},
+            ]
+        },
+    )
+    mw.file_manager = SimpleNamespace(info_store=store, backfill_info_store=MagicMock(return_value=0))
+    tab = InfoTab(mw)
+    assert _find_note_item(tab, "saved-1") is None
+
+    tab.chk_saved_scenes.setChecked(True)
+    tab.refresh_data(immediate=True)
+
+    mw.file_manager.backfill_info_store.assert_called_once()
+    saved = _find_note_item(tab, "saved-1")
+    assert saved is not None
+    assert tr("info_badge_saved_scene").format(scene="Archive") in saved.data()
+    # 開いているウィンドウは保存済みの古い内容ではなく現在の内容で 1 行だけ出る
+    open_rows = [i for i in _iter_all_tree_items(tab.notes_tree) if i.data(Qt.ItemDataRole.UserRole) == "open-1"]
+    assert len(open_rows) == 1 and "stale" not in open_rows[0].data()
+    assert tab._last_result is not None and tab._last_result.stats.starred_notes == 1
+
+
 def test_archived_badge_rendered_on_note_item(qapp):
     _ = qapp
     note_window = _DummyNoteWindow(uuid="n-1", is_archived=True)
@@ -529,7 +587,7 @@ def test_archived_badge_rendered_on_note_item(qapp):
 
     note_item = _find_note_item(tab, "n-1")
     assert note_item is not None
-    assert f"[{tr('info_badge_archived')}]" in note_item.text(0)
+    assert f"[{tr('info_badge_archived')}]" in note_item.data()
 
 
 def test_operation_log_panel_renders_and_clears(qapp):
@@ -599,7 +657,7 @@ def test_bulk_menu_action_uses_existing_bulk_handler(qapp):
 
     note_item = _find_note_item(tab, "n-1")
     assert note_item is not None
-    note_item.setSelected(True)
+    tab.notes_tree.selectionModel().select(note_item, QItemSelectionModel.SelectionFlag.Select)
 
     tab.btn_star_selected.trigger()
     assert note_window.is_starred is True
@@ -730,16 +788,94 @@ def test_refresh_data_reuses_cached_index_for_unchanged_windows(qapp):
         assert build_index_spy.call_count == 0
 
 
-def test_refresh_data_rebuilds_index_when_window_snapshot_changes(qapp):
+def test_refresh_data_reindexes_only_changed_window(qapp):
     _ = qapp
     task_window = _DummyTaskWindow(uuid="tw-cache")
-    mw, _ = _make_main_window(task_windows=[task_window], note_windows=[])
+    other_window = _DummyTaskWindow(uuid="tw-other")
+    mw, _ = _make_main_window(task_windows=[task_window, other_window], note_windows=[])
     tab = InfoTab(mw)
+    tab.refresh_data(immediate=True)
 
-    with patch.object(tab.index_manager, "build_index", wraps=tab.index_manager.build_index) as build_index_spy:
+    with patch.object(tab.index_manager, "build_window_items", wraps=tab.index_manager.build_window_items) as build_spy:
         task_window.text = "updated task body"
         tab.refresh_data(immediate=True)
-        assert build_index_spy.call_count == 1
+        assert [call.args[0] for call in build_spy.call_args_list] == [task_window]
+
+    assert "updated task body" in [item.text for item in tab._info_index.task_items]
+
+
+def test_targeted_refresh_skips_query_for_unindexed_window(qapp):
+    _ = qapp
+    mw, _ = _make_main_window()
+    tab = InfoTab(mw)
+    tab.refresh_data(immediate=True)
+
+    with patch.object(tab.index_manager, "query_tasks", wraps=tab.index_manager.query_tasks) as query_spy:
+        tab.refresh_data(immediate=True, window=object())
+        assert query_spy.call_count == 0
+        tab.refresh_data(immediate=True)
+        assert query_spy.call_count == 1
+
+
+def test_refresh_applies_row_diff_and_keeps_selection(qapp):
+    _ = qapp
+    kept_window = _DummyTaskWindow(uuid="tw-kept", text="keep me")
+    edited_window = _DummyTaskWindow(uuid="tw-edited", text="before")
+    mw, _ = _make_main_window(task_windows=[kept_window, edited_window], note_windows=[])
+    tab = InfoTab(mw)
+    tab.refresh_data(immediate=True)
+
+    kept = tab.tasks_model.find_index("task", "tw-kept:0")
+    tab.tasks_tree.selectionModel().select(kept, QItemSelectionModel.SelectionFlag.Select)
+    resets = []
+    tab.tasks_model.modelReset.connect(lambda: resets.append(True))
+
+    edited_window.text = "after\nsecond"
+    edited_window._states = [False, False]
+    tab.refresh_data(immediate=True, window=edited_window)
+
+    assert resets == []
+    assert tab._selected_task_item_keys() == ["tw-kept:0"]
+    texts = [str(index.data()) for index in _iter_all_tree_items(tab.tasks_tree)]
+    assert any("second" in text for text in texts)
+
+
+def test_unchanged_refresh_skips_row_diff(qapp, monkeypatch):
+    _ = qapp
+    task_window = _DummyTaskWindow(uuid="tw-same", text="same")
+    mw, _ = _make_main_window(task_windows=[task_window], note_windows=[])
+    tab = InfoTab(mw)
+    tab.refresh_data(immediate=True)
+    applied = []
+    monkeypatch.setattr(tab, "_populate_tasks_grouped", lambda *args: applied.append(args))
+
+    # 全体の再取得でも、結果が前回と同じなら行の差分計算は行わない
+    tab.refresh_data(immediate=True)
+    assert applied == []
+
+    task_window.text = "changed"
+    tab.refresh_data(immediate=True)
+    assert len(applied) == 1
+
+
+def test_background_query_keeps_previous_rows_until_result_lands(qapp):
+    _ = qapp
+    overdue = _DummyTaskWindow(uuid="t-overdue", text="over", due_at="2001-01-01T00:00:00")
+    future = _DummyTaskWindow(uuid="t-future", text="future", due_at="2999-01-01T00:00:00")
+    mw, _ = _make_main_window(task_windows=[overdue, future], note_windows=[])
+    tab = InfoTab(mw)
+    tab._query_worker._synchronous = False
+    tab._query_worker.inline_item_limit = 0
+    try:
+        tab.cmb_due_filter.setCurrentIndex(tab.cmb_due_filter.findData("upcoming"))
+        tab.refresh_data(immediate=True)
+        assert _count_task_items(tab) == 2
+
+        assert tab.wait_for_query_results()
+        assert _count_task_items(tab) == 1
+        assert str(_find_first_task_item(tab).data(Qt.ItemDataRole.UserRole)).startswith("t-future:")
+    finally:
+        tab.shutdown()
 
 
 def test_smart_view_buttons_toggle(qapp):
@@ -796,8 +932,8 @@ def test_all_tab_shows_tasks_and_notes(qapp):
     # Check all_tree has items
     all_items = _iter_all_tree_items(tab.all_tree)
     # Should have at least task items and note items
-    task_items_in_all = [item for item in all_items if str(item.data(0, Qt.ItemDataRole.UserRole + 3) or "") == "task"]
-    note_items_in_all = [item for item in all_items if str(item.data(0, Qt.ItemDataRole.UserRole + 3) or "") == "note"]
+    task_items_in_all = [item for item in all_items if str(item.data(Qt.ItemDataRole.UserRole + 3) or "") == "task"]
+    note_items_in_all = [item for item in all_items if str(item.data(Qt.ItemDataRole.UserRole + 3) or "") == "note"]
     assert len(task_items_in_all) > 0
     assert len(note_items_in_all) > 0
 
@@ -823,3 +959,94 @@ def test_preset_saves_group_by(qapp):
     assert len(user_ids) > 0
     preset = tab._view_presets[user_ids[-1]]
     assert preset.filters["group_by"] == "tag"
+
+
+def test_search_box_matches_terms_in_any_order(qapp):
+    _ = qapp
+    task_window = _DummyTaskWindow(uuid="tw-search", text="buy milk\n会議の資料\nother")
+    mw, _ = _make_main_window(task_windows=[task_window], note_windows=[_DummyNoteWindow()])
+    tab = InfoTab(mw)
+
+    with patch.object(tab, "_populate_tasks_grouped", wraps=tab._populate_tasks_grouped) as populate_spy:
+        tab.edit_search.setText("milk BU")
+        tab.refresh_data(immediate=True)
+        assert [item.text for item in populate_spy.call_args.args[1]] == ["buy milk"]
+
+        tab.edit_search.setText("資料")
+        tab.refresh_data(immediate=True)
+        assert [item.text for item in populate_spy.call_args.args[1]] == ["会議の資料"]
+
+
+def test_refresh_arms_single_due_rollover_timer(qapp):
+    _ = qapp
+    mw, _ = _make_main_window()
+    tab = InfoTab(mw)
+    tab.refresh_data(immediate=True)
+
+    assert tab._due_rollover_timer.isActive()
+    assert tab._due_rollover_timer.isSingleShot()
+    with (
+        patch.object(tab._info_index, "refresh_due_states", return_value=True),
+        patch.object(tab, "refresh_data") as refresh_spy,
+    ):
+        tab._on_due_rollover()
+    refresh_spy.assert_called_once_with()
+
+
+def test_shared_due_scheduler_replaces_tab_rollover_timer(qapp):
+    _ = qapp
+    mw, windows = _make_main_window()
+    mw.due_scheduler = DueScheduler()
+    tab = InfoTab(mw)
+    tab.refresh_data(immediate=True)
+
+    assert not tab._due_rollover_timer.isActive()
+    with (
+        patch.object(tab._info_index, "refresh_due_states", return_value=True) as refresh_states,
+        patch.object(tab, "refresh_data") as refresh_spy,
+    ):
+        mw.due_scheduler.sig_due_reached.emit(windows[:1])
+    refresh_states.assert_called_once_with(windows=windows[:1])
+    refresh_spy.assert_called_once_with()
+
+
+def test_info_tab_reindexes_only_on_metadata_changes(qapp):
+    _ = qapp
+    mw, windows = _make_main_window()
+    mw.property_change_bus = PropertyChangeBus(synchronous=True)
+    tab = InfoTab(mw)
+    target = windows[0]
+
+    with patch.object(tab, "refresh_data") as refresh_spy:
+        mw.property_change_bus.publish(target, ("font_color", "position", "move_speed"))
+        refresh_spy.assert_not_called()
+        mw.property_change_bus.publish(target, ("title",))
+    refresh_spy.assert_called_once_with(window=target)
+
+    tab.shutdown()
+    with patch.object(tab, "refresh_data") as refresh_spy:
+        mw.property_change_bus.publish(target, ("title",))
+    refresh_spy.assert_not_called()
+
+
+def test_operations_dialog_pages_older_entries(qapp):
+    _ = qapp
+    mw, text_windows = _make_main_window(task_windows=[], note_windows=[])
+    tab = InfoTab(mw)
+    store = OperationLogStore()
+    store.extend(
+        [{"at": f"2026-02-10T11:{i % 60:02d}:00", "action": "bulk_star", "target_count": i + 1} for i in range(120)]
+    )
+    actions = _DummyInfoActions(tab, text_windows)
+    actions.get_operation_log_page = store.read_page
+    mw.main_controller = SimpleNamespace(info_actions=actions)
+
+    with patch("ui.tabs.info_tab.InfoOperationsDialog.exec", return_value=0):
+        tab._open_operations_dialog()
+    dialog = tab._operations_dialog
+    assert dialog.operations_list.count() == 100
+    assert not dialog.btn_more.isHidden()
+
+    dialog.btn_more.click()
+    assert dialog.operations_list.count() == 120
+    assert dialog.btn_more.isHidden()
@@ -34,9 +34,8 @@ class TestE2EPersistence:
             pytest.fail(f"Write process failed with code {result_write.returncode}")
 
         # Check if files were created
-        # We saved scenes_db, so we check for that
-        assert os.path.exists(os.path.join(temp_config_dir, "scenes_db.json"))
-        # scenes_db might be created depending on logic
+        # Scene DB is sharded: a small index plus one file per scene under scenes/
+        assert os.path.exists(os.path.join(temp_config_dir, "scenes", "index.json"))
 
         # 2. READ Session
         cmd_read = [sys.executable, script_path, "--config-dir", temp_config_dir, "--mode", "read"]
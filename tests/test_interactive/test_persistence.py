@@ -81,3 +81,141 @@ def test_persistence_save_load(qapp, tmp_path):
         mw.close()
         for win in mw.text_windows:
             win.close()
+
+
+def test_scene_load_uses_single_batch_notification(qapp):
+    """シーンロードは一括生成で行われ、追加通知はバッチ単位で1回だけ発行される。"""
+    mw = MainWindow()
+    try:
+        added: list = []
+        mw.window_manager.sig_windows_added.connect(added.append)
+        scene = {
+            "format_version": 1,
+            "windows": [
+                {"type": "text", "uuid": f"batch-{i}", "text": f"Note {i}", "position": {"x": 10 * i, "y": 20}}
+                for i in range(3)
+            ],
+            "connections": [{"from_uuid": "batch-0", "to_uuid": "batch-1"}],
+        }
+
+        mw.file_manager.load_scene_from_data(scene)
+
+        assert [w.uuid for w in mw.text_windows] == ["batch-0", "batch-1", "batch-2"]
+        assert [w.text for w in mw.text_windows] == ["Note 0", "Note 1", "Note 2"]
+        assert mw.text_windows[2].x() == 20
+        assert len(added) == 1
+        assert len(mw.window_manager.connectors) == 1
+    finally:
+        mw.window_manager.clear_all()
+        mw.close()
+
+
+def test_scene_switch_reuses_windows_by_uuid(qapp):
+    """シーン切替は UUID が一致するウィンドウを再利用し、差分だけを生成/削除する。"""
+    mw = MainWindow()
+    try:
+
+        def _text(uuid: str, text: str, x: int) -> dict:
+            return {"type": "text", "uuid": uuid, "text": text, "position": {"x": x, "y": 50}}
+
+        scene_a = {
+            "format_version": 1,
+            "windows": [_text("keep", "Keep", 10), _text("moved", "Moved", 100), _text("gone", "Gone", 200)],
+            "connections": [{"from_uuid": "keep", "to_uuid": "gone"}],
+        }
+        scene_b = {
+            "format_version": 1,
+            "windows": [_text("keep", "Keep", 10), _text("moved", "Moved!", 300), _text("new", "New", 400)],
+            "connections": [{"from_uuid": "keep", "to_uuid": "new"}],
+        }
+
+        mw.file_manager.load_scene_from_data(scene_a)
+        before = {w.uuid: w for w in mw.text_windows}
+
+        mw.file_manager.switch_scene_from_data(scene_b)
+        qapp.processEvents()
+
+        after = {w.uuid: w for w in mw.text_windows}
+        assert set(after) == {"keep", "moved", "new"}
+        assert after["keep"] is before["keep"]
+        assert after["moved"] is before["moved"]
+        assert after["moved"].text == "Moved!"
+        assert after["moved"].x() == 300
+        pairs = {(c.start_window.uuid, c.end_window.uuid) for c in mw.window_manager.connectors}
+        assert pairs == {("keep", "new")}
+    finally:
+        mw.window_manager.clear_all()
+        mw.close()
+
+
+def test_progressive_load_keeps_scene_order(qapp):
+    """段階的読み込みは表示優先度順に生成するが、保存順（管理リストの並び）は読み込み元と同じになる。"""
+    mw = MainWindow()
+    try:
+        specs = [
+            {
+                "type": "text",
+                "uuid": f"w{i}",
+                "text": f"Note {i}",
+                "position": {"x": 10 * i, "y": 20},
+                "is_hidden": i % 2 == 0,
+            }
+            for i in range(50)
+        ]
+
+        mw.file_manager.load_scene_from_data(
+            {"format_version": 1, "windows": specs, "connections": []}, progressive=True
+        )
+        mw.file_manager.finish_scene_loading()
+
+        saved = mw.file_manager.get_scene_data()
+        assert [w["uuid"] for w in saved["windows"]] == [s["uuid"] for s in specs]
+    finally:
+        mw.window_manager.clear_all()
+        mw.close()
+
+
+def test_scene_switch_matches_fresh_load_and_order(qapp):
+    """再利用ウィンドウも新規読み込みと同じ config・切替先シーンと同じ並びになる。"""
+    mw = MainWindow()
+    try:
+        scene_a = {
+            "format_version": 1,
+            "windows": [
+                {"type": "text", "uuid": "a", "text": "A", "tags": ["old"], "font_size": 77},
+                {"type": "text", "uuid": "b", "text": "B"},
+            ],
+            "connections": [],
+        }
+        # 旧版・部分的なデータ: tags / font_size を持たない
+        scene_b = {
+            "format_version": 1,
+            "windows": [
+                {"type": "text", "uuid": "b", "text": "B"},
+                {"type": "text", "uuid": "new", "text": "New"},
+                {"type": "text", "uuid": "a", "text": "A"},
+            ],
+            "connections": [],
+        }
+
+        mw.file_manager.load_scene_from_data(scene_a)
+        reused = mw.text_windows[0]
+        mw.file_manager.switch_scene_from_data(scene_b)
+        qapp.processEvents()
+
+        assert [w.uuid for w in mw.text_windows] == ["b", "new", "a"]
+        assert mw.text_windows[2] is reused
+        switched = {w["uuid"]: w for w in mw.file_manager.get_scene_data()["windows"]}
+
+        mw.window_manager.clear_all()
+        mw.file_manager.load_scene_from_data(scene_b)
+        fresh = {w["uuid"]: w for w in mw.file_manager.get_scene_data()["windows"]}
+
+        ignored = ("created_at", "updated_at")
+        for uuid in ("a", "b"):
+            assert {k: v for k, v in switched[uuid].items() if k not in ignored} == {
+                k: v for k, v in fresh[uuid].items() if k not in ignored
+            }
+    finally:
+        mw.window_manager.clear_all()
+        mw.close()
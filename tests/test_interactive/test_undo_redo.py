@@ -56,3 +56,24 @@ def test_undo_redo_move(qapp):
 
     finally:
         mw.close()
+
+
+def test_property_undo_reaches_only_the_owning_main_window(qapp):
+    """プロパティの Undo/Redo は、対象を所有する MainWindow のバスにだけ流れる。"""
+    owner = MainWindow()
+    other = MainWindow()
+    try:
+        TextActions(owner).add_new_text_window()
+        win = owner.text_windows[0]
+        published = {"owner": [], "other": []}
+        owner.property_change_bus.publish = lambda w, fields=None: published["owner"].append((w, fields))
+        other.property_change_bus.publish = lambda w, fields=None: published["other"].append((w, fields))
+
+        win.set_undoable_property("font_size", 55, None)
+        owner.undo_stack.undo()
+
+        assert published["owner"] == [(win, ("font_size",)), (win, ("font_size",))]
+        assert published["other"] == []
+    finally:
+        other.close()
+        owner.close()
@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+
+from ui.main_window import MainWindow
+from ui.main_window_wiring import MAIN_TAB_SPECS, LazyTabHost
+from ui.mixins.lazy_member_mixin import peek_member
+
+
+def _built_tab_names(mw: MainWindow) -> list[str]:
+    return [attr_name for attr_name, _title, _factory in MAIN_TAB_SPECS if mw.is_lazy_built(attr_name)]
+
+
+def test_only_current_tab_and_no_property_panel_are_built_at_startup(qapp):
+    _ = qapp
+    mw = MainWindow()
+    try:
+        assert _built_tab_names(mw) == ["general_tab"]
+        assert not mw.is_lazy_built("property_panel")
+        assert mw.peek_lazy("info_tab") is None
+        assert isinstance(mw.tabs.widget(5), LazyTabHost)
+
+        # タブの選択で生成し、入れ物の中へ入れる
+        mw.tabs.setCurrentIndex(5)
+        assert mw.is_lazy_built("info_tab")
+        assert mw.tabs.widget(5).widget is mw.info_tab
+
+        # 属性として参照した場合も生成する（hasattr を含む既存の呼び出し側との互換）
+        assert hasattr(mw, "layer_tab")
+        assert mw.tabs.widget(7).widget is mw.layer_tab
+        assert mw.property_panel is mw.peek_lazy("property_panel")
+        assert not hasattr(mw, "no_such_member")
+    finally:
+        mw.close()
+
+
+def test_lazily_built_tab_follows_state_changed_before_creation(qapp):
+    _ = qapp
+    mw = MainWindow()
+    try:
+        mw.is_property_panel_active = True
+        mw._tab_compact_state = {**mw._tab_compact_state, "text": True}
+        assert not mw.is_lazy_built("text_tab")
+
+        text_tab = mw.text_tab
+        assert text_tab.btn_toggle_prop_text.isChecked()
+        assert text_tab._is_compact_mode is True
+    finally:
+        mw.is_property_panel_active = False
+        mw.close()
+
+
+def test_info_tab_builds_index_on_first_show(qapp):
+    _ = qapp
+    mw = MainWindow()
+    try:
+        tab = mw.info_tab
+        assert tab._initial_refresh_pending
+        tab.refresh_data(immediate=True)
+        assert tab._last_refresh_key is None
+
+        mw.tabs.setCurrentIndex(mw.tabs.indexOf(tab.parentWidget()))
+        qapp.processEvents()
+        assert not tab._initial_refresh_pending
+        assert tab._last_refresh_key is not None
+    finally:
+        mw.close()
+
+
+def test_peek_member_falls_back_to_getattr_for_plain_objects():
+    view = SimpleNamespace(text_tab="tab")
+    assert peek_member(view, "text_tab") == "tab"
+    assert peek_member(view, "info_tab") is None
+
+
+def test_hiding_property_panel_does_not_build_it(qapp):
+    _ = qapp
+    mw = MainWindow()
+    try:
+        # 非表示への切り替えではパネルを生成しない
+        mw.is_property_panel_active = True
+        mw.toggle_property_panel()
+        assert mw.is_property_panel_active is False
+        assert not mw.is_lazy_built("property_panel")
+
+        mw.toggle_property_panel()
+        assert mw.is_lazy_built("property_panel")
+        assert mw.property_panel.isVisible()
+
+        mw.toggle_property_panel()
+        assert not mw.property_panel.isVisible()
+    finally:
+        mw.is_property_panel_active = False
+        mw.close()
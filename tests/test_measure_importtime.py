@@ -0,0 +1,75 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts import measure_importtime
+
+_REPORT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   encodings.utf_8
+import time:       300 |        300 |     PIL._version
+import time:       500 |        800 |   PIL
+import time:      2000 |       2000 |   ui.main_window
+import time:      1000 |       3920 | main
+"""
+
+
+def _write_budget(tmp_path: Path, **overrides) -> Path:
+    payload = {
+        "target_module": "main",
+        "samples": 2,
+        "budget": {"median_ms": 5.0, "p95_ms": 6.0},
+        "deferred_modules": ["PIL", "utils.docs"],
+    }
+    payload.update(overrides)
+    path = tmp_path / "budget.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+def test_parse_importtime_reads_self_and_cumulative():
+    sample = measure_importtime.parse_importtime(_REPORT, "main")
+    assert sample.total_us == 3920
+    assert sample.modules["PIL"] == (500, 800)
+    assert "self [us]" not in sample.modules
+
+    with pytest.raises(ValueError):
+        measure_importtime.parse_importtime(_REPORT, "missing")
+
+
+def test_summary_and_violations():
+    fast = measure_importtime.parse_importtime(_REPORT, "main")
+    slow = measure_importtime.parse_importtime(_REPORT.replace("3920 | main", "9000 | main"), "main")
+    summary = measure_importtime.summarize([fast, slow, fast])
+    assert summary["elapsed_ms"]["median"] == pytest.approx(3.92)
+    assert summary["elapsed_ms"]["max"] == pytest.approx(9.0)
+    assert summary["top_cumulative"][0]["module"] == "main"
+
+    assert measure_importtime.find_deferred_violations(summary["imported_modules"], ["PIL", "utils.docs"]) == ["PIL"]
+    budget = measure_importtime.ImportTimeBudget("main", 3, median_ms=3.0, p95_ms=None, deferred_modules=[])
+    assert measure_importtime.find_budget_violations(summary["elapsed_ms"], budget) == ["median 3.9ms > budget 3.0ms"]
+
+
+def test_main_enforces_budget_only_when_requested(monkeypatch, tmp_path: Path):
+    budget_path = _write_budget(tmp_path, deferred_modules=["utils.docs"])
+    slow = measure_importtime.parse_importtime(_REPORT.replace("3920 | main", "9000 | main"), "main")
+    monkeypatch.setattr(measure_importtime, "run_importtime", lambda _base_dir, _target: slow)
+    monkeypatch.delenv(measure_importtime.ENV_PERF_ENFORCE, raising=False)
+
+    args = ["--base-dir", str(tmp_path), "--budget", str(budget_path)]
+    assert measure_importtime.main(args) == 0
+    assert measure_importtime.main([*args, "--enforce", "--output-dir", str(tmp_path / "out")]) == 1
+    report = json.loads(next((tmp_path / "out").glob("importtime_*.json")).read_text(encoding="utf-8"))
+    assert report["budget_violations"] and report["samples"] == 2
+
+
+def test_main_fails_when_deferred_module_is_imported(monkeypatch, tmp_path: Path):
+    budget_path = _write_budget(tmp_path, budget={})
+    sample = measure_importtime.parse_importtime(_REPORT, "main")
+    monkeypatch.setattr(measure_importtime, "run_importtime", lambda _base_dir, _target: sample)
+    assert measure_importtime.main(["--base-dir", str(tmp_path), "--budget", str(budget_path)]) == 1
+
+
+def test_main_skips_without_budget_file(tmp_path: Path):
+    assert measure_importtime.main(["--base-dir", str(tmp_path)]) == 0
@@ -0,0 +1,69 @@
+import os
+
+from managers.operation_log_store import OperationLogStore, sanitize_operation_log_entry
+
+
+def _entry(i: int) -> dict:
+    return {"at": f"2026-02-10T10:{i % 60:02d}:00", "action": "bulk_star", "target_count": i + 1, "detail": "x" * 40}
+
+
+def test_sanitize_rejects_invalid_entries():
+    assert sanitize_operation_log_entry({"at": "t", "action": "a", "target_count": 0}) is None
+    assert sanitize_operation_log_entry({"at": "", "action": "a", "target_count": 1}) is None
+    assert sanitize_operation_log_entry("nope") is None
+    assert sanitize_operation_log_entry({"at": "t", "action": "a", "target_count": "2", "detail": "d" * 200}) == {
+        "at": "t",
+        "action": "a",
+        "target_count": 2,
+        "detail": "d" * 80,
+    }
+
+
+def test_memory_only_store_keeps_ring_buffer():
+    store = OperationLogStore(buffer_size=3)
+    for i in range(5):
+        assert store.append(_entry(i))
+    assert not store.append({"action": "broken"})
+    assert [e["target_count"] for e in store.recent()] == [3, 4, 5]
+    assert [e["target_count"] for e in store.read_page(1, 5)] == [4, 3]
+    assert store.count() == 3 and store.revision == 5
+
+
+def test_rotates_and_pages_newest_first_across_backups(tmp_path):
+    path = str(tmp_path / "operation_logs.jsonl")
+    store = OperationLogStore(path, max_bytes=1024, backup_count=2, buffer_size=10)
+    for i in range(40):
+        store.append(_entry(i))
+
+    assert os.path.exists(f"{path}.1") and os.path.exists(f"{path}.2")
+    assert not os.path.exists(f"{path}.3")
+    assert all(os.path.getsize(p) <= 1024 for p in (path, f"{path}.1", f"{path}.2"))
+
+    total = store.count()
+    assert 10 < total < 40
+    newest_first = []
+    offset = 0
+    while page := store.read_page(offset, 7):
+        newest_first.extend(e["target_count"] for e in page)
+        offset += len(page)
+    assert len(newest_first) == total
+    assert newest_first == list(range(40, 40 - total, -1))
+    assert [e["target_count"] for e in store.recent()] == list(range(31, 41))
+
+
+def test_reload_restores_recent_and_skips_truncated_lines(tmp_path):
+    path = str(tmp_path / "operation_logs.jsonl")
+    store = OperationLogStore(path, buffer_size=5)
+    store.extend([_entry(i) for i in range(3)])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"at":"2026-02-10T10:59:00","act')
+
+    reloaded = OperationLogStore(path, buffer_size=5)
+    assert [e["target_count"] for e in reloaded.recent()] == [1, 2, 3]
+    assert reloaded.count() == 3
+    reloaded.append(_entry(9))
+    assert [e["target_count"] for e in OperationLogStore(path).read_page(0, 2)] == [10, 3]
+
+    reloaded.clear()
+    assert not os.path.exists(path)
+    assert reloaded.recent() == [] and reloaded.read_page(0, 10) == []
@@ -0,0 +1,117 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from scripts import measure_phase9e
+from scripts.utils import process_memory
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def _result(scenario_id: str, *, median: float, p95: float, peak_rss_mb: float) -> measure_phase9e.ScenarioResult:
+    return measure_phase9e.ScenarioResult(
+        scenario_id=scenario_id,
+        name=scenario_id,
+        status="ok",
+        warmup=0,
+        samples=1,
+        elapsed_ms={"median": median, "p95": p95, "max": p95, "min": median},
+        counters={},
+        peak_rss_mb=peak_rss_mb,
+    )
+
+
+def test_perf_contract_scenarios_exist_and_enforced_ones_have_thresholds() -> None:
+    known = {spec.scenario_id for spec in measure_phase9e._scenario_specs()}
+    contract = json.loads((BASE_DIR / "config/perf/phase9e_scenarios.json").read_text(encoding="utf-8"))
+    rules = measure_phase9e._load_threshold_rules(BASE_DIR / measure_phase9e.DEFAULT_THRESHOLDS_RELATIVE_PATH)
+
+    assert set(contract["ci_default_scenarios"]) <= known
+    assert set(contract["enforce_target_scenarios"]) <= set(rules)
+    assert set(rules) <= known
+
+
+def test_threshold_rules_accept_optional_peak_rss(tmp_path: Path) -> None:
+    path = tmp_path / "thresholds.json"
+    path.write_text(
+        json.dumps(
+            {
+                "scenarios": {
+                    "P9E-S17": {"median_ms": 10.0, "p95_ms": 20.0, "peak_rss_mb": 100.0},
+                    "P9E-S19": {"median_ms": 10.0, "p95_ms": 20.0},
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    rules = measure_phase9e._load_threshold_rules(path)
+    assert rules["P9E-S17"]["peak_rss_mb"] == 100.0
+    assert "peak_rss_mb" not in rules["P9E-S19"]
+
+    path.write_text(
+        json.dumps({"scenarios": {"P9E-S17": {"median_ms": 1.0, "p95_ms": 1.0, "peak_rss_mb": 0}}}), encoding="utf-8"
+    )
+    with pytest.raises(ValueError):
+        measure_phase9e._load_threshold_rules(path)
+
+
+def test_peak_rss_threshold_is_skipped_when_rss_is_unavailable() -> None:
+    rules = {"P9E-S17": {"median_ms": 10.0, "p95_ms": 20.0, "samples": 0.0, "peak_rss_mb": 100.0}}
+
+    violations, matched = measure_phase9e._collect_threshold_violations(
+        [_result("P9E-S17", median=5.0, p95=6.0, peak_rss_mb=150.0)], rules
+    )
+    assert matched == {"P9E-S17"}
+    assert violations == ["P9E-S17: peak RSS 150.0MB > threshold 100.0MB"]
+
+    violations, _ = measure_phase9e._collect_threshold_violations(
+        [_result("P9E-S17", median=5.0, p95=6.0, peak_rss_mb=0.0)], rules
+    )
+    assert violations == []
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="per-scenario reset uses /proc")
+def test_process_memory_reports_peak_rss() -> None:
+    assert process_memory.reset_peak_rss()
+    assert process_memory.peak_rss_mb() > 0
+    assert process_memory.maxrss_to_mb(2048) == (2.0 if sys.platform != "darwin" else 0.0)
+
+
+def test_scene_scenarios_report_time_and_peak_rss(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.delenv(measure_phase9e.ENV_PERF_ENFORCE, raising=False)
+    output_dir = tmp_path / "perf"
+    args = ["--base-dir", str(BASE_DIR), "--output-dir", str(output_dir), "--warmup", "0", "--samples", "2"]
+    for scenario_id in ("P9E-S17", "P9E-S18", "P9E-S21", "P9E-S24"):
+        args.extend(["--scenario", scenario_id])
+
+    assert measure_phase9e.main(args) == 0
+
+    payload = json.loads(next(output_dir.glob("phase9e_measurement_*.json")).read_text(encoding="utf-8"))
+    assert payload["meta"]["peak_rss_scope"] in {"scenario", "process"}
+    assert payload["meta"]["workload_seed"] == measure_phase9e.WORKLOAD_SEED
+    by_id = {entry["id"]: entry for entry in payload["scenarios"]}
+    for entry in by_id.values():
+        assert entry["status"] == "ok", entry["error"]
+        assert entry["elapsed_ms"]["p95"] >= entry["elapsed_ms"]["median"] > 0
+        assert "peak_rss_mb" in entry
+        assert "peak_rss_mb" not in entry["counters"]
+
+    cold_start = by_id["P9E-S17"]["counters"]
+    assert cold_start["first_paint_ms"] >= cold_start["import_ms"] > 0
+    assert by_id["P9E-S18"]["counters"] == {"window_count": 10, "image_window_count": 2, "progressive": 0}
+    assert by_id["P9E-S21"]["counters"]["reused_window_count"] == 5
+    assert by_id["P9E-S21"]["counters"]["window_count"] == 10
+    assert by_id["P9E-S24"]["counters"]["cache_misses"] == 1
+    assert by_id["P9E-S24"]["counters"]["project_bytes"] > 0
+
+
+def test_config_hydration_scenario_compares_per_field_and_bulk_paths() -> None:
+    counters = measure_phase9e._scenario_s09_config_hydration()()
+
+    assert counters["hydrated_count"] == 100
+    assert counters["mismatched_count"] == 0
+    assert counters["per_field_ms"] > 0 and counters["bulk_ms"] > 0
+    # 一括適用は検証1回で済むため、フィールド単位の代入より速い
+    assert counters["per_field_to_bulk_ratio"] > 1.0
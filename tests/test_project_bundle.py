@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from PIL import Image
+from PySide6.QtCore import QPoint
+from PySide6.QtGui import QAction
+
+from managers import project_bundle
+from managers.file_manager import FileManager
+from managers.project_bundle import (
+    MANIFEST_NAME,
+    ProjectBundle,
+    ensure_bundle_image,
+    extract_deferred_bundle_images,
+    is_project_bundle,
+    iter_window_specs,
+    write_project_bundle,
+)
+from windows.image_window import ImageWindow
+
+
+def _make_image(path: Path, color: tuple[int, int, int], size: tuple[int, int] = (640, 320)) -> str:
+    Image.new("RGB", size, color).save(path)
+    return str(path)
+
+
+def _project(red: str, blue: str, missing: str) -> dict:
+    def image(uuid: str, path: str) -> dict:
+        return {"type": "image", "uuid": uuid, "image_path": path}
+
+    return {
+        "type": "ftiv_project",
+        "version": "1.0",
+        "scenes": {
+            "cat": {
+                "s1": {"windows": [image("a", red), image("b", blue)], "connections": []},
+                "s2": {"windows": [image("c", red), image("d", missing)], "connections": []},
+            }
+        },
+        "current_state": {"windows": [image("e", red), {"type": "text", "uuid": "t", "text": "x"}]},
+    }
+
+
+@pytest.fixture(autouse=True)
+def _reset_deferred_images():
+    project_bundle._deferred_members.clear()
+    yield
+    project_bundle._deferred_members.clear()
+
+
+@pytest.fixture
+def images(tmp_path: Path) -> tuple[str, str, str]:
+    src = tmp_path / "src"
+    src.mkdir()
+    red = _make_image(src / "red.png", (255, 0, 0))
+    # 同じ内容を別名で置いても1つにまとめられる
+    red_copy = src / "red_copy.png"
+    red_copy.write_bytes(Path(red).read_bytes())
+    blue = _make_image(src / "blue.png", (0, 0, 255))
+    return str(red_copy), blue, str(src / "missing.png")
+
+
+def test_zip_bundle_dedups_images_and_round_trips(tmp_path: Path, images) -> None:
+    red, blue, missing = images
+    project = _project(red, blue, missing)
+    path = tmp_path / "project.ftivz"
+
+    manifest = write_project_bundle(str(path), project)
+
+    assert is_project_bundle(str(path))
+    assert len(manifest["images"]) == 2
+    with zipfile.ZipFile(path) as zf:
+        names = set(zf.namelist())
+    assert sum(n.startswith("images/") for n in names) == 2
+    assert sum(n.startswith("previews/") for n in names) == 2
+    assert project["current_state"]["windows"][0]["image_path"] == red
+
+    with ProjectBundle(str(path)) as bundle:
+        data = bundle.load_project(str(tmp_path / "cache"))
+
+    specs = {w["uuid"]: w for w in iter_window_specs(data)}
+    assert ensure_bundle_image(specs["a"]["image_path"]) and ensure_bundle_image(specs["b"]["image_path"])
+    assert Path(specs["a"]["image_path"]).read_bytes() == Path(red).read_bytes()
+    assert specs["a"]["image_path"] == specs["c"]["image_path"] == specs["e"]["image_path"]
+    assert Path(specs["b"]["image_path"]).read_bytes() == Path(blue).read_bytes()
+    assert specs["d"]["image_path"] == missing
+
+
+def test_previews_are_attached_to_current_windows_only(tmp_path: Path, images) -> None:
+    red, blue, missing = images
+    path = tmp_path / "project.ftivz"
+    write_project_bundle(str(path), _project(red, blue, missing))
+
+    with ProjectBundle(str(path)) as bundle:
+        data = bundle.load_project(str(tmp_path / "cache"))
+
+    current = data["current_state"]["windows"][0]
+    with Image.open(current["_preview_path"]) as preview:
+        assert max(preview.size) <= 256
+    assert current["_preview_size"] == [640, 320]
+    assert all("_preview_path" not in w for w in data["scenes"]["cat"]["s1"]["windows"])
+
+
+def test_second_open_reuses_extracted_images(tmp_path: Path, images) -> None:
+    red, blue, missing = images
+    path = tmp_path / "project.ftivz"
+    write_project_bundle(str(path), _project(red, blue, missing), include_previews=False)
+    cache = str(tmp_path / "cache")
+
+    with ProjectBundle(str(path)) as first:
+        first.load_project(cache)
+    assert extract_deferred_bundle_images() == 2
+    with ProjectBundle(str(path)) as second:
+        second.load_project(cache)
+
+    assert (first.extracted_count, first.deferred_count, first.reused_count) == (0, 2, 0)
+    assert (second.extracted_count, second.deferred_count, second.reused_count) == (0, 0, 2)
+
+
+def test_images_are_extracted_only_when_first_needed(tmp_path: Path, images) -> None:
+    red, blue, missing = images
+    path = tmp_path / "project.ftivz"
+    write_project_bundle(str(path), _project(red, blue, missing))
+    cache = tmp_path / "cache"
+
+    with ProjectBundle(str(path)) as bundle:
+        data = bundle.load_project(str(cache))
+
+    specs = {w["uuid"]: w for w in iter_window_specs(data)}
+    # プレビューは current_state の画像（赤）の分だけ、本体はまだ展開しない
+    assert not (cache / "images").exists()
+    assert len(list((cache / "previews").iterdir())) == 1
+
+    # zip を閉じた後でも、最初に必要になった時点で展開できる
+    assert ensure_bundle_image(specs["e"]["image_path"])
+    assert Path(specs["e"]["image_path"]).read_bytes() == Path(red).read_bytes()
+    assert not Path(specs["b"]["image_path"]).exists()
+    assert project_bundle.has_deferred_bundle_images()
+
+    # 未展開のままバンドルを保存し直しても画像は欠けない
+    manifest = write_project_bundle(str(tmp_path / "again.ftivz"), data)
+    assert len(manifest["images"]) == 2
+
+    assert extract_deferred_bundle_images() == 0
+    assert not project_bundle.has_deferred_bundle_images()
+    assert Path(specs["b"]["image_path"]).read_bytes() == Path(blue).read_bytes()
+
+
+def test_directory_bundle_opens_from_manifest(tmp_path: Path, images) -> None:
+    red, blue, missing = images
+    root = tmp_path / "bundle"
+    write_project_bundle(str(root), _project(red, blue, missing), as_zip=False)
+
+    assert is_project_bundle(str(root))
+    with ProjectBundle(str(root / MANIFEST_NAME)) as bundle:
+        data = bundle.load_project(str(tmp_path / "unused"))
+
+    assert data["current_state"]["windows"][0]["image_path"].startswith(str(root))
+    assert not (tmp_path / "unused").exists()
+
+
+def test_invalid_bundle_raises(tmp_path: Path) -> None:
+    path = tmp_path / "broken.ftivz"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("project.json", "{}")
+    with pytest.raises(ValueError):
+        ProjectBundle(str(path))
+
+
+def test_file_manager_applies_bundle_project(tmp_path: Path, images) -> None:
+    red, blue, missing = images
+    path = tmp_path / "project.ftivz"
+    write_project_bundle(str(path), _project(red, blue, missing))
+    mw = MagicMock()
+    fm = FileManager(mw)
+    fm.save_scenes_db = MagicMock()
+    fm.load_scene_from_data = MagicMock()
+
+    with ProjectBundle(str(path)) as bundle:
+        assert fm._apply_project_data(bundle.load_project(str(tmp_path / "cache")))
+
+    assert set(mw.scenes["cat"]) == {"s1", "s2"}
+    mw.window_manager.clear_all.assert_called_once()
+    current = fm.load_scene_from_data.call_args.args[0]
+    assert current["windows"][0]["_preview_path"].endswith(".png")
+    assert fm._apply_project_data("not a project") is False
+
+
+def _image_window() -> ImageWindow:
+    mw = MagicMock()
+    mw.undo_action = QAction("Undo", None)
+    mw.redo_action = QAction("Redo", None)
+    return ImageWindow(mw, "", position=QPoint(0, 0))
+
+
+def test_image_window_shows_preview_then_decodes_when_shown(qapp, tmp_path: Path, monkeypatch) -> None:
+    preview = _make_image(tmp_path / "preview.png", (0, 255, 0), (64, 32))
+    full = _make_image(tmp_path / "full.png", (0, 0, 255), (40, 20))
+    monkeypatch.setattr(
+        "windows.image_window.QProgressDialog", MagicMock(side_effect=AssertionError("no progress dialog"))
+    )
+    window = _image_window()
+    window.image_path = full
+
+    assert window.show_preview(preview, [640, 320])
+    assert window.frames[0].width() == 640 and window.frames[0].height() == 320
+    assert window.has_pending_full_image()
+    # 表示されるまではデコードしない
+    qapp.processEvents()
+    assert window.has_pending_full_image()
+
+    window.show()
+    qapp.processEvents()
+    assert not window.has_pending_full_image()
+    assert (window.frames[0].width(), window.frames[0].height()) == (40, 20)
+    assert not window.show_preview(str(tmp_path / "nope.png"))
+    window.close()
+    window.deleteLater()
+
+
+def test_deferred_decodes_are_paced_one_per_tick(qapp, tmp_path: Path) -> None:
+    from windows import image_window
+
+    preview = _make_image(tmp_path / "preview.png", (0, 255, 0), (64, 32))
+    full = _make_image(tmp_path / "full.png", (0, 0, 255), (40, 20))
+    windows = [_image_window() for _ in range(3)]
+    decoder = image_window._deferred_decoder()
+    try:
+        for window in windows:
+            window.image_path = full
+            window.show()
+            assert window.show_preview(preview, [40, 20])
+
+        # 1周につき1枚だけデコードし、残りは次の周へ回す
+        decoder._decode_next()
+        assert [w.has_pending_full_image() for w in windows] == [False, True, True]
+        for _ in range(10):
+            qapp.processEvents()
+        assert not any(w.has_pending_full_image() for w in windows)
+    finally:
+        for window in windows:
+            window.close()
+            window.deleteLater()
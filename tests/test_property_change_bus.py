@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+
+from managers.property_change_bus import CHANGE_CATEGORIES, PropertyChangeBus, categorize_field, categorize_fields
+from models.window_config import ImageWindowConfig, TextWindowConfig
+
+
+def _window(uuid: str = "w1") -> SimpleNamespace:
+    return SimpleNamespace(uuid=uuid, config=TextWindowConfig(uuid=uuid))
+
+
+def test_fields_are_categorized():
+    assert categorize_field("due_at") == "metadata"
+    assert categorize_field("position") == "geometry"
+    assert categorize_field("move_speed") == "animation"
+    assert categorize_field("animation_speed_factor") == "animation"
+    assert categorize_field("font_color") == "visual"
+    assert categorize_fields(["text", "is_hidden"]) == {"metadata", "geometry"}
+    assert categorize_fields(None) == CHANGE_CATEGORIES
+
+
+def test_config_reports_changed_fields_once():
+    config = ImageWindowConfig()
+    config.opacity = 0.5
+    config.geometry = {**config.geometry}
+    config.opacity = 0.5
+    assert config.take_changed_fields() == {"opacity", "geometry"}
+    assert config.take_changed_fields() == frozenset()
+    config.mark_dirty("tags")
+    config.mark_dirty()
+    assert config.take_changed_fields() == {"tags"}
+
+
+def test_publishes_coalesce_per_tick_and_filter_by_category(qapp):
+    bus = PropertyChangeBus(synchronous=False)
+    everything, metadata_only = [], []
+    bus.subscribe(everything.append)
+    bus.subscribe(metadata_only.append, categories=("metadata",))
+    window, other = _window("w1"), _window("w2")
+    window.config.take_changed_fields()
+    other.config.take_changed_fields()
+
+    window.config.font_size = 12
+    bus.publish(window)
+    window.config.text = "hello"
+    bus.publish(window)
+    bus.publish(window, ("font_size",))
+    other.config.position = {"x": 1, "y": 2}
+    bus.publish(other)
+    assert everything == []
+
+    for _ in range(5):
+        qapp.processEvents()
+
+    assert len(everything) == 1
+    first, second = everything[0]
+    assert first.window is window and first.fields == {"font_size", "text"}
+    assert first.categories == {"visual", "metadata"}
+    assert second.fields == {"position"} and second.affects("geometry")
+    assert [[e.window for e in batch] for batch in metadata_only] == [[window]]
+    assert bus.published_count == 4 and bus.delivered_count == 2
+
+
+def test_unchanged_and_replaced_configs(qapp):
+    _ = qapp
+    bus = PropertyChangeBus(synchronous=True)
+    received = []
+    bus.subscribe(received.extend)
+    window = _window()
+    window.config.take_changed_fields()
+
+    # 初回は直前までの変更記録を、以後は config の変更だけを流す（何も変わっていなければ配らない）
+    bus.publish(window)
+    assert received == []
+
+    window.config = window.config.with_updates({"text": "loaded"})
+    bus.publish(window)
+    assert len(received) == 1
+    assert received[0].fields is None and received[0].touches("due_at")
+    assert received[0].categories == CHANGE_CATEGORIES
+
+    bus.forget(window)
+    bus.publish(object())
+    assert len(received) == 2 and received[1].fields is None
@@ -109,3 +109,17 @@ class TestResetManager:
         elif filename == "overlay_settings.json":
             return os.path.join(base_dir, "json", filename)
         return os.path.join(base_dir, "json", filename)
+
+    def test_user_data_reset_removes_sharded_scene_store(self, mock_env):
+        base_dir, _ = mock_env
+        scenes_dir = os.path.join(base_dir, "json", "scenes")
+        os.makedirs(scenes_dir, exist_ok=True)
+        with open(os.path.join(scenes_dir, "index.json"), "w") as f:
+            f.write('{"schema_version": 1, "categories": {}}')
+
+        manager = ResetManager(base_dir=base_dir)
+        assert manager.perform_factory_reset(reset_settings=False, reset_user_data=True)
+
+        assert not os.path.exists(scenes_dir)
+        backups = os.listdir(os.path.join(base_dir, "backups"))
+        assert os.path.exists(os.path.join(base_dir, "backups", backups[0], "scenes", "index.json"))
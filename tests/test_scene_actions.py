@@ -17,6 +17,7 @@ def mock_mw():
     mw.scenes = {}
     mw.scene_tab = MagicMock()
     mw.file_manager = MagicMock()
+    mw.file_manager.get_scene.side_effect = lambda category, name: mw.scenes.get(category, {}).get(name)
     return mw
 
 
@@ -35,6 +36,7 @@ class TestAddNewCategory:
         sa.add_new_category()
         assert "TestCat" in mock_mw.scenes
         mock_mw.scene_tab.refresh_category_list.assert_called_once()
+        mock_mw.file_manager.save_scene_category.assert_called_once_with("TestCat")
 
     @patch("ui.controllers.scene_actions.QInputDialog")
     def test_cancel_does_nothing(self, mock_dialog, sa, mock_mw):
@@ -70,6 +72,7 @@ class TestAddNewScene:
         sa.add_new_scene()
         assert "Scene1" in mock_mw.scenes["Cat1"]
         mock_mw.scene_tab.refresh_scene_list.assert_called_once()
+        mock_mw.file_manager.save_scene_entry.assert_called_once_with("Cat1", "Scene1")
 
     @patch("ui.controllers.scene_actions.QMessageBox")
     def test_no_category_warns(self, mock_msg, sa, mock_mw):
@@ -104,13 +107,13 @@ class TestLoadSelectedScene:
         mock_mw.scene_tab.get_current_scene.return_value = "S1"
         mock_mw.scenes["Cat"] = {"S1": {"windows": []}}
         sa.load_selected_scene()
-        mock_mw.file_manager.load_scene_from_data.assert_called_once_with({"windows": []})
+        mock_mw.file_manager.switch_scene_from_data.assert_called_once_with({"windows": []})
 
     def test_no_selection_is_noop(self, sa, mock_mw):
         mock_mw.scene_tab.get_current_category.return_value = None
         mock_mw.scene_tab.get_current_scene.return_value = None
         sa.load_selected_scene()
-        mock_mw.file_manager.load_scene_from_data.assert_not_called()
+        mock_mw.file_manager.switch_scene_from_data.assert_not_called()
 
     def test_no_scene_tab_is_noop(self):
         mw = MagicMock(spec=["scenes", "file_manager"])
@@ -122,7 +125,7 @@ class TestLoadSelectedScene:
         mock_mw.scene_tab.get_current_scene.return_value = "Missing"
         mock_mw.scenes["Cat"] = {}
         sa.load_selected_scene()
-        mock_mw.file_manager.load_scene_from_data.assert_not_called()
+        mock_mw.file_manager.switch_scene_from_data.assert_not_called()
 
 
 # ============================================================
@@ -138,6 +141,7 @@ class TestUpdateSelectedScene:
         mock_mw.file_manager.get_scene_data.return_value = {"new": True}
         sa.update_selected_scene()
         assert mock_mw.scenes["Cat"]["S1"] == {"new": True}
+        mock_mw.file_manager.save_scene_entry.assert_called_once_with("Cat", "S1")
 
     @patch("ui.controllers.scene_actions.QMessageBox")
     def test_cancel_keeps_old_data(self, mock_msg, sa, mock_mw):
@@ -174,6 +178,7 @@ class TestDeleteSelectedItem:
         sa.delete_selected_item()
         assert "S1" not in mock_mw.scenes["Cat"]
         mock_mw.scene_tab.refresh_scene_list.assert_called_once()
+        mock_mw.file_manager.delete_scene_entry.assert_called_once_with("Cat", "S1")
 
     @patch("ui.controllers.scene_actions.QMessageBox")
     def test_delete_category(self, mock_msg, sa, mock_mw):
@@ -184,6 +189,7 @@ class TestDeleteSelectedItem:
         sa.delete_selected_item()
         assert "Cat" not in mock_mw.scenes
         mock_mw.scene_tab.refresh_category_list.assert_called_once()
+        mock_mw.file_manager.delete_scene_category.assert_called_once_with("Cat")
 
     @patch("ui.controllers.scene_actions.QMessageBox")
     def test_cancel_keeps_data(self, mock_msg, sa, mock_mw):
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from managers import scene_format
+from managers.file_manager import FileManager
+from managers.scene_format import (
+    FORMAT_JSON,
+    FORMAT_STREAM,
+    detect_scene_format,
+    iter_scene_stream,
+    read_scene_file,
+    read_scene_stream,
+    write_scene_stream,
+)
+
+
+def _scene(count: int) -> dict:
+    windows = [
+        {
+            "type": "text",
+            "uuid": f"w{i}",
+            "text": f"行 {i}\n二行目",
+            "position": {"x": i, "y": i * 2},
+            "tags": ["a", "タグ"],
+        }
+        for i in range(count)
+    ]
+    connections = [{"from_uuid": f"w{i}", "to_uuid": f"w{i + 1}", "width": 2} for i in range(count - 1)]
+    return {"format_version": 1, "windows": windows, "connections": connections}
+
+
+def test_round_trip_with_legacy_json(tmp_path: Path) -> None:
+    legacy = tmp_path / "scene.json"
+    FileManager(MagicMock())._save_json_atomic(str(legacy), _scene(5))
+    compact = tmp_path / "scene.ftivs"
+
+    write_scene_stream(str(compact), read_scene_file(str(legacy)))
+
+    assert detect_scene_format(str(legacy)) == FORMAT_JSON
+    assert detect_scene_format(str(compact)) == FORMAT_STREAM
+    assert read_scene_file(str(compact)) == read_scene_file(str(legacy))
+    assert compact.stat().st_size < legacy.stat().st_size
+    assert not (tmp_path / "scene.ftivs.tmp").exists()
+
+
+def test_stdlib_fallback_reads_fast_encoder_output(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "scene.ftivs"
+    write_scene_stream(str(path), _scene(3))
+
+    monkeypatch.setattr(scene_format, "_orjson", None)
+    assert scene_format.json_backend() == "json"
+    assert read_scene_stream(str(path)) == _scene(3)
+
+    write_scene_stream(str(path), _scene(4))
+    assert read_scene_stream(str(path)) == _scene(4)
+
+
+def test_reader_yields_windows_before_reading_whole_file(tmp_path: Path) -> None:
+    path = tmp_path / "scene.ftivs"
+    write_scene_stream(str(path), _scene(100))
+    raw = io.BytesIO(path.read_bytes())
+
+    records = iter_scene_stream(raw)
+    assert next(records).data["window_count"] == 100
+    first = next(records)
+
+    assert first.kind == "window" and first.data["uuid"] == "w0"
+    assert raw.tell() < len(raw.getvalue()) // 10
+
+
+def test_invalid_stream_raises(tmp_path: Path) -> None:
+    path = tmp_path / "broken.ftivs"
+    path.write_bytes(b'{"ftiv_scene_stream":1}\n{"not":"a record"}\n')
+    with pytest.raises(ValueError):
+        read_scene_stream(str(path))
+    with pytest.raises(ValueError):
+        list(iter_scene_stream(io.BytesIO(json.dumps({"windows": []}).encode())))
+
+
+def test_file_manager_creates_windows_while_reading(tmp_path: Path) -> None:
+    path = tmp_path / "scene.ftivs"
+    write_scene_stream(str(path), _scene(70))
+    mw = MagicMock()
+    fm = FileManager(mw)
+    mw.window_manager.create_windows.side_effect = lambda specs, select_last: [object() for _ in specs]
+    fm._finish_scene_load = MagicMock()
+
+    fm.load_scene_from_file(str(path))
+
+    chunk_sizes = [len(c.args[0]) for c in mw.window_manager.create_windows.call_args_list]
+    assert chunk_sizes == [32, 32, 6]
+    specs, created, connections = fm._finish_scene_load.call_args.args
+    assert [s["uuid"] for s in specs] == [f"w{i}" for i in range(70)]
+    assert len(created) == 70 and len(connections) == 69
+    mw.window_manager.set_selected_window.assert_called_once_with(created[-1])
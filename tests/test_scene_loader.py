@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from PySide6.QtCore import QRect
+
+from managers.file_manager import FileManager
+from managers.scene_loader import ProgressiveSceneLoader, load_priority
+
+
+class _DummyWindow:
+    def __init__(self, uuid: str, *, is_hidden: bool = False) -> None:
+        self.uuid = uuid
+        self.parent_window_uuid = None
+        self.child_windows: list[_DummyWindow] = []
+        self.config = SimpleNamespace(is_hidden=is_hidden, layer_order=None, layer_offset=None)
+
+    def add_child_window(self, child: "_DummyWindow") -> None:
+        child.parent_window_uuid = self.uuid
+        if child not in self.child_windows:
+            self.child_windows.append(child)
+
+
+class _DummyWindowManager:
+    def __init__(self) -> None:
+        self.text_windows: list[_DummyWindow] = []
+        self.image_windows: list[_DummyWindow] = []
+        self.connectors: list = []
+        self.created_batches: list[list[str]] = []
+        self.selected = None
+
+    def create_windows(self, specs: list[dict], *, select_last: bool = False) -> list[_DummyWindow]:
+        self.created_batches.append([str(s.get("uuid")) for s in specs])
+        result = []
+        for spec in specs:
+            window = _DummyWindow(str(spec.get("uuid")), is_hidden=bool(spec.get("is_hidden", False)))
+            self.text_windows.append(window)
+            result.append(window)
+        return result
+
+    def set_selected_window(self, window) -> None:
+        self.selected = window
+
+
+def _build_file_manager() -> tuple[FileManager, _DummyWindowManager, list[list[dict]]]:
+    wm = _DummyWindowManager()
+    fm = FileManager(SimpleNamespace(window_manager=wm, json_directory="."))
+    restored: list[list[dict]] = []
+    fm._restore_connections = lambda conns: restored.append(list(conns))  # type: ignore[method-assign]
+    return fm, wm, restored
+
+
+def _specs(count: int, **extra) -> list[dict]:
+    return [{"uuid": f"w{i}", "type": "text", **extra} for i in range(count)]
+
+
+def test_load_priority_defers_hidden_and_offscreen() -> None:
+    screen = QRect(0, 0, 1920, 1080)
+    assert load_priority({"position": {"x": 10, "y": 10}}, screen) == 0
+    assert load_priority({"position": {"x": 10, "y": 10}, "is_frontmost": False}, screen) == 1
+    assert load_priority({"position": {"x": 5000, "y": 10}}, screen) == 2
+    assert load_priority({"position": {"x": 10, "y": 10}, "is_hidden": True}, screen) == 3
+    assert load_priority({"is_archived": True}, screen) == 3
+
+
+def test_loader_creates_visible_windows_first(qapp) -> None:
+    fm, wm, _ = _build_file_manager()
+    specs = [
+        {"uuid": "hidden", "type": "text", "is_hidden": True},
+        {"uuid": "back", "type": "text", "is_frontmost": False},
+        {"uuid": "front", "type": "text"},
+    ]
+    loader = ProgressiveSceneLoader(fm, specs, [])
+    first: list[str] = []
+    loader.sig_first_visible.connect(lambda w: first.append(w.uuid))
+
+    loader.finish_now()
+
+    created_order = [uuid for batch in wm.created_batches for uuid in batch]
+    assert created_order == ["front", "back", "hidden"]
+    assert first == ["front"]
+    # 選択は生成順ではなく保存順の最後（従来の一括読み込みと同じ）
+    assert wm.selected is not None and wm.selected.uuid == "front"
+
+
+def test_loader_spreads_creation_across_ticks(qapp) -> None:
+    fm, wm, _ = _build_file_manager()
+    loader = ProgressiveSceneLoader(fm, _specs(20), [])
+    progress: list[tuple[int, int]] = []
+    finished: list[bool] = []
+    loader.sig_progress.connect(lambda done, total: progress.append((done, total)))
+    loader.sig_finished.connect(lambda: finished.append(True))
+
+    loader.start()
+    assert wm.text_windows == []  # 最初の chunk は次の tick
+
+    qapp.processEvents()
+    assert 0 < len(wm.text_windows) < 20
+    for _ in range(100):
+        if finished:
+            break
+        qapp.processEvents()
+
+    assert finished == [True]
+    assert len(wm.text_windows) == 20
+    assert len(wm.created_batches) > 1
+    assert progress[0] == (0, 20)
+    assert progress[-1] == (20, 20)
+
+
+def test_connections_attach_once_both_ends_exist(qapp) -> None:
+    fm, wm, restored = _build_file_manager()
+    specs = [
+        {"uuid": "a", "type": "text"},
+        {"uuid": "b", "type": "text", "is_hidden": True},
+    ]
+    connections = [{"from_uuid": "a", "to_uuid": "b"}]
+    loader = ProgressiveSceneLoader(fm, specs, connections)
+    loader._chunk_size = 1
+
+    loader.start()
+    qapp.processEvents()
+    assert [w.uuid for w in wm.text_windows] == ["a"]
+    assert restored == []
+
+    loader.finish_now()
+    assert restored[0] == connections
+
+
+def test_cancel_stops_further_creation(qapp) -> None:
+    fm, wm, _ = _build_file_manager()
+    loader = ProgressiveSceneLoader(fm, _specs(10), [])
+    loader._chunk_size = 2
+    loader.start()
+    qapp.processEvents()
+    created = len(wm.text_windows)
+
+    loader.cancel()
+    for _ in range(5):
+        qapp.processEvents()
+
+    assert len(wm.text_windows) == created
+    assert not loader.is_running()
+
+
+def test_get_scene_data_completes_pending_progressive_load(qapp) -> None:
+    fm, wm, _ = _build_file_manager()
+    fm.load_scene_from_data({"windows": _specs(6), "connections": []}, progressive=True)
+    assert fm.scene_loader is not None
+
+    fm.finish_scene_loading()
+
+    assert len(wm.text_windows) == 6
+    assert fm.scene_loader is None
+
+
+def test_finished_loader_is_released(qapp) -> None:
+    import gc
+    import weakref
+
+    fm, _, _ = _build_file_manager()
+    fm.load_scene_from_data({"windows": _specs(6), "connections": []}, progressive=True)
+    loader_ref = weakref.ref(fm.scene_loader)
+
+    fm.finish_scene_loading()
+    # 予約済みの tick（singleShot）が掴んでいる参照を流す
+    qapp.processEvents()
+    gc.collect()
+
+    # 生成済みウィンドウを抱えたローダーが残り続けないこと
+    assert loader_ref() is None
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+from managers.file_manager import FileManager
+from managers.scene_store import SceneStore
+
+
+def _write_legacy(path: Path, data: dict) -> None:
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=4), encoding="utf-8")
+
+
+def _scene(n: int) -> dict:
+    return {"format_version": 1, "windows": [{"type": "text", "uuid": f"w{n}", "text": f"scene {n}"}]}
+
+
+def test_migrates_legacy_db_into_shards(tmp_path: Path) -> None:
+    legacy = tmp_path / "scenes_db.json"
+    _write_legacy(legacy, {"Cat": {"A": _scene(1), "B": _scene(2)}, "Empty": {}})
+    store = SceneStore(str(tmp_path / "scenes"), legacy_db_path=str(legacy))
+
+    assert store.load_index() == {"Cat": ["A", "B"], "Empty": []}
+    assert (tmp_path / "scenes" / "index.json").exists()
+    assert len(list((tmp_path / "scenes").glob("*.json"))) == 3  # index + 2 shards
+    assert store.load_scene("Cat", "B") == _scene(2)
+    assert legacy.exists()  # 元ファイルは残す
+
+
+def test_index_takes_precedence_over_legacy(tmp_path: Path) -> None:
+    legacy = tmp_path / "scenes_db.json"
+    _write_legacy(legacy, {"Cat": {"A": _scene(1)}})
+    SceneStore(str(tmp_path / "scenes"), legacy_db_path=str(legacy)).load_index()
+    _write_legacy(legacy, {"Other": {"Z": _scene(9)}})
+
+    store = SceneStore(str(tmp_path / "scenes"), legacy_db_path=str(legacy))
+    assert store.load_index() == {"Cat": ["A"]}
+
+
+def test_save_scene_writes_only_the_changed_shard(tmp_path: Path, monkeypatch) -> None:
+    store = SceneStore(str(tmp_path / "scenes"))
+    store.save_scene("Cat", "A", _scene(1))
+    store.save_scene("Cat", "B", _scene(2))
+
+    written: list[str] = []
+    original = store.writer.submit
+
+    def _spy(path: str, data, **kwargs) -> None:
+        written.append(Path(path).name)
+        original(path, data, **kwargs)
+
+    monkeypatch.setattr(store.writer, "submit", _spy)
+    store.save_scene("Cat", "A", _scene(3))
+
+    assert len(written) == 1
+    assert written[0] != SceneStore.INDEX_FILENAME
+    assert SceneStore(str(tmp_path / "scenes")).load_scene("Cat", "A") == _scene(3)
+
+
+def test_delete_and_replace_all_remove_stale_shards(tmp_path: Path) -> None:
+    root = tmp_path / "scenes"
+    store = SceneStore(str(root))
+    store.save_scene("Cat", "A", _scene(1))
+    store.save_scene("Cat", "B", _scene(2))
+    store.save_scene("Old", "C", _scene(3))
+
+    store.delete_scene("Cat", "A")
+    # B は未読込（None）のまま残し、Old カテゴリは消す
+    store.replace_all({"Cat": {"B": None, "D": _scene(4)}})
+
+    reloaded = SceneStore(str(root))
+    assert reloaded.load_index() == {"Cat": ["B", "D"]}
+    assert reloaded.load_scene("Cat", "B") == _scene(2)
+    assert len(list(root.glob("*.json"))) == 3  # index + B + D
+
+
+def test_rename_category_merges_entries(tmp_path: Path) -> None:
+    store = SceneStore(str(tmp_path / "scenes"))
+    store.save_scene("未分類", "A", _scene(1))
+    store.save_scene("__default__", "B", _scene(2))
+
+    store.rename_category("未分類", "__default__")
+
+    assert store.load_index() == {"__default__": ["B", "A"]}
+    assert store.load_scene("__default__", "A") == _scene(1)
+
+
+def test_file_manager_loads_scene_bodies_lazily(tmp_path: Path) -> None:
+    legacy = tmp_path / "scenes_db.json"
+    _write_legacy(legacy, {"Uncategorized": {"A": _scene(1)}, "Cat": {"B": _scene(2)}})
+    mw = SimpleNamespace(scene_db_path=str(legacy), scenes={}, refresh_scene_tabs=lambda: None)
+    fm = FileManager(mw)
+
+    fm.load_scenes_db()
+    assert mw.scenes == {"__default__": {"A": None}, "Cat": {"B": None}}
+
+    assert fm.get_scene("Cat", "B") == _scene(2)
+    assert mw.scenes["Cat"]["B"] == _scene(2)
+    assert fm.get_scene("Cat", "missing") is None
+
+    mw.scenes["Cat"]["C"] = _scene(3)
+    fm.save_scene_entry("Cat", "C")
+    fm.delete_scene_entry("__default__", "A")
+
+    reloaded = SceneStore(str(tmp_path / "scenes"))
+    assert reloaded.load_index() == {"__default__": [], "Cat": ["B", "C"]}
+
+
+def test_file_manager_indexes_saved_scenes_into_info_store(tmp_path: Path) -> None:
+    from managers.info_index_manager import InfoQuery
+
+    legacy = tmp_path / "scenes_db.json"
+    _write_legacy(legacy, {"Cat": {"A": _scene(1), "B": _scene(2)}})
+    mw = SimpleNamespace(scene_db_path=str(legacy), scenes={}, refresh_scene_tabs=lambda: None)
+    fm = FileManager(mw)
+    fm.load_scenes_db()
+
+    # 未索引のシーンはシャードから取り込む（本体はキャッシュしない）
+    assert fm.backfill_info_store() == 2
+    assert fm.backfill_info_store() == 0
+    assert mw.scenes["Cat"] == {"A": None, "B": None}
+    assert fm.locate_saved_window("w2") == ("Cat", "B")
+
+    mw.scenes["Cat"]["C"] = _scene(3)
+    fm.save_scene_entry("Cat", "C")
+    assert [n.window_uuid for n in fm.info_store.query_notes(InfoQuery(text="scene 3"))] == ["w3"]
+
+    fm.delete_scene_entry("Cat", "A")
+    assert fm.locate_saved_window("w1") is None
+    fm.delete_scene_category("Cat")
+    assert fm.info_store.count() == 0
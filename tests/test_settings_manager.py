@@ -1,4 +1,3 @@
-import os
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,9 +8,10 @@ from managers.settings_manager import SettingsManager
 
 class TestSettingsManager:
     @pytest.fixture
-    def settings_manager(self):
+    def settings_manager(self, tmp_path):
         self.mw = MagicMock()
-        self.mw.base_directory = os.getcwd()  # Default
+        # 保存系のテストがリポジトリの json/ に書き込まないよう一時ディレクトリを使う
+        self.mw.base_directory = str(tmp_path)
         self.mw.windowFlags.return_value = Qt.WindowType.Widget  # Default flags
 
         sm = SettingsManager(self.mw)
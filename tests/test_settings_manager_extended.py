@@ -80,6 +80,29 @@ class TestSaveSettings:
             manager.save_overlay_settings()
             mock_save.assert_not_called()
 
+    def test_background_write_failure_is_reported_on_gui_thread(self, manager, mock_mw, qapp, monkeypatch):
+        from utils import write_behind
+
+        writer = write_behind.JsonWriteBehind(coalesce_sec=0.0, synchronous=False)
+        monkeypatch.setattr("utils.app_settings.get_write_behind", lambda: writer)
+
+        def _broken(*_args, **_kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(write_behind, "write_json_atomic", _broken)
+        manager.app_settings = AppSettings()
+        try:
+            with patch("managers.settings_manager.QMessageBox") as mock_box:
+                manager.save_app_settings()
+                assert writer.wait_idle(timeout=5.0)
+                mock_box.critical.assert_not_called()
+                qapp.processEvents()
+                mock_box.critical.assert_called_once()
+                assert mock_box.critical.call_args.args[0] is mock_mw
+                assert "disk full" in mock_box.critical.call_args.args[2]
+        finally:
+            writer.close()
+
 
 class TestTextArchetype:
     def test_load_archetype_returns_empty_when_no_file(self, manager):
@@ -93,6 +116,22 @@ class TestTextArchetype:
         assert loaded["font"] == "Arial"
         assert loaded["font_size"] == 24
 
+    def test_save_archetype_is_on_disk_before_returning(self, manager, tmp_path, monkeypatch):
+        from utils.write_behind import JsonWriteBehind
+
+        writer = JsonWriteBehind(coalesce_sec=60.0, synchronous=False)
+        monkeypatch.setattr("managers.settings_manager.get_write_behind", lambda: writer)
+        try:
+            assert manager.save_text_archetype({"font_size": 30}) is True
+            assert (tmp_path / "json" / "text_archetype.json").exists()
+
+            # 書き込みに失敗したら False を返す（「保存しました」を出さない）
+            (tmp_path / "file").write_text("not a directory")
+            manager.base_directory = str(tmp_path / "file")
+            assert manager.save_text_archetype({"font_size": 31}) is False
+        finally:
+            writer.close()
+
     def test_load_archetype_corrupted_returns_empty(self, manager, tmp_path):
         json_dir = tmp_path / "json"
         json_dir.mkdir(exist_ok=True)
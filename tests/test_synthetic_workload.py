@@ -0,0 +1,128 @@
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from managers.scene_format import read_scene_file
+from models.enums import ArrowStyle
+from models.window_config import ImageWindowConfig, TextWindowConfig
+from scripts import synthetic_workload
+from scripts.synthetic_workload import PROFILES, WorkloadProfile, generate_workload
+
+
+def _generate(tmp_path: Path, *, seed: int = 7, name: str = "fixtures", **changes):
+    profile = replace(PROFILES["production"], window_count=50, **changes)
+    return generate_workload(profile, seed=seed, fixture_dir=tmp_path / name)
+
+
+def test_same_seed_reproduces_scene_and_fixture_bytes(tmp_path: Path) -> None:
+    first = _generate(tmp_path, name="a")
+    second = _generate(tmp_path, name="b")
+
+    rebased = json.dumps(second.scene).replace(str(tmp_path / "b"), str(tmp_path / "a"))
+    assert json.loads(rebased) == json.loads(json.dumps(first.scene))
+    assert [Path(p).read_bytes() for p in first.image_paths] == [Path(p).read_bytes() for p in second.image_paths]
+
+    other = _generate(tmp_path, seed=8, name="c")
+    assert [w["uuid"] for w in other.scene["windows"]] != [w["uuid"] for w in first.scene["windows"]]
+
+
+def test_ratios_are_applied_as_exact_quotas(tmp_path: Path) -> None:
+    summary = _generate(tmp_path).summary()
+
+    # 50 件中 画像 20% = 10、テキスト 40 件のうちタスク 30% = 12 など
+    assert summary["windows"] == 50
+    assert summary["image_windows"] == 10
+    assert summary["animated_image_windows"] == 3
+    assert summary["task_windows"] == 12
+    assert summary["due_tasks"] == 6
+    assert summary["vertical_windows"] == 4
+    assert summary["outlined_windows"] == 16
+    assert summary["blurred_windows"] == 8
+    assert summary["gradient_windows"] == 8
+    assert summary["hidden_windows"] == 5
+    assert summary["child_windows"] == 15
+    assert summary["connections"] == 5
+
+    plain = _generate(tmp_path, name="plain", **{f: 0.0 for f in ("image_ratio", "child_ratio", "connector_ratio")})
+    assert plain.image_paths == []
+    assert plain.summary()["image_windows"] == plain.summary()["child_windows"] == 0
+
+
+def test_windows_are_valid_configs(tmp_path: Path) -> None:
+    workload = _generate(tmp_path)
+
+    for spec in workload.scene["windows"]:
+        fields = {k: v for k, v in spec.items() if k != "type"}
+        if spec["type"] == "image":
+            assert Path(ImageWindowConfig(**fields).image_path).exists()
+            continue
+        config = TextWindowConfig(**fields)
+        if config.content_mode == "task":
+            assert len(config.task_states) == len(config.text.split("\n"))
+            # タスクモードは横書きのみ
+            assert not config.is_vertical
+
+
+def test_layer_tree_and_connections_are_consistent(tmp_path: Path) -> None:
+    workload = _generate(tmp_path, child_ratio=0.8, max_layer_depth=2, connector_ratio=0.5)
+    windows = workload.scene["windows"]
+    index = {w["uuid"]: i for i, w in enumerate(windows)}
+
+    orders: dict[str, list[int]] = {}
+    for i, window in enumerate(windows):
+        parent = window.get("parent_uuid")
+        if parent:
+            assert index[parent] < i
+            orders.setdefault(parent, []).append(window["layer_order"])
+    for values in orders.values():
+        assert sorted(values) == list(range(len(values)))
+    assert 1 <= workload.summary()["max_layer_depth"] <= 2
+
+    pairs = set()
+    for conn in workload.scene["connections"]:
+        assert conn["from_uuid"] in index and conn["to_uuid"] in index
+        assert conn["from_uuid"] != conn["to_uuid"]
+        assert ArrowStyle(conn["arrow_style"])
+        pairs.add(frozenset((conn["from_uuid"], conn["to_uuid"])))
+    assert len(pairs) == len(workload.scene["connections"]) == 25
+
+
+def test_animated_fixtures_have_multiple_frames(tmp_path: Path) -> None:
+    workload = _generate(tmp_path, image_ratio=1.0, animated_image_ratio=1.0, gif_frames=(3, 3))
+
+    gifs = [p for p in workload.image_paths if p.endswith(".gif")]
+    assert len(gifs) == PROFILES["production"].animated_fixture_count
+    with Image.open(gifs[0]) as image:
+        assert image.is_animated
+        assert image.n_frames == 3
+
+
+def test_profile_validation_and_overrides() -> None:
+    with pytest.raises(ValueError):
+        WorkloadProfile(image_ratio=1.5)
+    with pytest.raises(ValueError):
+        WorkloadProfile(text_lines=(3, 1))
+
+    profile = synthetic_workload.apply_overrides(
+        PROFILES["plain"], ["image_ratio=0.5", "window_count=12", "text_lines=2,4"]
+    )
+    assert (profile.image_ratio, profile.window_count, profile.text_lines) == (0.5, 12, (2, 4))
+    with pytest.raises(ValueError):
+        synthetic_workload.apply_overrides(profile, ["unknown=1"])
+
+
+def test_cli_writes_scene_and_fixtures(tmp_path: Path, capsys) -> None:
+    out = tmp_path / "out"
+    args = ["--output-dir", str(out), "--windows", "20", "--seed", "3", "--scene-name", "scene.ftivs"]
+
+    assert synthetic_workload.main(args) == 0
+
+    scene = read_scene_file(str(out / "scene.ftivs"))
+    assert len(scene["windows"]) == 20
+    assert any((out / "fixtures").iterdir())
+    assert '"windows": 20' in capsys.readouterr().out
+
+    assert synthetic_workload.main(["--output-dir", str(out), "--set", "image_ratio=2"]) == 2
@@ -5,6 +5,7 @@
 初期化、プロパティ、prune、基本的なデータ操作に集中。
 """
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -115,6 +116,223 @@ class TestPruneInvalidRefs:
         assert len(wm.connectors) == 1
 
 
+class TestEventDrivenDeregistration:
+    """destroyed 購読による登録解除のテスト（全件 prune に依存しない）。"""
+
+    @staticmethod
+    def _make_window(uuid: str):
+        from PySide6.QtCore import QObject
+
+        w = QObject()
+        w.uuid = uuid
+        w.child_windows = []
+        w.connected_lines = []
+        return w
+
+    def test_destroyed_window_is_removed_from_lists(self, wm):
+        import shiboken6
+
+        keep = self._make_window("keep")
+        gone = self._make_window("gone")
+        wm.text_windows = [keep, gone]
+        wm._register_window(keep)
+        wm._register_window(gone)
+
+        shiboken6.delete(gone)
+
+        assert wm.text_windows == [keep]
+
+    def test_destroyed_selected_window_clears_selection(self, wm):
+        import shiboken6
+
+        win = self._make_window("sel")
+        wm.image_windows = [win]
+        wm._register_window(win)
+        wm.last_selected_window = win
+
+        shiboken6.delete(win)
+
+        assert wm.image_windows == []
+        assert wm.last_selected_window is None
+
+    def test_destroyed_window_drops_attached_connectors(self, wm):
+        import shiboken6
+
+        start = self._make_window("s")
+        end = self._make_window("e")
+        conn = MagicMock()
+        conn.start_window = start
+        conn.end_window = end
+        wm.text_windows = [start, end]
+        wm.connectors = [conn]
+        wm._register_window(start)
+
+        shiboken6.delete(start)
+
+        assert wm.connectors == []
+
+    def test_destroyed_connector_is_removed(self, wm):
+        import shiboken6
+        from PySide6.QtCore import QObject
+
+        start = self._make_window("s")
+        end = self._make_window("e")
+        conn = QObject()
+        conn.start_window = start
+        conn.end_window = end
+        start.connected_lines = [conn]
+        end.connected_lines = [conn]
+        wm.connectors = [conn]
+        wm._register_connector(conn)
+
+        shiboken6.delete(conn)
+
+        assert wm.connectors == []
+        assert start.connected_lines == []
+        assert end.connected_lines == []
+
+    def test_destroyed_hook_does_not_keep_window_alive(self, wm):
+        import gc
+        import weakref
+
+        win = self._make_window("closed")
+        wm._register_window(win)
+        ref = weakref.ref(win)
+
+        del win
+        gc.collect()
+
+        assert ref() is None
+
+    def test_set_selected_window_does_not_sweep(self, wm):
+        wm._prune_invalid_refs = MagicMock()
+        wm.text_windows = [MagicMock() for _ in range(50)]
+
+        wm.set_selected_window(wm.text_windows[0])
+
+        wm._prune_invalid_refs.assert_not_called()
+
+
+class TestCreateWindows:
+    """create_windows（一括生成）のオーケストレーションテスト。"""
+
+    @pytest.fixture
+    def batch_wm(self, wm):
+        built: list = []
+
+        def _build(spec, *_args):
+            w = MagicMock()
+            w.uuid = spec.get("uuid", "")
+            w.config.is_hidden = bool(spec.get("is_hidden", False))
+            built.append(w)
+            return w
+
+        wm._build_text_window = MagicMock(side_effect=_build)
+        wm._build_image_window = MagicMock(side_effect=_build)
+        wm._load_text_archetype = MagicMock(return_value={})
+        wm._resume_window_animations = MagicMock()
+        return wm
+
+    def test_results_are_aligned_with_specs(self, batch_wm):
+        specs = [
+            {"type": "text", "uuid": "t1"},
+            {"type": "bogus"},
+            {"image_path": "a.png", "uuid": "i1"},
+        ]
+        with patch("managers.window_manager.is_over_limit", return_value=False):
+            result = batch_wm.create_windows(specs)
+
+        assert [getattr(w, "uuid", None) for w in result] == ["t1", None, "i1"]
+        assert [w.uuid for w in batch_wm.text_windows] == ["t1"]
+        assert [w.uuid for w in batch_wm.image_windows] == ["i1"]
+
+    def test_notifies_once_per_batch(self, batch_wm):
+        added: list = []
+        layer_events: list = []
+        batch_wm.sig_windows_added.connect(added.append)
+        batch_wm.sig_layer_structure_changed.connect(lambda: layer_events.append(1))
+
+        specs = [{"type": "text", "uuid": f"t{i}"} for i in range(5)]
+        with patch("managers.window_manager.is_over_limit", return_value=False):
+            batch_wm.create_windows(specs)
+
+        assert len(added) == 1
+        assert len(added[0]) == 5
+        assert layer_events == [1]
+        batch_wm._load_text_archetype.assert_called_once()
+
+    def test_hidden_windows_are_not_shown(self, batch_wm):
+        with patch("managers.window_manager.is_over_limit", return_value=False):
+            shown, hidden = batch_wm.create_windows(
+                [{"type": "text", "uuid": "a"}, {"type": "text", "uuid": "b", "is_hidden": True}]
+            )
+        shown.show.assert_called_once()
+        hidden.show.assert_not_called()
+
+    def test_limit_skips_remaining_specs(self, batch_wm):
+        with patch("managers.window_manager.is_over_limit", side_effect=lambda count, _limit: count >= 2):
+            result = batch_wm.create_windows([{"type": "text", "uuid": f"t{i}"} for i in range(4)])
+        assert [w is not None for w in result] == [True, True, False, False]
+        assert len(batch_wm.text_windows) == 2
+
+
+class TestApplyConfigValues:
+    """_apply_config_values（config 一括ハイドレーション）のテスト。"""
+
+    def test_swaps_config_in_one_pass(self):
+        from models.window_config import TextWindowConfig
+
+        window = SimpleNamespace(config=TextWindowConfig())
+        original = window.config
+        WindowManager._apply_config_values(window, {"text": "abc", "font_size": 30.0, "type": "text"})
+        assert window.config is not original
+        assert window.config.text == "abc"
+        assert window.config.font_size == 30
+
+    def test_invalid_value_falls_back_to_per_field(self):
+        from models.window_config import TextWindowConfig
+
+        window = SimpleNamespace(config=TextWindowConfig())
+        default_size = window.config.font_size
+        WindowManager._apply_config_values(window, {"text": "abc", "font_size": "huge"})
+        assert window.config.text == "abc"
+        assert window.config.font_size == default_size
+
+
+class TestDiffConfigValues:
+    """_diff_config_values（シーン切替の差分抽出）のテスト。"""
+
+    def test_returns_only_changed_fields(self):
+        from models.window_config import TextWindowConfig
+
+        config = TextWindowConfig(uuid="u1", text="a", font_size=20)
+        spec = config.model_dump(mode="json", exclude_none=True)
+        spec.update({"uuid": "other", "text": "b"})
+        assert WindowManager._diff_config_values(config, spec) == {"text": "b"}
+
+    def test_missing_optional_field_resets_to_none(self):
+        from models.window_config import TextWindowConfig
+
+        config = TextWindowConfig(layer_offset={"x": 1, "y": 2}, parent_uuid="p")
+        spec = TextWindowConfig().model_dump(mode="json", exclude_none=True)
+        changed = WindowManager._diff_config_values(config, spec)
+        assert changed["layer_offset"] is None
+        assert "parent_uuid" not in changed
+
+    def test_missing_fields_are_diffed_against_fresh_load(self):
+        from models.window_config import TextWindowConfig
+
+        config = TextWindowConfig(text="a", tags=["old"], task_states=[True], font_size=99, font_color="#123456")
+        spec = {"uuid": "u1", "text": "a", "position": config.position}
+        changed = WindowManager._diff_config_values(config, spec, {"font_color": "#abcdef"})
+        assert changed["tags"] == []
+        assert changed["task_states"] == []
+        assert changed["font_size"] == TextWindowConfig().font_size
+        # base（Archetype）の値は既定値より優先
+        assert changed["font_color"] == "#abcdef"
+        assert "position" not in changed and "created_at" not in changed
+
+
 class TestSignals:
     def test_selection_changed_signal_exists(self, wm):
         assert hasattr(wm, "sig_selection_changed")
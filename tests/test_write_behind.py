@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from managers.scene_store import SceneStore
+from utils import write_behind
+from utils.write_behind import JsonWriteBehind
+
+
+def _read(path: Path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_background_submits_are_coalesced_per_path(tmp_path: Path) -> None:
+    writer = JsonWriteBehind(coalesce_sec=0.2, synchronous=False)
+    target = tmp_path / "settings.json"
+    try:
+        for i in range(20):
+            writer.submit(str(target), {"n": i}, indent=2)
+
+        assert writer.has_pending(str(target))
+        assert writer.wait_idle(timeout=5.0)
+        assert _read(target) == {"n": 19}
+        assert writer.write_count == 1
+        assert writer.coalesced_count == 19
+        assert not (tmp_path / "settings.json.tmp").exists()
+    finally:
+        writer.close()
+
+
+def test_flush_writes_pending_on_calling_thread(tmp_path: Path) -> None:
+    writer = JsonWriteBehind(coalesce_sec=60.0, synchronous=False)
+    a = tmp_path / "a.json"
+    b = tmp_path / "b.json"
+    try:
+        writer.submit(str(a), {"a": 1})
+        writer.submit(str(b), {"b": 2})
+
+        writer.flush(str(a))
+        assert _read(a) == {"a": 1}
+        assert not b.exists()
+
+        writer.flush()
+        assert _read(b) == {"b": 2}
+        assert not writer.has_pending()
+    finally:
+        writer.close()
+
+
+def test_serialization_runs_off_the_calling_thread(tmp_path: Path, monkeypatch) -> None:
+    writer = JsonWriteBehind(coalesce_sec=0.0, synchronous=False)
+    threads: list[str] = []
+    original = json.dump
+
+    def _spy(*args, **kwargs):
+        threads.append(threading.current_thread().name)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(json, "dump", _spy)
+    try:
+        writer.submit(str(tmp_path / "x.json"), {"x": 1})
+        assert writer.wait_idle(timeout=5.0)
+    finally:
+        writer.close()
+
+    assert threads == ["JsonWriteBehind"]
+
+
+def test_remove_supersedes_pending_write(tmp_path: Path) -> None:
+    writer = JsonWriteBehind(coalesce_sec=60.0, synchronous=False)
+    target = tmp_path / "shard.json"
+    target.write_text("{}", encoding="utf-8")
+    try:
+        writer.submit(str(target), {"late": True})
+        writer.remove(str(target))
+        assert writer.wait_idle(timeout=5.0)
+        assert not target.exists()
+    finally:
+        writer.close()
+
+
+def test_close_flushes_and_switches_to_synchronous(tmp_path: Path) -> None:
+    writer = JsonWriteBehind(coalesce_sec=60.0, synchronous=False)
+    target = tmp_path / "exit.json"
+    writer.submit(str(target), {"v": 1})
+    writer.close()
+    assert _read(target) == {"v": 1}
+
+    writer.submit(str(target), {"v": 2})
+    assert _read(target) == {"v": 2}
+
+
+def test_scene_store_reads_through_pending_writes(tmp_path: Path) -> None:
+    writer = JsonWriteBehind(coalesce_sec=60.0, synchronous=False)
+    root = tmp_path / "scenes"
+    try:
+        store = SceneStore(str(root), writer=writer)
+        store.save_scene("Cat", "A", {"windows": [1]})
+        store.save_scene("Cat", "A", {"windows": [2]})
+        assert store.has_data()
+
+        # 未書き込みでも、読み込み前に対象シャードだけ反映される
+        assert store.load_scene("Cat", "A") == {"windows": [2]}
+
+        writer.flush()
+        assert SceneStore(str(root), writer=writer).load_index() == {"Cat": ["A"]}
+    finally:
+        writer.close()
+
+
+def test_background_failure_reaches_on_error(tmp_path: Path, monkeypatch) -> None:
+    writer = JsonWriteBehind(coalesce_sec=60.0, synchronous=False)
+    target = tmp_path / "fail.json"
+    errors: list[tuple[str, str]] = []
+
+    def _broken(*_args, **_kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(write_behind, "write_json_atomic", _broken)
+    try:
+        writer.submit(str(target), {"v": 1}, on_error=lambda path, e: errors.append((path, str(e))))
+        # 後続の要求にコールバックが無くても、集約前の通知先は保たれる
+        writer.submit(str(target), {"v": 2})
+        writer.flush()
+    finally:
+        monkeypatch.undo()
+        writer.close()
+
+    assert errors == [(str(target), "disk full")]
+    assert not target.exists()
+
+
+def test_write_now_writes_immediately_and_raises(tmp_path: Path) -> None:
+    writer = JsonWriteBehind(coalesce_sec=60.0, synchronous=False)
+    target = tmp_path / "now.json"
+    try:
+        writer.submit(str(target), {"stale": True})
+        writer.write_now(str(target), {"fresh": True}, indent=4)
+        assert _read(target) == {"fresh": True}
+        assert not writer.has_pending(str(target))
+
+        with pytest.raises(OSError):
+            writer.write_now(str(tmp_path / "missing" / "x.json"), {})
+    finally:
+        writer.close()
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from windows.connector import ConnectorLine
 
 from models.constants import AppDefaults
+from ui.mixins.lazy_member_mixin import peek_member
 
 
 class ConnectorActions:
@@ -68,8 +69,8 @@ class ConnectorActions:
 
         # UI/状態のリセット（MainWindow側の変数は維持しているのでここで落とす）
         try:
-            if hasattr(self.mw, "connections_tab"):
-                self.mw.connections_tab.on_selection_changed(None)
+            if (tab := peek_member(self.mw, "connections_tab")) is not None:
+                tab.on_selection_changed(None)
             else:
                 self.mw.last_selected_connector = None
         except Exception as e:
@@ -384,8 +385,8 @@ class ConnectorActions:
 
         # UIのチェック同期は MainWindow の既存ロジックに寄せる（安全）
         try:
-            if hasattr(self.mw, "connections_tab"):
-                self.mw.connections_tab.on_selection_changed(getattr(self.mw, "last_selected_window", None))
+            if (tab := peek_member(self.mw, "connections_tab")) is not None:
+                tab.on_selection_changed(getattr(self.mw, "last_selected_window", None))
             elif hasattr(self.mw, "_conn_on_selection_changed"):
                 self.mw._conn_on_selection_changed(getattr(self.mw, "last_selected_window", None))
         except Exception as e:
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Optional
 
+from ui.mixins.lazy_member_mixin import peek_member
 from utils.error_reporter import ErrorNotifyState, report_unexpected_error
 from utils.translator import tr
 
@@ -171,8 +172,8 @@ class ImageActions:
 
         # UIのチェック表示を実状態に寄せる（保険）
         try:
-            if hasattr(self.mw, "image_tab"):
-                self.mw.image_tab.on_selection_changed(getattr(self.mw, "last_selected_window", None))
+            if (tab := peek_member(self.mw, "image_tab")) is not None:
+                tab.on_selection_changed(getattr(self.mw, "last_selected_window", None))
         except Exception as e:
             report_unexpected_error(self.mw, "Failed to refresh Image tab UI.", e, self._err_state)
 
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import logging
+import os
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
+from managers.operation_log_store import OPERATION_LOG_FILENAME, OperationLogStore
 from utils.due_date import normalize_due_iso
 from utils.error_reporter import ErrorNotifyState, report_unexpected_error
 from utils.tag_ops import merge_tags, normalize_tags
@@ -13,12 +16,42 @@ if TYPE_CHECKING:
     from ui.main_window import MainWindow
 
 
+logger = logging.getLogger(__name__)
+
+
 class InfoActions:
     """Infoタブ向けの操作ロジック。"""
 
     def __init__(self, mw: "MainWindow") -> None:
         self.mw = mw
         self._err_state = ErrorNotifyState()
+        self._operation_log_store: Optional[OperationLogStore] = None
+
+    @property
+    def operation_log_store(self) -> OperationLogStore:
+        """操作ログのストア（初回アクセス時に開き、設定ファイルに残る旧形式の履歴を移す）。"""
+        if self._operation_log_store is None:
+            json_dir = getattr(self.mw, "json_directory", None)
+            path = None
+            if isinstance(json_dir, str) and json_dir and os.getenv("FTIV_TEST_MODE") != "1":
+                path = os.path.join(json_dir, OPERATION_LOG_FILENAME)
+            store = OperationLogStore(path)
+            self._operation_log_store = store
+            self._migrate_legacy_operation_logs(store)
+        return self._operation_log_store
+
+    def _migrate_legacy_operation_logs(self, store: OperationLogStore) -> None:
+        settings = getattr(self.mw, "app_settings", None)
+        legacy = list(getattr(settings, "info_operation_logs", []) or []) if settings is not None else []
+        if not legacy:
+            return
+        try:
+            moved = store.extend(legacy)
+            settings.info_operation_logs = []
+            self._persist_app_settings()
+            logger.info(f"Moved {moved} operation logs out of app settings")
+        except Exception:
+            logger.warning("Failed to migrate operation logs from app settings", exc_info=True)
 
     def _iter_text_windows(self) -> list[Any]:
         wm = getattr(self.mw, "window_manager", None)
@@ -137,12 +170,8 @@ class InfoActions:
             if not action_key:
                 return
 
-            settings = getattr(self.mw, "app_settings", None)
-            if settings is None:
-                return
-
-            logs = list(getattr(settings, "info_operation_logs", []) or [])
-            logs.append(
+            # 設定 JSON 全体ではなく、専用の JSONL へ 1 行だけ追記する
+            self.operation_log_store.append(
                 {
                     "at": datetime.now().isoformat(timespec="seconds"),
                     "action": action_key,
@@ -150,32 +179,35 @@ class InfoActions:
                     "detail": str(detail or "").strip()[:80],
                 }
             )
-            settings.info_operation_logs = logs[-200:]
-            self._persist_app_settings()
         except Exception as e:
             report_unexpected_error(self.mw, "Failed to save operation log", e, self._err_state)
 
+    @property
+    def operation_log_revision(self) -> int:
+        """操作ログが変わるたびに増える番号。"""
+        return self.operation_log_store.revision
+
     def get_operation_logs(self, limit: int | None = None) -> list[dict[str, Any]]:
-        settings = getattr(self.mw, "app_settings", None)
-        logs = list(getattr(settings, "info_operation_logs", []) or []) if settings is not None else []
-        if limit is None:
-            return logs
-        if int(limit) <= 0:
-            return []
-        return logs[-int(limit) :]
+        """直近の操作ログ（古い順）。メモリのリングバッファから返す。"""
+        return self.operation_log_store.recent(limit)
+
+    def get_operation_log_page(self, offset: int = 0, limit: int = 50) -> list[dict[str, Any]]:
+        """操作ログを新しい順にページ単位で返す（ローテーション済みの旧世代まで遡る）。"""
+        return self.operation_log_store.read_page(offset, limit)
 
     def clear_operation_logs(self) -> None:
-        settings = getattr(self.mw, "app_settings", None)
-        if settings is None:
-            return
-        settings.info_operation_logs = []
-        self._persist_app_settings()
+        self.operation_log_store.clear()
         self._refresh_info_tab()
 
     def focus_window(self, window_uuid: str) -> None:
-        """UUID指定のウィンドウを前面化・選択する。"""
+        """UUID指定のウィンドウを前面化・選択する。
+
+        開いていないウィンドウは、保存済みシーンの索引から所属シーンを探して開いてから前面化する。
+        """
         try:
             window = self._find_window(window_uuid)
+            if window is None:
+                window = self._open_owning_scene(window_uuid)
             if window is None:
                 return
 
@@ -191,6 +223,24 @@ class InfoActions:
         except Exception as e:
             report_unexpected_error(self.mw, "Failed to focus window", e, self._err_state)
 
+    def _open_owning_scene(self, window_uuid: str) -> Any:
+        """保存済みシーンからウィンドウを含むシーンを開き、そのウィンドウを返す。"""
+        file_manager = getattr(self.mw, "file_manager", None)
+        if file_manager is None or not hasattr(file_manager, "locate_saved_window"):
+            return None
+        location = file_manager.locate_saved_window(window_uuid)
+        if location is None:
+            return None
+        category, scene_name = location
+        scene_data = file_manager.get_scene(category, scene_name)
+        if not scene_data:
+            return None
+        file_manager.switch_scene_from_data(scene_data)
+        # 段階的読み込みの途中だと対象のウィンドウがまだ無いため、先に完了させる
+        file_manager.finish_scene_loading()
+        logger.info(f"Opened scene for Info item: {category}/{scene_name}")
+        return self._find_window(window_uuid)
+
     def toggle_task(self, item_key: str) -> None:
         """task item_key(uuid:index) を受けて完了状態をトグルする。"""
         try:
@@ -3,6 +3,8 @@ from typing import TYPE_CHECKING, Any, Optional
 
 from PySide6.QtCore import Qt
 
+from ui.mixins.lazy_member_mixin import peek_member
+
 if TYPE_CHECKING:
     from managers.window_manager import WindowManager
     from ui.main_window import MainWindow
@@ -23,6 +25,7 @@ class MainController:
         """シグナル接続をセットアップする。"""
         # Model -> View/Controller (選択変更など)
         self.model.sig_selection_changed.connect(self._on_selection_changed)
+        self.model.sig_windows_added.connect(self._on_windows_added)
 
     # --- Actions Accessors (Dependency Decoupling) ---
     @property
@@ -55,9 +58,11 @@ class MainController:
 
     def _on_selection_changed(self, window: Optional[Any]) -> None:
         """WindowManagerからの選択変更通知を処理する。"""
-        # 1. PropertyPanel の更新
-        if hasattr(self.view, "property_panel"):
-            panel = self.view.property_panel
+        # 1. PropertyPanel の更新（未生成なら、表示が必要になるまで作らない）
+        panel = peek_member(self.view, "property_panel")
+        if panel is None and window and getattr(self.view, "is_property_panel_active", False):
+            panel = getattr(self.view, "property_panel", None)
+        if panel is not None:
             if window:
                 panel.set_target(window)
                 if self.view.is_property_panel_active:
@@ -77,9 +82,18 @@ class MainController:
         self._update_tab_state("connections_tab", window)
         self._update_tab_state("info_tab", window)
 
+    def _on_windows_added(self, windows: list) -> None:
+        """一括生成（シーンロード/複数複製）完了時に、一覧系タブを1回だけ更新する。"""
+        due_scheduler = getattr(self.view, "due_scheduler", None)
+        if due_scheduler is not None:
+            due_scheduler.track_many(windows)
+        info_tab = peek_member(self.view, "info_tab")
+        if info_tab is not None and hasattr(info_tab, "refresh_data"):
+            info_tab.refresh_data()
+
     def _update_tab_state(self, tab_attr: str, window: Optional[Any]) -> None:
-        """タブが選択変更メソッドを持っていれば呼ぶヘルパー。"""
-        tab = getattr(self.view, tab_attr, None)
+        """タブが選択変更メソッドを持っていれば呼ぶヘルパー（未生成のタブは生成時に同期される）。"""
+        tab = peek_member(self.view, tab_attr)
         if tab and hasattr(tab, "on_selection_changed"):
             tab.on_selection_changed(window)
 
@@ -97,7 +111,7 @@ class MainController:
 
             # 全タブのボタン状態更新 (PropertyボタンをONにする)
             for tab_name in ["general_tab", "text_tab", "image_tab"]:
-                tab = getattr(self.view, tab_name, None)
+                tab = peek_member(self.view, tab_name)
                 if tab and hasattr(tab, "update_prop_button_state"):
                     tab.update_prop_button_state(True)
 
@@ -106,9 +120,9 @@ class MainController:
         # モデルの選択状態を更新 (パネルが開いたらそのウィンドウを選択)
         self.model.set_selected_window(window)
 
-        # パネル表示・前面化
-        if hasattr(self.view, "property_panel"):
-            panel = self.view.property_panel
+        # パネル表示・前面化（表示要求なので、未生成ならここで生成する）
+        panel = getattr(self.view, "property_panel", None)
+        if panel is not None:
             if self._is_panel_minimized(panel):
                 panel.showNormal()
             else:
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 from PySide6.QtWidgets import QInputDialog, QMessageBox
 
+from ui.mixins.lazy_member_mixin import peek_member
 from utils.error_reporter import ErrorNotifyState, report_unexpected_error
 from utils.translator import tr
 
@@ -39,11 +40,13 @@ class SceneActions:
                     return
 
                 self.mw.scenes[name] = {}
+                self.mw.file_manager.save_scene_category(name)
                 # UI更新 (SceneTabのrefresh)
-                if hasattr(self.mw, "scene_tab") and hasattr(self.mw.scene_tab, "refresh_category_list"):
-                    self.mw.scene_tab.refresh_category_list()
+                # 未生成のタブは生成時に最新の一覧を読み込むため、生成済みの場合だけ更新する
+                scene_tab = peek_member(self.mw, "scene_tab")
+                if scene_tab is not None and hasattr(scene_tab, "refresh_category_list"):
+                    scene_tab.refresh_category_list()
 
-                # DB保存などがもしあればここで呼ぶ
         except Exception as e:
             report_unexpected_error(self.mw, "Failed to add category", e, self._err_state)
 
@@ -70,16 +73,21 @@ class SceneActions:
                 # 現在のシーン状態を取得して保存
                 scene_data = self.mw.file_manager.get_scene_data()
                 self.mw.scenes[current_category][name] = scene_data
+                # 変更したシーンのシャードだけを書き込む
+                self.mw.file_manager.save_scene_entry(current_category, name)
 
                 # UI更新
-                if hasattr(self.mw, "scene_tab"):
-                    self.mw.scene_tab.refresh_scene_list()
+                if (scene_tab := peek_member(self.mw, "scene_tab")) is not None:
+                    scene_tab.refresh_scene_list()
 
         except Exception as e:
             report_unexpected_error(self.mw, "Failed to add scene", e, self._err_state)
 
     def load_selected_scene(self) -> None:
-        """選択されたシーンをロードする。"""
+        """選択されたシーンへ切り替える。
+
+        共通するウィンドウ（同一 UUID）は再利用し、差分だけを反映する。
+        """
         try:
             if not hasattr(self.mw, "scene_tab"):
                 return
@@ -90,9 +98,10 @@ class SceneActions:
             if not category or not scene_name:
                 return
 
-            scene_data = self.mw.scenes.get(category, {}).get(scene_name)
+            # シーン本体は初回アクセス時にシャードから読み込まれる
+            scene_data = self.mw.file_manager.get_scene(category, scene_name)
             if scene_data:
-                self.mw.file_manager.load_scene_from_data(scene_data)
+                self.mw.file_manager.switch_scene_from_data(scene_data)
 
         except Exception as e:
             report_unexpected_error(self.mw, "Failed to load scene", e, self._err_state)
@@ -121,6 +130,7 @@ class SceneActions:
 
             new_data = self.mw.file_manager.get_scene_data()
             self.mw.scenes[category][scene_name] = new_data
+            self.mw.file_manager.save_scene_entry(category, scene_name)
 
             if hasattr(self.mw, "show_status_message"):
                 self.mw.show_status_message(tr("msg_scene_updated"))
@@ -159,11 +169,13 @@ class SceneActions:
                 # シーン削除
                 if category in self.mw.scenes and scene in self.mw.scenes[category]:
                     del self.mw.scenes[category][scene]
+                    self.mw.file_manager.delete_scene_entry(category, scene)
                     self.mw.scene_tab.refresh_scene_list()
             else:
                 # カテゴリ削除
                 if category in self.mw.scenes:
                     del self.mw.scenes[category]
+                    self.mw.file_manager.delete_scene_category(category)
                     self.mw.scene_tab.refresh_category_list()
 
         except Exception as e:
@@ -4,6 +4,7 @@ from __future__ import annotations
 import logging
 from typing import Any, Optional
 
+from ui.mixins.lazy_member_mixin import peek_member
 from utils.error_reporter import ErrorNotifyState, report_unexpected_error
 from utils.translator import tr
 
@@ -277,8 +278,8 @@ class TextActions:
 
             # UIのチェック状態を実状態に寄せる（MainWindow 側の既存ロジックを呼ぶ）
             try:
-                if hasattr(self.mw, "text_tab"):
-                    self.mw.text_tab.on_selection_changed(getattr(self.mw, "last_selected_window", None))
+                if (tab := peek_member(self.mw, "text_tab")) is not None:
+                    tab.on_selection_changed(getattr(self.mw, "last_selected_window", None))
             except Exception as e:
                 report_unexpected_error(
                     self.mw, "Failed to refresh Text tab UI after visibility action.", e, self._err_state
@@ -371,8 +372,8 @@ class TextActions:
 
             # UIのチェック状態を実状態に寄せる
             try:
-                if hasattr(self.mw, "text_tab"):
-                    self.mw.text_tab.on_selection_changed(getattr(self.mw, "last_selected_window", None))
+                if (tab := peek_member(self.mw, "text_tab")) is not None:
+                    tab.on_selection_changed(getattr(self.mw, "last_selected_window", None))
             except Exception as e:
                 report_unexpected_error(
                     self.mw, "Failed to refresh Text tab UI after layout action.", e, self._err_state
@@ -37,7 +37,7 @@ from utils.font_dialog import choose_font
 from utils.tag_ops import parse_tags_csv
 from utils.translator import tr
 
-from .widgets import Gradient
+from .widgets import Gradient, TagCompleter
 
 
 class BaseTranslatableDialog(QDialog):
@@ -181,7 +181,9 @@ class DatePickerDialog(BaseTranslatableDialog):
 class BulkTagEditDialog(BaseTranslatableDialog):
     """Dialog for bulk add/remove tag editing."""
 
-    def __init__(self, parent: Optional[QWidget] = None) -> None:
+    def __init__(
+        self, parent: Optional[QWidget] = None, tag_provider: Optional[Callable[[str, int], list[str]]] = None
+    ) -> None:
         super().__init__(parent)
         self.setWindowTitle(tr("title_info_bulk_tags"))
 
@@ -198,6 +200,10 @@ class BulkTagEditDialog(BaseTranslatableDialog):
         form.addRow(tr("label_info_bulk_tags_add"), self.edit_add)
         form.addRow(tr("label_info_bulk_tags_remove"), self.edit_remove)
         layout.addLayout(form)
+        if tag_provider is not None:
+            # 既存タグの入力補完（タグ索引の前方一致）
+            self.add_completer = TagCompleter(self.edit_add, tag_provider)
+            self.remove_completer = TagCompleter(self.edit_remove, tag_provider)
 
         self.button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel, self)
         self.button_box.accepted.connect(self.accept)
@@ -217,8 +223,10 @@ class BulkTagEditDialog(BaseTranslatableDialog):
         return parse_tags_csv(self.edit_add.text()), parse_tags_csv(self.edit_remove.text())
 
     @classmethod
-    def ask(cls, parent: Optional[QWidget] = None) -> tuple[list[str], list[str]] | None:
-        dialog = cls(parent=parent)
+    def ask(
+        cls, parent: Optional[QWidget] = None, tag_provider: Optional[Callable[[str, int], list[str]]] = None
+    ) -> tuple[list[str], list[str]] | None:
+        dialog = cls(parent=parent, tag_provider=tag_provider)
         if dialog.exec() != QDialog.Accepted:
             return None
         return dialog.get_values()
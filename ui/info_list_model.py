@@ -0,0 +1,312 @@
+# ui/info_list_model.py
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QObject, Qt, Signal
+from PySide6.QtGui import QBrush, QColor, QFont
+
+from managers.info_index_manager import TaskIndexItem
+
+# 行の種類
+ROW_HEADER = "header"
+ROW_TASK = "task"
+ROW_NOTE = "note"
+ROW_EMPTY = "empty"
+
+# 行データのロール（QTreeWidget 時代の UserRole 割り当てを踏襲）
+ROLE_KEY = Qt.ItemDataRole.UserRole  # タスク: item_key / ノート: window_uuid / 見出し: ""
+ROLE_CHECKED = Qt.ItemDataRole.UserRole + 1  # タスク: done / ノート: is_starred
+ROLE_WINDOW_UUID = Qt.ItemDataRole.UserRole + 2
+ROLE_KIND = Qt.ItemDataRole.UserRole + 3  # "task" / "note"
+
+_GROUP_HEADER_COLORS = {
+    "overdue": "#ff9a9a",
+    "today": "#f5c16c",
+    "starred": "#ffd700",
+}
+
+# アイテム → (表示テキスト, 文字色)
+RowRenderer = Callable[[Any], tuple[str, Optional[QColor]]]
+
+
+class _Row:
+    """モデル内部のノード。見出しは子に行を持ち、タスク/ノート行は葉になる。"""
+
+    __slots__ = ("key", "kind", "item", "label", "group_key", "parent", "row", "children", "display")
+
+    def __init__(self, key: tuple[str, str], kind: str, item: Any = None, label: str = "", group_key: str = "") -> None:
+        self.key = key
+        self.kind = kind
+        self.item = item
+        self.label = label
+        self.group_key = group_key
+        self.parent: Optional[_Row] = None
+        self.row = 0
+        self.children: list[_Row] = []
+        # 描画時に初めて生成する (テキスト, 色)
+        self.display: Optional[tuple[str, Optional[QColor]]] = None
+
+
+def _renumber(rows: list[_Row], start: int = 0) -> None:
+    for position in range(start, len(rows)):
+        rows[position].row = position
+
+
+def _runs(positions: Sequence[int]) -> list[tuple[int, int]]:
+    """昇順の位置リストを連続区間 (first, last) にまとめる。"""
+    runs: list[tuple[int, int]] = []
+    for position in positions:
+        if runs and runs[-1][1] == position - 1:
+            runs[-1] = (runs[-1][0], position)
+        else:
+            runs.append((position, position))
+    return runs
+
+
+class InfoListModel(QAbstractItemModel):
+    """Info タブの一覧モデル（グループ見出し → タスク/ノート行 の 2 階層）。
+
+    一覧は作り直さず、前回との差分（行の削除・追加・並べ替え・内容変更）として
+    ビューへ通知するため、選択・スクロール位置・見出しの開閉が保たれる。
+    行の表示テキストはビューが実際に描画を求めたときに renderer で生成する。
+
+    チェックボックスの操作は値を書き換えず、check_toggled で通知する
+    （実データの更新後に差分として反映される）。
+    """
+
+    check_toggled = Signal(QModelIndex, bool)
+
+    def __init__(self, renderer: RowRenderer, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._renderer = renderer
+        self._root = _Row(("", ""), ROW_HEADER)
+        self._header_colors = {key: QColor(value) for key, value in _GROUP_HEADER_COLORS.items()}
+        # renderer の呼び出し回数（描画の遅延生成を確認するため）
+        self.render_count: int = 0
+
+    # ==========================================
+    # 差分の適用
+    # ==========================================
+
+    def set_items(self, items: Sequence[Any]) -> None:
+        """見出しなしのフラットな一覧を反映する。"""
+        self._apply_children(self._root, [self._make_item_row(item) for item in items])
+
+    def set_groups(self, groups: Sequence[Any]) -> None:
+        """グループ（label / group_key / items を持つ）ごとの見出し付き一覧を反映する。"""
+        rows: list[_Row] = []
+        for group in groups:
+            header = _Row((ROW_HEADER, str(group.group_key)), ROW_HEADER, label=group.label, group_key=group.group_key)
+            header.children = [self._make_item_row(item) for item in group.items]
+            for child in header.children:
+                child.parent = header
+            _renumber(header.children)
+            rows.append(header)
+        self._apply_children(self._root, rows)
+
+    def set_empty(self, text: str) -> None:
+        """該当なしの 1 行だけを表示する。"""
+        self._apply_children(self._root, [_Row((ROW_EMPTY, ""), ROW_EMPTY, label=text)])
+
+    def invalidate_display(self) -> None:
+        """生成済みの表示テキストを破棄して再描画させる（言語切り替え時など）。"""
+        self._invalidate_display(self._root, QModelIndex())
+
+    def _invalidate_display(self, parent: _Row, parent_index: QModelIndex) -> None:
+        for node in parent.children:
+            node.display = None
+            if node.children:
+                self._invalidate_display(node, self.createIndex(node.row, 0, node))
+        if parent.children:
+            self.dataChanged.emit(self.index(0, 0, parent_index), self.index(len(parent.children) - 1, 0, parent_index))
+
+    @staticmethod
+    def _make_item_row(item: Any) -> _Row:
+        if isinstance(item, TaskIndexItem):
+            return _Row((ROW_TASK, item.item_key), ROW_TASK, item)
+        return _Row((ROW_NOTE, item.window_uuid), ROW_NOTE, item)
+
+    def _apply_children(self, parent: _Row, new_rows: list[_Row]) -> None:
+        """parent の子を new_rows に合わせる。行はキー（種類 + ID）で同一視する。"""
+        parent_index = self._index_for(parent)
+        rows = parent.children
+        new_keys = {node.key for node in new_rows}
+
+        removed = [position for position, node in enumerate(rows) if node.key not in new_keys]
+        for first, last in reversed(_runs(removed)):
+            self.beginRemoveRows(parent_index, first, last)
+            del rows[first : last + 1]
+            _renumber(rows, first)
+            self.endRemoveRows()
+
+        current = {node.key: node for node in rows}
+        surviving_order = [node.key for node in new_rows if node.key in current]
+        if surviving_order == [node.key for node in rows]:
+            # 既存行の順序が変わらない場合は、新しい行を目的の位置へ直接挿入する
+            added = [position for position, node in enumerate(new_rows) if node.key not in current]
+            for first, last in _runs(added):
+                self.beginInsertRows(parent_index, first, last)
+                for node in new_rows[first : last + 1]:
+                    node.parent = parent
+                rows[first:first] = new_rows[first : last + 1]
+                _renumber(rows, first)
+                self.endInsertRows()
+        else:
+            added_rows = [node for node in new_rows if node.key not in current]
+            if added_rows:
+                first = len(rows)
+                self.beginInsertRows(parent_index, first, first + len(added_rows) - 1)
+                for node in added_rows:
+                    node.parent = parent
+                rows.extend(added_rows)
+                _renumber(rows, first)
+                self.endInsertRows()
+            order = {node.key: node for node in rows}
+            self._reorder(parent, [order[node.key] for node in new_rows])
+
+        changed: list[int] = []
+        for position, new_node in enumerate(new_rows):
+            node = rows[position]
+            if node is new_node:
+                continue
+            if node.label != new_node.label or node.item is not new_node.item:
+                node.label = new_node.label
+                node.item = new_node.item
+                node.display = None
+                changed.append(position)
+            if node.kind == ROW_HEADER:
+                self._apply_children(node, new_node.children)
+        for first, last in _runs(changed):
+            self.dataChanged.emit(self.index(first, 0, parent_index), self.index(last, 0, parent_index))
+
+    def _reorder(self, parent: _Row, ordered: list[_Row]) -> None:
+        """parent の子を ordered の順に並べ替え、永続インデックス（選択など）を付け替える。"""
+        self.layoutAboutToBeChanged.emit()
+        moved = [index for index in self.persistentIndexList() if index.internalPointer().parent is parent]
+        nodes = [index.internalPointer() for index in moved]
+        parent.children[:] = ordered
+        _renumber(parent.children)
+        self.changePersistentIndexList(moved, [self.createIndex(node.row, 0, node) for node in nodes])
+        self.layoutChanged.emit()
+
+    # ==========================================
+    # 参照
+    # ==========================================
+
+    def iter_indexes(self) -> Iterator[QModelIndex]:
+        """全行（見出しを含む）のインデックスを表示順に列挙する。"""
+        for node in self._root.children:
+            yield self.createIndex(node.row, 0, node)
+            for child in node.children:
+                yield self.createIndex(child.row, 0, child)
+
+    def find_index(self, kind: str, key: str) -> QModelIndex:
+        """種類と ID（item_key / window_uuid）が一致する最初の行を返す。"""
+        target = (kind, key)
+        for index in self.iter_indexes():
+            if index.internalPointer().key == target:
+                return index
+        return QModelIndex()
+
+    # ==========================================
+    # QAbstractItemModel
+    # ==========================================
+
+    def _index_for(self, node: _Row) -> QModelIndex:
+        if node is self._root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def _node(self, index: QModelIndex) -> _Row:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        node = self._node(parent)
+        if column != 0 or not 0 <= row < len(node.children):
+            return QModelIndex()
+        return self.createIndex(row, 0, node.children[row])
+
+    def parent(self, index: Optional[QModelIndex] = None) -> Any:
+        if index is None:
+            return super().parent()
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        kind = index.internalPointer().kind
+        if kind == ROW_HEADER:
+            return Qt.ItemFlag.ItemIsEnabled
+        if kind == ROW_EMPTY:
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+
+    def _display(self, node: _Row) -> tuple[str, Optional[QColor]]:
+        if node.display is None:
+            if node.kind == ROW_HEADER:
+                node.display = (f"──── {node.label} ────", self._header_colors.get(node.group_key))
+            elif node.kind == ROW_EMPTY:
+                node.display = (node.label, None)
+            else:
+                self.render_count += 1
+                node.display = self._renderer(node.item)
+        return node.display
+
+    @staticmethod
+    def _is_checked(node: _Row) -> bool:
+        if node.kind == ROW_TASK:
+            return bool(node.item.done)
+        return bool(node.item.is_starred)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        node: _Row = index.internalPointer()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display(node)[0]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            color = self._display(node)[1]
+            return QBrush(color) if color is not None else None
+        if role == Qt.ItemDataRole.FontRole:
+            if node.kind != ROW_HEADER:
+                return None
+            font = QFont()
+            font.setBold(True)
+            return font
+        if node.kind not in (ROW_TASK, ROW_NOTE):
+            return "" if role == ROLE_KEY and node.kind == ROW_HEADER else None
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if self._is_checked(node) else Qt.CheckState.Unchecked
+        if role == ROLE_KEY:
+            return node.key[1]
+        if role == ROLE_CHECKED:
+            return self._is_checked(node)
+        if role == ROLE_WINDOW_UUID:
+            return node.item.window_uuid if node.kind == ROW_TASK else None
+        if role == ROLE_KIND:
+            return node.kind
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        if index.internalPointer().kind not in (ROW_TASK, ROW_NOTE):
+            return False
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.check_toggled.emit(index, checked)
+        return True
@@ -5,7 +5,7 @@ import logging
 import os
 import sys
 import traceback
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 # PySide6 Imports
 from PySide6.QtCore import QPoint, Qt, QTimer, QUrl  # ← QUrl 追加
@@ -32,9 +32,12 @@ from PySide6.QtWidgets import (
 )
 
 from managers.animation_manager import AnimationManager
+from managers.autosave_journal import AutosaveJournal
 from managers.bulk_manager import BulkOperationManager
+from managers.due_scheduler import DueScheduler
 from managers.file_manager import FileManager
 from managers.menu_manager import MenuManager
+from managers.property_change_bus import PropertyChangeBus
 from managers.settings_manager import SettingsManager
 
 # マネージャークラス
@@ -46,24 +49,31 @@ from ui.controllers.info_actions import InfoActions
 from ui.controllers.text_actions import TextActions
 from ui.main_window_wiring import build_main_tabs, create_connections_subtab, refresh_main_tab_titles
 from ui.mixins.dnd_mixin import DnDMixin
+from ui.mixins.lazy_member_mixin import LazyMemberMixin
 from ui.mixins.shortcut_mixin import ShortcutMixin
-from ui.property_panel import PropertyPanel
 from utils.app_settings import AppSettings
 from utils.overlay_settings import OverlaySettings
 
 # ユーティリティ・ダイアログ
 from utils.translator import _translator, get_lang, set_lang, tr
+from utils.write_behind import flush_pending_writes
+
+if TYPE_CHECKING:
+    from ui.property_panel import PropertyPanel
 
 # Logger Setup
 logger = logging.getLogger(__name__)
 
 
-class MainWindow(DnDMixin, ShortcutMixin, QWidget):
+class MainWindow(DnDMixin, ShortcutMixin, LazyMemberMixin, QWidget):
     """アプリケーションのメインウィンドウクラス。
 
     各マネージャーの管理、UIの構築、グローバルなイベントハンドリングを担当します。
     """
 
+    # UI 密度（compact）を切り替えるタブのキー（属性名は f"{key}_tab"）
+    _COMPACTABLE_TAB_KEYS = ("general", "text", "image", "scene", "connections", "info", "animation", "about")
+
     def __init__(self) -> None:
         """MainWindowの初期化。"""
         super().__init__()
@@ -92,6 +102,11 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
         self.window_manager: WindowManager = WindowManager(self)
         self.file_manager: FileManager = FileManager(self)
         self.style_manager: StyleManager = StyleManager(self)
+        # 全ウィンドウの期限境界を 1 本のタイマーで監視する（Info タブより先に用意する）
+        self.due_scheduler: DueScheduler = DueScheduler(self)
+        # プロパティ変更は分類つきでバスへ流し、購読者はイベントループ 1 周ごとにまとめて受け取る
+        self.property_change_bus: PropertyChangeBus = PropertyChangeBus(self)
+        self.property_change_bus.subscribe(self._on_property_changes)
 
         # Global Style System (Design Tokens)
         from managers.theme_manager import ThemeManager
@@ -130,6 +145,7 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
 
         self.create_undo_redo_actions()
         self.file_manager.load_scenes_db()
+        self._init_autosave_journal()
 
         self._register_emergency_shortcuts()
 
@@ -287,7 +303,7 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
 
     def set_tab_compact_override(self, tab_key: str, enabled: Optional[bool]) -> None:
         normalized = str(tab_key or "").strip().lower()
-        if normalized not in {"general", "text", "image", "scene", "connections", "info", "animation", "about"}:
+        if normalized not in self._COMPACTABLE_TAB_KEYS:
             return
         if enabled is None:
             self._tab_compact_overrides.pop(normalized, None)
@@ -297,19 +313,9 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
         self._apply_mainwindow_compact_mode(force=True)
 
     def _iter_compactable_tabs(self) -> List[tuple[str, Any]]:
-        tab_entries = [
-            ("general", "general_tab"),
-            ("text", "text_tab"),
-            ("image", "image_tab"),
-            ("scene", "scene_tab"),
-            ("connections", "connections_tab"),
-            ("info", "info_tab"),
-            ("animation", "animation_tab"),
-            ("about", "about_tab"),
-        ]
         out: List[tuple[str, Any]] = []
-        for key, attr_name in tab_entries:
-            tab = getattr(self, attr_name, None)
+        for key in self._COMPACTABLE_TAB_KEYS:
+            tab = self.peek_lazy(f"{key}_tab")
             if tab is None:
                 continue
             out.append((key, tab))
@@ -327,6 +333,47 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
             return "comfortable"
         return "regular"
 
+    def _init_autosave_journal(self) -> None:
+        """自動保存ジャーナルを開始する。前回が異常終了なら復旧を確認する。"""
+        self.autosave_journal: Optional[AutosaveJournal] = None
+        if os.getenv("FTIV_TEST_MODE") == "1":
+            return
+        try:
+            journal = AutosaveJournal(
+                os.path.join(self.json_directory, "autosave"), self.file_manager.get_scene_data, parent=self
+            )
+            if not journal.claim_session():
+                return
+            if journal.had_unclean_shutdown():
+                scene = journal.recover()
+                count = len(scene.get("windows", [])) if scene else 0
+                if count > 0:
+                    ret = QMessageBox.question(
+                        self,
+                        tr("title_autosave_recovery"),
+                        tr("msg_autosave_recovery").format(count=count),
+                        QMessageBox.Yes | QMessageBox.No,
+                    )
+                    if ret == QMessageBox.Yes:
+                        self.file_manager.load_scene_from_data(scene)
+                        self.file_manager.finish_scene_loading()
+
+            journal.start()
+            self.property_change_bus.subscribe(journal.record_changes)
+            self.window_manager.sig_windows_added.connect(journal.schedule_compact)
+            self.window_manager.sig_layer_structure_changed.connect(journal.schedule_compact)
+            self.autosave_journal = journal
+        except Exception:
+            logger.error("Failed to start autosave journal", exc_info=True)
+
+    def _close_autosave_journal(self) -> None:
+        journal = getattr(self, "autosave_journal", None)
+        if journal is None:
+            return
+        self.property_change_bus.unsubscribe(journal.record_changes)
+        journal.close()
+        self.autosave_journal = None
+
     def _persist_main_window_geometry(self) -> None:
         if os.getenv("FTIV_TEST_MODE") == "1":
             return
@@ -339,9 +386,10 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
     def _apply_mainwindow_compact_mode(self, force: bool = False) -> None:
         effective = self._compute_effective_ui_density_mode()
         default_compact = effective != "comfortable"
-        next_state: Dict[str, bool] = {}
-        for key, _ in self._iter_compactable_tabs():
-            next_state[key] = bool(self._tab_compact_overrides.get(key, default_compact))
+        # 未生成のタブの分も記録しておき、生成時に _on_lazy_member_created で適用する
+        next_state: Dict[str, bool] = {
+            key: bool(self._tab_compact_overrides.get(key, default_compact)) for key in self._COMPACTABLE_TAB_KEYS
+        }
 
         if (
             not force
@@ -375,12 +423,34 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
         self.undo_stack.push(command)
 
     def on_properties_changed(self, window: Any) -> None:
-        """プロパティ変更時にパネルを更新。"""
-        if self.is_property_panel_active and self.last_selected_window == window:
-            if hasattr(self.property_panel, "update_property_values"):
-                self.property_panel.update_property_values()
-        if hasattr(self, "info_tab") and hasattr(self.info_tab, "refresh_data"):
-            self.info_tab.refresh_data()
+        """プロパティ変更をバスへ流す（変わったフィールドは config の変更記録から取る）。"""
+        if hasattr(self, "property_change_bus"):
+            self.property_change_bus.publish(window)
+
+    def on_property_command_applied(self, target: Any, property_name: str) -> None:
+        """PropertyChangeCommand の redo/undo をバスへ流す（このウィンドウが所有する対象のみ通知される）。"""
+        if hasattr(self, "property_change_bus"):
+            self.property_change_bus.publish(target, (property_name,))
+
+    def _on_property_changes(self, events: List[Any]) -> None:
+        """バスの購読者: プロパティパネルと期限スケジューラを更新する。
+
+        Info タブ・LayerTab・自動保存はそれぞれ必要な分類だけを購読している。
+        """
+        selected = self.last_selected_window
+        panel = self.peek_lazy("property_panel")
+        if (
+            panel is not None
+            and self.is_property_panel_active
+            and selected is not None
+            and any(e.window is selected for e in events)
+        ):
+            if hasattr(panel, "update_property_values"):
+                panel.update_property_values()
+        if hasattr(self, "due_scheduler"):
+            self.due_scheduler.track_many(
+                e.window for e in events if e.touches("due_at", "due_time", "due_timezone", "due_precision")
+            )
 
     def on_request_property_panel(self, window: Any) -> None:
         """ウィンドウからの要求に応じてプロパティパネルを表示。"""
@@ -405,14 +475,18 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
     def on_window_moved(self, window: Any) -> None:
         """移動中のパネル座標同期。"""
         if self.is_property_panel_active and self.last_selected_window == window:
-            if hasattr(self, "property_panel"):
-                if hasattr(self.property_panel, "update_coordinates"):
-                    self.property_panel.update_coordinates()
+            if (panel := self.peek_lazy("property_panel")) is not None:
+                if hasattr(panel, "update_coordinates"):
+                    panel.update_coordinates()
                 else:
-                    self.property_panel.refresh_ui()
+                    panel.refresh_ui()
 
     def on_window_closed(self, window: Any) -> None:
         """ウィンドウが閉じられた際のクリーンアップ。"""
+        if hasattr(self, "due_scheduler"):
+            self.due_scheduler.untrack(window)
+        if hasattr(self, "property_change_bus"):
+            self.property_change_bus.forget(window)
         self.window_manager.remove_window(window)
 
     # ==========================================
@@ -461,20 +535,43 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
         build_main_tabs(self, self.tabs)
 
     def _init_property_panel(self) -> None:
-        """プロパティパネルの初期化（Undo/Redo action の取り込み含む）。"""
+        """プロパティパネルを遅延生成として登録する（初回参照時に _create_property_panel で作る）。"""
+        self.register_lazy("property_panel", self._create_property_panel)
+
+    def _create_property_panel(self) -> "PropertyPanel":
+        """プロパティパネルの生成（Undo/Redo action の取り込み含む）。"""
+        from ui.property_panel import PropertyPanel
+
         # 独立ウィンドウとして扱うため Qt親は None にする。
         # MainWindow側トグル同期に必要な参照は main_window 引数で渡す。
-        self.property_panel = PropertyPanel(parent=None, main_window=self)
+        panel = PropertyPanel(parent=None, main_window=self)
 
         if hasattr(self, "undo_action"):
-            self.property_panel.addAction(self.undo_action)
+            panel.addAction(self.undo_action)
         if hasattr(self, "redo_action"):
-            self.property_panel.addAction(self.redo_action)
+            panel.addAction(self.redo_action)
 
-        self.property_panel.hide()
+        panel.hide()
 
         screen_geo = self.screen().availableGeometry()
-        self.property_panel.move(screen_geo.right() - 320, screen_geo.top() + 100)
+        panel.move(screen_geo.right() - 320, screen_geo.top() + 100)
+        return panel
+
+    def _on_lazy_member_created(self, name: str, member: Any) -> None:
+        """遅延生成したタブを、生成までに変わった状態（選択・密度・パネル表示など）へ合わせる。"""
+        try:
+            compact_key = name[: -len("_tab")] if name.endswith("_tab") else ""
+            compact = getattr(self, "_tab_compact_state", {}).get(compact_key)
+            if compact is not None and hasattr(member, "set_compact_mode"):
+                member.set_compact_mode(compact)
+            if hasattr(member, "update_prop_button_state"):
+                member.update_prop_button_state(self.is_property_panel_active)
+            if name != "property_panel" and hasattr(member, "on_selection_changed"):
+                member.on_selection_changed(self.last_selected_window)
+            if name == "scene_tab":
+                self.refresh_scene_tabs()
+        except Exception:
+            logger.warning(f"Failed to sync lazily created member: {name}", exc_info=True)
 
     def _get_stylesheet(self) -> str:
         """UIの基本スタイルシート定義（スリム化版）。"""
@@ -531,38 +628,38 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
         - 例外が出ても refresh 全体を落とさない
         """
         try:
-            if hasattr(self, "animation_tab"):
-                self.animation_tab.on_selection_changed(self.last_selected_window)
+            if (tab := self.peek_lazy("animation_tab")) is not None:
+                tab.on_selection_changed(self.last_selected_window)
         except Exception:
             logger.error("Failed to refresh AnimationTab selection", exc_info=True)
 
         try:
-            if hasattr(self, "image_tab"):
-                self.image_tab.on_selection_changed(self.last_selected_window)
+            if (tab := self.peek_lazy("image_tab")) is not None:
+                tab.on_selection_changed(self.last_selected_window)
             elif hasattr(self, "_img_on_selection_changed"):
                 self._img_on_selection_changed(self.last_selected_window)
         except Exception:
             logger.error("Failed to refresh ImageTab selection", exc_info=True)
 
         try:
-            if hasattr(self, "text_tab"):
-                self.text_tab.on_selection_changed(self.last_selected_window)
+            if (tab := self.peek_lazy("text_tab")) is not None:
+                tab.on_selection_changed(self.last_selected_window)
             elif hasattr(self, "_txt_on_selection_changed"):
                 self._txt_on_selection_changed(self.last_selected_window)
         except Exception:
             logger.error("Failed to refresh TextTab selection", exc_info=True)
 
         try:
-            if hasattr(self, "connections_tab"):
-                self.connections_tab.on_selection_changed(self.last_selected_window)
+            if (tab := self.peek_lazy("connections_tab")) is not None:
+                tab.on_selection_changed(self.last_selected_window)
             elif hasattr(self, "_conn_on_selection_changed"):
                 self._conn_on_selection_changed(self.last_selected_window)
         except Exception:
             logger.error("Failed to refresh ConnectionsTab selection", exc_info=True)
 
         try:
-            if hasattr(self, "info_tab"):
-                self.info_tab.on_selection_changed(self.last_selected_window)
+            if (tab := self.peek_lazy("info_tab")) is not None:
+                tab.on_selection_changed(self.last_selected_window)
         except Exception:
             logger.error("Failed to refresh InfoTab selection", exc_info=True)
 
@@ -605,8 +702,8 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
             self.txt_layout_grp_all.setTitle(tr("anim_target_all_text"))
 
         # --- Text Tab ---
-        if hasattr(self, "text_tab"):
-            self.text_tab.refresh_ui()
+        if (tab := self.peek_lazy("text_tab")) is not None:
+            tab.refresh_ui()
         if hasattr(self, "btn_def_spacing_h"):
             self.btn_def_spacing_h.setText(tr("btn_set_def_spacing_h"))
         if hasattr(self, "btn_def_spacing_v"):
@@ -675,8 +772,8 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
                 logger.error("Failed to refresh Arrange subtab texts", exc_info=True)
 
         # --- Image Tab ---
-        if hasattr(self, "image_tab"):
-            self.image_tab.refresh_ui()
+        if (tab := self.peek_lazy("image_tab")) is not None:
+            tab.refresh_ui()
 
     def _refresh_scene_tab_text(self) -> None:
         """Sceneタブ内のラベル/ボタン/タブ名(未分類)を現在言語で更新する。"""
@@ -700,9 +797,10 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
             self.btn_delete_scene.setText(tr("btn_delete_scene"))
 
         # Sceneカテゴリタブ名：defaultカテゴリだけ表示を翻訳に寄せる
-        if hasattr(self, "scene_tab") and hasattr(self.scene_tab, "scene_category_tabs"):
+        scene_tab = self.peek_lazy("scene_tab")
+        if scene_tab is not None and hasattr(scene_tab, "scene_category_tabs"):
             try:
-                tabs = self.scene_tab.scene_category_tabs
+                tabs = scene_tab.scene_category_tabs
                 tab_bar = tabs.tabBar()
                 for i in range(tabs.count()):
                     tab_data = tab_bar.tabData(i)
@@ -723,24 +821,24 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
         try:
             # 分割済みの更新関数だけ呼ぶ
             self._refresh_tab_titles()
-            if hasattr(self, "general_tab"):
-                self.general_tab.refresh_ui()
-            if hasattr(self, "text_tab"):
-                self.text_tab.refresh_ui()
-            if hasattr(self, "image_tab"):
-                self.image_tab.refresh_ui()
-            if hasattr(self, "scene_tab"):
-                self.scene_tab.refresh_ui()
-            if hasattr(self, "connections_tab"):
-                self.connections_tab.refresh_ui()
-            if hasattr(self, "info_tab"):
-                self.info_tab.refresh_ui()
-            if hasattr(self, "animation_tab"):
-                self.animation_tab.refresh_ui()
-            if hasattr(self, "about_tab"):
-                self.about_tab.refresh_ui()
-            if hasattr(self, "layer_tab"):
-                self.layer_tab.refresh_ui()
+            if (tab := self.peek_lazy("general_tab")) is not None:
+                tab.refresh_ui()
+            if (tab := self.peek_lazy("text_tab")) is not None:
+                tab.refresh_ui()
+            if (tab := self.peek_lazy("image_tab")) is not None:
+                tab.refresh_ui()
+            if (tab := self.peek_lazy("scene_tab")) is not None:
+                tab.refresh_ui()
+            if (tab := self.peek_lazy("connections_tab")) is not None:
+                tab.refresh_ui()
+            if (tab := self.peek_lazy("info_tab")) is not None:
+                tab.refresh_ui()
+            if (tab := self.peek_lazy("animation_tab")) is not None:
+                tab.refresh_ui()
+            if (tab := self.peek_lazy("about_tab")) is not None:
+                tab.refresh_ui()
+            if (tab := self.peek_lazy("layer_tab")) is not None:
+                tab.refresh_ui()
 
             # MainWindow自体
             self.setWindowTitle(tr("app_title"))
@@ -758,9 +856,10 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
 
             # PropertyPanel（表示中なら）
             try:
-                if hasattr(self, "property_panel") and self.property_panel.isVisible():
-                    self.property_panel.setWindowTitle(tr("prop_panel_title"))
-                    self.property_panel.refresh_ui()
+                panel = self.peek_lazy("property_panel")
+                if panel is not None and panel.isVisible():
+                    panel.setWindowTitle(tr("prop_panel_title"))
+                    panel.refresh_ui()
             except Exception:
                 logger.error("Failed to refresh PropertyPanel", exc_info=True)
 
@@ -1178,24 +1277,26 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
             # メニュー等から直接呼ばれた場合のトグル
             self.is_property_panel_active = not self.is_property_panel_active
 
-        if hasattr(self, "general_tab"):
-            self.general_tab.update_prop_button_state(self.is_property_panel_active)
-        if hasattr(self, "text_tab"):
-            self.text_tab.update_prop_button_state(self.is_property_panel_active)
-        if hasattr(self, "image_tab"):
-            self.image_tab.update_prop_button_state(self.is_property_panel_active)
+        if (tab := self.peek_lazy("general_tab")) is not None:
+            tab.update_prop_button_state(self.is_property_panel_active)
+        if (tab := self.peek_lazy("text_tab")) is not None:
+            tab.update_prop_button_state(self.is_property_panel_active)
+        if (tab := self.peek_lazy("image_tab")) is not None:
+            tab.update_prop_button_state(self.is_property_panel_active)
 
         # self.update_prop_button_style() # Deprecated/Removed as CSS handles it via :checked state
 
-        if hasattr(self, "property_panel"):
-            if self.is_property_panel_active:
-                self.property_panel.show()
-                self.property_panel.raise_()
+        if self.is_property_panel_active:
+            # パネルは表示するときにだけ生成する
+            panel = getattr(self, "property_panel", None)
+            if panel is not None:
+                panel.show()
+                panel.raise_()
                 if self.last_selected_window:
-                    self.property_panel.set_target(self.last_selected_window)
+                    panel.set_target(self.last_selected_window)
                     self.last_selected_window.raise_()
-            else:
-                self.property_panel.hide()
+        elif (panel := self.peek_lazy("property_panel")) is not None:
+            panel.hide()
 
     def update_prop_button_style(self) -> None:
         """プロパティパネルボタンのトグル状態に応じたスタイル更新。"""
@@ -1221,10 +1322,12 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
 
     def refresh_scene_tabs(self) -> None:
         """シーンDBの内容に基づいてタブを再構築。"""
-        if not hasattr(self, "scene_tab") or not hasattr(self.scene_tab, "scene_category_tabs"):
+        scene_tab = self.peek_lazy("scene_tab")
+        if scene_tab is None or not hasattr(scene_tab, "scene_category_tabs"):
+            # 未生成の Scene タブは、生成時に現在のシーンDBから作る
             return
 
-        tabs = self.scene_tab.scene_category_tabs
+        tabs = scene_tab.scene_category_tabs
         tab_bar = tabs.tabBar()
         cur_idx = tabs.currentIndex()
         cur_key = ""
@@ -1325,14 +1428,26 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
             self._persist_main_window_geometry()
         except Exception:
             logger.warning("Failed to persist MainWindow geometry on close", exc_info=True)
-        if hasattr(self, "property_panel"):
-            self.property_panel.close()
+        # 正常終了なので自動保存ジャーナルは破棄する（ウィンドウを閉じる前に止める）
+        try:
+            self._close_autosave_journal()
+        except Exception:
+            logger.warning("Failed to close autosave journal", exc_info=True)
+
+        if (tab := self.peek_lazy("info_tab")) is not None:
+            tab.shutdown()
+
+        if (panel := self.peek_lazy("property_panel")) is not None:
+            panel.close()
 
         # Sticky Note Mode (Orphan Windows) Cleanup
         # 親子関係を切ったウィンドウ達は道連れにならないので、手動で閉じる
         if hasattr(self, "window_manager"):
             self.window_manager.close_all_windows()
 
+        # Write-Behind の保存待ち（設定・シーンDB）を終了前に書き出す
+        flush_pending_writes()
+
     def show_context_menu(self, pos: QPoint) -> None:
         """メインウィンドウの背景右クリックメニュー構築（MenuManagerに委譲）。"""
         if self._try_forward_context_menu_to_selected_window(pos):
@@ -1462,15 +1577,18 @@ class MainWindow(DnDMixin, ShortcutMixin, QWidget):
         sender = self.sender()
         if isinstance(sender, QPushButton):
             is_checked = sender.isChecked()
-        elif hasattr(self, "general_tab"):
+        elif (tab := self.peek_lazy("general_tab")) is not None:
             # Fallback
-            is_checked = self.general_tab.btn_main_frontmost.isChecked()
+            is_checked = tab.btn_main_frontmost.isChecked()
+        else:
+            # タブ未生成時は、ボタンの初期状態と同じく現在のウィンドウフラグを使う
+            is_checked = bool(self.windowFlags() & Qt.WindowType.WindowStaysOnTopHint)
 
         self.settings_manager.set_main_frontmost(is_checked)
 
         # UI更新
-        if hasattr(self, "general_tab"):
-            self.general_tab.update_frontmost_button_state(is_checked)
+        if (tab := self.peek_lazy("general_tab")) is not None:
+            tab.update_frontmost_button_state(is_checked)
 
     def apply_performance_settings(self, debounce_ms: int, wheel_debounce_ms: int, cache_size: int) -> None:
         """パフォーマンス設定を保存し、既存の全ウィンドウに即時適用する。"""
@@ -6,64 +6,109 @@ MainWindow can focus on orchestration.
 
 from __future__ import annotations
 
-from typing import Any
-
-from PySide6.QtWidgets import QTabWidget
-
-from ui.tabs.about_tab import AboutTab
-from ui.tabs.animation_tab import AnimationTab
-from ui.tabs.general_tab import GeneralTab
-from ui.tabs.image_tab import ImageTab
-from ui.tabs.info_tab import InfoTab
-from ui.tabs.layer_tab import LayerTab
-from ui.tabs.scene_tab import ConnectionsTab, SceneTab
-from ui.tabs.text_tab import TextTab
-from utils.translator import tr
-
-
-def build_main_tabs(main_window: Any, tabs: QTabWidget) -> None:
-    """Build main tabs in a single, centralized order."""
-    main_window.general_tab = GeneralTab(main_window)
-    tabs.addTab(main_window.general_tab, tr("tab_general"))
-
-    main_window.text_tab = TextTab(main_window)
-    tabs.addTab(main_window.text_tab, tr("tab_text"))
+import importlib
+from functools import partial
+from typing import Any, Callable, Optional, Tuple
 
-    main_window.image_tab = ImageTab(main_window)
-    tabs.addTab(main_window.image_tab, tr("tab_image"))
+from PySide6.QtWidgets import QTabWidget, QVBoxLayout, QWidget
 
-    main_window.scene_tab = SceneTab(main_window)
-    tabs.addTab(main_window.scene_tab, tr("tab_scene"))
-
-    main_window.connections_tab = ConnectionsTab(main_window)
-    tabs.addTab(main_window.connections_tab, tr("tab_connections"))
+from utils.translator import tr
 
-    main_window.info_tab = InfoTab(main_window)
-    tabs.addTab(main_window.info_tab, tr("tab_info"))
 
-    main_window.animation_tab = AnimationTab(main_window)
-    tabs.addTab(main_window.animation_tab, tr("tab_animation"))
+def _deferred_tab(module_name: str, class_name: str, **kwargs: Any) -> Callable[[Any], QWidget]:
+    """タブのモジュールを生成時に import する生成関数を返す（起動時の import を軽くする）。"""
+
+    def _create(main_window: Any) -> QWidget:
+        tab_class = getattr(importlib.import_module(module_name), class_name)
+        return tab_class(main_window, **kwargs)
+
+    return _create
+
+
+# (属性名, タイトルの翻訳キー, 生成関数) をタブの並び順で持つ
+MAIN_TAB_SPECS: Tuple[Tuple[str, str, Callable[[Any], QWidget]], ...] = (
+    ("general_tab", "tab_general", _deferred_tab("ui.tabs.general_tab", "GeneralTab")),
+    ("text_tab", "tab_text", _deferred_tab("ui.tabs.text_tab", "TextTab")),
+    ("image_tab", "tab_image", _deferred_tab("ui.tabs.image_tab", "ImageTab")),
+    ("scene_tab", "tab_scene", _deferred_tab("ui.tabs.scene_tab", "SceneTab")),
+    ("connections_tab", "tab_connections", _deferred_tab("ui.tabs.scene_tab", "ConnectionsTab")),
+    # 索引は初めて表示されたときに作る
+    ("info_tab", "tab_info", _deferred_tab("ui.tabs.info_tab", "InfoTab", defer_initial_refresh=True)),
+    ("animation_tab", "tab_animation", _deferred_tab("ui.tabs.animation_tab", "AnimationTab")),
+    ("layer_tab", "tab_layer", _deferred_tab("ui.tabs.layer_tab", "LayerTab")),
+    ("about_tab", "tab_about", _deferred_tab("ui.tabs.about_tab", "AboutTab")),
+)
+
+
+class LazyTabHost(QWidget):
+    """タブの中身を初めて必要になるまで作らない入れ物。
+
+    QTabWidget にはこの入れ物を追加しておき、タブが選ばれたとき（または MainWindow の
+    属性として参照されたとき）に本来のタブを生成して自分のレイアウトへ入れる。
+    """
+
+    def __init__(self, attr_name: str, factory: Callable[[], QWidget], parent: Optional[QWidget] = None) -> None:
+        """LazyTabHostを初期化します。
+
+        Args:
+            attr_name: MainWindow 上の属性名（例: "info_tab"）。
+            factory: 本来のタブを生成する関数。
+            parent: 親ウィジェット。
+        """
+        super().__init__(parent)
+        self.attr_name = attr_name
+        self._factory = factory
+        self.widget: Optional[QWidget] = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+    @property
+    def is_built(self) -> bool:
+        """本来のタブを生成済みかどうか。"""
+        return self.widget is not None
+
+    def materialize(self) -> QWidget:
+        """本来のタブを（未生成なら）生成して返す。"""
+        if self.widget is None:
+            widget = self._factory()
+            self.widget = widget
+            self.layout().addWidget(widget)
+        return self.widget
 
-    main_window.layer_tab = LayerTab(main_window)
-    tabs.addTab(main_window.layer_tab, tr("tab_layer"))
 
-    main_window.about_tab = AboutTab(main_window)
-    tabs.addTab(main_window.about_tab, tr("tab_about"))
+def build_main_tabs(main_window: Any, tabs: QTabWidget) -> None:
+    """Build main tabs in a single, centralized order.
+
+    main_window が遅延生成（register_lazy）に対応していれば、最初に表示するタブ以外は
+    LazyTabHost だけを追加し、タブの生成とシグナル接続は初回の表示まで遅らせる。
+    """
+    register_lazy = getattr(main_window, "register_lazy", None)
+    materialize_lazy = getattr(main_window, "materialize_lazy", None)
+    if not callable(register_lazy) or not callable(materialize_lazy):
+        for attr_name, title_key, factory in MAIN_TAB_SPECS:
+            tab = factory(main_window)
+            setattr(main_window, attr_name, tab)
+            tabs.addTab(tab, tr(title_key))
+        return
+
+    for attr_name, title_key, factory in MAIN_TAB_SPECS:
+        host = LazyTabHost(attr_name, partial(factory, main_window))
+        register_lazy(attr_name, host.materialize)
+        tabs.addTab(host, tr(title_key))
+
+    def _materialize_current(index: int) -> None:
+        page = tabs.widget(index)
+        if isinstance(page, LazyTabHost) and not page.is_built:
+            materialize_lazy(page.attr_name)
+
+    tabs.currentChanged.connect(_materialize_current)
+    _materialize_current(tabs.currentIndex())
 
 
 def refresh_main_tab_titles(tabs: QTabWidget) -> None:
     """Refresh localized titles for top-level tabs."""
-    title_keys = (
-        "tab_general",
-        "tab_text",
-        "tab_image",
-        "tab_scene",
-        "tab_connections",
-        "tab_info",
-        "tab_animation",
-        "tab_layer",
-        "tab_about",
-    )
+    title_keys = tuple(title_key for _attr_name, title_key, _factory in MAIN_TAB_SPECS)
     count = min(tabs.count(), len(title_keys))
     for index in range(count):
         tabs.setTabText(index, tr(title_keys[index]))
@@ -71,4 +116,6 @@ def refresh_main_tab_titles(tabs: QTabWidget) -> None:
 
 def create_connections_subtab(main_window: Any) -> Any:
     """Build connections widget via centralized tab wiring module."""
+    from ui.tabs.scene_tab import ConnectionsTab
+
     return ConnectionsTab(main_window)
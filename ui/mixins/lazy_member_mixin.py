@@ -0,0 +1,78 @@
+# ui/mixins/lazy_member_mixin.py
+"""MainWindow のタブ・プロパティパネルを初回アクセスまで生成しないための Mixin。
+
+生成済みかどうかに関係なく状態を反映したい処理は peek_member() / peek_lazy() を使う。
+hasattr() や getattr() は未生成のメンバーを生成してしまう点に注意する。
+"""
+
+from typing import Any, Callable, Dict, Optional, Set
+
+
+def peek_member(owner: Any, name: str) -> Optional[Any]:
+    """owner の属性を、遅延生成メンバーなら生成せずに取得する。
+
+    LazyMemberMixin を持たないオブジェクト（テスト用のダミー等）では通常の getattr と同じ。
+
+    Returns:
+        Optional[Any]: 生成済みの実体。未生成・存在しない場合は None。
+    """
+    if isinstance(owner, LazyMemberMixin):
+        return owner.peek_lazy(name)
+    return getattr(owner, name, None)
+
+
+class LazyMemberMixin:
+    """初回アクセスまで生成しないメンバー（タブ・プロパティパネル）を提供する Mixin。
+
+    register_lazy() で登録した名前は、初めて属性として参照されたとき（__getattr__）または
+    materialize_lazy() で生成し、以後は通常の属性として保持する。
+    選択変更や言語切替などの「作られていれば更新する」処理は peek_lazy() を使い、
+    未生成のメンバーを作らない（生成時に _on_lazy_member_created で現在の状態へ合わせる）。
+    """
+
+    def register_lazy(self, name: str, factory: Callable[[], Any]) -> None:
+        """遅延生成メンバーを登録する。"""
+        self.__dict__.setdefault("_lazy_factories", {})[name] = factory
+
+    def is_lazy_built(self, name: str) -> bool:
+        """登録済みのメンバーが生成済みかどうか（未登録の名前は属性の有無）。"""
+        return name in self.__dict__
+
+    def peek_lazy(self, name: str) -> Optional[Any]:
+        """生成済みならその実体、未生成なら None を返す（生成はしない）。"""
+        if name in self.__dict__:
+            return self.__dict__[name]
+        factories: Dict[str, Callable[[], Any]] = self.__dict__.get("_lazy_factories", {})
+        if name in factories:
+            return None
+        return getattr(self, name, None)
+
+    def materialize_lazy(self, name: str) -> Any:
+        """メンバーを（未生成なら）生成して返す。"""
+        if name in self.__dict__:
+            return self.__dict__[name]
+        factories: Dict[str, Callable[[], Any]] = self.__dict__.get("_lazy_factories", {})
+        factory = factories.get(name)
+        if factory is None:
+            raise AttributeError(name)
+        building: Set[str] = self.__dict__.setdefault("_lazy_building", set())
+        if name in building:
+            # 生成中のメンバーのコンストラクタから自分自身を参照した（一括生成時の「まだ無い」と同じ扱い）
+            raise AttributeError(name)
+        building.add(name)
+        try:
+            member = factory()
+        finally:
+            building.discard(name)
+        setattr(self, name, member)
+        hook = getattr(self, "_on_lazy_member_created", None)
+        if callable(hook):
+            hook(name, member)
+        return member
+
+    def __getattr__(self, name: str) -> Any:
+        # 通常の属性探索で見つからなかった場合だけ呼ばれる
+        factories = self.__dict__.get("_lazy_factories")
+        if factories and name in factories:
+            return self.materialize_lazy(name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
@@ -27,6 +27,7 @@ from PySide6.QtWidgets import (
 from models.enums import ArrowStyle
 from models.protocols import NoteMetadataEditableTarget, UndoableConfigurable
 from ui.dialogs import DatePickerDialog
+from ui.mixins.lazy_member_mixin import peek_member
 from ui.property_panel_orchestrator import (
     build_text_window_primary_sections,
     elide_label_text,
@@ -573,6 +574,13 @@ class PropertyPanel(QWidget):
         self.edit_note_due_at.setText(selected)
         self._set_due_input_invalid(False)
 
+    def _complete_note_tags(self, prefix: str, limit: int) -> list[str]:
+        """タグ入力欄の補完候補（Info タブのタグ索引から前方一致で取得）。"""
+        info_tab = getattr(self.mw, "info_tab", None)
+        if info_tab is None or not hasattr(info_tab, "complete_tags"):
+            return []
+        return list(info_tab.complete_tags(prefix, limit))
+
     @staticmethod
     def _due_text_for_offset(days: int) -> str:
         return (date.today() + timedelta(days=int(days))).isoformat()
@@ -740,8 +748,8 @@ class PropertyPanel(QWidget):
             undo_target.set_undoable_property("is_archived", bool(archived), "update_text")
 
         self.update_property_values()
-        if self.mw and hasattr(self.mw, "info_tab"):
-            self.mw.info_tab.refresh_data()
+        if self.mw and (info_tab := peek_member(self.mw, "info_tab")) is not None:
+            info_tab.refresh_data()
         return True
 
     def _update_outline_values(self, index: int, target: Any) -> None:
@@ -1737,7 +1745,7 @@ class PropertyPanel(QWidget):
 
                 # トグルボタン群もOFFへ（各タブの同期メソッド経由）
                 for tab_name in ["general_tab", "text_tab", "image_tab"]:
-                    tab = getattr(mw, tab_name, None)
+                    tab = peek_member(mw, tab_name)
                     if tab is not None and hasattr(tab, "update_prop_button_state"):
                         tab.update_prop_button_state(False)
 
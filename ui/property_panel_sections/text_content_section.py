@@ -3,7 +3,7 @@ from typing import Any
 
 from PySide6.QtWidgets import QComboBox, QFormLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QWidget
 
-from ui.widgets import CollapsibleBox
+from ui.widgets import CollapsibleBox, TagCompleter
 from utils.due_date import display_due_iso
 from utils.translator import tr
 
@@ -78,6 +78,7 @@ def build_text_content_section(panel: Any, target: Any) -> None:
     tag_text = ", ".join(str(tag) for tag in raw_tags if str(tag).strip()) if isinstance(raw_tags, list) else ""
     panel.edit_note_tags = QLineEdit(tag_text)
     panel.edit_note_tags.setPlaceholderText(tr("placeholder_note_tags"))
+    panel.note_tags_completer = TagCompleter(panel.edit_note_tags, panel._complete_note_tags)
     text_content_layout.addRow(tr("label_note_tags"), typing.cast(QWidget, panel.edit_note_tags))
 
     due_text = display_due_iso(str(getattr(target, "due_at", "") or ""))
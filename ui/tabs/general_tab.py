@@ -16,7 +16,6 @@ from PySide6.QtWidgets import (
 )
 
 from ui.action_priority_helper import ActionPriorityHelper
-from utils.overlay_settings import save_overlay_settings
 from utils.translator import get_lang, tr
 
 if TYPE_CHECKING:
@@ -270,7 +269,7 @@ class GeneralTab(QWidget):
 
     def _on_toggle_overlay(self, checked: bool) -> None:
         self.mw.overlay_settings.selection_frame_enabled = bool(checked)
-        save_overlay_settings(self.mw, self.mw.base_directory, self.mw.overlay_settings)
+        self.mw.settings_manager.save_overlay_settings()
         self.mw.apply_overlay_settings_to_all_windows()
 
         self._update_overlay_button_style(bool(checked))
@@ -285,7 +284,7 @@ class GeneralTab(QWidget):
             return
 
         self.mw.overlay_settings.selection_frame_color = color.name(QColor.NameFormat.HexArgb)
-        save_overlay_settings(self.mw, self.mw.base_directory, self.mw.overlay_settings)
+        self.mw.settings_manager.save_overlay_settings()
         self.mw.apply_overlay_settings_to_all_windows()
 
     def _on_change_overlay_width(self) -> None:
@@ -304,7 +303,7 @@ class GeneralTab(QWidget):
             return
 
         self.mw.overlay_settings.selection_frame_width = int(val)
-        save_overlay_settings(self.mw, self.mw.base_directory, self.mw.overlay_settings)
+        self.mw.settings_manager.save_overlay_settings()
         self.mw.apply_overlay_settings_to_all_windows()
 
     def refresh_ui(self) -> None:
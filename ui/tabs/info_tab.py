@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import logging
+import time
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Any, Optional
 
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QAction, QBrush, QColor
+from PySide6.QtCore import QCoreApplication, QItemSelectionModel, QModelIndex, Qt, QTimer
+from PySide6.QtGui import QAction, QColor, QShowEvent
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QCheckBox,
@@ -21,18 +24,39 @@ from PySide6.QtWidgets import (
     QPushButton,
     QTabWidget,
     QToolButton,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
-from managers.info_index_manager import InfoIndexManager, InfoQuery, InfoStats, NoteIndexItem, TaskIndexItem
+from managers.info_index_manager import (
+    GroupedMixed,
+    GroupedNotes,
+    GroupedTasks,
+    IncrementalInfoIndex,
+    InfoIndexManager,
+    InfoQuery,
+    InfoStats,
+    NoteIndexItem,
+    TaskIndexItem,
+)
+from managers.info_query_worker import InfoQueryResult, InfoQuerySnapshot, InfoQueryWorker, SavedScenesQuery
 from ui.dialogs import BulkTagEditDialog
-from ui.widgets import CollapsibleBox
-from utils.due_date import classify_due, format_due_for_display
+from ui.info_list_model import ROLE_CHECKED, ROLE_KEY, ROLE_KIND, ROLE_WINDOW_UUID, ROW_NOTE, InfoListModel
+from ui.widgets import CollapsibleBox, TagCompleter
 from utils.translator import tr
 
+logger = logging.getLogger(__name__)
+
+# 期限境界タイマーの発火を境界より遅らせる猶予と、1回の待ち時間の上限（ミリ秒）
+_DUE_ROLLOVER_SLACK_MS = 500
+_DUE_ROLLOVER_MAX_MS = 6 * 60 * 60 * 1000
+# 保存済みシーンから取り出すタスク行・ノートそれぞれの上限（統計は全件で数える）
+_SAVED_SCENES_RESULT_LIMIT = 2000
+# これ以下の件数なら絞り込みはワーカーへ渡さず GUI スレッドで行う（スレッドの往復の方が高くつく）
+_INLINE_QUERY_ITEM_LIMIT = 1000
+_OPERATION_LOG_PAGE_SIZE = 100
+
 
 @dataclass(frozen=True)
 class ViewPreset:
@@ -55,12 +79,16 @@ class InfoOperationsDialog(QDialog):
 
         self.btn_clear = QPushButton(tr("info_clear_operations"))
         self.btn_clear.setObjectName("ActionBtn")
+        # 古い履歴はページ単位で読み足す（ファイル全体は読み込まない）
+        self.btn_more = QPushButton(tr("info_operations_load_more"))
+        self.btn_more.setVisible(False)
         self.btn_close = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         self.btn_close.rejected.connect(self.reject)
 
         button_row = QHBoxLayout()
         button_row.setContentsMargins(0, 0, 0, 0)
         button_row.addWidget(self.btn_clear)
+        button_row.addWidget(self.btn_more)
         button_row.addStretch(1)
         button_row.addWidget(self.btn_close)
         layout.addLayout(button_row)
@@ -75,9 +103,18 @@ class InfoOperationsDialog(QDialog):
         for line in entries:
             self.operations_list.addItem(QListWidgetItem(str(line)))
 
+    def append_entries(self, entries: list[str]) -> None:
+        """読み足したページを末尾（より古い側）へ追加する。"""
+        for line in entries:
+            self.operations_list.addItem(QListWidgetItem(str(line)))
+
+    def set_has_more(self, has_more: bool) -> None:
+        self.btn_more.setVisible(bool(has_more))
+
     def refresh_ui(self) -> None:
         self.setWindowTitle(tr("info_recent_operations"))
         self.btn_clear.setText(tr("info_clear_operations"))
+        self.btn_more.setText(tr("info_operations_load_more"))
 
 
 class InfoTab(QWidget):
@@ -92,10 +129,18 @@ class InfoTab(QWidget):
     _GROUP_BY_VALUES = ("smart", "tag", "window", "flat")
     _LAYOUT_MODE_VALUES = ("auto", "compact", "regular")
 
-    def __init__(self, main_window: Any):
+    def __init__(self, main_window: Any, *, defer_initial_refresh: bool = False):
+        """InfoTabを初期化します。
+
+        Args:
+            main_window: MainWindow。
+            defer_initial_refresh: True の場合、索引の構築と一覧の取得を初めて表示されるまで遅らせる。
+        """
         super().__init__()
         self.mw = main_window
         self.index_manager = InfoIndexManager()
+        # 初回表示まで refresh_data は要求を記録するだけにする
+        self._initial_refresh_pending = bool(defer_initial_refresh)
 
         self._current_selected_uuid: str = ""
         self._is_refreshing = False
@@ -114,12 +159,25 @@ class InfoTab(QWidget):
         self._effective_layout_mode = "regular"
         self._operations_dialog: Optional[InfoOperationsDialog] = None
         self._operation_log_lines: list[str] = []
-        self._index_cache_signature: Optional[tuple[Any, ...]] = None
-        self._index_cache_task_items: list[TaskIndexItem] = []
-        self._index_cache_note_items: list[NoteIndexItem] = []
-        self._last_task_rows_signature: Optional[tuple[Any, ...]] = None
-        self._last_note_rows_signature: Optional[tuple[Any, ...]] = None
-        self._last_all_rows_signature: Optional[tuple[Any, ...]] = None
+        # ダイアログで読み込み済みの件数（新しい順の offset）
+        self._operation_log_loaded = 0
+        self._last_operation_log_revision: Optional[int] = None
+        self._info_index = IncrementalInfoIndex(self.index_manager)
+        # refresh_data(window=...) で通知された変更ウィンドウ（id -> window）
+        self._pending_index_windows: dict[int, Any] = {}
+        self._index_full_sync_pending = True
+        self._last_refresh_key: Optional[tuple[Any, ...]] = None
+        # 一覧の絞り込みはワーカーで行う。世代番号で古い結果を捨てる
+        self._query_worker = InfoQueryWorker(
+            self.index_manager, inline_item_limit=_INLINE_QUERY_ITEM_LIMIT, parent=self
+        )
+        self._query_worker.finished.connect(self._on_query_finished)
+        self._query_generation = 0
+        self._applied_generation = 0
+        self._query_total_count = 0
+        self._last_result: Optional[InfoQueryResult] = None
+        # 一覧の行に反映済みの結果（表示の作り直しが必要になったら None に戻す）
+        self._rows_result: Optional[InfoQueryResult] = None
         self._last_operation_logs_signature: Optional[tuple[Any, ...]] = None
 
         self._refresh_timer = QTimer(self)
@@ -127,13 +185,33 @@ class InfoTab(QWidget):
         self._refresh_timer.setInterval(100)
         self._refresh_timer.timeout.connect(self._refresh_now)
 
+        # 期限の状態（期限切れ/今日/今後）が次に変わる時刻に1回だけ発火するタイマー
+        self._due_rollover_timer = QTimer(self)
+        self._due_rollover_timer.setSingleShot(True)
+        self._due_rollover_timer.timeout.connect(self._on_due_rollover)
+        # MainWindow の DueScheduler があればそちらの通知を使い、境界を過ぎたウィンドウだけを再評価する
+        self._due_scheduler: Any = getattr(self.mw, "due_scheduler", None)
+        if self._due_scheduler is not None:
+            self._due_scheduler.sig_due_reached.connect(self._on_due_reached)
+        # 一覧に出るのは metadata だけのため、描画・位置・アニメーションの変更は受け取らない
+        self._property_change_bus: Any = getattr(self.mw, "property_change_bus", None)
+        if self._property_change_bus is not None:
+            self._property_change_bus.subscribe(self._on_property_changes, categories=("metadata",))
+
         self._setup_ui()
         self._load_ui_state_from_settings()
         self._load_presets_from_settings()
         self._reload_view_preset_combo_items()
         self._restore_last_preset()
         self._apply_layout_mode(force=True)
-        self.refresh_data(immediate=True)
+        if not self._initial_refresh_pending:
+            self.refresh_data(immediate=True)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        if self._initial_refresh_pending:
+            self._initial_refresh_pending = False
+            self.refresh_data(immediate=True)
 
     def _setup_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -223,6 +301,7 @@ class InfoTab(QWidget):
         self.edit_tag_filter = QLineEdit()
         self.edit_tag_filter.setPlaceholderText(tr("info_tag_placeholder"))
         self.edit_tag_filter.textChanged.connect(self._on_filter_controls_changed)
+        self.tag_filter_completer = TagCompleter(self.edit_tag_filter, self.complete_tags)
         advanced_layout.addWidget(self.edit_tag_filter, 0, 0, 1, 5)
 
         self.chk_open_only = QCheckBox(tr("info_open_tasks_only"))
@@ -231,6 +310,10 @@ class InfoTab(QWidget):
         self.chk_star_only = QCheckBox(tr("info_star_only"))
         self.chk_star_only.toggled.connect(self._on_filter_controls_changed)
         advanced_layout.addWidget(self.chk_star_only, 1, 1)
+        self.chk_saved_scenes = QCheckBox(tr("info_include_saved_scenes"))
+        self.chk_saved_scenes.setToolTip(tr("info_include_saved_scenes_tooltip"))
+        self.chk_saved_scenes.toggled.connect(self._on_saved_scenes_toggled)
+        advanced_layout.addWidget(self.chk_saved_scenes, 1, 2, 1, 3)
 
         self.lbl_mode = QLabel(tr("info_mode_label"))
         advanced_layout.addWidget(self.lbl_mode, 2, 0)
@@ -278,50 +361,28 @@ class InfoTab(QWidget):
 
         self.all_tab = QWidget()
         all_layout = QVBoxLayout(self.all_tab)
-        self.all_tree = QTreeWidget()
-        self.all_tree.setHeaderHidden(True)
-        self.all_tree.setColumnCount(1)
-        self.all_tree.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.all_tree.setRootIsDecorated(False)
-        self.all_tree.setIndentation(16)
-        self.all_tree.itemChanged.connect(self._on_all_item_changed)
-        self.all_tree.itemDoubleClicked.connect(self._on_all_item_activated)
-        self.all_tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.all_tree.customContextMenuRequested.connect(lambda pos: self._show_bulk_context_menu(self.all_tree, pos))
+        self.all_model = InfoListModel(self._render_mixed_row, self)
+        self.all_model.check_toggled.connect(self._on_all_item_check_toggled)
+        self.all_tree = self._make_list_view(self.all_model)
+        self.all_tree.doubleClicked.connect(self._on_all_item_activated)
         all_layout.addWidget(self.all_tree)
         self.subtabs.addTab(self.all_tab, tr("info_all_tab"))
 
         self.tasks_tab = QWidget()
         tasks_layout = QVBoxLayout(self.tasks_tab)
-        self.tasks_tree = QTreeWidget()
-        self.tasks_tree.setHeaderHidden(True)
-        self.tasks_tree.setColumnCount(1)
-        self.tasks_tree.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.tasks_tree.setRootIsDecorated(False)
-        self.tasks_tree.setIndentation(16)
-        self.tasks_tree.itemChanged.connect(self._on_task_item_changed)
-        self.tasks_tree.itemDoubleClicked.connect(self._on_task_item_activated)
-        self.tasks_tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.tasks_tree.customContextMenuRequested.connect(
-            lambda pos: self._show_bulk_context_menu(self.tasks_tree, pos)
-        )
+        self.tasks_model = InfoListModel(self._render_task_row, self)
+        self.tasks_model.check_toggled.connect(self._on_task_check_toggled)
+        self.tasks_tree = self._make_list_view(self.tasks_model)
+        self.tasks_tree.doubleClicked.connect(self._on_task_item_activated)
         tasks_layout.addWidget(self.tasks_tree)
         self.subtabs.addTab(self.tasks_tab, tr("info_tasks_tab"))
 
         self.notes_tab = QWidget()
         notes_layout = QVBoxLayout(self.notes_tab)
-        self.notes_tree = QTreeWidget()
-        self.notes_tree.setHeaderHidden(True)
-        self.notes_tree.setColumnCount(1)
-        self.notes_tree.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.notes_tree.setRootIsDecorated(False)
-        self.notes_tree.setIndentation(16)
-        self.notes_tree.itemChanged.connect(self._on_note_item_changed)
-        self.notes_tree.itemDoubleClicked.connect(self._on_note_item_activated)
-        self.notes_tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.notes_tree.customContextMenuRequested.connect(
-            lambda pos: self._show_bulk_context_menu(self.notes_tree, pos)
-        )
+        self.notes_model = InfoListModel(self._render_note_row, self)
+        self.notes_model.check_toggled.connect(self._on_note_check_toggled)
+        self.notes_tree = self._make_list_view(self.notes_model)
+        self.notes_tree.doubleClicked.connect(self._on_note_item_activated)
         notes_layout.addWidget(self.notes_tree)
 
         notes_btn_row = QHBoxLayout()
@@ -392,6 +453,33 @@ class InfoTab(QWidget):
         summary_layout.addWidget(self.btn_open_operations)
         layout.addWidget(self.operation_summary_row)
 
+    def _make_list_view(self, model: InfoListModel) -> QTreeView:
+        """一覧モデルを表示するビューを作る。行の高さを揃え、見える範囲だけを描画させる。"""
+        view = QTreeView()
+        view.setHeaderHidden(True)
+        view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        view.setRootIsDecorated(False)
+        view.setIndentation(16)
+        view.setUniformRowHeights(True)
+        view.setModel(model)
+        # 新しく現れたグループ見出しだけを開く（既存の見出しの開閉状態は保つ）
+        model.rowsInserted.connect(
+            lambda parent, first, last, v=view: self._expand_inserted_headers(v, parent, first, last)
+        )
+        view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        view.customContextMenuRequested.connect(lambda pos, v=view: self._show_bulk_context_menu(v, pos))
+        return view
+
+    @staticmethod
+    def _expand_inserted_headers(view: QTreeView, parent: QModelIndex, first: int, last: int) -> None:
+        if parent.isValid():
+            return
+        model = view.model()
+        for row in range(first, last + 1):
+            index = model.index(row, 0)
+            if model.hasChildren(index):
+                view.setExpanded(index, True)
+
     def _setup_smart_view_buttons(self, parent_layout: QHBoxLayout) -> None:
         """スマートビューのトグルボタン列を生成する。"""
         _BUTTON_DEFS: list[tuple[str, str, str]] = [
@@ -687,6 +775,8 @@ class InfoTab(QWidget):
         if group_by not in self._GROUP_BY_VALUES:
             group_by = "smart"
         self._group_by = group_by
+        for model in (self.all_model, self.tasks_model, self.notes_model):
+            model.invalidate_display()
         self._invalidate_refresh_signatures()
         self.refresh_data(immediate=True)
 
@@ -982,90 +1072,6 @@ class InfoTab(QWidget):
             return []
         return list(getattr(wm, "text_windows", []) or [])
 
-    @staticmethod
-    def _normalize_signature_tags(raw_tags: Any) -> tuple[str, ...]:
-        if not isinstance(raw_tags, list):
-            return ()
-        tags: list[str] = []
-        for raw in raw_tags:
-            tag = str(raw or "").strip().lower()
-            if tag:
-                tags.append(tag)
-        return tuple(tags)
-
-    @staticmethod
-    def _task_state_signature(raw_states: Any) -> tuple[int, int]:
-        if not isinstance(raw_states, list):
-            return (0, 0)
-        normalized = tuple(bool(v) for v in raw_states)
-        return (len(normalized), hash(normalized))
-
-    def _build_index_signature(self, windows: list[Any]) -> tuple[Any, ...]:
-        signatures: list[tuple[Any, ...]] = []
-        for window in windows:
-            if window is None:
-                continue
-            text = str(getattr(window, "text", "") or "")
-            signatures.append(
-                (
-                    str(getattr(window, "uuid", "") or ""),
-                    str(getattr(window, "updated_at", "") or ""),
-                    str(getattr(window, "content_mode", "note") or "note").strip().lower(),
-                    bool(getattr(window, "is_archived", False)),
-                    bool(getattr(window, "is_starred", False)),
-                    str(getattr(window, "title", "") or ""),
-                    self._normalize_signature_tags(getattr(window, "tags", [])),
-                    str(getattr(window, "due_at", "") or ""),
-                    str(getattr(window, "due_time", "") or ""),
-                    str(getattr(window, "due_timezone", "") or ""),
-                    str(getattr(window, "due_precision", "date") or "date").strip().lower(),
-                    len(text),
-                    hash(text),
-                    self._task_state_signature(getattr(window, "task_states", [])),
-                )
-            )
-        return tuple(signatures)
-
-    @staticmethod
-    def _make_task_rows_signature(items: list[TaskIndexItem]) -> tuple[Any, ...]:
-        return tuple(
-            (
-                item.item_key,
-                bool(item.done),
-                bool(item.is_archived),
-                bool(item.is_starred),
-                item.title,
-                item.text,
-                item.updated_at,
-                item.created_at,
-                item.due_at,
-                item.due_time,
-                item.due_timezone,
-                item.due_precision,
-            )
-            for item in items
-        )
-
-    @staticmethod
-    def _make_note_rows_signature(items: list[NoteIndexItem]) -> tuple[Any, ...]:
-        return tuple(
-            (
-                item.window_uuid,
-                bool(item.is_starred),
-                bool(item.is_archived),
-                item.title,
-                item.first_line,
-                item.content_mode,
-                item.updated_at,
-                item.created_at,
-                item.due_at,
-                item.due_time,
-                item.due_timezone,
-                item.due_precision,
-            )
-            for item in items
-        )
-
     @staticmethod
     def _make_operation_logs_signature(entries: list[dict[str, Any]]) -> tuple[Any, ...]:
         return tuple(
@@ -1079,23 +1085,47 @@ class InfoTab(QWidget):
         )
 
     def _invalidate_refresh_signatures(self) -> None:
-        self._last_task_rows_signature = None
-        self._last_note_rows_signature = None
-        self._last_all_rows_signature = None
+        self._last_refresh_key = None
+        self._rows_result = None
         self._last_operation_logs_signature = None
 
     def _get_index_items(self, windows: list[Any]) -> tuple[list[TaskIndexItem], list[NoteIndexItem]]:
-        signature = self._build_index_signature(windows)
-        if signature == self._index_cache_signature:
-            return self._index_cache_task_items, self._index_cache_note_items
-        task_items, note_items = self.index_manager.build_index(windows)
-        self._index_cache_signature = signature
-        self._index_cache_task_items = task_items
-        self._index_cache_note_items = note_items
-        self._invalidate_refresh_signatures()
-        return task_items, note_items
-
-    def refresh_data(self, immediate: bool = False) -> None:
+        """インデックスを差分更新し、既定順のタスク・ノート一覧を返す。
+
+        変更通知のあったウィンドウだけを再索引する。全体同期が要求された場合や
+        ウィンドウ数が変わった場合は、全ウィンドウの変更リビジョンと突き合わせる。
+        """
+        index = self._info_index
+        pending = list(self._pending_index_windows.values())
+        self._pending_index_windows.clear()
+        if self._index_full_sync_pending or len(windows) != index.window_count:
+            self._index_full_sync_pending = False
+            changed = index.sync(windows)
+            if self._due_scheduler is not None:
+                # 変更通知を経ずに期限が変わったウィンドウ（シーン読み込み等）も拾う
+                self._due_scheduler.sync(windows)
+        else:
+            # 画像ウィンドウなど索引対象外の通知は無視する
+            changed = index.update_windows(w for w in pending if index.contains(w))
+        if changed:
+            self._invalidate_refresh_signatures()
+        return index.task_items, index.note_items
+
+    def refresh_data(self, immediate: bool = False, window: Any = None) -> None:
+        """一覧を更新する（通常は 100ms デバウンス）。
+
+        Args:
+            immediate: True で即時に更新する。
+            window: 変更のあったウィンドウ。指定時はそのウィンドウだけを再索引する。
+                省略時は全ウィンドウと突き合わせる。
+        """
+        if window is None:
+            self._index_full_sync_pending = True
+        else:
+            self._pending_index_windows[id(window)] = window
+        if self._initial_refresh_pending:
+            # まだ表示されていない: 索引の構築は showEvent まで待つ
+            return
         if immediate:
             if self._refresh_timer.isActive():
                 self._refresh_timer.stop()
@@ -1109,66 +1139,176 @@ class InfoTab(QWidget):
 
         self._is_refreshing = True
         try:
+            targeted_only = not self._index_full_sync_pending
             windows = self._iter_text_windows()
             task_items, note_items = self._get_index_items(windows)
             query = self._build_query()
-            filtered_tasks = self.index_manager.query_tasks(task_items, query)
-            filtered_notes = self.index_manager.query_notes(note_items, query)
-            stats = self.index_manager.build_stats(filtered_tasks, filtered_notes)
-
-            task_sig = self._make_task_rows_signature(filtered_tasks)
-            if task_sig != self._last_task_rows_signature:
-                task_groups = self._build_task_groups(filtered_tasks)
-                self._populate_tasks_grouped(task_groups, filtered_tasks)
-                self._last_task_rows_signature = task_sig
-
-            note_sig = self._make_note_rows_signature(filtered_notes)
-            if note_sig != self._last_note_rows_signature:
-                note_groups = self._build_note_groups(filtered_notes)
-                self._populate_notes_grouped(note_groups, filtered_notes)
-                self._last_note_rows_signature = note_sig
-
-            all_sig = (task_sig, note_sig)
-            if all_sig != self._last_all_rows_signature:
-                mixed_groups = self._build_mixed_groups(filtered_tasks, filtered_notes)
-                self._populate_all_grouped(mixed_groups, filtered_tasks, filtered_notes)
-                self._last_all_rows_signature = all_sig
-
-            self._update_empty_state_hint(len(task_items) + len(note_items), len(filtered_tasks) + len(filtered_notes))
-            self._update_stats(stats)
+            info_store = self._saved_scenes_store()
+            store_revision = info_store.revision if info_store is not None else None
+            refresh_key = (self._info_index.revision, store_revision, query, self._group_by)
+            if targeted_only and refresh_key == self._last_refresh_key:
+                # 索引対象のウィンドウに変化が無く、表示条件も同じなら一覧は変わらない
+                return
+            self._last_refresh_key = refresh_key
+            # 全文検索とタグ絞り込みは索引で候補を絞り、残りの条件だけを各アイテムに適用する
+            search_tasks, search_notes, filter_query = self._info_index.narrow(query)
+            # 絞り込み・並べ替え・グループ化はワーカーで行い、結果が届くまでは前回の一覧を表示しておく
+            self._query_generation += 1
+            self._query_total_count = len(task_items) + len(note_items)
+            saved_scenes = None
+            if info_store is not None:
+                # 開いているウィンドウは保存済みの内容より新しいため、ストア側からは除外する
+                saved_scenes = SavedScenesQuery(
+                    store=info_store,
+                    query=query,
+                    exclude_window_uuids=tuple(str(getattr(w, "uuid", "") or "") for w in windows),
+                    limit=_SAVED_SCENES_RESULT_LIMIT,
+                )
+                self._query_total_count += self._count_saved_items(info_store)
+            self._query_worker.submit(
+                InfoQuerySnapshot(
+                    generation=self._query_generation,
+                    tasks=tuple(search_tasks),
+                    notes=tuple(search_notes),
+                    query=filter_query,
+                    group_by=self._group_by,
+                    saved_scenes=saved_scenes,
+                )
+            )
             self._populate_operation_logs()
+            self._schedule_due_rollover()
         finally:
             self._is_refreshing = False
 
-    def _build_task_groups(self, items: list[TaskIndexItem]) -> list[Any]:
-        mgr = self.index_manager
-        if self._group_by == "tag":
-            return mgr.group_tasks_by_tag(items)
-        if self._group_by == "window":
-            return mgr.group_tasks_by_window(items)
-        if self._group_by == "flat":
-            return []
-        return mgr.group_tasks_smart(items)
-
-    def _build_note_groups(self, items: list[NoteIndexItem]) -> list[Any]:
-        mgr = self.index_manager
-        if self._group_by == "tag":
-            return mgr.group_notes_by_tag(items)
-        if self._group_by == "window":
-            return mgr.group_notes_by_window(items)
-        if self._group_by == "flat":
-            return []
-        return mgr.group_notes_smart(items)
-
-    def _build_mixed_groups(self, tasks: list[TaskIndexItem], notes: list[NoteIndexItem]) -> list[Any]:
-        mgr = self.index_manager
-        if self._group_by == "tag":
-            return mgr.group_mixed_by_tag(tasks, notes)
-        if self._group_by == "window":
-            return mgr.group_mixed_by_window(tasks, notes)
-        if self._group_by == "flat":
-            return []
-        return mgr.group_mixed_smart(tasks, notes)
+    def _saved_scenes_store(self) -> Any:
+        """保存済みシーンを含める設定なら InfoStore を返す。"""
+        if not self.chk_saved_scenes.isChecked():
+            return None
+        file_manager = getattr(self.mw, "file_manager", None)
+        if file_manager is None or not hasattr(file_manager, "info_store"):
+            return None
+        try:
+            return file_manager.info_store
+        except Exception:
+            logger.warning("Info store is unavailable", exc_info=True)
+            return None
+
+    @staticmethod
+    def _count_saved_items(info_store: Any) -> int:
+        try:
+            return int(info_store.count())
+        except Exception:
+            return 0
+
+    def _on_saved_scenes_toggled(self, checked: bool) -> None:
+        if checked:
+            file_manager = getattr(self.mw, "file_manager", None)
+            if file_manager is not None and hasattr(file_manager, "backfill_info_store"):
+                try:
+                    # まだ索引していない保存済みシーンを取り込む（1セッションにつき1回）
+                    file_manager.backfill_info_store()
+                except Exception:
+                    logger.warning("Failed to backfill info store", exc_info=True)
+        self._on_filter_controls_changed()
+
+    def _schedule_due_rollover(self) -> None:
+        """次の期限境界（深夜0時または時刻指定の期限）にタイマーを合わせる。"""
+        if self._due_scheduler is not None:
+            # 共有のスケジューラが境界を通知するため、タブ側のタイマーは使わない
+            self._due_rollover_timer.stop()
+            return
+        now = datetime.now()
+        boundary = self._info_index.next_due_boundary(now)
+        # 境界ちょうどではなく少し後に発火させ、状態の切り替わりを確実に拾う
+        delay_ms = int((boundary - now).total_seconds() * 1000) + _DUE_ROLLOVER_SLACK_MS
+        self._due_rollover_timer.start(max(_DUE_ROLLOVER_SLACK_MS, min(delay_ms, _DUE_ROLLOVER_MAX_MS)))
+
+    def _on_due_rollover(self) -> None:
+        if self._info_index.refresh_due_states():
+            self._invalidate_refresh_signatures()
+            self.refresh_data()
+        else:
+            self._schedule_due_rollover()
+
+    def _on_due_reached(self, windows: list[Any]) -> None:
+        """期限の境界を過ぎたウィンドウの行だけを再評価する。"""
+        if self._info_index.refresh_due_states(windows=windows):
+            self._invalidate_refresh_signatures()
+            self.refresh_data()
+
+    def _on_query_finished(self, result: InfoQueryResult) -> None:
+        if result.generation != self._query_generation:
+            # 後続のフィルタ変更で不要になった結果
+            return
+        was_refreshing = self._is_refreshing
+        self._is_refreshing = True
+        try:
+            if not self._same_rows(self._rows_result, result):
+                # 一覧は差分で更新されるため、変化の無い行には何もしない
+                self._populate_tasks_grouped(result.task_groups, result.tasks)
+                self._populate_notes_grouped(result.note_groups, result.notes)
+                self._populate_all_grouped(result.mixed_groups, result.tasks, result.notes)
+                self._rows_result = result
+            self._update_empty_state_hint(self._query_total_count, len(result.tasks) + len(result.notes))
+            self._update_stats(result.stats)
+            self._last_result = result
+            self._applied_generation = result.generation
+        finally:
+            self._is_refreshing = was_refreshing
+
+    @staticmethod
+    def _same_rows(previous: Optional[InfoQueryResult], result: InfoQueryResult) -> bool:
+        """前回反映した結果と行・グループが同じかどうか（同じなら行の差分計算ごと省く）。"""
+        if previous is None:
+            return False
+        # 索引が変わらなければ同じアイテムオブジェクトが並ぶため、比較はほぼ同一性の確認で済む
+        return (
+            previous.tasks == result.tasks
+            and previous.notes == result.notes
+            and previous.task_groups == result.task_groups
+            and previous.note_groups == result.note_groups
+            and previous.mixed_groups == result.mixed_groups
+        )
+
+    def wait_for_query_results(self, timeout: float = 5.0) -> bool:
+        """バックグラウンドのクエリ結果が一覧に反映されるまで待つ（計測・テスト用）。
+
+        Returns:
+            bool: 時間内に最新の結果が反映された場合 True。
+        """
+        deadline = time.monotonic() + max(0.0, float(timeout))
+        while self._applied_generation != self._query_generation:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._query_worker.wait_idle(remaining)
+            QCoreApplication.processEvents()
+        return True
+
+    def complete_tags(self, prefix: str, limit: int = 20) -> list[str]:
+        """索引済みのタグから前方一致する候補を使用数の多い順に返す（入力補完用）。"""
+        if self._initial_refresh_pending:
+            # 一覧はまだ作らないが、補完に必要な索引だけは（差分で）用意する
+            self._get_index_items(self._iter_text_windows())
+        return self._info_index.complete_tags(prefix, limit)
+
+    def current_tag_counts(self) -> dict[str, int]:
+        """表示中の絞り込み結果に含まれるタグごとの件数。"""
+        result = self._last_result
+        if result is None:
+            return {}
+        return self._info_index.tag_counts([*result.tasks, *result.notes])
+
+    def shutdown(self) -> None:
+        """終了時にクエリワーカーを止める。"""
+        if self._property_change_bus is not None:
+            self._property_change_bus.unsubscribe(self._on_property_changes)
+        self._query_worker.close()
+
+    def _on_property_changes(self, events: list[Any]) -> None:
+        """metadata の変更があったウィンドウだけを再索引させる。"""
+        for event in events:
+            self.refresh_data(window=event.window)
 
     def _add_text_from_empty_state(self) -> None:
         main_controller = getattr(self.mw, "main_controller", None)
@@ -1219,131 +1359,30 @@ class InfoTab(QWidget):
             return ""
         return " ".join(f"[{tag}]" for tag in tags)
 
-    def _build_task_item_text(
-        self,
-        item: TaskIndexItem,
-        due_text_cache: dict[tuple[str, str, str, str], str],
-        due_state_cache: dict[tuple[str, str, str, str], str],
-    ) -> tuple[str, str]:
-        """タスクアイテムの表示テキストと期限状態を返す。"""
+    @staticmethod
+    def _format_scene_badge(scene: tuple[str, str]) -> str:
+        """保存済みシーン由来のアイテムに付けるシーン名のバッジ。"""
+        _category, name = scene
+        return tr("info_badge_saved_scene").format(scene=name)
+
+    def _build_task_item_text(self, item: TaskIndexItem) -> tuple[str, str]:
+        """タスクアイテムの表示テキストと期限状態を返す（期限はインデックス作成時に算出済み）。"""
         text = tr("info_task_item_fmt").format(title=item.title, text=item.text)
         tag_badge = self._format_tags_badge(item.tags)
         if tag_badge:
             text = f"{text}  {tag_badge}"
-        due_key = (
-            str(item.due_at or ""),
-            str(item.due_time or ""),
-            str(item.due_timezone or ""),
-            str(item.due_precision or "date"),
-        )
-        due_text = due_text_cache.get(due_key)
-        if due_text is None:
-            due_text = format_due_for_display(
-                item.due_at,
-                due_time=item.due_time,
-                due_timezone=item.due_timezone,
-                due_precision=item.due_precision,
-            )
-            due_text_cache[due_key] = due_text
-        due_state = due_state_cache.get(due_key)
-        if due_state is None:
-            due_state = classify_due(
-                item.due_at,
-                due_time=item.due_time,
-                due_timezone=item.due_timezone,
-                due_precision=item.due_precision,
-            )
-            due_state_cache[due_key] = due_state
+        if item.scene is not None:
+            text = f"{text}  {self._format_scene_badge(item.scene)}"
+        due_state = item.due_state
         badges = self._build_due_badges(due_state, is_archived=bool(item.is_archived), is_done_task=bool(item.done))
-        if due_text:
-            text = f"{text}  ({tr('info_due_short_fmt').format(date=due_text)})"
+        if item.due_text:
+            text = f"{text}  ({tr('info_due_short_fmt').format(date=item.due_text)})"
         if badges:
             text = f"{text} {' '.join(badges)}"
         return text, due_state
 
-    def _populate_tasks_grouped(
-        self,
-        groups: list[Any],
-        all_items: list[TaskIndexItem],
-    ) -> None:
-        from managers.info_index_manager import GroupedTasks
-
-        due_text_cache: dict[tuple[str, str, str, str], str] = {}
-        due_state_cache: dict[tuple[str, str, str, str], str] = {}
-        self.tasks_tree.blockSignals(True)
-        try:
-            self.tasks_tree.clear()
-            if not all_items:
-                empty = QTreeWidgetItem(self.tasks_tree)
-                empty.setText(0, tr("info_list_empty"))
-                empty.setFlags(Qt.ItemFlag.NoItemFlags)
-                return
-
-            has_multiple_groups = len(groups) > 1 or (len(groups) == 1 and groups[0].group_key != "other")
-            if not has_multiple_groups:
-                # グループが1つだけ（other のみ）の場合はフラット表示
-                items = groups[0].items if groups else all_items
-                for item in items:
-                    text, due_state = self._build_task_item_text(item, due_text_cache, due_state_cache)
-                    tw_item = QTreeWidgetItem(self.tasks_tree)
-                    tw_item.setText(0, text)
-                    tw_item.setFlags(
-                        Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
-                    )
-                    tw_item.setCheckState(0, Qt.CheckState.Checked if item.done else Qt.CheckState.Unchecked)
-                    tw_item.setData(0, Qt.ItemDataRole.UserRole, item.item_key)
-                    tw_item.setData(0, Qt.ItemDataRole.UserRole + 1, bool(item.done))
-                    tw_item.setData(0, Qt.ItemDataRole.UserRole + 2, item.window_uuid)
-                    color = self._item_color(due_state, bool(item.is_archived))
-                    if color is not None:
-                        tw_item.setForeground(0, QBrush(color))
-                return
-
-            for group in groups:
-                if not isinstance(group, GroupedTasks) or not group.items:
-                    continue
-                header = QTreeWidgetItem(self.tasks_tree)
-                header.setText(0, f"──── {group.label} ────")
-                header.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                header.setData(0, Qt.ItemDataRole.UserRole, "")
-                font = header.font(0)
-                font.setBold(True)
-                header.setFont(0, font)
-                _GROUP_HEADER_COLORS = {
-                    "overdue": QColor("#ff9a9a"),
-                    "today": QColor("#f5c16c"),
-                    "starred": QColor("#ffd700"),
-                }
-                group_color = _GROUP_HEADER_COLORS.get(group.group_key)
-                if group_color is not None:
-                    header.setForeground(0, QBrush(group_color))
-
-                for item in group.items:
-                    text, due_state = self._build_task_item_text(item, due_text_cache, due_state_cache)
-                    tw_item = QTreeWidgetItem(header)
-                    tw_item.setText(0, text)
-                    tw_item.setFlags(
-                        Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
-                    )
-                    tw_item.setCheckState(0, Qt.CheckState.Checked if item.done else Qt.CheckState.Unchecked)
-                    tw_item.setData(0, Qt.ItemDataRole.UserRole, item.item_key)
-                    tw_item.setData(0, Qt.ItemDataRole.UserRole + 1, bool(item.done))
-                    tw_item.setData(0, Qt.ItemDataRole.UserRole + 2, item.window_uuid)
-                    color = self._item_color(due_state, bool(item.is_archived))
-                    if color is not None:
-                        tw_item.setForeground(0, QBrush(color))
-
-                header.setExpanded(True)
-        finally:
-            self.tasks_tree.blockSignals(False)
-
-    def _build_note_item_text(
-        self,
-        item: NoteIndexItem,
-        due_text_cache: dict[tuple[str, str, str, str], str],
-        due_state_cache: dict[tuple[str, str, str, str], str],
-    ) -> tuple[str, str]:
-        """ノートアイテムの表示テキストと期限状態を返す。"""
+    def _build_note_item_text(self, item: NoteIndexItem) -> tuple[str, str]:
+        """ノートアイテムの表示テキストと期限状態を返す（期限はインデックス作成時に算出済み）。"""
         mode_text = tr("label_content_mode_task") if item.content_mode == "task" else tr("label_content_mode_note")
         line = tr("info_note_item_fmt").format(
             title=item.title,
@@ -1353,107 +1392,59 @@ class InfoTab(QWidget):
         tag_badge = self._format_tags_badge(item.tags)
         if tag_badge:
             line = f"{line}  {tag_badge}"
-        due_key = (
-            str(item.due_at or ""),
-            str(item.due_time or ""),
-            str(item.due_timezone or ""),
-            str(item.due_precision or "date"),
-        )
-        due_text = due_text_cache.get(due_key)
-        if due_text is None:
-            due_text = format_due_for_display(
-                item.due_at,
-                due_time=item.due_time,
-                due_timezone=item.due_timezone,
-                due_precision=item.due_precision,
-            )
-            due_text_cache[due_key] = due_text
-        due_state = due_state_cache.get(due_key)
-        if due_state is None:
-            due_state = classify_due(
-                item.due_at,
-                due_time=item.due_time,
-                due_timezone=item.due_timezone,
-                due_precision=item.due_precision,
-            )
-            due_state_cache[due_key] = due_state
+        if item.scene is not None:
+            line = f"{line}  {self._format_scene_badge(item.scene)}"
+        due_state = item.due_state
         badges = self._build_due_badges(due_state, is_archived=bool(item.is_archived))
-        if due_text:
-            line = f"{line}  ({tr('info_due_short_fmt').format(date=due_text)})"
+        if item.due_text:
+            line = f"{line}  ({tr('info_due_short_fmt').format(date=item.due_text)})"
         if badges:
             line = f"{line} {' '.join(badges)}"
         return line, due_state
 
+    def _render_task_row(self, item: TaskIndexItem) -> tuple[str, Optional[QColor]]:
+        text, due_state = self._build_task_item_text(item)
+        return text, self._item_color(due_state, bool(item.is_archived))
+
+    def _render_note_row(self, item: NoteIndexItem) -> tuple[str, Optional[QColor]]:
+        line, due_state = self._build_note_item_text(item)
+        return line, self._item_color(due_state, bool(item.is_archived))
+
+    def _render_mixed_row(self, item: Any) -> tuple[str, Optional[QColor]]:
+        if isinstance(item, TaskIndexItem):
+            text, color = self._render_task_row(item)
+            return f"\U0001f4cb {text}", color
+        text, color = self._render_note_row(item)
+        return f"\U0001f4dd {text}", color
+
+    @staticmethod
+    def _apply_groups_to_model(model: InfoListModel, groups: list[Any], all_items: list[Any], group_type: type) -> None:
+        if not all_items:
+            model.set_empty(tr("info_list_empty"))
+            return
+        has_multiple_groups = len(groups) > 1 or (len(groups) == 1 and groups[0].group_key != "other")
+        if not has_multiple_groups:
+            # グループが1つだけ（other のみ）の場合はフラット表示
+            model.set_items(groups[0].items if groups else all_items)
+            return
+        model.set_groups([group for group in groups if isinstance(group, group_type) and group.items])
+
+    def _populate_tasks_grouped(
+        self,
+        groups: list[Any],
+        all_items: list[TaskIndexItem],
+    ) -> None:
+        self._apply_groups_to_model(self.tasks_model, groups, all_items, GroupedTasks)
+
     def _populate_notes_grouped(
         self,
         groups: list[Any],
         all_items: list[NoteIndexItem],
     ) -> None:
-        from managers.info_index_manager import GroupedNotes
-
-        due_text_cache: dict[tuple[str, str, str, str], str] = {}
-        due_state_cache: dict[tuple[str, str, str, str], str] = {}
-        self.notes_tree.blockSignals(True)
-        try:
-            self.notes_tree.clear()
-            if not all_items:
-                empty = QTreeWidgetItem(self.notes_tree)
-                empty.setText(0, tr("info_list_empty"))
-                empty.setFlags(Qt.ItemFlag.NoItemFlags)
-                return
-
-            has_multiple_groups = len(groups) > 1 or (len(groups) == 1 and groups[0].group_key != "other")
-            if not has_multiple_groups:
-                items = groups[0].items if groups else all_items
-                for item in items:
-                    line, due_state = self._build_note_item_text(item, due_text_cache, due_state_cache)
-                    tw_item = QTreeWidgetItem(self.notes_tree)
-                    tw_item.setText(0, line)
-                    tw_item.setFlags(
-                        Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
-                    )
-                    tw_item.setCheckState(0, Qt.CheckState.Checked if item.is_starred else Qt.CheckState.Unchecked)
-                    tw_item.setData(0, Qt.ItemDataRole.UserRole, item.window_uuid)
-                    tw_item.setData(0, Qt.ItemDataRole.UserRole + 1, bool(item.is_starred))
-                    color = self._item_color(due_state, bool(item.is_archived))
-                    if color is not None:
-                        tw_item.setForeground(0, QBrush(color))
-                    if item.window_uuid and item.window_uuid == self._current_selected_uuid:
-                        tw_item.setSelected(True)
-                return
-
-            for group in groups:
-                if not isinstance(group, GroupedNotes) or not group.items:
-                    continue
-                header = QTreeWidgetItem(self.notes_tree)
-                header.setText(0, f"──── {group.label} ────")
-                header.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                header.setData(0, Qt.ItemDataRole.UserRole, "")
-                font = header.font(0)
-                font.setBold(True)
-                header.setFont(0, font)
-                if group.group_key == "starred":
-                    header.setForeground(0, QBrush(QColor("#ffd700")))
-
-                for item in group.items:
-                    line, due_state = self._build_note_item_text(item, due_text_cache, due_state_cache)
-                    tw_item = QTreeWidgetItem(header)
-                    tw_item.setText(0, line)
-                    tw_item.setFlags(
-                        Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
-                    )
-                    tw_item.setCheckState(0, Qt.CheckState.Checked if item.is_starred else Qt.CheckState.Unchecked)
-                    tw_item.setData(0, Qt.ItemDataRole.UserRole, item.window_uuid)
-                    tw_item.setData(0, Qt.ItemDataRole.UserRole + 1, bool(item.is_starred))
-                    color = self._item_color(due_state, bool(item.is_archived))
-                    if color is not None:
-                        tw_item.setForeground(0, QBrush(color))
-                    if item.window_uuid and item.window_uuid == self._current_selected_uuid:
-                        tw_item.setSelected(True)
-
-                header.setExpanded(True)
-        finally:
-            self.notes_tree.blockSignals(False)
+        self._apply_groups_to_model(self.notes_model, groups, all_items, GroupedNotes)
+        selection = self.notes_tree.selectionModel()
+        if self._current_selected_uuid and not selection.hasSelection():
+            self._select_note_by_uuid(self._current_selected_uuid)
 
     def _populate_all_grouped(
         self,
@@ -1461,102 +1452,22 @@ class InfoTab(QWidget):
         all_tasks: list[TaskIndexItem],
         all_notes: list[NoteIndexItem],
     ) -> None:
-        from managers.info_index_manager import GroupedMixed
+        all_items: list[Any] = list(all_tasks) + list(all_notes)
+        self._apply_groups_to_model(self.all_model, groups, all_items, GroupedMixed)
 
-        due_text_cache: dict[tuple[str, str, str, str], str] = {}
-        due_state_cache: dict[tuple[str, str, str, str], str] = {}
-        self.all_tree.blockSignals(True)
-        try:
-            self.all_tree.clear()
-            total = len(all_tasks) + len(all_notes)
-            if total == 0:
-                empty = QTreeWidgetItem(self.all_tree)
-                empty.setText(0, tr("info_list_empty"))
-                empty.setFlags(Qt.ItemFlag.NoItemFlags)
-                return
-
-            all_items: list[Any] = list(all_tasks) + list(all_notes)
-            has_multiple_groups = len(groups) > 1 or (len(groups) == 1 and groups[0].group_key != "other")
-            if not has_multiple_groups:
-                items = groups[0].items if groups else all_items
-                for item in items:
-                    self._add_mixed_item_to_tree(self.all_tree, item, due_text_cache, due_state_cache)
-                return
-
-            for group in groups:
-                if not isinstance(group, GroupedMixed) or not group.items:
-                    continue
-                header = QTreeWidgetItem(self.all_tree)
-                header.setText(0, f"──── {group.label} ────")
-                header.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                header.setData(0, Qt.ItemDataRole.UserRole, "")
-                font = header.font(0)
-                font.setBold(True)
-                header.setFont(0, font)
-                _GROUP_HEADER_COLORS = {
-                    "overdue": QColor("#ff9a9a"),
-                    "today": QColor("#f5c16c"),
-                    "starred": QColor("#ffd700"),
-                }
-                group_color = _GROUP_HEADER_COLORS.get(group.group_key)
-                if group_color is not None:
-                    header.setForeground(0, QBrush(group_color))
-                for item in group.items:
-                    self._add_mixed_item_to_tree(header, item, due_text_cache, due_state_cache)
-                header.setExpanded(True)
-        finally:
-            self.all_tree.blockSignals(False)
-
-    def _add_mixed_item_to_tree(
-        self,
-        parent: Any,
-        item: Any,
-        due_text_cache: dict[tuple[str, str, str, str], str],
-        due_state_cache: dict[tuple[str, str, str, str], str],
-    ) -> None:
-        from managers.info_index_manager import TaskIndexItem as _TI
-
-        is_task = isinstance(item, _TI)
-        if is_task:
-            text, due_state = self._build_task_item_text(item, due_text_cache, due_state_cache)
-            prefix = "\U0001f4cb "
-        else:
-            text, due_state = self._build_note_item_text(item, due_text_cache, due_state_cache)
-            prefix = "\U0001f4dd "
-
-        tw_item = QTreeWidgetItem(parent)
-        tw_item.setText(0, f"{prefix}{text}")
-        tw_item.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable)
-        if is_task:
-            tw_item.setCheckState(0, Qt.CheckState.Checked if item.done else Qt.CheckState.Unchecked)
-            tw_item.setData(0, Qt.ItemDataRole.UserRole, item.item_key)
-            tw_item.setData(0, Qt.ItemDataRole.UserRole + 1, bool(item.done))
-            tw_item.setData(0, Qt.ItemDataRole.UserRole + 2, item.window_uuid)
-            tw_item.setData(0, Qt.ItemDataRole.UserRole + 3, "task")
-        else:
-            tw_item.setCheckState(0, Qt.CheckState.Checked if item.is_starred else Qt.CheckState.Unchecked)
-            tw_item.setData(0, Qt.ItemDataRole.UserRole, item.window_uuid)
-            tw_item.setData(0, Qt.ItemDataRole.UserRole + 1, bool(item.is_starred))
-            tw_item.setData(0, Qt.ItemDataRole.UserRole + 3, "note")
-        color = self._item_color(due_state, bool(item.is_archived))
-        if color is not None:
-            tw_item.setForeground(0, QBrush(color))
-
-    def _on_all_item_changed(self, item: QTreeWidgetItem, column: int = 0) -> None:
-        if self._is_refreshing:
-            return
-        item_type = str(item.data(0, Qt.ItemDataRole.UserRole + 3) or "")
+    def _on_all_item_check_toggled(self, index: QModelIndex, checked: bool) -> None:
+        item_type = str(index.data(ROLE_KIND) or "")
         if item_type == "task":
-            self._on_task_item_changed(item, column)
+            self._on_task_check_toggled(index, checked)
         elif item_type == "note":
-            self._on_note_item_changed(item, column)
+            self._on_note_check_toggled(index, checked)
 
-    def _on_all_item_activated(self, item: QTreeWidgetItem, column: int = 0) -> None:
-        item_type = str(item.data(0, Qt.ItemDataRole.UserRole + 3) or "")
+    def _on_all_item_activated(self, index: QModelIndex) -> None:
+        item_type = str(index.data(ROLE_KIND) or "")
         if item_type == "task":
-            self._on_task_item_activated(item, column)
+            self._on_task_item_activated(index)
         elif item_type == "note":
-            self._on_note_item_activated(item, column)
+            self._on_note_item_activated(index)
 
     def _update_stats(self, stats: InfoStats) -> None:
         self.lbl_stats.setText(
@@ -1595,6 +1506,12 @@ class InfoTab(QWidget):
     def _populate_operation_logs(self) -> None:
         main_controller = getattr(self.mw, "main_controller", None)
         actions = getattr(main_controller, "info_actions", None)
+        revision = getattr(actions, "operation_log_revision", None)
+        if isinstance(revision, int):
+            # 追記・消去が無ければ読み直さない
+            if revision == self._last_operation_log_revision and self._last_operation_logs_signature is not None:
+                return
+            self._last_operation_log_revision = revision
         logs = actions.get_operation_logs(limit=10) if actions is not None else []
         entries = [dict(entry) for entry in list(logs or [])]
         signature = self._make_operation_logs_signature(entries)
@@ -1616,7 +1533,7 @@ class InfoTab(QWidget):
         self.lbl_operation_summary.setText(summary)
         self.lbl_operation_summary.setToolTip(latest_line)
 
-    def _show_bulk_context_menu(self, source: QTreeWidget, pos: Any) -> None:
+    def _show_bulk_context_menu(self, source: QAbstractItemView, pos: Any) -> None:
         global_pos = source.viewport().mapToGlobal(pos)
         self.menu_bulk_actions.exec(global_pos)
 
@@ -1624,24 +1541,52 @@ class InfoTab(QWidget):
         if self._operations_dialog is None:
             self._operations_dialog = InfoOperationsDialog(self)
             self._operations_dialog.btn_clear.clicked.connect(self._clear_operation_logs)
-        self._operations_dialog.set_entries(list(self._operation_log_lines))
+            self._operations_dialog.btn_more.clicked.connect(self._load_more_operation_logs)
+        self._operations_dialog.set_entries([])
+        self._operation_log_loaded = 0
+        if not self._load_more_operation_logs():
+            # ページ読み込みに対応しない場合は要約用の直近分だけを出す
+            self._operations_dialog.set_entries(list(self._operation_log_lines))
         self._operations_dialog.refresh_ui()
         self._operations_dialog.exec()
 
-    def _on_task_item_changed(self, item: QTreeWidgetItem, column: int = 0) -> None:
+    def _load_more_operation_logs(self) -> bool:
+        """操作ログの次のページ（新しい順）をダイアログへ読み足す。
+
+        Returns:
+            bool: ページ単位の読み込みを行った場合 True。
+        """
+        dialog = self._operations_dialog
+        main_controller = getattr(self.mw, "main_controller", None)
+        actions = getattr(main_controller, "info_actions", None)
+        read_page = getattr(actions, "get_operation_log_page", None)
+        if dialog is None or not callable(read_page):
+            return False
+        page = list(read_page(self._operation_log_loaded, _OPERATION_LOG_PAGE_SIZE + 1) or [])
+        has_more = len(page) > _OPERATION_LOG_PAGE_SIZE
+        page = page[:_OPERATION_LOG_PAGE_SIZE]
+        lines = [self._format_operation_entry(dict(entry)) for entry in page]
+        if self._operation_log_loaded == 0:
+            dialog.set_entries(lines)
+        else:
+            dialog.append_entries(lines)
+        self._operation_log_loaded += len(page)
+        dialog.set_has_more(has_more)
+        return True
+
+    def _on_task_check_toggled(self, index: QModelIndex, checked: bool) -> None:
         if self._is_refreshing:
             return
-        item_key = str(item.data(0, Qt.ItemDataRole.UserRole) or "")
+        item_key = str(index.data(ROLE_KEY) or "")
         if ":" not in item_key:
             return
 
-        prev_done = bool(item.data(0, Qt.ItemDataRole.UserRole + 1))
-        next_done = item.checkState(0) == Qt.CheckState.Checked
-        if prev_done == next_done:
+        prev_done = bool(index.data(ROLE_CHECKED))
+        if prev_done == checked:
             return
 
-        # Defer action to next event loop tick so that setCheckState() finishes
-        # before the tree is cleared/repopulated (prevents C++ access violation).
+        # Defer action to next event loop tick so that the view finishes handling
+        # the click before the model applies the resulting row diff.
         actions = getattr(self.mw.main_controller, "info_actions", None)
         if actions is not None:
             QTimer.singleShot(0, lambda _k=item_key: actions.toggle_task(_k))
@@ -1649,10 +1594,10 @@ class InfoTab(QWidget):
 
         QTimer.singleShot(0, lambda: self.refresh_data(immediate=True))
 
-    def _on_task_item_activated(self, item: QTreeWidgetItem, column: int = 0) -> None:
-        window_uuid = str(item.data(0, Qt.ItemDataRole.UserRole + 2) or "")
+    def _on_task_item_activated(self, index: QModelIndex) -> None:
+        window_uuid = str(index.data(ROLE_WINDOW_UUID) or "")
         if not window_uuid:
-            item_key = str(item.data(0, Qt.ItemDataRole.UserRole) or "")
+            item_key = str(index.data(ROLE_KEY) or "")
             if ":" in item_key:
                 window_uuid = item_key.rsplit(":", 1)[0]
         if not window_uuid:
@@ -1662,28 +1607,27 @@ class InfoTab(QWidget):
         if actions is not None:
             actions.focus_window(window_uuid)
 
-    def _on_note_item_changed(self, item: QTreeWidgetItem, column: int = 0) -> None:
+    def _on_note_check_toggled(self, index: QModelIndex, checked: bool) -> None:
         if self._is_refreshing:
             return
-        window_uuid = str(item.data(0, Qt.ItemDataRole.UserRole) or "")
+        window_uuid = str(index.data(ROLE_KEY) or "")
         if not window_uuid:
             return
-        prev_star = bool(item.data(0, Qt.ItemDataRole.UserRole + 1))
-        next_star = item.checkState(0) == Qt.CheckState.Checked
-        if prev_star == next_star:
+        prev_star = bool(index.data(ROLE_CHECKED))
+        if prev_star == checked:
             return
 
-        # Defer action to next event loop tick so that setCheckState() finishes
-        # before the tree is cleared/repopulated (prevents C++ access violation).
+        # Defer action to next event loop tick so that the view finishes handling
+        # the click before the model applies the resulting row diff.
         actions = getattr(self.mw.main_controller, "info_actions", None)
         if actions is not None:
-            QTimer.singleShot(0, lambda _u=window_uuid, _s=next_star: actions.set_star(_u, _s))
+            QTimer.singleShot(0, lambda _u=window_uuid, _s=checked: actions.set_star(_u, _s))
             return
 
         QTimer.singleShot(0, lambda: self.refresh_data(immediate=True))
 
-    def _on_note_item_activated(self, item: QTreeWidgetItem, column: int = 0) -> None:
-        window_uuid = str(item.data(0, Qt.ItemDataRole.UserRole) or "")
+    def _on_note_item_activated(self, index: QModelIndex) -> None:
+        window_uuid = str(index.data(ROLE_KEY) or "")
         if not window_uuid:
             return
         actions = getattr(self.mw.main_controller, "info_actions", None)
@@ -1691,13 +1635,13 @@ class InfoTab(QWidget):
             actions.focus_window(window_uuid)
 
     def _toggle_selected_note_star(self) -> None:
-        item = self.notes_tree.currentItem()
-        if item is None:
+        index = self.notes_tree.currentIndex()
+        if not index.isValid():
             return
-        window_uuid = str(item.data(0, Qt.ItemDataRole.UserRole) or "")
+        window_uuid = str(index.data(ROLE_KEY) or "")
         if not window_uuid:
             return
-        current = item.checkState(0) == Qt.CheckState.Checked
+        current = bool(index.data(ROLE_CHECKED))
 
         actions = getattr(self.mw.main_controller, "info_actions", None)
         if actions is not None:
@@ -1707,8 +1651,8 @@ class InfoTab(QWidget):
     def _selected_task_item_keys(self) -> list[str]:
         keys: list[str] = []
         for tree in (self.tasks_tree, self.all_tree):
-            for item in tree.selectedItems():
-                item_key = str(item.data(0, Qt.ItemDataRole.UserRole) or "")
+            for index in tree.selectionModel().selectedIndexes():
+                item_key = str(index.data(ROLE_KEY) or "")
                 if ":" in item_key:
                     keys.append(item_key)
         return keys
@@ -1716,23 +1660,23 @@ class InfoTab(QWidget):
     def _selected_window_uuids(self) -> list[str]:
         uuids: set[str] = set()
         for tree in (self.notes_tree, self.all_tree):
-            for item in tree.selectedItems():
-                item_type = str(item.data(0, Qt.ItemDataRole.UserRole + 3) or "")
+            for index in tree.selectionModel().selectedIndexes():
+                item_type = str(index.data(ROLE_KIND) or "")
                 if item_type == "task":
-                    window_uuid = str(item.data(0, Qt.ItemDataRole.UserRole + 2) or "")
+                    window_uuid = str(index.data(ROLE_WINDOW_UUID) or "")
                     if not window_uuid:
-                        item_key = str(item.data(0, Qt.ItemDataRole.UserRole) or "")
+                        item_key = str(index.data(ROLE_KEY) or "")
                         if ":" in item_key:
                             window_uuid = item_key.rsplit(":", 1)[0]
                 else:
-                    window_uuid = str(item.data(0, Qt.ItemDataRole.UserRole) or "")
+                    window_uuid = str(index.data(ROLE_KEY) or "")
                 if window_uuid:
                     uuids.add(window_uuid)
 
-        for item in self.tasks_tree.selectedItems():
-            window_uuid = str(item.data(0, Qt.ItemDataRole.UserRole + 2) or "")
+        for index in self.tasks_tree.selectionModel().selectedIndexes():
+            window_uuid = str(index.data(ROLE_WINDOW_UUID) or "")
             if not window_uuid:
-                item_key = str(item.data(0, Qt.ItemDataRole.UserRole) or "")
+                item_key = str(index.data(ROLE_KEY) or "")
                 if ":" in item_key:
                     window_uuid = item_key.rsplit(":", 1)[0]
             if window_uuid:
@@ -1785,7 +1729,7 @@ class InfoTab(QWidget):
         uuids = self._selected_window_uuids()
         if not uuids:
             return
-        values = BulkTagEditDialog.ask(self)
+        values = BulkTagEditDialog.ask(self, tag_provider=self.complete_tags)
         if values is None:
             return
         add_tags, remove_tags = values
@@ -1802,8 +1746,10 @@ class InfoTab(QWidget):
         actions = getattr(self.mw.main_controller, "info_actions", None)
         if actions is not None and hasattr(actions, "clear_operation_logs"):
             actions.clear_operation_logs()
+            self._operation_log_loaded = 0
             if self._operations_dialog is not None:
                 self._operations_dialog.set_entries([])
+                self._operations_dialog.set_has_more(False)
             return
         self.refresh_data(immediate=True)
 
@@ -1814,29 +1760,16 @@ class InfoTab(QWidget):
         self._select_note_by_uuid(self._current_selected_uuid)
 
     def _select_note_by_uuid(self, target_uuid: str) -> None:
-        """ノートツリー内の指定UUIDのアイテムを選択してスクロールする。"""
-        iterator = self._iter_tree_items(self.notes_tree)
-        for item in iterator:
-            uuid = str(item.data(0, Qt.ItemDataRole.UserRole) or "")
-            is_match = uuid == target_uuid
-            item.setSelected(is_match)
-            if is_match:
-                self.notes_tree.scrollToItem(item)
-
-    @staticmethod
-    def _iter_tree_items(tree: QTreeWidget) -> list[QTreeWidgetItem]:
-        """QTreeWidget内の全アイテム（ヘッダー含む）をフラットに列挙する。"""
-        result: list[QTreeWidgetItem] = []
-        for i in range(tree.topLevelItemCount()):
-            top = tree.topLevelItem(i)
-            if top is None:
-                continue
-            result.append(top)
-            for j in range(top.childCount()):
-                child = top.child(j)
-                if child is not None:
-                    result.append(child)
-        return result
+        """ノート一覧内の指定UUIDの行だけを選択してスクロールする。"""
+        selection = self.notes_tree.selectionModel()
+        index = self.notes_model.find_index(ROW_NOTE, target_uuid)
+        if not index.isValid():
+            selection.clearSelection()
+            return
+        selection.select(
+            index, QItemSelectionModel.SelectionFlag.ClearAndSelect | QItemSelectionModel.SelectionFlag.Rows
+        )
+        self.notes_tree.scrollTo(index)
 
     def refresh_ui(self) -> None:
         self.lbl_layout_mode.setText(tr("info_layout_mode_label"))
@@ -1844,6 +1777,8 @@ class InfoTab(QWidget):
         self.edit_tag_filter.setPlaceholderText(tr("info_tag_placeholder"))
         self.chk_open_only.setText(tr("info_open_tasks_only"))
         self.chk_star_only.setText(tr("info_star_only"))
+        self.chk_saved_scenes.setText(tr("info_include_saved_scenes"))
+        self.chk_saved_scenes.setToolTip(tr("info_include_saved_scenes_tooltip"))
         self.btn_refresh.setText(tr("info_refresh"))
         self.btn_toggle_star.setText(tr("info_toggle_star"))
         self.lbl_mode.setText(tr("info_mode_label"))
@@ -1902,5 +1837,7 @@ class InfoTab(QWidget):
         self.subtabs.setTabText(0, tr("info_all_tab"))
         self.subtabs.setTabText(1, tr("info_tasks_tab"))
         self.subtabs.setTabText(2, tr("info_notes_tab"))
+        for model in (self.all_model, self.tasks_model, self.notes_model):
+            model.invalidate_display()
         self._invalidate_refresh_signatures()
         self.refresh_data(immediate=True)
@@ -14,7 +14,7 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
 from PySide6.QtCore import QPoint, Qt, QTimer
 from PySide6.QtGui import QBrush, QColor
@@ -46,6 +46,9 @@ _BADGE_LOCKED = " [L]"
 _BADGE_FRONT = " [F]"
 _BADGE_PARENT = " [P]"
 
+# ラベル（名前・状態バッジ）に使う config フィールド
+_LABEL_FIELDS = ("text", "image_path", "is_hidden", "is_locked", "is_frontmost")
+
 _SONAR_DURATION_MS = 1200
 _SONAR_DURATION_MS_TEST = 0
 
@@ -348,6 +351,17 @@ class LayerTab(QWidget):
             wm.sig_selection_changed.connect(self._on_canvas_selection_changed)
         except AttributeError:
             logger.debug("LayerTab: WindowManager シグナル接続スキップ（テスト環境）")
+        bus = getattr(self.mw, "property_change_bus", None)
+        if bus is not None:
+            bus.subscribe(self._on_property_changes, categories=("metadata", "geometry"))
+
+    def _on_property_changes(self, events: List[Any]) -> None:
+        """ラベルに出るフィールドが変わったときだけツリーを作り直す。"""
+        if not self.isVisible():
+            # 非表示中は showEvent で作り直す
+            return
+        if any(event.touches(*_LABEL_FIELDS) for event in events):
+            self._schedule_rebuild()
 
     def _schedule_rebuild(self) -> None:
         """多重 rebuild を1回に合流する。テスト時は同期実行。"""
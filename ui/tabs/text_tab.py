@@ -23,6 +23,7 @@ from PySide6.QtWidgets import (
 
 from ui.action_priority_helper import ActionPriorityHelper
 from ui.dialogs import DatePickerDialog
+from ui.mixins.lazy_member_mixin import peek_member
 from utils.due_date import display_due_iso, normalize_due_input_allow_empty
 from utils.translator import tr
 
@@ -749,8 +750,8 @@ class TextTab(QWidget):
                     target.set_undoable_property("is_archived", bool(is_archived), "update_text")
 
             self._sync_note_meta_controls(target)
-            if hasattr(self.mw, "info_tab"):
-                self.mw.info_tab.refresh_data()
+            if (info_tab := peek_member(self.mw, "info_tab")) is not None:
+                info_tab.refresh_data()
         except Exception:
             logger.debug("Failed to apply note metadata", exc_info=True)
 
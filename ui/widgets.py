@@ -1,9 +1,22 @@
+import logging
 import math
-from typing import List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple
 
-from PySide6.QtCore import QPointF, QRect, QSize, Qt, Signal
+from PySide6.QtCore import QPointF, QRect, QSize, QStringListModel, Qt, Signal
 from PySide6.QtGui import QColor, QKeyEvent, QLinearGradient, QMouseEvent, QPainter, QPaintEvent, QPen
-from PySide6.QtWidgets import QColorDialog, QLayout, QMessageBox, QPushButton, QSizePolicy, QVBoxLayout, QWidget
+from PySide6.QtWidgets import (
+    QColorDialog,
+    QCompleter,
+    QLayout,
+    QLineEdit,
+    QMessageBox,
+    QPushButton,
+    QSizePolicy,
+    QVBoxLayout,
+    QWidget,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class ColorButton(QPushButton):
@@ -589,3 +602,61 @@ class CollapsibleBox(QWidget):
         self.title_text = text
         arrow = "▼" if self.toggle_button.isChecked() else "▶"
         self.toggle_button.setText(f"{arrow} {text}")
+
+
+class TagCompleter(QCompleter):
+    """カンマ区切りのタグ入力欄で、入力中の最後のタグを補完する。
+
+    候補は入力のたびに provider(prefix, 件数上限) から取得する（タグ索引の前方一致）。
+    すでに入力済みのタグは候補から除く。
+    """
+
+    def __init__(self, line_edit: QLineEdit, provider: Callable[[str, int], List[str]], max_items: int = 20):
+        super().__init__(line_edit)
+        self._line_edit = line_edit
+        self._provider = provider
+        self._max_items = max(1, int(max_items))
+        self._model = QStringListModel(self)
+        self.setModel(self._model)
+        self.setCaseSensitivity(Qt.CaseInsensitive)
+        self.setCompletionMode(QCompleter.PopupCompletion)
+        self.setMaxVisibleItems(10)
+        self.setWidget(line_edit)
+        line_edit.textEdited.connect(self.update_candidates)
+        self.activated[str].connect(self.insert_tag)
+
+    @staticmethod
+    def _split(text: str) -> Tuple[str, str]:
+        """入力を（確定済み部分, 入力中のタグ）に分ける。"""
+        head, sep, tail = str(text or "").rpartition(",")
+        return (head + sep if sep else ""), tail.strip()
+
+    def candidates(self, text: str) -> List[str]:
+        """入力テキストに対する補完候補を返す。"""
+        head, prefix = self._split(text)
+        if not prefix:
+            return []
+        entered = {tag.strip().lower() for tag in head.split(",") if tag.strip()}
+        try:
+            found = self._provider(prefix, self._max_items + len(entered))
+        except Exception as e:
+            logger.debug(f"Tag completion provider failed: {e}")
+            return []
+        return [tag for tag in found if tag.lower() not in entered][: self._max_items]
+
+    def update_candidates(self, text: str) -> None:
+        """候補を取り直してポップアップを更新する。"""
+        found = self.candidates(text)
+        self._model.setStringList(found)
+        if not found:
+            self.popup().hide()
+            return
+        self.setCompletionPrefix(self._split(text)[1])
+        self.complete()
+
+    def insert_tag(self, tag: str) -> None:
+        """入力中のタグを選択された候補で置き換える。"""
+        head, _prefix = self._split(self._line_edit.text())
+        text = f"{head} {tag}" if head else tag
+        self._line_edit.setText(text)
+        self._line_edit.setCursorPosition(len(text))
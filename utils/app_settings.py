@@ -5,12 +5,13 @@ import json
 import logging
 import os
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Optional
 
 from PySide6.QtWidgets import QMessageBox
 
 from utils.paths import get_base_dir
 from utils.translator import tr
+from utils.write_behind import SaveErrorCallback, get_write_behind
 
 logger = logging.getLogger(__name__)
 
@@ -233,8 +234,17 @@ def _get_settings_path(base_directory: str) -> str:
     return os.path.join(json_dir, "app_settings.json")
 
 
-def save_app_settings(parent: Any, base_directory: str, settings: AppSettings) -> bool:
-    """アプリ設定を保存する。"""
+def save_app_settings(
+    parent: Any,
+    base_directory: str,
+    settings: AppSettings,
+    on_error: Optional[SaveErrorCallback] = None,
+) -> bool:
+    """アプリ設定を保存する。
+
+    書き込みはバックグラウンドで行うため、True は保存要求を受け付けたことを表す。
+    ディスクへの書き込みに失敗した場合は on_error がワーカースレッドから呼ばれる。
+    """
     path: str = _get_settings_path(base_directory)
     try:
         data: dict[str, Any] = {
@@ -261,8 +271,8 @@ def save_app_settings(parent: Any, base_directory: str, settings: AppSettings) -
             ),
             "about_section_state": _sanitize_about_section_state(getattr(settings, "about_section_state", {})),
         }
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # シリアライズと書き込みはバックグラウンドで行う（連続保存はまとめて1回）
+        get_write_behind().submit(path, data, indent=2, on_error=on_error)
         return True
     except Exception as e:
         QMessageBox.critical(
@@ -276,6 +286,8 @@ def save_app_settings(parent: Any, base_directory: str, settings: AppSettings) -
 def load_app_settings(parent: Any, base_directory: str) -> AppSettings:
     """アプリ設定を読み込む。"""
     path: str = _get_settings_path(base_directory)
+    # 書き込み待ちの保存があれば先にディスクへ反映する
+    get_write_behind().flush(path)
     if not os.path.exists(path):
         return AppSettings()
 
@@ -1,8 +1,31 @@
 # utils/commands.py
 
+import logging
+from typing import Any
+
 import shiboken6  # PySide6のオブジェクト生存確認用
+from PySide6.QtCore import QObject
 from PySide6.QtGui import QUndoCommand
 
+logger = logging.getLogger(__name__)
+
+
+def _notify_property_changed(target: Any, property_name: str) -> None:
+    """redo/undo の適用を、対象を所有する MainWindow（Undo スタックの持ち主）にだけ通知する。
+
+    通知先は target.main_window の on_property_command_applied(target, property_name)。
+    """
+    owner = getattr(target, "main_window", None)
+    if owner is None or (isinstance(owner, QObject) and not shiboken6.isValid(owner)):
+        return
+    notify = getattr(owner, "on_property_command_applied", None)
+    if not callable(notify):
+        return
+    try:
+        notify(target, property_name)
+    except Exception:
+        logger.warning(f"Property change notification failed: {property_name}", exc_info=True)
+
 
 class PropertyChangeCommand(QUndoCommand):
     def __init__(self, target, property_name, old_value, new_value, update_method_name=None):
@@ -26,7 +49,8 @@ class PropertyChangeCommand(QUndoCommand):
             setattr(self.target, self.property_name, self.new_value)
             self._update_target()
         except RuntimeError:
-            pass  # 万が一の競合エラー回避
+            return  # 万が一の競合エラー回避
+        _notify_property_changed(self.target, self.property_name)
 
     def undo(self):
         if not self._is_target_valid():
@@ -36,7 +60,8 @@ class PropertyChangeCommand(QUndoCommand):
             setattr(self.target, self.property_name, self.old_value)
             self._update_target()
         except RuntimeError:
-            pass
+            return
+        _notify_property_changed(self.target, self.property_name)
 
     def _update_target(self):
         if not self._is_target_valid():
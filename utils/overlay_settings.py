@@ -4,12 +4,13 @@ from __future__ import annotations
 import json
 import os
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Optional
 
 from PySide6.QtWidgets import QMessageBox
 
 from utils.paths import get_base_dir
 from utils.translator import tr
+from utils.write_behind import SaveErrorCallback, get_write_behind
 
 
 @dataclass
@@ -43,6 +44,8 @@ def load_overlay_settings(parent: Any, base_directory: str) -> OverlaySettings:
         OverlaySettings: 読み込んだ設定（失敗時はデフォルト）。
     """
     path: str = _get_settings_path(base_directory)
+    # 書き込み待ちの保存があれば先にディスクへ反映する
+    get_write_behind().flush(path)
     if not os.path.exists(path):
         return OverlaySettings()
 
@@ -64,16 +67,23 @@ def load_overlay_settings(parent: Any, base_directory: str) -> OverlaySettings:
         return OverlaySettings()
 
 
-def save_overlay_settings(parent: Any, base_directory: str, settings: OverlaySettings) -> bool:
+def save_overlay_settings(
+    parent: Any,
+    base_directory: str,
+    settings: OverlaySettings,
+    on_error: Optional[SaveErrorCallback] = None,
+) -> bool:
     """オーバーレイ設定を保存する。
 
     Args:
         parent (Any): QMessageBox 親。
         base_directory (str): アプリ基準ディレクトリ。
         settings (OverlaySettings): 保存する設定。
+        on_error (Optional[SaveErrorCallback]): バックグラウンド書き込みが失敗したときの通知先
+            （ワーカースレッドから呼ばれる）。
 
     Returns:
-        bool: 成功したら True。
+        bool: 保存要求を受け付けたら True。
     """
     path: str = _get_settings_path(base_directory)
     try:
@@ -82,8 +92,8 @@ def save_overlay_settings(parent: Any, base_directory: str, settings: OverlaySet
             "selection_frame_color": str(settings.selection_frame_color),
             "selection_frame_width": int(settings.selection_frame_width),
         }
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # シリアライズと書き込みはバックグラウンドで行う（連続保存はまとめて1回）
+        get_write_behind().submit(path, data, indent=2, on_error=on_error)
         return True
     except Exception as e:
         QMessageBox.critical(parent, tr("msg_error"), f"Failed to save overlay settings: {e}")
@@ -116,8 +116,9 @@ class ResetManager:
             return False
 
         # Always backup first
+        backup_dir = ""
         try:
-            self.backup_current_config(target_files)
+            backup_dir = self.backup_current_config(target_files)
         except Exception as e:
             logger.error(f"Backup failed during reset: {e}")
             pass
@@ -153,4 +154,16 @@ class ResetManager:
                     logger.error(f"Failed to clean presets directory: {e}")
                     success = False
 
+            # Sharded scene DB (json/scenes/index.json + one file per scene)
+            scenes_dir = os.path.join(self.json_dir, "scenes")
+            if os.path.isdir(scenes_dir):
+                try:
+                    if backup_dir:
+                        shutil.copytree(scenes_dir, os.path.join(backup_dir, "scenes"), dirs_exist_ok=True)
+                    shutil.rmtree(scenes_dir)
+                    logger.info(f"Deleted scene store: {scenes_dir}")
+                except Exception as e:
+                    logger.error(f"Failed to remove scene store: {e}")
+                    success = False
+
         return success
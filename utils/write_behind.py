@@ -0,0 +1,321 @@
+# utils/write_behind.py
+"""JSON 永続化の Write-Behind（遅延・集約・バックグラウンド書き込み）。
+
+GUI スレッドでは保存内容のスナップショット（新しい dict/list）を渡すだけにし、
+JSON シリアライズ・fsync・置換はワーカースレッドで行う。
+同じパスへの保存が短時間に繰り返された場合は最後の内容だけを書き込む（コアレス）。
+
+書き込み自体は従来どおり「一時ファイル → os.replace」のアトミック保存。
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 同一パスへの保存をまとめる待ち時間（秒）
+DEFAULT_COALESCE_SEC: float = 0.3
+
+_REMOVE = object()
+
+# 書き込み失敗の通知先: (path, exception)
+SaveErrorCallback = Callable[[str, BaseException], None]
+
+
+def write_json_atomic(path: str, data: Any, *, indent: Optional[int] = None, fsync: bool = False) -> None:
+    """JSONを一時ファイル経由で書き込み、os.replace で置き換える（Atomic Save）。
+
+    indent=None の場合は区切りの空白も省いたコンパクト形式で書き出す。
+
+    Args:
+        path: 保存先パス。
+        data: JSONシリアライズ可能なデータ。
+        indent: インデント幅。None でコンパクト出力。
+        fsync: True の場合、置換前に一時ファイルをディスクへ同期する。
+    """
+    temp_path = f"{path}.tmp"
+    separators = (",", ":") if indent is None else None
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False, separators=separators)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except Exception:
+                pass
+        raise
+
+
+@dataclass
+class _PendingWrite:
+    data: Any
+    indent: Optional[int]
+    due: float
+    on_error: Optional[SaveErrorCallback] = None
+
+
+class JsonWriteBehind:
+    """パス単位で保存要求を集約し、ワーカースレッドで書き込むライター。
+
+    - submit(): スナップショットを登録する。同じパスの未書き込み分は上書きされる。
+    - write_now(): その場で書き込む（ユーザー操作による保存など、結果をすぐ返したい場合）。
+    - remove(): ファイル削除を同じ順序保証の中で登録する（未書き込みの保存は破棄）。
+    - flush(): 未書き込み分を呼び出し元スレッドで即時に書き込む（終了時・テスト用）。
+    - wait_idle(): ワーカーの処理待ちが無くなるまで待つ。
+
+    submit に渡すデータは呼び出し後に変更しないこと（GUI 側で新しい dict/list を作って渡す）。
+
+    Attributes:
+        coalesce_sec: 同一パスへの保存をまとめる待ち時間（秒）。
+        synchronous: True の場合は submit 時にその場で書き込む。
+        write_count: 実際に書き込んだ回数。
+        coalesced_count: 集約により省略された書き込み回数。
+    """
+
+    def __init__(self, coalesce_sec: float = DEFAULT_COALESCE_SEC, *, synchronous: Optional[bool] = None) -> None:
+        """JsonWriteBehindを初期化します。
+
+        Args:
+            coalesce_sec: 同一パスへの保存をまとめる待ち時間（秒）。
+            synchronous: 同期書き込みにするか。None の場合は FTIV_TEST_MODE=1 のとき同期。
+        """
+        self.coalesce_sec: float = max(0.0, float(coalesce_sec))
+        self._synchronous: Optional[bool] = synchronous
+        self._pending: Dict[str, _PendingWrite] = {}
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        # 実書き込みを直列化する（ワーカーと flush の順序保証）
+        self._io_lock = threading.Lock()
+        self._busy: bool = False
+        self._closed: bool = False
+        self._thread: Optional[threading.Thread] = None
+        self.write_count: int = 0
+        self.coalesced_count: int = 0
+        self.last_error: Optional[BaseException] = None
+
+    @property
+    def synchronous(self) -> bool:
+        """同期書き込みモードかどうか。"""
+        if self._synchronous is not None:
+            return self._synchronous
+        return os.getenv("FTIV_TEST_MODE") == "1"
+
+    # ==========================================
+    # Public API
+    # ==========================================
+
+    def submit(
+        self,
+        path: str,
+        data: Any,
+        *,
+        indent: Optional[int] = None,
+        on_error: Optional[SaveErrorCallback] = None,
+    ) -> None:
+        """保存要求を登録する。同期モードではその場で書き込み、例外はそのまま送出する。
+
+        Args:
+            path: 保存先パス。
+            data: JSONシリアライズ可能なスナップショット。
+            indent: インデント幅。None でコンパクト出力。
+            on_error: 遅延書き込みが失敗したときに (path, exception) で呼ばれる。
+                ワーカースレッドから呼ばれるため、GUI 操作はシグナル等で GUI スレッドへ渡すこと。
+        """
+        if self.synchronous or self._closed:
+            self.write_now(path, data, indent=indent)
+            return
+        self._enqueue(path, _PendingWrite(data, indent, time.monotonic() + self.coalesce_sec, on_error))
+
+    def write_now(self, path: str, data: Any, *, indent: Optional[int] = None) -> None:
+        """呼び出し元スレッドでその場で書き込む。同じパスの未書き込み分は破棄し、例外はそのまま送出する。
+
+        Args:
+            path: 保存先パス。
+            data: JSONシリアライズ可能なデータ。
+            indent: インデント幅。None でコンパクト出力。
+        """
+        with self._io_lock:
+            self._discard(path)
+            self._write(path, _PendingWrite(data, indent, 0.0))
+
+    def remove(self, path: str) -> None:
+        """ファイル削除を登録する。先行する未書き込みの保存は破棄される。"""
+        if self.synchronous or self._closed:
+            with self._io_lock:
+                self._discard(path)
+                self._write(path, _PendingWrite(_REMOVE, None, 0.0))
+            return
+        # 削除は待たせる理由が無いので即時扱い
+        self._enqueue(path, _PendingWrite(_REMOVE, None, time.monotonic()))
+
+    def has_pending(self, path: Optional[str] = None) -> bool:
+        """未書き込みの要求があるかどうかを返す。"""
+        with self._lock:
+            if path is None:
+                return bool(self._pending) or self._busy
+            return path in self._pending
+
+    def flush(self, path: Optional[str] = None) -> None:
+        """未書き込みの要求を呼び出し元スレッドで即時に書き込む。
+
+        ワーカーが書き込み中の場合はその完了を待ってから処理する。
+
+        Args:
+            path: 指定した場合はそのパスだけを書き込む。
+        """
+        with self._io_lock:
+            with self._lock:
+                if path is None:
+                    items = list(self._pending.items())
+                    self._pending.clear()
+                else:
+                    item = self._pending.pop(path, None)
+                    items = [(path, item)] if item is not None else []
+            for target, pending in items:
+                self._write_logged(target, pending)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """ワーカーの処理待ち（未書き込み・書き込み中）が無くなるまで待つ。
+
+        Args:
+            timeout: 最大待ち時間（秒）。None で無制限。
+
+        Returns:
+            bool: 時間内にアイドルになった場合 True。
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.notify_all()
+                self._cond.wait(remaining if remaining is not None else 0.1)
+        return True
+
+    def close(self) -> None:
+        """未書き込み分を書き出し、ワーカーを停止する。以降の要求は同期書き込みになる。"""
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+
+    # ==========================================
+    # Internals
+    # ==========================================
+
+    def _discard(self, path: str) -> None:
+        with self._lock:
+            if self._pending.pop(path, None) is not None:
+                self.coalesced_count += 1
+
+    def _enqueue(self, path: str, pending: _PendingWrite) -> None:
+        with self._cond:
+            previous = self._pending.get(path)
+            if previous is not None:
+                # 最初の要求の期限を保つ（連続保存で書き込みが無限に延びないように）
+                pending.due = min(pending.due, previous.due)
+                if pending.on_error is None:
+                    pending.on_error = previous.on_error
+                self.coalesced_count += 1
+            self._pending[path] = pending
+            self._ensure_worker()
+            self._cond.notify_all()
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="JsonWriteBehind", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed:
+                    if self._pending:
+                        now = time.monotonic()
+                        next_due = min(p.due for p in self._pending.values())
+                        if next_due <= now:
+                            break
+                        self._cond.wait(next_due - now)
+                    else:
+                        self._cond.wait()
+                if self._closed:
+                    self._cond.notify_all()
+                    return
+
+            with self._io_lock:
+                with self._cond:
+                    now = time.monotonic()
+                    due = [(p, item) for p, item in self._pending.items() if item.due <= now]
+                    for target, _item in due:
+                        del self._pending[target]
+                    self._busy = bool(due)
+                try:
+                    for target, item in due:
+                        self._write_logged(target, item)
+                finally:
+                    with self._cond:
+                        self._busy = False
+                        self._cond.notify_all()
+
+    def _write_logged(self, path: str, pending: _PendingWrite) -> None:
+        try:
+            self._write(path, pending)
+        except Exception as e:
+            self.last_error = e
+            logger.error(f"Background save failed: {path}: {e}", exc_info=True)
+            if pending.on_error is not None:
+                try:
+                    pending.on_error(path, e)
+                except Exception:
+                    logger.error("Save error callback failed", exc_info=True)
+
+    def _write(self, path: str, pending: _PendingWrite) -> None:
+        if pending.data is _REMOVE:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        write_json_atomic(path, pending.data, indent=pending.indent, fsync=True)
+        self.write_count += 1
+
+
+_writer: Optional[JsonWriteBehind] = None
+_writer_lock = threading.Lock()
+
+
+def get_write_behind() -> JsonWriteBehind:
+    """アプリ共通の JsonWriteBehind を返す（初回生成時に終了時 flush を登録する）。"""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = JsonWriteBehind()
+            atexit.register(flush_pending_writes)
+        return _writer
+
+
+def flush_pending_writes() -> None:
+    """アプリ共通ライターの未書き込み分を即時に書き込む。"""
+    writer = _writer
+    if writer is None:
+        return
+    try:
+        writer.flush()
+    except Exception:
+        logger.error("Failed to flush pending writes", exc_info=True)
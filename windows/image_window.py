@@ -5,11 +5,14 @@ import logging
 import os
 import traceback
 import warnings
-from typing import Any, Dict, List
+import weakref
+from collections import deque
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Sequence, Tuple
 
 import shiboken6
-from PIL import Image, ImageSequence, PngImagePlugin
-from PySide6.QtCore import QPoint, QRect, Qt, QTimer
+from pydantic import ValidationError
+from PySide6.QtCore import QObject, QPoint, QRect, Qt, QTimer
 from PySide6.QtGui import (
     QColor,
     QDragEnterEvent,
@@ -23,16 +26,82 @@ from PySide6.QtGui import (
 )
 from PySide6.QtWidgets import QApplication, QFileDialog, QMessageBox, QProgressDialog
 
+from managers.project_bundle import ensure_bundle_image
 from models.window_config import ImageWindowConfig
 from ui.context_menu import ContextMenuBuilder
 from utils.translator import tr
 
 from .base_window import BaseOverlayWindow
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 logger = logging.getLogger(__name__)
 
-# PngImagePluginの警告を無視
-warnings.simplefilter("ignore", PngImagePlugin.PngImageFile)
+
+@lru_cache(maxsize=None)
+def _import_pillow() -> Tuple[Any, Any]:
+    """Pillow（Image, ImageSequence）を読み込む。
+
+    起動時の import を軽くするため、最初に画像を開くときまで遅らせる。
+    """
+    from PIL import Image, ImageSequence, PngImagePlugin
+
+    # PngImagePluginの警告を無視
+    warnings.simplefilter("ignore", PngImagePlugin.PngImageFile)
+    return Image, ImageSequence
+
+
+class _DeferredImageDecoder(QObject):
+    """プレビュー表示中のウィンドウの元画像を、イベントループの1周につき1枚ずつデコードするキュー。
+
+    全ウィンドウを続けてデコードして操作を止めないよう、1枚ごとにイベントループへ戻る。
+    表示されていないウィンドウは飛ばし、表示された時点（showEvent）で登録し直す。
+
+    Attributes:
+        decoded_count: デコードしたウィンドウの累計数。
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._queue: Deque["weakref.ReferenceType[ImageWindow]"] = deque()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._decode_next)
+        self.decoded_count: int = 0
+
+    def enqueue(self, window: "ImageWindow") -> None:
+        """ウィンドウをデコード待ちに加える。"""
+        self._queue.append(weakref.ref(window))
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _decode_next(self) -> None:
+        while self._queue:
+            window = self._queue.popleft()()
+            if window is None or not shiboken6.isValid(window) or not window.has_pending_full_image():
+                continue
+            if not window.isVisible():
+                continue
+            try:
+                window.ensure_full_image()
+                self.decoded_count += 1
+            except Exception:
+                logger.warning("Deferred image decode failed", exc_info=True)
+            break
+        if self._queue:
+            self._timer.start()
+
+
+_decoder: Optional[_DeferredImageDecoder] = None
+
+
+def _deferred_decoder() -> _DeferredImageDecoder:
+    global _decoder
+    if _decoder is None or not shiboken6.isValid(_decoder):
+        _decoder = _DeferredImageDecoder()
+    return _decoder
 
 
 class ImageWindow(BaseOverlayWindow):
@@ -74,6 +143,9 @@ class ImageWindow(BaseOverlayWindow):
         self.timer.timeout.connect(self.next_frame)
         self.is_rotating: bool = False
 
+        # 縮小プレビューを仮表示していて、元画像のデコードが済んでいないか
+        self._pending_full_image: bool = False
+
         self.setAcceptDrops(True)
         if image_path:
             self.load_image(image_path)
@@ -253,23 +325,29 @@ class ImageWindow(BaseOverlayWindow):
         except Exception:
             pass  # Suppress context menu errors
 
-    def load_image(self, image_path: str):
+    def load_image(self, image_path: str, show_progress: bool = True):
         """画像ファイルを読み込み、フレームを構築する。
 
         Args:
             image_path (str): 読み込む画像ファイルのパス。
+            show_progress (bool): 進捗ダイアログを出すか。False の場合は途中でイベントを処理せず、
+                失敗してもダイアログを出さずにログへ記録する（プレビューからの遅延デコード用）。
         """
+        self._pending_full_image = False
         self.frames = []
-        if not os.path.exists(image_path):
+        if not ensure_bundle_image(image_path):
             self.create_placeholder_image(image_path)
             return
 
-        progress = QProgressDialog(tr("msg_loading_image"), tr("label_cancel"), 0, 100, self)
-        progress.setWindowTitle(tr("title_loading"))
-        progress.setWindowModality(Qt.WindowModal)
-        progress.show()
+        progress: Optional[QProgressDialog] = None
+        if show_progress:
+            progress = QProgressDialog(tr("msg_loading_image"), tr("label_cancel"), 0, 100, self)
+            progress.setWindowTitle(tr("title_loading"))
+            progress.setWindowModality(Qt.WindowModal)
+            progress.show()
 
         try:
+            Image, ImageSequence = _import_pillow()
             with Image.open(image_path) as img:
                 if "icc_profile" in img.info:
                     img.info.pop("icc_profile")
@@ -277,13 +355,15 @@ class ImageWindow(BaseOverlayWindow):
                 if getattr(img, "is_animated", False):
                     total = img.n_frames
                     for i, frame in enumerate(ImageSequence.Iterator(img)):
-                        QApplication.processEvents()
-                        if not shiboken6.isValid(self) or progress.wasCanceled():
-                            return
+                        if progress is not None:
+                            QApplication.processEvents()
+                            if not shiboken6.isValid(self) or progress.wasCanceled():
+                                return
 
                         qimage = self.pillow_image_to_qimage(frame)
                         self.frames.append(QPixmap.fromImage(qimage))
-                        progress.setValue(int((i + 1) / total * 100))
+                        if progress is not None:
+                            progress.setValue(int((i + 1) / total * 100))
 
                     self.original_speed = int(img.info.get("duration", 100))
                     self._update_animation_timer()
@@ -294,13 +374,56 @@ class ImageWindow(BaseOverlayWindow):
                 self.last_directory = os.path.dirname(image_path)
                 self.current_frame = 0
                 self.update_image()
-            progress.close()
+            if progress is not None:
+                progress.close()
 
         except Exception as e:
-            progress.close()
-            QMessageBox.critical(self, tr("msg_error"), tr("msg_error_loading").format(e))
+            if progress is not None:
+                progress.close()
+                QMessageBox.critical(self, tr("msg_error"), tr("msg_error_loading").format(e))
+            else:
+                logger.warning(f"Failed to load image: {image_path}: {e}")
             self.create_placeholder_image(image_path)
 
+    def show_preview(self, preview_path: str, size: Optional[Sequence[int]] = None) -> bool:
+        """縮小プレビューを仮フレームとして表示し、本体のデコードを後回しにする。
+
+        プロジェクトバンドルの読み込みで、全ウィンドウの画像デコードを待たずに表示するために使う。
+        本体は表示されてから、1周に1枚ずつ進捗ダイアログ無しでデコードし、それまでプレビューを保つ。
+
+        Args:
+            preview_path (str): プレビュー画像（PNG）のパス。
+            size (Optional[Sequence[int]]): 元画像の (幅, 高さ)。指定時はその大きさへ拡大して表示サイズを合わせる。
+
+        Returns:
+            bool: プレビューを設定し、本体の読み込みを予約した場合 True。
+        """
+        pixmap = QPixmap(preview_path)
+        if pixmap.isNull():
+            return False
+        if size and len(size) == 2:
+            pixmap = pixmap.scaled(int(size[0]), int(size[1]), Qt.IgnoreAspectRatio, Qt.FastTransformation)
+        self.frames = [pixmap]
+        self.current_frame = 0
+        self.timer.stop()
+        self._pending_full_image = True
+        _deferred_decoder().enqueue(self)
+        return True
+
+    def has_pending_full_image(self) -> bool:
+        """プレビューを仮表示していて、元画像のデコードが済んでいないかどうか。"""
+        return self._pending_full_image
+
+    def ensure_full_image(self) -> None:
+        """プレビュー表示中なら、元画像をその場でデコードする（進捗ダイアログは出さない）。"""
+        if self._pending_full_image:
+            self.load_image(self.image_path, show_progress=False)
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if self._pending_full_image:
+            _deferred_decoder().enqueue(self)
+
     def load_image_wrapper(self):
         """Undo/Redo用の再読み込みラッパー。"""
         if self.image_path:
@@ -334,17 +457,27 @@ class ImageWindow(BaseOverlayWindow):
         self.timer.stop()
         self.update_image()
 
-    def to_dict(self) -> Dict[str, Any]:
-        """現在の状態を辞書形式で出力する。"""
-        self.config.geometry = {"x": self.x(), "y": self.y(), "width": self.width(), "height": self.height()}
-        self.config.position = {"x": self.x(), "y": self.y()}
+    def prepare_config_for_dump(self) -> None:
+        """保存前に現在の位置・サイズを config へ反映する。
+
+        値が変わらないフィールドは代入しない（FileManager の dump キャッシュを無効化しないため）。
+        """
+        geometry = {"x": self.x(), "y": self.y(), "width": self.width(), "height": self.height()}
+        if self.config.geometry != geometry:
+            self.config.geometry = geometry
+        position = {"x": self.x(), "y": self.y()}
+        if self.config.position != position:
+            self.config.position = position
 
         # 旧 absolute move は使わない方針：次回保存で消えるよう None に落とす
-        if hasattr(self.config, "start_position"):
+        if getattr(self.config, "start_position", None) is not None:
             self.config.start_position = None
-        if hasattr(self.config, "end_position"):
+        if getattr(self.config, "end_position", None) is not None:
             self.config.end_position = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """現在の状態を辞書形式で出力する。"""
+        self.prepare_config_for_dump()
         data = self.config.model_dump(mode="json", exclude_none=True)
         data["type"] = "image"
         return data
@@ -352,9 +485,17 @@ class ImageWindow(BaseOverlayWindow):
     def apply_data(self, data: Dict[str, Any]):
         """辞書データから状態を復元する。"""
         try:
-            for key, value in data.items():
-                if hasattr(self.config, key):
-                    setattr(self.config, key, value)
+            try:
+                # 1回の検証で新しい config を作り、まとめて差し替える
+                self.config = self.config.with_updates(data)
+            except ValidationError:
+                logger.debug("Bulk config hydration failed; falling back to per-field assignment", exc_info=True)
+                for key, value in data.items():
+                    if key in type(self.config).model_fields:
+                        try:
+                            setattr(self.config, key, value)
+                        except ValidationError:
+                            logger.debug("Skipped invalid config value: %s=%r", key, value)
 
             self._update_animation_timer()
             self.is_frontmost = self.config.is_frontmost
@@ -388,7 +529,7 @@ class ImageWindow(BaseOverlayWindow):
             # Loading data errors are non-critical here (failed restore)
             pass
 
-    def pillow_image_to_qimage(self, pillow_image: Image.Image) -> QImage:
+    def pillow_image_to_qimage(self, pillow_image: "Image.Image") -> QImage:
         """PILの画像をQImageに変換する。"""
         buffer = io.BytesIO()
         pillow_image.save(buffer, format="PNG")
@@ -425,7 +566,10 @@ class ImageWindow(BaseOverlayWindow):
 
             self.setPixmap(final_pixmap)
             self.resize(final_pixmap.width(), final_pixmap.height())
-            self.config.geometry["width"], self.config.geometry["height"] = self.width(), self.height()
+            geometry = {**self.config.geometry, "width": self.width(), "height": self.height()}
+            if geometry != self.config.geometry:
+                # GIF のフレーム送りでは大きさが変わらないため、config を変更扱いにしない
+                self.config.geometry = geometry
             self.sig_properties_changed.emit(self)
         except Exception as e:
             QMessageBox.critical(self, tr("msg_error"), f"Error updating image: {e}")
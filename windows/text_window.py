@@ -60,6 +60,18 @@ class TextWindow(EditDialogMixin, TextPropertiesMixin, BaseOverlayWindow):  # ty
     テキストの描画、スタイル設定、および接続線と組み合わせたノード風の可視化操作を管理します。
     """
 
+    @staticmethod
+    def margin_values_from_defaults(defaults: Dict[str, Any]) -> Dict[str, float]:
+        """テキスト既定値（load_text_defaults）から、生成時に config へ入れる余白の値を作る。"""
+        return {
+            "horizontal_margin_ratio": defaults.get("h_margin", 0.0),
+            "vertical_margin_ratio": defaults.get("v_margin", 0.0),
+            "margin_top": defaults.get("margin_top", 0.0),
+            "margin_bottom": defaults.get("margin_bottom", 0.0),
+            "margin_left": defaults.get("margin_left", 0.0),
+            "margin_right": defaults.get("margin_right", 0.0),
+        }
+
     def __init__(
         self,
         main_window: Any,
@@ -98,13 +110,8 @@ class TextWindow(EditDialogMixin, TextPropertiesMixin, BaseOverlayWindow):  # ty
             self.canvas_size: QSize = QSize(10, 10)
             self.setGeometry(QRect(pos, self.canvas_size))
 
-            defaults = self.load_text_defaults()
-            self.config.horizontal_margin_ratio = defaults.get("h_margin", 0.0)
-            self.config.vertical_margin_ratio = defaults.get("v_margin", 0.0)  # Was 0.2
-            self.config.margin_top = defaults.get("margin_top", 0.0)
-            self.config.margin_bottom = defaults.get("margin_bottom", 0.0)
-            self.config.margin_left = defaults.get("margin_left", 0.0)
-            self.config.margin_right = defaults.get("margin_right", 0.0)
+            for key, value in self.margin_values_from_defaults(self.load_text_defaults()).items():
+                setattr(self.config, key, value)
 
             self._previous_text_opacity: int = 100
             self._previous_background_opacity: int = 100